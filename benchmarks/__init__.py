@@ -0,0 +1,9 @@
+"""Offline benchmarks for Cassiopeia's hot paths.
+
+The benchmarks run against recorded (or generated) Riot API and Data Dragon responses served by a local stub server,
+so they need neither an API key nor a network connection. Run them with `python -m benchmarks`.
+"""
+
+from .suite import run, compare
+
+__all__ = ["run", "compare"]
@@ -0,0 +1,68 @@
+import argparse
+import json
+import sys
+
+from .suite import compare, run
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Runs Cassiopeia's benchmarks offline and writes the results as JSON.",
+    )
+    parser.add_argument(
+        "-o", "--output", help="Write the results to this file instead of stdout."
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        help="Compare the results to an earlier results file and exit with status 1 if any regressed.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="How much slower (or bigger) a result can be than the baseline before it counts as a regression, "
+        "as a fraction (default: 0.2).",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="PREFIX",
+        help='Only run the benchmarks whose names start with PREFIX, e.g. "transform." (can be repeated).',
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Run every benchmark only a few times, to check that they work.",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(quick=args.quick, only=args.only)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        rows = compare(baseline, results, tolerance=args.tolerance)
+        for row in rows:
+            print(
+                "{:<45} {:>8.2f}x {}".format(
+                    row["name"],
+                    row["ratio"] if row["ratio"] is not None else float("nan"),
+                    "REGRESSED" if row["regressed"] else "",
+                ),
+                file=sys.stderr,
+            )
+        if any(row["regressed"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,620 @@
+"""Riot API and Data Dragon response bodies for the benchmarks.
+
+Responses recorded with `python -m benchmarks.record` are kept in `benchmarks/fixtures/` and are used when they're
+there. Otherwise, bodies with the same shape and size as real responses (a ranked game of about 30 minutes) are
+generated from a fixed seed, so every run sees the same data.
+"""
+
+import copy
+import json
+import os
+import random
+from typing import Any, Dict, List
+
+FIXTURES_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "fixtures"
+)
+
+MATCH_ID = 4800000000
+PLATFORM = "NA1"
+VERSION = "14.1.1"
+
+_CHALLENGES = [
+    "12AssistStreakCount", "abilityUses", "acesBefore15Minutes", "alliedJungleMonsterKills", "baronTakedowns",
+    "blastConeOppositeOpponentCount", "bountyGold", "buffsStolen", "completeSupportQuestInTime",
+    "controlWardsPlaced", "damagePerMinute", "damageTakenOnTeamPercentage", "dancedWithRiftHerald",
+    "deathsByEnemyChamps", "dodgeSkillShotsSmallWindow", "doubleAces", "dragonTakedowns",
+    "earlyLaningPhaseGoldExpAdvantage", "effectiveHealAndShielding", "elderDragonKillsWithOpposingSoul",
+    "elderDragonMultikills", "enemyChampionImmobilizations", "enemyJungleMonsterKills",
+    "epicMonsterKillsNearEnemyJungler", "epicMonsterKillsWithin30SecondsOfSpawn", "epicMonsterSteals",
+    "epicMonsterStolenWithoutSmite", "firstTurretKilled", "flawlessAces", "fullTeamTakedown", "gameLength",
+    "getTakedownsInAllLanesEarlyJungleAsLaner", "goldPerMinute", "hadOpenNexus", "immobilizeAndKillWithAlly",
+    "initialBuffCount", "initialCrabCount", "jungleCsBefore10Minutes", "junglerTakedownsNearDamagedEpicMonster",
+    "kTurretsDestroyedBeforePlatesFall", "kda", "killAfterHiddenWithAlly", "killParticipation",
+    "killedChampTookFullTeamDamageSurvived", "killingSprees", "killsNearEnemyTurret",
+    "killsOnOtherLanesEarlyJungleAsLaner", "killsOnRecentlyHealedByAramPack", "killsUnderOwnTurret",
+    "killsWithHelpFromEpicMonster", "knockEnemyIntoTeamAndKill", "landSkillShotsEarlyGame",
+    "laneMinionsFirst10Minutes", "laningPhaseGoldExpAdvantage", "legendaryCount", "lostAnInhibitor",
+    "maxCsAdvantageOnLaneOpponent", "maxKillDeficit", "maxLevelLeadLaneOpponent", "mejaisFullStackInTime",
+    "moreEnemyJungleThanOpponent", "multiKillOneSpell", "multiTurretRiftHeraldCount", "multikills",
+    "multikillsAfterAggressiveFlash", "outerTurretExecutesBefore10Minutes", "outnumberedKills",
+    "outnumberedNexusKill", "perfectDragonSoulsTaken", "perfectGame", "pickKillWithAlly",
+    "playedChampSelectPosition", "poroExplosions", "quickCleanse", "quickFirstTurret", "quickSoloKills",
+    "riftHeraldTakedowns", "saveAllyFromDeath", "scuttleCrabKills", "skillshotsDodged", "skillshotsHit",
+    "snowballsHit", "soloBaronKills", "soloKills", "stealthWardsPlaced", "survivedSingleDigitHpCount",
+    "survivedThreeImmobilizesInFight", "takedownOnFirstTurret", "takedowns",
+    "takedownsAfterGainingLevelAdvantage", "takedownsBeforeJungleMinionSpawn", "takedownsFirstXMinutes",
+    "takedownsInAlcove", "takedownsInEnemyFountain", "teamBaronKills", "teamDamagePercentage",
+    "teamElderDragonKills", "teamRiftHeraldKills", "tookLargeDamageSurvived", "turretPlatesTaken",
+    "turretTakedowns", "turretsTakenWithRiftHerald", "twentyMinionsIn3SecondsCount", "twoWardsOneSweeperCount",
+    "unseenRecalls", "visionScoreAdvantageLaneOpponent", "visionScorePerMinute", "wardTakedowns",
+    "wardTakedownsBefore20M", "wardsGuarded",
+]  # fmt: skip
+
+_PARTICIPANT_COUNTS = [
+    "allInPings", "assistMePings", "assists", "baronKills", "basicPings", "bountyLevel", "champExperience",
+    "champLevel", "championTransform", "commandPings", "consumablesPurchased", "damageDealtToBuildings",
+    "damageDealtToObjectives", "damageDealtToTurrets", "damageSelfMitigated", "dangerPings", "deaths",
+    "detectorWardsPlaced", "doubleKills", "dragonKills", "enemyMissingPings", "enemyVisionPings", "getBackPings",
+    "goldEarned", "goldSpent", "holdPings", "inhibitorKills", "inhibitorTakedowns", "inhibitorsLost",
+    "itemsPurchased", "killingSprees", "kills", "largestCriticalStrike", "largestKillingSpree", "largestMultiKill",
+    "longestTimeSpentLiving", "magicDamageDealt", "magicDamageDealtToChampions", "magicDamageTaken",
+    "needVisionPings", "neutralMinionsKilled", "nexusKills", "nexusLost", "nexusTakedowns", "objectivesStolen",
+    "objectivesStolenAssists", "onMyWayPings", "pentaKills", "physicalDamageDealt",
+    "physicalDamageDealtToChampions", "physicalDamageTaken", "profileIcon", "pushPings", "quadraKills",
+    "sightWardsBoughtInGame", "spell1Casts", "spell2Casts", "spell3Casts", "spell4Casts", "summoner1Casts",
+    "summoner2Casts", "summonerLevel", "timeCCingOthers", "timePlayed", "totalAllyJungleMinionsKilled",
+    "totalDamageDealt", "totalDamageDealtToChampions", "totalDamageShieldedOnTeammates", "totalDamageTaken",
+    "totalEnemyJungleMinionsKilled", "totalHeal", "totalHealsOnTeammates", "totalMinionsKilled",
+    "totalTimeCCDealt", "totalTimeSpentDead", "totalUnitsHealed", "tripleKills", "trueDamageDealt",
+    "trueDamageDealtToChampions", "trueDamageTaken", "turretKills", "turretTakedowns", "turretsLost",
+    "unrealKills", "visionClearedPings", "visionScore", "visionWardsBoughtInGame", "wardsKilled", "wardsPlaced",
+]  # fmt: skip
+
+_CHAMPION_STATS = [
+    "abilityHaste", "abilityPower", "armor", "armorPen", "armorPenPercent", "attackDamage", "attackSpeed",
+    "bonusArmorPenPercent", "bonusMagicPenPercent", "ccReduction", "cooldownReduction", "health", "healthMax",
+    "healthRegen", "lifesteal", "magicPen", "magicPenPercent", "magicResist", "movementSpeed", "omnivamp",
+    "physicalVamp", "power", "powerMax", "powerRegen", "spellVamp",
+]  # fmt: skip
+
+_DAMAGE_STATS = [
+    "magicDamageDone", "magicDamageDoneToChampions", "magicDamageTaken", "physicalDamageDone",
+    "physicalDamageDoneToChampions", "physicalDamageTaken", "totalDamageDone", "totalDamageDoneToChampions",
+    "totalDamageTaken", "trueDamageDone", "trueDamageDoneToChampions", "trueDamageTaken",
+]  # fmt: skip
+
+_POSITIONS = ["TOP", "JUNGLE", "MIDDLE", "BOTTOM", "UTILITY"]
+_ITEMS = [
+    1001,
+    1036,
+    1037,
+    1038,
+    1052,
+    1055,
+    1056,
+    2003,
+    2055,
+    3006,
+    3020,
+    3031,
+    3047,
+    3071,
+    3111,
+    3157,
+]
+
+
+def _participant(rng: random.Random, id: int) -> Dict[str, Any]:
+    team_id = 100 if id <= 5 else 200
+    participant = {name: rng.randint(0, 30000) for name in _PARTICIPANT_COUNTS}
+    participant.update(
+        {
+            "participantId": id,
+            "teamId": team_id,
+            "win": team_id == 100,
+            "puuid": "puuid-{:02d}".format(id) * 4,
+            "summonerId": "summoner-{:02d}".format(id),
+            "summonerName": "",
+            "riotIdGameName": "Player {}".format(id),
+            "riotIdTagline": "NA1",
+            "championId": rng.randint(1, 900),
+            "championName": "Champion",
+            "individualPosition": _POSITIONS[(id - 1) % 5],
+            "teamPosition": _POSITIONS[(id - 1) % 5],
+            "lane": _POSITIONS[(id - 1) % 5],
+            "role": "SOLO",
+            "summoner1Id": 4,
+            "summoner2Id": 14,
+            "eligibleForProgression": True,
+            "firstBloodAssist": False,
+            "firstBloodKill": id == 1,
+            "firstTowerAssist": False,
+            "firstTowerKill": id == 3,
+            "gameEndedInEarlySurrender": False,
+            "gameEndedInSurrender": False,
+            "teamEarlySurrendered": False,
+            "placement": 0,
+            "playerAugment1": 0,
+            "playerAugment2": 0,
+            "playerAugment3": 0,
+            "playerAugment4": 0,
+            "playerSubteamId": 0,
+            "subteamPlacement": 0,
+            "challenges": {name: rng.randint(0, 100) for name in _CHALLENGES},
+            "missions": {"playerScore{}".format(i): 0 for i in range(12)},
+            "perks": {
+                "statPerks": {"defense": 5001, "flex": 5008, "offense": 5005},
+                "styles": [
+                    {
+                        "description": "primaryStyle",
+                        "selections": [
+                            {
+                                "perk": perk,
+                                "var1": rng.randint(0, 2000),
+                                "var2": 0,
+                                "var3": 0,
+                            }
+                            for perk in (8005, 9111, 9104, 8014)
+                        ],
+                        "style": 8000,
+                    },
+                    {
+                        "description": "subStyle",
+                        "selections": [
+                            {
+                                "perk": perk,
+                                "var1": rng.randint(0, 2000),
+                                "var2": 0,
+                                "var3": 0,
+                            }
+                            for perk in (8444, 8453)
+                        ],
+                        "style": 8400,
+                    },
+                ],
+            },
+        }
+    )
+    for slot in range(7):
+        participant["item{}".format(slot)] = rng.choice(_ITEMS) if slot < 6 else 3340
+    return participant
+
+
+def _team(rng: random.Random, team_id: int) -> Dict[str, Any]:
+    return {
+        "teamId": team_id,
+        "win": team_id == 100,
+        "bans": [
+            {"championId": rng.randint(1, 900), "pickTurn": turn}
+            for turn in range(1, 6)
+        ],
+        "objectives": {
+            name: {"first": team_id == 100, "kills": rng.randint(0, 11)}
+            for name in (
+                "baron",
+                "champion",
+                "dragon",
+                "horde",
+                "inhibitor",
+                "riftHerald",
+                "tower",
+            )
+        },
+    }
+
+
+def match(id: int = MATCH_ID, platform: str = PLATFORM) -> Dict[str, Any]:
+    """A match-v5 /lol/match/v5/matches/{matchId} response body."""
+    rng = random.Random(1)
+    participants = [_participant(rng, id) for id in range(1, 11)]
+    return {
+        "metadata": {
+            "dataVersion": "2",
+            "matchId": "{}_{}".format(platform, id),
+            "participants": [participant["puuid"] for participant in participants],
+        },
+        "info": {
+            "endOfGameResult": "GameComplete",
+            "gameCreation": 1704067200000,
+            "gameDuration": 1832,
+            "gameEndTimestamp": 1704069100000,
+            "gameId": id,
+            "gameMode": "CLASSIC",
+            "gameName": "teambuilder-match-{}".format(id),
+            "gameStartTimestamp": 1704067260000,
+            "gameType": "MATCHED_GAME",
+            "gameVersion": "14.1.555.5828",
+            "mapId": 11,
+            "participants": participants,
+            "platformId": platform,
+            "queueId": 420,
+            "teams": [_team(rng, 100), _team(rng, 200)],
+            "tournamentCode": "",
+        },
+    }
+
+
+def _position(rng: random.Random) -> Dict[str, int]:
+    return {"x": rng.randint(0, 14800), "y": rng.randint(0, 14800)}
+
+
+def _damage(rng: random.Random, participant_id: int) -> Dict[str, Any]:
+    return {
+        "basic": False,
+        "magicDamage": rng.randint(0, 800),
+        "name": "Champion",
+        "participantId": participant_id,
+        "physicalDamage": rng.randint(0, 800),
+        "spellName": "championq",
+        "spellSlot": 0,
+        "trueDamage": 0,
+        "type": "OTHER",
+    }
+
+
+class _Events(object):
+    # Makes events in the proportions of a real game, keeping every participant's inventory consistent
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.inventories = {id: [] for id in range(1, 11)}
+        self.levels = {id: 1 for id in range(1, 11)}
+
+    def __call__(self, timestamp: int) -> Dict[str, Any]:
+        rng = self.rng
+        id = rng.randint(1, 10)
+        kind = rng.random()
+        if kind < 0.3:
+            item = rng.choice(_ITEMS)
+            self.inventories[id].append(item)
+            return {
+                "type": "ITEM_PURCHASED",
+                "timestamp": timestamp,
+                "participantId": id,
+                "itemId": item,
+            }
+        if kind < 0.4 and self.inventories[id]:
+            item = self.inventories[id].pop(0)
+            return {
+                "type": "ITEM_DESTROYED",
+                "timestamp": timestamp,
+                "participantId": id,
+                "itemId": item,
+            }
+        if kind < 0.55:
+            return {
+                "type": "WARD_PLACED",
+                "timestamp": timestamp,
+                "creatorId": id,
+                "wardType": "YELLOW_TRINKET",
+            }
+        if kind < 0.6:
+            return {
+                "type": "WARD_KILL",
+                "timestamp": timestamp,
+                "killerId": id,
+                "wardType": "CONTROL_WARD",
+            }
+        if kind < 0.75 and self.levels[id] < 18:
+            self.levels[id] += 1
+            return {
+                "type": "SKILL_LEVEL_UP",
+                "timestamp": timestamp,
+                "participantId": id,
+                "skillSlot": rng.randint(1, 4),
+                "levelUpType": "NORMAL",
+            }
+        if kind < 0.85:
+            return {
+                "type": "LEVEL_UP",
+                "timestamp": timestamp,
+                "participantId": id,
+                "level": self.levels[id],
+            }
+        if kind < 0.95:
+            victim = (id + 4) % 10 + 1
+            return {
+                "type": "CHAMPION_KILL",
+                "timestamp": timestamp,
+                "killerId": id,
+                "victimId": victim,
+                "assistingParticipantIds": [(id + 1) % 5 + 1 + (5 if id > 5 else 0)],
+                "bounty": 300,
+                "shutdownBounty": 0,
+                "killStreakLength": rng.randint(0, 3),
+                "position": _position(rng),
+                "victimDamageDealt": [_damage(rng, victim) for _ in range(2)],
+                "victimDamageReceived": [_damage(rng, id) for _ in range(3)],
+            }
+        return {
+            "type": "BUILDING_KILL",
+            "timestamp": timestamp,
+            "killerId": id,
+            "teamId": 200 if id <= 5 else 100,
+            "buildingType": "TOWER_BUILDING",
+            "towerType": "OUTER_TURRET",
+            "laneType": "MID_LANE",
+            "bounty": 250,
+            "assistingParticipantIds": [],
+            "position": _position(rng),
+        }
+
+
+def timeline(id: int = MATCH_ID, platform: str = PLATFORM) -> Dict[str, Any]:
+    """A match-v5 /lol/match/v5/matches/{matchId}/timeline response body."""
+    rng = random.Random(2)
+    events = _Events(rng)
+    frames = []
+    for minute in range(32):
+        timestamp = minute * 60000
+        frames.append(
+            {
+                "timestamp": timestamp + rng.randint(0, 40),
+                "participantFrames": {
+                    str(id): {
+                        "participantId": id,
+                        "championStats": {
+                            name: rng.randint(0, 3000) for name in _CHAMPION_STATS
+                        },
+                        "damageStats": {
+                            name: rng.randint(0, 90000) for name in _DAMAGE_STATS
+                        },
+                        "currentGold": rng.randint(0, 3000),
+                        "goldPerSecond": 0,
+                        "jungleMinionsKilled": rng.randint(0, 8) * minute,
+                        "level": min(18, 1 + minute // 2),
+                        "minionsKilled": rng.randint(5, 9) * minute,
+                        "position": _position(rng),
+                        "timeEnemySpentControlled": rng.randint(0, 90000),
+                        "totalGold": 500 + rng.randint(300, 450) * minute,
+                        "xp": rng.randint(350, 500) * minute,
+                    }
+                    for id in range(1, 11)
+                },
+                "events": [
+                    events(timestamp + offset)
+                    for offset in sorted(
+                        rng.randint(1, 59999) for _ in range(rng.randint(20, 60))
+                    )
+                ],
+            }
+        )
+    return {
+        "metadata": {
+            "dataVersion": "2",
+            "matchId": "{}_{}".format(platform, id),
+            "participants": ["puuid-{:02d}".format(id) * 4 for id in range(1, 11)],
+        },
+        "info": {
+            "endOfGameResult": "GameComplete",
+            "frameInterval": 60000,
+            "frames": frames,
+            "gameId": id,
+            "participants": [
+                {"participantId": id, "puuid": "puuid-{:02d}".format(id) * 4}
+                for id in range(1, 11)
+            ],
+        },
+    }
+
+
+PUUID = "puuid-01" * 4
+
+
+def matchlist() -> List[str]:
+    """A match-v5 /lol/match/v5/matches/by-puuid/{puuid}/ids response body for 100 matches. Every id is served the
+    same match body."""
+    return ["{}_{}".format(PLATFORM, MATCH_ID - i) for i in range(100)]
+
+
+def summoner() -> Dict[str, Any]:
+    """A summoner-v4 /lol/summoner/v4/summoners/by-puuid/{puuid} response body."""
+    return {
+        "id": "summoner-01",
+        "accountId": "account-01",
+        "puuid": PUUID,
+        "profileIconId": 4568,
+        "revisionDate": 1704069100000,
+        "summonerLevel": 312,
+    }
+
+
+def versions() -> Any:
+    """The Data Dragon /api/versions.json body."""
+    return [VERSION] + ["13.{}.1".format(patch) for patch in range(24, 0, -1)]
+
+
+def realms() -> Dict[str, Any]:
+    """A Data Dragon /realms/{region}.json body."""
+    return {
+        "n": {name: VERSION for name in ("item", "rune", "mastery", "summoner", "champion", "profileicon", "map", "language", "sticker")},
+        "v": VERSION,
+        "l": "en_US",
+        "cdn": "https://ddragon.leagueoflegends.com/cdn",
+        "dd": VERSION,
+        "lg": VERSION,
+        "css": VERSION,
+        "profileiconmax": 28,
+        "store": None,
+    }  # fmt: skip
+
+
+def _image(group: str, full: str) -> Dict[str, Any]:
+    return {"full": full, "sprite": group + "0.png", "group": group, "x": 0, "y": 0, "w": 48, "h": 48}  # fmt: skip
+
+
+def champions() -> Dict[str, Any]:
+    """A Data Dragon /cdn/{version}/data/{locale}/championFull.json body with one champion."""
+    return {
+        "type": "champion",
+        "format": "full",
+        "version": VERSION,
+        "data": {
+            "Annie": {
+                "id": "Annie",
+                "key": "1",
+                "name": "Annie",
+                "title": "the Dark Child",
+                "image": _image("champion", "Annie.png"),
+                "skins": [{"id": "1000", "num": 0, "name": "default", "chromas": False}],
+                "lore": "",
+                "blurb": "",
+                "allytips": [],
+                "enemytips": [],
+                "tags": ["Mage"],
+                "partype": "Mana",
+                "info": {"attack": 2, "defense": 3, "magic": 10, "difficulty": 6},
+                "stats": {"hp": 560, "hpperlevel": 96, "mp": 418, "mpperlevel": 25, "movespeed": 335, "armor": 21},
+                "spells": [],
+                "passive": {"name": "Pyromania", "description": "", "image": _image("passive", "Annie_Passive.png")},
+                "recommended": [],
+            }
+        },
+        "keys": {"1": "Annie"},
+    }  # fmt: skip
+
+
+def items() -> Dict[str, Any]:
+    """A Data Dragon /cdn/{version}/data/{locale}/item.json body with one item."""
+    return {
+        "type": "item",
+        "version": VERSION,
+        "basic": {},
+        "data": {
+            "1001": {
+                "name": "Boots",
+                "description": "",
+                "plaintext": "Slightly increases Move Speed",
+                "gold": {"base": 300, "purchasable": True, "total": 300, "sell": 210},
+                "tags": ["Boots"],
+                "maps": {"11": True, "12": True},
+                "stats": {"FlatMovementSpeedMod": 25},
+                "image": _image("item", "1001.png"),
+            }
+        },
+        "groups": [],
+        "tree": [],
+    }  # fmt: skip
+
+
+def runes() -> List[Dict[str, Any]]:
+    """A Data Dragon /cdn/{version}/data/{locale}/runesReforged.json body with one path of one rune."""
+    return [
+        {
+            "id": 8100,
+            "key": "Domination",
+            "icon": "perk-images/Styles/7200_Domination.png",
+            "name": "Domination",
+            "slots": [
+                {
+                    "runes": [
+                        {"id": 8112, "key": "Electrocute", "icon": "", "name": "Electrocute", "shortDesc": "", "longDesc": ""}
+                    ]
+                }
+            ],
+        }
+    ]  # fmt: skip
+
+
+def perks() -> List[Dict[str, Any]]:
+    """A CommunityDragon perks.json body with one stat rune."""
+    return [{"id": 5008, "name": "Adaptive Force", "shortDesc": "", "longDesc": "", "iconPath": ""}]  # fmt: skip
+
+
+def summoner_spells() -> Dict[str, Any]:
+    """A Data Dragon /cdn/{version}/data/{locale}/summoner.json body with one summoner spell."""
+    return {
+        "type": "summoner",
+        "version": VERSION,
+        "data": {
+            "SummonerFlash": {
+                "id": "SummonerFlash",
+                "name": "Flash",
+                "description": "",
+                "tooltip": "",
+                "maxrank": 1,
+                "cooldown": [300],
+                "cooldownBurn": "300",
+                "cost": [0],
+                "costBurn": "0",
+                "datavalues": {},
+                "effect": [None],
+                "effectBurn": [None],
+                "vars": [],
+                "key": "4",
+                "summonerLevel": 7,
+                "modes": ["CLASSIC"],
+                "costType": "No Cost",
+                "maxammo": "-1",
+                "range": [425],
+                "rangeBurn": "425",
+                "image": _image("spell", "SummonerFlash.png"),
+                "resource": "No Cost",
+            }
+        },
+    }  # fmt: skip
+
+
+def maps() -> Dict[str, Any]:
+    """A Data Dragon /cdn/{version}/data/{locale}/map.json body with one map."""
+    return {
+        "type": "map",
+        "version": VERSION,
+        "data": {"11": {"MapName": "Summoner's Rift", "MapId": "11", "image": _image("map", "map11.png")}},
+    }  # fmt: skip
+
+
+def profile_icons() -> Dict[str, Any]:
+    """A Data Dragon /cdn/{version}/data/{locale}/profileicon.json body with one icon."""
+    return {
+        "type": "profileicon",
+        "version": VERSION,
+        "data": {"0": {"id": 0, "image": _image("profileicon", "0.png")}},
+    }  # fmt: skip
+
+
+_generators = {
+    "match": match,
+    "timeline": timeline,
+    "matchlist": matchlist,
+    "summoner": summoner,
+    "versions": versions,
+    "realms": realms,
+    "champions": champions,
+    "items": items,
+    "runes": runes,
+    "perks": perks,
+    "summoner_spells": summoner_spells,
+    "maps": maps,
+    "profile_icons": profile_icons,
+}
+_loaded = {}
+
+
+def _rekey(name: str, body: Any) -> Any:
+    # Recorded bodies get the fixed ids, so the benchmarks can ask for them whichever match was recorded
+    if name in ("match", "timeline"):
+        body["metadata"]["matchId"] = "{}_{}".format(PLATFORM, MATCH_ID)
+        body["info"]["gameId"] = MATCH_ID
+        if name == "match":
+            body["info"]["platformId"] = PLATFORM
+    elif name == "summoner":
+        body["puuid"] = PUUID
+    return body
+
+
+def load(name: str) -> Any:
+    """The recorded `name` fixture (e.g. "match") if there is one, otherwise a generated body. A new copy is returned
+    every time."""
+    if name not in _loaded:
+        path = os.path.join(FIXTURES_DIRECTORY, name + ".json")
+        if os.path.exists(path):
+            with open(path, "rb") as file:
+                _loaded[name] = _rekey(name, json.loads(file.read()))
+        else:
+            _loaded[name] = _generators[name]()
+    return copy.deepcopy(_loaded[name])
+
+
+def is_recorded(name: str) -> bool:
+    return os.path.exists(os.path.join(FIXTURES_DIRECTORY, name + ".json"))
@@ -0,0 +1,94 @@
+"""Records real Riot API, Data Dragon and CommunityDragon responses (the match, its timeline and the static data of
+the current version) into `benchmarks/fixtures/`, for the benchmarks to use instead of the generated bodies.
+
+    python -m benchmarks.record --api-key RGAPI-... --match NA1_4800000000
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from cassiopeia.data import Platform
+from cassiopeia.datastores.common import HTTPClient
+
+from .fixtures import FIXTURES_DIRECTORY
+
+
+def record(api_key: str, match_id: str) -> None:
+    platform = Platform(match_id.split("_", 1)[0].upper())
+    continent = platform.continent.value.lower()
+    region = platform.region.value.lower()
+    client = HTTPClient()
+    headers = {"X-Riot-Token": api_key}
+
+    def get(name, url, **kwargs):
+        body, _ = client.get(url, decode_json=False, **kwargs)
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        os.makedirs(FIXTURES_DIRECTORY, exist_ok=True)
+        with open(os.path.join(FIXTURES_DIRECTORY, name + ".json"), "wb") as file:
+            file.write(body)
+        print("Recorded {}".format(name), file=sys.stderr)
+        return json.loads(body)
+
+    match_url = "https://{}.api.riotgames.com/lol/match/v5/matches/{}".format(
+        continent, match_id
+    )
+    match = get("match", match_url, headers=headers)
+    get("timeline", match_url + "/timeline", headers=headers)
+    get(
+        "matchlist",
+        "https://{}.api.riotgames.com/lol/match/v5/matches/by-puuid/{}/ids?count=100".format(
+            continent, match["metadata"]["participants"][0]
+        ),
+        headers=headers,
+    )
+    get(
+        "summoner",
+        "https://{}.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/{}".format(
+            platform.value.lower(), match["metadata"]["participants"][0]
+        ),
+        headers=headers,
+    )
+    get("versions", "https://ddragon.leagueoflegends.com/api/versions.json")
+    realm = get(
+        "realms", "https://ddragon.leagueoflegends.com/realms/{}.json".format(region)
+    )
+    data_url = "https://ddragon.leagueoflegends.com/cdn/{}/data/{}/".format(
+        realm["v"], realm["l"]
+    )
+    for name, file in [
+        ("champions", "championFull.json"),
+        ("items", "item.json"),
+        ("runes", "runesReforged.json"),
+        ("summoner_spells", "summoner.json"),
+        ("maps", "map.json"),
+        ("profile_icons", "profileicon.json"),
+    ]:
+        get(name, data_url + file)
+    get(
+        "perks",
+        "https://raw.communitydragon.org/pbe/plugins/rcp-be-lol-game-data/global/default/v1/perks.json",
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.record",
+        description="Records the responses the benchmarks use from the real Riot API, Data Dragon and CommunityDragon.",
+    )
+    parser.add_argument("--api-key", required=True, help="A Riot API key.")
+    parser.add_argument(
+        "--match",
+        required=True,
+        metavar="MATCH_ID",
+        help='The match to record, with its platform, e.g. "NA1_4800000000".',
+    )
+    args = parser.parse_args(argv)
+    record(args.api_key, args.match)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""A local HTTP server that answers Riot API and Data Dragon requests with the fixtures, and an `HTTPClient` that sends
+every request to it.
+
+Requests to "https://{host}/{path}" are sent to "http://127.0.0.1:{port}/{host}/{path}", so the URLs the data sources
+build, the HTTP client, and the JSON decoding are all the same as against the real servers.
+"""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Tuple
+
+from cassiopeia.datastores.common import HTTPClient
+
+from . import fixtures
+
+# (host pattern, path pattern, fixture name)
+_ROUTES = [
+    (r"[a-z]+\.api\.riotgames\.com", r"/lol/match/v5/matches/by-puuid/[^/]+/ids", "matchlist"),
+    (r"[a-z]+\.api\.riotgames\.com", r"/lol/match/v5/matches/[A-Z0-9]+_\d+/timeline", "timeline"),
+    (r"[a-z]+\.api\.riotgames\.com", r"/lol/match/v5/matches/[A-Z0-9]+_\d+", "match"),
+    (r"[a-z0-9]+\.api\.riotgames\.com", r"/lol/summoner/v4/summoners/by-puuid/[^/]+", "summoner"),
+    (r"ddragon\.leagueoflegends\.com", r"/api/versions\.json", "versions"),
+    (r"ddragon\.leagueoflegends\.com", r"/realms/[a-z]+\.json", "realms"),
+    (r"ddragon\.leagueoflegends\.com", r"/cdn/[^/]+/data/[A-Za-z_]+/championFull\.json", "champions"),
+    (r"ddragon\.leagueoflegends\.com", r"/cdn/[^/]+/data/[A-Za-z_]+/item\.json", "items"),
+    (r"ddragon\.leagueoflegends\.com", r"/cdn/[^/]+/data/[A-Za-z_]+/runesReforged\.json", "runes"),
+    (r"ddragon\.leagueoflegends\.com", r"/cdn/[^/]+/data/[A-Za-z_]+/summoner\.json", "summoner_spells"),
+    (r"ddragon\.leagueoflegends\.com", r"/cdn/[^/]+/data/[A-Za-z_]+/map\.json", "maps"),
+    (r"ddragon\.leagueoflegends\.com", r"/cdn/[^/]+/data/[A-Za-z_]+/profileicon\.json", "profile_icons"),
+    (r"raw\.communitydragon\.org", r"/pbe/plugins/rcp-be-lol-game-data/global/default/v1/perks\.json", "perks"),
+]  # fmt: skip
+_ROUTES = [(re.compile(host), re.compile(path), name) for host, path, name in _ROUTES]
+
+# Generous limits, so the rate limiters never wait
+_RATE_LIMIT_HEADERS = {
+    "X-App-Rate-Limit": "1000000:1",
+    "X-Method-Rate-Limit": "1000000:1",
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep connections alive, like the real servers
+    disable_nagle_algorithm = (
+        True  # Otherwise small responses wait for the client's delayed ACK
+    )
+
+    def do_GET(self):
+        _, host, path = self.path.split("/", 2)
+        path = "/" + path.split("?", 1)[0]
+        self.server.requests.append((host, path))
+        for host_pattern, path_pattern, name in _ROUTES:
+            if host_pattern.fullmatch(host) and path_pattern.fullmatch(path):
+                body = self.server.bodies[name]
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json;charset=utf-8")
+                for header, value in _RATE_LIMIT_HEADERS.items():
+                    self.send_header(header, value)
+                break
+        else:
+            body = b'{"status": {"message": "Data not found", "status_code": 404}}'
+            self.send_response(404)
+            self.send_header("Content-Type", "application/json;charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(object):
+    """Serves the fixtures on a free local port until `close` is called. Every request's (host, path) is recorded in
+    `requests`."""
+
+    def __init__(self) -> None:
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.requests = self.requests = []
+        self._server.bodies = {
+            name: json.dumps(fixtures.load(name)).encode("utf-8")
+            for _, _, name in _ROUTES
+        }
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        return "http://127.0.0.1:{}".format(self._server.server_address[1])
+
+    def body(self, name: str) -> bytes:
+        return self._server.bodies[name]
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class StubHTTPClient(HTTPClient):
+    """An `HTTPClient` that sends every request to a `StubServer` instead of the host in its URL."""
+
+    def __init__(self, server_url: str, pool_size: int = 10) -> None:
+        super().__init__(pool_size=pool_size)
+        self._server_url = server_url
+
+    def get(self, url: str, *args, **kwargs) -> Tuple[Any, Dict[str, str]]:
+        if isinstance(url, bytes):
+            url = url.decode("utf-8")
+        url = re.sub(r"^https?://", self._server_url + "/", url)
+        return super().get(url, *args, **kwargs)
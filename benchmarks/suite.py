@@ -0,0 +1,443 @@
+"""The benchmarks.
+
+Every benchmark is a function that takes a `Runner` and records one or more results with it. Timings are the best
+time per operation over `repeat` rounds of `number` operations (like `timeit`), and memory is measured with
+`tracemalloc`.
+"""
+
+import contextlib
+import copy
+import datetime
+import gc
+import importlib.metadata
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import cassiopeia
+from cassiopeia import configuration
+from cassiopeia.core.match import (
+    CumulativeTimeline,
+    Match,
+    MatchData,
+    Timeline,
+    TimelineData,
+    TimelineIndex,
+)
+from cassiopeia.core.staticdata import Realms, Versions
+from cassiopeia.core.summoner import Summoner
+from cassiopeia.data import Continent, Platform
+from cassiopeia.datastores import Cache
+from cassiopeia.datastores import common as datastores_common
+from cassiopeia.datastores.common import loads
+from cassiopeia.datastores.riotapi.match import MatchAPI
+from cassiopeia.dto.match import MatchDto
+from cassiopeia.transformers.match import MatchTransformer
+
+from . import fixtures
+from .stubserver import StubHTTPClient, StubServer
+
+FORMAT_VERSION = 1
+
+
+@contextlib.contextmanager
+def _settings(**values: Any) -> Iterator[None]:
+    # Switches global settings (e.g. lazy_match_data=True) for the duration of a benchmark
+    old = {}
+    for name, value in values.items():
+        attribute = "_Settings__" + name
+        old[attribute] = getattr(configuration.settings, attribute)
+        setattr(configuration.settings, attribute, value)
+    try:
+        yield
+    finally:
+        for attribute, value in old.items():
+            setattr(configuration.settings, attribute, value)
+
+
+class Runner(object):
+    """Times functions and measures memory, and collects the results by name."""
+
+    def __init__(self, quick: bool = False, only: Optional[List[str]] = None) -> None:
+        self.quick = quick
+        self.only = only
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def wanted(self, name: str) -> bool:
+        return not self.only or any(name.startswith(prefix) for prefix in self.only)
+
+    def time(
+        self,
+        name: str,
+        function: Callable,
+        setup: Callable[[], Any] = None,
+        number: int = 100,
+        repeat: int = 5,
+    ) -> None:
+        """Records the best time per call of `function`. If `setup` is given, `function` is called with a fresh
+        result of `setup` each time, made before the timer starts."""
+        if not self.wanted(name):
+            return
+        if self.quick:
+            number, repeat = max(1, number // 20), 1
+        best = None
+        for _ in range(repeat):
+            if setup is not None:
+                arguments = [setup() for _ in range(number)]
+                start = time.perf_counter()
+                for argument in arguments:
+                    function(argument)
+            else:
+                start = time.perf_counter()
+                for _ in range(number):
+                    function()
+            seconds = (time.perf_counter() - start) / number
+            best = seconds if best is None else min(best, seconds)
+        self.results[name] = {
+            "unit": "seconds",
+            "per_op": best,
+            "ops_per_second": 1 / best if best else None,
+            "number": number,
+            "repeat": repeat,
+        }
+
+    def memory(self, name: str, function: Callable[[], Any], count: int = 100) -> None:
+        """Records the memory held by whatever `function` returns, per item. `function` is called with the number of
+        items to make."""
+        if not self.wanted(name):
+            return
+        if self.quick:
+            count = max(2, count // 20)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            kept = function(count)
+            gc.collect()
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        del kept
+        self.results[name] = {"unit": "bytes", "per_item": size / count, "count": count}
+
+
+def _match_dto(id: int = fixtures.MATCH_ID) -> MatchDto:
+    body = fixtures.load("match")
+    body["info"]["gameId"] = id
+    return MatchAPI._to_match_dto(body, Continent.americas, id)
+
+
+def _loaded_match(data: MatchData) -> Match:
+    # What loading a Match through the pipeline does once the MatchData is in hand
+    match = Match._construct_normally(id=data.id, platform=data.platform)
+    match.__load_hook__(MatchData, data)
+    match._Ghost__set_loaded(MatchData)
+    return match
+
+
+def _match(id: int = fixtures.MATCH_ID) -> Match:
+    return _loaded_match(MatchTransformer().match_dto_to_data(_match_dto(id)))
+
+
+def _timeline_dto() -> dict:
+    return MatchAPI._to_timeline_dto(
+        fixtures.load("timeline"), Platform.north_america, fixtures.MATCH_ID
+    )
+
+
+def _touch_match(match: Match) -> None:
+    # Uses a little of every part of the match, like most analyses would
+    match.duration, match.queue
+    for participant in match.participants:
+        participant.side, participant.stats.kills, participant.stats.gold_earned
+    for team in match.teams:
+        team.win
+
+
+def transforms(runner: Runner) -> None:
+    transformer = MatchTransformer()
+    body = json.dumps(fixtures.load("match")).encode("utf-8")
+    timeline_body = json.dumps(fixtures.load("timeline")).encode("utf-8")
+
+    runner.time("decode.match", lambda: loads(body), number=200)
+    runner.time("decode.timeline", lambda: loads(timeline_body), number=20)
+
+    for suffix, settings in (("", {}), (".lazy", {"lazy_match_data": True})):
+        with _settings(**settings):
+            runner.time(
+                "transform.match.dto_to_data" + suffix,
+                transformer.match_dto_to_data,
+                setup=_match_dto,
+                number=100,
+            )
+            runner.time(
+                "transform.match.dto_to_core" + suffix,
+                lambda dto: _touch_match(
+                    _loaded_match(transformer.match_dto_to_data(dto))
+                ),
+                setup=_match_dto,
+                number=100,
+            )
+
+    for suffix, settings in (
+        ("", {}),
+        (".compact", {"compact_match_data": True}),
+        (".columnar", {"columnar_timeline_data": True}),
+    ):
+        with _settings(**settings):
+            runner.time(
+                "transform.timeline.dto_to_data" + suffix,
+                transformer.timeline_dto_to_data,
+                setup=_timeline_dto,
+                number=10,
+            )
+    runner.time(
+        "transform.timeline.json_to_data",
+        lambda: transformer.timeline_json_to_data(timeline_body),
+        number=10,
+    )
+
+
+def cache(runner: Runner) -> None:
+    count = 50 if runner.quick else 500
+    matches = [_match(fixtures.MATCH_ID + i) for i in range(count)]
+    queries = [
+        {"platform": Platform.north_america, "id": fixtures.MATCH_ID + i}
+        for i in range(count)
+    ]
+
+    for suffix, kwargs in (("", {}), (".bounded", {"max_bytes": 2**30})):
+        store = Cache(**kwargs)
+        items = iter(matches * 100)
+        runner.time(
+            "cache.put.match" + suffix,
+            lambda: store.put(Match, next(items)),
+            number=count,
+        )
+        for match in matches:
+            store.put(Match, match)
+        queries_ = iter(queries * 100)
+        runner.time(
+            "cache.get.match" + suffix,
+            lambda: store.get(Match, next(queries_)),
+            number=count,
+        )
+
+    store = Cache()
+    missing = {"platform": Platform.north_america, "id": 1}
+
+    def miss():
+        try:
+            store.get(Match, missing)
+        except Exception:
+            pass
+
+    runner.time("cache.get.miss", miss, number=count)
+
+
+def _stub_settings(server: StubServer) -> dict:
+    client = StubHTTPClient(server.url)
+    return {
+        "global": {"version_from_match": "latest", "default_region": "NA"},
+        "pipeline": {
+            "Cache": {},
+            "DDragon": {"http_client": client},
+            "RiotAPI": {"api_key": "RGAPI-benchmark", "http_client": client},
+        },
+        "logging": {"print_calls": False},
+    }
+
+
+def pipeline(runner: Runner) -> None:
+    id = fixtures.MATCH_ID
+    gets = {
+        "match": lambda: Match(id=id, region="NA").load(),
+        "timeline": lambda: Timeline(id=id, region="NA").load(),
+        "summoner": lambda: Summoner(puuid=fixtures.PUUID, region="NA").load(),
+        "versions": lambda: Versions(region="NA")[0],
+        "realms": lambda: Realms(region="NA").load(),
+    }
+    numbers = {"timeline": 10}
+    for name, get in gets.items():
+        number = numbers.get(name, 50)
+
+        def cold():
+            configuration.settings.clear_sinks()
+            get()
+
+        runner.time("pipeline.get.{}.cold".format(name), cold, number=number)
+        get()
+        runner.time("pipeline.get.{}.warm".format(name), get, number=number * 10)
+
+
+def timelines(runner: Runner) -> None:
+    match = Match(id=fixtures.MATCH_ID, region="NA")
+    timeline = match.timeline.load()
+    data = timeline._data[TimelineData]
+    participants = match.participants
+
+    runner.time("timeline.index", lambda: TimelineIndex(data), number=20)
+
+    def walk():
+        for frame in Timeline.from_data(data).frames:
+            for participant_frame in frame.participant_frames.values():
+                participant_frame.gold_earned, participant_frame.position.x
+            for event in frame.events:
+                event.type
+
+    runner.time("timeline.walk", walk, number=10)
+    runner.time(
+        "timeline.participant_events",
+        lambda: [len(p.timeline.champion_kills) for p in participants],
+        number=50,
+    )
+
+    def states():
+        for participant in participants:
+            states = CumulativeTimeline(participant.id, participant.timeline)
+            for minute in range(0, 30, 5):
+                state = states[datetime.timedelta(minutes=minute)]
+                state.kills, state.level, state.gold_earned
+
+    runner.time("timeline.cumulative_states", states, number=10)
+    runner.time(
+        "timeline.curves",
+        lambda: timeline.curves(["goldEarned", "experience"], format="python"),
+        number=50,
+    )
+    with _settings(columnar_timeline_data=True):
+        columnar = Timeline.from_data(
+            MatchTransformer().timeline_dto_to_data(_timeline_dto())
+        )
+    runner.time(
+        "timeline.curves.columnar",
+        lambda: columnar.curves(["goldEarned", "experience"], format="python"),
+        number=50,
+    )
+
+
+def memory(runner: Runner) -> None:
+    dtos = [_match_dto(fixtures.MATCH_ID + i) for i in range(100)]
+
+    def cached_matches(count):
+        store = Cache()
+        transformer = MatchTransformer()
+        for dto in dtos[:count]:
+            match = _loaded_match(transformer.match_dto_to_data(copy.deepcopy(dto)))
+            store.put(Match, match)
+        return store
+
+    runner.memory("memory.cached_match", cached_matches, count=100)
+    with _settings(lazy_match_data=True):
+        runner.memory("memory.cached_match.lazy", cached_matches, count=100)
+
+    timeline_dtos = [_timeline_dto() for _ in range(10)]
+
+    def cached_timelines(count):
+        store = Cache()
+        transformer = MatchTransformer()
+        for i, dto in enumerate(timeline_dtos[:count]):
+            dto = copy.deepcopy(dto)
+            dto["matchId"] = fixtures.MATCH_ID + i
+            store.put(
+                Timeline, Timeline.from_data(transformer.timeline_dto_to_data(dto))
+            )
+        return store
+
+    for suffix, settings in (
+        ("", {}),
+        (".compact", {"compact_match_data": True}),
+        (".columnar", {"columnar_timeline_data": True}),
+    ):
+        with _settings(**settings):
+            runner.memory("memory.cached_timeline" + suffix, cached_timelines, count=10)
+
+
+BENCHMARKS = [transforms, cache, pipeline, timelines, memory]
+
+
+def _environment() -> Dict[str, Any]:
+    try:
+        version = importlib.metadata.version("cassiopeia")
+    except importlib.metadata.PackageNotFoundError:
+        version = None
+    try:
+        commit = (
+            subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                capture_output=True,
+                text=True,
+                cwd=cassiopeia.__path__[0],
+                timeout=10,
+            ).stdout.strip()
+            or None
+        )
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "cassiopeia": version,
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "http_client": "pycurl" if datastores_common.USE_PYCURL else "requests",
+        "json_parser": datastores_common.JSON_PARSER,
+        "fixtures": {
+            name: "recorded" if fixtures.is_recorded(name) else "generated"
+            for name in ("match", "timeline", "summoner", "versions", "realms")
+        },
+    }
+
+
+def run(quick: bool = False, only: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Runs the benchmarks against the fixtures and returns the results in a JSON-serializable dict.
+
+    `quick` runs every benchmark only a few times, to check that they work. `only` limits the results to those
+    whose names start with one of the given prefixes, e.g. ["transform.", "cache.get"].
+    """
+    runner = Runner(quick=quick, only=only)
+    old_settings = configuration.settings
+    started = datetime.datetime.now(datetime.timezone.utc)
+    with StubServer() as server:
+        try:
+            cassiopeia.apply_settings(_stub_settings(server))
+            for benchmark in BENCHMARKS:
+                benchmark(runner)
+        finally:
+            configuration._settings = old_settings
+    return {
+        "format": FORMAT_VERSION,
+        "started": started.isoformat(),
+        "quick": quick,
+        "environment": _environment(),
+        "results": runner.results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any], results: Dict[str, Any], tolerance: float = 0.2
+) -> List[Dict[str, Any]]:
+    """Compares two `run` results. Returns one row per benchmark in both, with the ratio of the new value to the old
+    one (time per operation or bytes per item, so lower is better) and whether it's worse by more than `tolerance`.
+    """
+    rows = []
+    for name, new in results["results"].items():
+        old = baseline["results"].get(name, None)
+        if old is None or old["unit"] != new["unit"]:
+            continue
+        key = "per_op" if new["unit"] == "seconds" else "per_item"
+        ratio = new[key] / old[key] if old[key] else None
+        rows.append(
+            {
+                "name": name,
+                "unit": new["unit"],
+                "old": old[key],
+                "new": new[key],
+                "ratio": ratio,
+                "regressed": ratio is not None and ratio > 1 + tolerance,
+            }
+        )
+    return rows
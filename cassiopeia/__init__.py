@@ -36,7 +36,13 @@ from .cassiopeia import (
     get_champion_rotations,
     get_paginated_league_entries,
 )
-from .cassiopeia import apply_settings, set_riot_api_key, print_calls, _get_pipeline
+from .cassiopeia import (
+    apply_settings,
+    set_riot_api_key,
+    print_calls,
+    set_instrumentation,
+    _get_pipeline,
+)
 from .core import (
     Champion,
     Champions,
@@ -71,6 +77,9 @@ from .core import (
     ChampionRotation,
     LeagueSummonerEntries,
     CurrentMatch,
+    participant_columns,
+    team_columns,
+    resolve_static_data,
 )
 from .data import (
     Queue,
@@ -0,0 +1,115 @@
+import threading
+from enum import Enum
+from typing import Any, Hashable, Mapping, Optional, Type, TypeVar
+
+from datapipelines import DataPipeline, NotFoundError
+
+T = TypeVar("T")
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, (str, int, float, bool, Enum)) or value is None:
+        return value
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    raise TypeError("Can't freeze {}".format(type(value).__name__))
+
+
+def _flight_key(type: Type[T], query: Mapping[str, Any]) -> Optional[Hashable]:
+    # Queries with values that can't be compared (e.g. generators) aren't coalesced
+    try:
+        return type, _freeze(query)
+    except TypeError:
+        return None
+
+
+class _Flight(object):
+    # A get that other threads with the same query are waiting on
+    __slots__ = ("thread", "done", "result", "error")
+
+    def __init__(self) -> None:
+        self.thread = threading.get_ident()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class CassiopeiaPipeline(DataPipeline):
+    """A `DataPipeline` that remembers what couldn't be found, and doesn't get the same thing twice at once.
+
+    When no source has the object for a query, every sink that can record it (one with `is_not_found` and
+    `put_not_found` methods, like the `Cache` and the `SQLiteStore`) stores the query as not found, with its own
+    expiration for each type. Until that expires, getting the same query raises `NotFoundError` without asking the
+    sources again. Clearing or expiring a type in the sinks also clears or expires what wasn't found.
+
+    When several threads get the same type with the same query at once, only the first asks the stores; the others
+    wait for it and get the same object (or the same error).
+
+    Only `get` does either; `get_many` is the same as in `DataPipeline`.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._not_found_sinks = [
+            sink
+            for sink in self._sinks
+            if hasattr(sink, "is_not_found") and hasattr(sink, "put_not_found")
+        ]
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+
+    def get(self, type: Type[T], query: Mapping[str, Any]) -> T:
+        key = _flight_key(type, query)
+        if key is None:
+            return self._get(type, query)
+
+        with self._flights_lock:
+            flight = self._flights.get(key, None)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                leader = True
+            else:
+                # The same query nested inside itself on one thread would wait forever, so it's just made again
+                leader = False
+                follow = flight.thread != threading.get_ident()
+
+        if not leader:
+            if not follow:
+                return self._get(type, query)
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self._get(type, query)
+            return flight.result
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _get(self, type: Type[T], query: Mapping[str, Any]) -> T:
+        if not self._not_found_sinks:
+            return super().get(type, query)
+
+        for sink in self._not_found_sinks:
+            if sink.is_not_found(type, query):
+                raise NotFoundError(
+                    "No source returned a query result! (Cached by {})".format(
+                        sink.__class__.__name__
+                    )
+                )
+        try:
+            return super().get(type, query)
+        except NotFoundError:
+            for sink in self._not_found_sinks:
+                sink.put_not_found(type, query)
+            raise
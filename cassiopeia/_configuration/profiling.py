@@ -0,0 +1,295 @@
+import threading
+import time
+from collections import defaultdict
+from copy import deepcopy
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Type, TypeVar
+
+from datapipelines import NotFoundError, NoConversionError, PipelineContext
+from datapipelines.pipelines import _SourceHandler
+
+from .pipeline import CassiopeiaPipeline
+
+T = TypeVar("T")
+
+_PROFILE = "profile"  # The PipelineContext key of the current request's _Request
+
+
+def _hops(transform: Any) -> int:
+    # The pipeline's transforms are either the identity or a partial over a chain of (transformer, type) pairs
+    keywords = getattr(transform, "keywords", None) or {}
+    return len(keywords.get("transformer_chain", ()))
+
+
+class _Request(object):
+    # The measurements of one get or get_many
+    __slots__ = ("misses", "store", "source", "transform", "sinks", "hops", "coalesced")
+
+    def __init__(self) -> None:
+        self.misses = []  # (store, seconds) of each store that didn't have the object
+        self.store = None
+        self.source = 0.0
+        self.transform = 0.0
+        self.sinks = 0.0
+        self.hops = 0
+        self.coalesced = (
+            False  # Whether another thread's identical request was waited on instead
+        )
+
+
+class _ProfiledSourceHandler(_SourceHandler):
+    # The same as _SourceHandler, but records how long each step takes in the request's _Request
+
+    def get(self, query: Mapping[str, Any], context=None) -> T:
+        request = context.get(_PROFILE, None) if context is not None else None
+        if request is None:
+            return super().get(query, context)
+        start = time.perf_counter()
+        try:
+            result = self._source.get(self._source_type, deepcopy(query), context)
+        except NotFoundError:
+            request.misses.append(
+                (type(self._source).__name__, time.perf_counter() - start)
+            )
+            raise
+        fetched = time.perf_counter()
+        for sink in self._before_transform:
+            sink.put(result, context)
+        before = time.perf_counter()
+        result = self._transform(data=result, context=context)
+        transformed = time.perf_counter()
+        for sink in self._after_transform:
+            sink.put(result, context)
+        after = time.perf_counter()
+
+        request.store = type(self._source).__name__
+        request.source = fetched - start
+        request.sinks = (before - fetched) + (after - transformed)
+        request.transform = transformed - before
+        request.hops = _hops(self._transform)
+        return result
+
+    def get_many(
+        self, query: Mapping[str, Any], context=None, streaming: bool = False
+    ) -> Iterable[T]:
+        request = context.get(_PROFILE, None) if context is not None else None
+        if request is None:
+            return super().get_many(query, context, streaming)
+        start = time.perf_counter()
+        try:
+            result = self._source.get_many(self._source_type, deepcopy(query), context)
+        except NotFoundError:
+            request.misses.append(
+                (type(self._source).__name__, time.perf_counter() - start)
+            )
+            raise
+        request.store = type(self._source).__name__
+        request.hops = _hops(self._transform)
+        if streaming:
+            # The items are fetched, transformed, and stored as they're iterated over, which isn't measured
+            request.source = time.perf_counter() - start
+            return self._get_many_generator(result)
+
+        result = list(result)
+        fetched = time.perf_counter()
+        for sink in self._before_transform:
+            sink.put_many(result, context)
+        before = time.perf_counter()
+        result = [self._transform(data=item, context=context) for item in result]
+        transformed = time.perf_counter()
+        for sink in self._after_transform:
+            sink.put_many(result, context)
+        after = time.perf_counter()
+
+        request.source = fetched - start
+        request.sinks = (before - fetched) + (after - transformed)
+        request.transform = transformed - before
+        return result
+
+
+class _TypeProfile(object):
+    def __init__(self) -> None:
+        self.requests = 0
+        self.not_found = 0
+        self.coalesced = 0
+        self.misses = 0
+        self.seconds = 0.0
+        self.source_seconds = 0.0
+        self.transform_seconds = 0.0
+        self.sink_seconds = 0.0
+        self.transform_hops = 0
+        self.stores = defaultdict(
+            lambda: {"served": 0, "seconds": 0.0, "missed": 0, "miss_seconds": 0.0}
+        )
+
+    def add(self, request: _Request, seconds: float) -> None:
+        self.requests += 1
+        self.seconds += seconds
+        self.misses += len(request.misses)
+        for store, miss_seconds in request.misses:
+            self.stores[store]["missed"] += 1
+            self.stores[store]["miss_seconds"] += miss_seconds
+        if request.coalesced:
+            self.coalesced += 1
+            return
+        if request.store is None:
+            self.not_found += 1
+            return
+        self.source_seconds += request.source
+        self.transform_seconds += request.transform
+        self.sink_seconds += request.sinks
+        self.transform_hops += request.hops
+        self.stores[request.store]["served"] += 1
+        self.stores[request.store]["seconds"] += request.source
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "not_found": self.not_found,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "seconds": self.seconds,
+            "source_seconds": self.source_seconds,
+            "transform_seconds": self.transform_seconds,
+            "sink_seconds": self.sink_seconds,
+            "transform_hops": self.transform_hops,
+            "stores": {store: dict(stats) for store, stats in self.stores.items()},
+        }
+
+
+class ProfilingDataPipeline(CassiopeiaPipeline):
+    """A `DataPipeline` that records, for each type requested with `get` or `get_many`, which store returned it, how
+    many stores didn't have it first, and how long was spent in the stores, transforming the result, and putting it
+    into the sinks. Requests answered by a sink that recently recorded the query as not found count as "not_found"
+    without any misses, and those that waited for the same request on another thread count as "coalesced".
+
+    A store's time includes validating the query and computing its keys. Nested requests (e.g. for the latest version
+    while loading a champion) are recorded separately, and their time is also part of the request that made them.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._profiles = defaultdict(_TypeProfile)
+        self._profiles_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _create_source_handlers(self, type: Type[T]) -> List[_SourceHandler]:
+        profiled = []
+        for handler in super()._create_source_handlers(type):
+            sinks = {sink: False for sink in handler._before_transform}
+            sinks.update({sink: True for sink in handler._after_transform})
+            profiled.append(
+                _ProfiledSourceHandler(
+                    handler._source, handler._source_type, handler._transform, sinks
+                )
+            )
+        return profiled
+
+    def _new_context(self) -> PipelineContext:
+        context = super()._new_context()
+        # Puts make contexts too, outside of any get or get_many
+        requests = getattr(self._local, "requests", None)
+        if requests:
+            context[_PROFILE] = requests[-1]
+        return context
+
+    def _record(self, type: Type[T], request: _Request, start: float) -> None:
+        seconds = time.perf_counter() - start
+        with self._profiles_lock:
+            self._profiles[type].add(request, seconds)
+
+    def _profiled(self, get: Callable[..., Any], type: Type[T], *args) -> Any:
+        # Nested requests are made on the same thread while the outer one is still running, so each thread keeps a
+        # stack of its current requests and new contexts get the innermost one
+        try:
+            requests = self._local.requests
+        except AttributeError:
+            requests = self._local.requests = []
+        request = _Request()
+        requests.append(request)
+        start = time.perf_counter()
+        try:
+            result = get(type, *args)
+            request.coalesced = request.store is None
+            return result
+        except NoConversionError:
+            request = None
+            raise
+        finally:
+            requests.pop()
+            if request is not None:
+                self._record(type, request, start)
+
+    def get(self, type: Type[T], query: Mapping[str, Any]) -> T:
+        return self._profiled(super().get, type, query)
+
+    def get_many(
+        self, type: Type[T], query: Mapping[str, Any], streaming: bool = False
+    ) -> Iterable[T]:
+        return self._profiled(super().get_many, type, query, streaming)
+
+    def profile(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the totals recorded so far for each requested type, keyed by the type's name.
+
+        Each has the number of "requests", how many were "not_found" by any store, how many were "coalesced" with the
+        same request on another thread, the total number of "misses" (stores that didn't have the object before one
+        did), and the total "seconds" taken, split into "source_seconds", "transform_seconds" and "sink_seconds" for
+        the requests that were found. "transform_hops"
+        is the total number of transformations made, and "stores" has, for each store, how many requests it
+        "served" and the "seconds" it took to, and how many it "missed" and the "miss_seconds" it took to.
+        """
+        with self._profiles_lock:
+            return {
+                type.__name__: profile.to_dict()
+                for type, profile in self._profiles.items()
+            }
+
+    def reset_profile(self) -> None:
+        with self._profiles_lock:
+            self._profiles.clear()
+
+    def format_profile(self) -> str:
+        """The profile as a table, with the average time per request of each type in milliseconds."""
+        rows = [
+            (
+                "type",
+                "requests",
+                "served by",
+                "misses",
+                "total ms",
+                "source ms",
+                "transform ms",
+                "sink ms",
+                "hops",
+            )
+        ]
+        for name, profile in sorted(self.profile().items()):
+            requests = profile["requests"]
+            found = (requests - profile["not_found"] - profile["coalesced"]) or 1
+            served = ", ".join(
+                "{} {}".format(store, stats["served"])
+                for store, stats in sorted(
+                    profile["stores"].items(), key=lambda item: -item[1]["served"]
+                )
+                if stats["served"]
+            )
+            rows.append(
+                (
+                    name,
+                    str(requests),
+                    served or "-",
+                    "{:.2f}".format(profile["misses"] / requests),
+                    "{:.3f}".format(1000 * profile["seconds"] / requests),
+                    "{:.3f}".format(1000 * profile["source_seconds"] / found),
+                    "{:.3f}".format(1000 * profile["transform_seconds"] / found),
+                    "{:.3f}".format(1000 * profile["sink_seconds"] / found),
+                    "{:.2f}".format(profile["transform_hops"] / found),
+                )
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if i < 3 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in rows
+        )
@@ -12,6 +12,8 @@ from datapipelines import (
     DataTransformer,
 )
 
+from .pipeline import CassiopeiaPipeline
+
 T = TypeVar("T")
 
 logging.basicConfig(
@@ -21,9 +23,22 @@ logging.basicConfig(
 )
 
 
-def create_pipeline(service_configs: Dict, verbose: int = 0) -> DataPipeline:
+def create_pipeline(
+    service_configs: Dict,
+    verbose: int = 0,
+    http_config: Dict = None,
+    profile: bool = False,
+) -> DataPipeline:
     transformers = []
 
+    # All of the stores that make HTTP requests share one client (and so one connection pool) unless their config
+    # supplies their own.
+    from ..datastores.common import HTTPClient
+
+    if http_config is None:
+        http_config = get_default_config()["http"]
+    http_client = HTTPClient(**http_config)
+
     # Always use the Riot API transformers
     from ..transformers import __transformers__ as riotapi_transformer
 
@@ -37,6 +52,8 @@ def create_pipeline(service_configs: Dict, verbose: int = 0) -> DataPipeline:
             package = "cassiopeia.datastores"
         module = importlib.import_module(name=package)
         store_cls = getattr(module, store_name)
+        if "http_client" in inspect.signature(store_cls).parameters:
+            config = {"http_client": http_client, **config}
         store = store_cls(**config)
         services.append(store)
         service_transformers = getattr(module, "__transformers__", [])
@@ -63,9 +80,14 @@ def create_pipeline(service_configs: Dict, verbose: int = 0) -> DataPipeline:
             # Insert the ghost store at the beginning of the pipeline
             services.insert(0, UnloadedGhostStore())
 
-    services.append(MerakiAnalyticsCDN())
-    services.append(LolWikia())
-    pipeline = DataPipeline(services, transformers)
+    services.append(MerakiAnalyticsCDN(http_client=http_client))
+    services.append(LolWikia(http_client=http_client))
+    if profile:
+        from .profiling import ProfilingDataPipeline
+
+        pipeline = ProfilingDataPipeline(services, transformers)
+    else:
+        pipeline = CassiopeiaPipeline(services, transformers)
 
     # Manually put the cache on the pipeline.
     for datastore in services:
@@ -119,16 +141,24 @@ def register_transformer_conversion(transformer: DataTransformer, from_type, to_
 
 def get_default_config():
     return {
-        "global": {"version_from_match": "patch"},
+        "global": {
+            "version_from_match": "patch",
+            "lazy_match_data": False,
+            "compact_match_data": False,
+            "columnar_timeline_data": False,
+            "profile_pipeline": False,
+        },
         "plugins": {},
         "pipeline": {
             "Cache": {},
             "DDragon": {},
             "RiotAPI": {"api_key": "$RIOT_API_KEY"},
         },
+        "http": {"pool_size": 10, "http2": True},
         "logging": {
             "print_calls": True,
             "print_riot_api_key": False,
+            "instrumentation": None,
             "default": "WARNING",
             "core": "WARNING",
         },
@@ -142,12 +172,26 @@ class Settings(object):
         self.__version_from_match = globals_.get(
             "version_from_match", _defaults["global"]["version_from_match"]
         )  # Valid json values are: "version", "patch", and null
+        self.__lazy_match_data = globals_.get(
+            "lazy_match_data", _defaults["global"]["lazy_match_data"]
+        )
+        self.__compact_match_data = globals_.get(
+            "compact_match_data", _defaults["global"]["compact_match_data"]
+        )
+        self.__columnar_timeline_data = globals_.get(
+            "columnar_timeline_data", _defaults["global"]["columnar_timeline_data"]
+        )
+        self.__profile_pipeline = globals_.get(
+            "profile_pipeline", _defaults["global"]["profile_pipeline"]
+        )
 
         self.__plugins = settings.get("plugins", _defaults["plugins"])
 
         self.__pipeline_args = settings.get("pipeline", _defaults["pipeline"])
         self.__pipeline = None  # type: DataPipeline
 
+        self.__http_args = settings.get("http", _defaults["http"])
+
         logging_config = settings.get("logging", _defaults["logging"])
         self.__default_print_calls = logging_config.get(
             "print_calls", _defaults["logging"]["print_calls"]
@@ -155,6 +199,9 @@ class Settings(object):
         self.__default_print_riot_api_key = logging_config.get(
             "print_riot_api_key", _defaults["logging"]["print_riot_api_key"]
         )
+        self.__instrumentation = logging_config.get(
+            "instrumentation", _defaults["logging"]["instrumentation"]
+        )
         for name in ["default", "core"]:
             logger = logging.getLogger(name)
             level = logging_config.get(name, _defaults["logging"][name])
@@ -176,7 +223,10 @@ class Settings(object):
     def pipeline(self) -> DataPipeline:
         if self.__pipeline is None:
             self.__pipeline = create_pipeline(
-                service_configs=self.__pipeline_args, verbose=0
+                service_configs=self.__pipeline_args,
+                verbose=0,
+                http_config=self.__http_args,
+                profile=self.__profile_pipeline,
             )
         return self.__pipeline
 
@@ -184,6 +234,22 @@ class Settings(object):
     def version_from_match(self):
         return self.__version_from_match
 
+    @property
+    def lazy_match_data(self):
+        return self.__lazy_match_data
+
+    @property
+    def compact_match_data(self):
+        return self.__compact_match_data
+
+    @property
+    def columnar_timeline_data(self):
+        return self.__columnar_timeline_data
+
+    @property
+    def profile_pipeline(self):
+        return self.__profile_pipeline
+
     @property
     def plugins(self):
         return self.__plugins
@@ -212,6 +278,10 @@ class Settings(object):
             for type_ in types:
                 sink.clear(type_)
 
+        from ..core.match import _clear_static_data_indexes
+
+        _clear_static_data_indexes()
+
     def expire_sinks(self, type_: Type[T] | None = None):
         types = {type_}
         if type_ is not None:
@@ -1,4 +1,4 @@
-from typing import List, Set, Dict, Union, TextIO
+from typing import List, Set, Dict, Union, TextIO, Optional
 import arrow
 import datetime
 
@@ -38,11 +38,13 @@ from .core import (
     Patch,
     ChampionRotation,
 )
+from .core.match import _clear_static_data_indexes
 from .datastores import common as _common_datastore
+from .datastores import instrumentation as _instrumentation
+from .datastores.instrumentation import Instrumentation, create_instrumentation
 from ._configuration import Settings, load_config, get_default_config
 from . import configuration
 
-
 # Settings endpoints
 
 
@@ -66,9 +68,18 @@ def apply_settings(config: Union[str, TextIO, Dict, Settings]):
         settings._Settings__default_print_calls,
         settings._Settings__default_print_riot_api_key,
     )
+    # The new settings decide the instrumentation, and whatever was measuring before is done
+    previous = _instrumentation.current
+    if settings._Settings__instrumentation is not None:
+        set_instrumentation(create_instrumentation(settings._Settings__instrumentation))
+    else:
+        set_instrumentation(None)
+    if previous is not None and previous is not _instrumentation.current:
+        previous.close()
 
-    # Overwrite the old settings
+    # Overwrite the old settings, and forget the static data that was loaded with them
     configuration._settings = settings
+    _clear_static_data_indexes()
 
     # Initialize the pipeline immediately
     _ = configuration.settings.pipeline
@@ -83,6 +94,10 @@ def print_calls(calls: bool, api_key: bool = False):
     _common_datastore._print_api_key = api_key
 
 
+def set_instrumentation(instrumentation: Optional[Instrumentation]):
+    _instrumentation.set_instrumentation(instrumentation)
+
+
 # Data endpoints
 
 
@@ -123,6 +138,9 @@ def get_match_history(
     type: MatchType = None,
     start: int = None,
     count: int = None,
+    prefetch: int = None,
+    prefetch_concurrency: int = None,
+    prefetch_timelines: bool = None,
 ):
     return MatchHistory(
         continent=continent,
@@ -133,6 +151,9 @@ def get_match_history(
         end_time=end_time,
         queue=queue,
         type=type,
+        prefetch=prefetch,
+        prefetch_concurrency=prefetch_concurrency,
+        prefetch_timelines=prefetch_timelines,
     )
 
 
@@ -20,7 +20,8 @@ from .champion import ChampionRotation
 from .summoner import Summoner
 from .account import Account
 from .championmastery import ChampionMastery, ChampionMasteries
-from .match import Match, MatchHistory
+from .match import Match, MatchHistory, resolve_static_data
+from .matchstats import participant_columns, team_columns
 from .spectator import CurrentMatch, FeaturedMatches
 from .status import ShardStatus
 from .league import (
@@ -58,6 +59,9 @@ __all__ = [
     "ChampionMasteries",
     "Match",
     "MatchHistory",
+    "resolve_static_data",
+    "participant_columns",
+    "team_columns",
     "CurrentMatch",
     "FeaturedMatches",
     "ShardStatus",
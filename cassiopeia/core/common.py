@@ -9,14 +9,13 @@ import datetime
 import inspect
 
 from merakicommons.ghost import Ghost, ghost_load_on as _ghost_load_on
-from merakicommons.container import SearchableLazyList
+from merakicommons.container import SearchableLazyList, SearchError
 
 from .. import configuration
 from ..data import Region, Platform
 
 import json  # Can't use ujson here because of the encoder
 
-
 LOGGER = logging.getLogger("core")
 
 
@@ -34,6 +33,9 @@ def get_latest_version(region: Union[Region, str], endpoint: Optional[str]):
 
 
 class CoreData(object):
+    __slots__ = ()  # Lets subclasses opt out of a __dict__
+    _data_type = None  # Set by variants of a data type to the type they stand in for
+
     @property
     @abstractclassmethod
     def _renamed(cls) -> Mapping[str, str]:
@@ -129,13 +131,14 @@ class CassiopeiaObject(object):
         assert data is not None
         self = cls()
 
-        if data.__class__ not in self._data_types:
+        data_type = data._data_type or data.__class__
+        if data_type not in self._data_types:
             raise TypeError(
                 "Wrong data type '{}' passed to '{}.from_data'".format(
                     data.__class__.__name__, self.__class__.__name__
                 )
             )
-        self._data[data.__class__] = data
+        self._data[data_type] = data
         return self
 
     def __call__(self, **kwargs) -> "CassiopeiaObject":
@@ -293,13 +296,14 @@ class CassiopeiaGhost(CassiopeiaPipelineObject, Ghost):
 
         # Make spots for the data and put it in
         self._data = {_type: None for _type in self._data_types}
-        if data.__class__ not in self._data_types:
+        data_type = data._data_type or data.__class__
+        if data_type not in self._data_types:
             raise TypeError(
                 "Wrong data type '{}' passed to '{}.from_data'".format(
                     data.__class__.__name__, self.__class__.__name__
                 )
             )
-        self._data[data.__class__] = data
+        self._data[data_type] = data
 
         # Set as loaded
         if loaded_groups is None:
@@ -319,6 +323,13 @@ class CassiopeiaGhost(CassiopeiaPipelineObject, Ghost):
 
 
 class CassiopeiaLazyList(SearchableLazyList, CassiopeiaPipelineObject):
+    # The searchable attributes of the elements to index, by the type of value they're searched with (e.g.
+    # {int: ["id"]}). Only attributes that are the elements' sole searchable attribute for that type can be indexed,
+    # so that `find` and `contains` give the same answer from the index as from searching the elements one by one.
+    # The index is built the first time it's needed, which generates the whole list. `search`, and finding other
+    # values, still go through the elements one by one.
+    _index_keys = {}
+
     def __init__(self, *args, **kwargs):
         if "generator" in kwargs:
             generator = kwargs.pop("generator")
@@ -355,6 +366,79 @@ class CassiopeiaLazyList(SearchableLazyList, CassiopeiaPipelineObject):
     def __str__(self):
         return SearchableLazyList.__str__(self)
 
+    def _build_index(self) -> Mapping[type, Mapping]:
+        if not self._empty:
+            self._generate_more()
+        index = {type_: {} for type_ in self._index_keys}
+        for element in list.__iter__(self):
+            for type_, attributes in self._index_keys.items():
+                for attribute in attributes:
+                    try:
+                        value = getattr(element, attribute)
+                    except AttributeError:
+                        continue
+                    if type(value) is not type_:
+                        continue
+                    elements = index[type_].setdefault(value, [])
+                    if not elements or elements[-1] is not element:
+                        elements.append(element)
+        self._index = index
+        return index
+
+    def _lookup(self, item) -> Optional[list]:
+        # The elements with an indexed attribute equal to `item`, in order, or None if `item` isn't indexed
+        if type(item) not in self._index_keys:
+            return None
+        index = getattr(self, "_index", None)
+        if index is None:
+            index = self._build_index()
+        return index[type(item)].get(item, [])
+
+    def find(self, item, reverse: bool = False):
+        elements = self._lookup(item)
+        if elements is None:
+            return SearchableLazyList.find(self, item, reverse=reverse)
+        if not elements:
+            raise SearchError(str(item))
+        return elements[-1] if reverse else elements[0]
+
+    def contains(self, item) -> bool:
+        elements = self._lookup(item)
+        if elements is None:
+            return SearchableLazyList.contains(self, item)
+        return bool(elements)
+
+
+def _drops_index(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._index = None
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+# Anything that changes the list's elements or their order invalidates the index
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(
+        CassiopeiaLazyList,
+        _name,
+        _drops_index(getattr(CassiopeiaLazyList, _name)),
+    )
+del _name
+
 
 class CassiopeiaJsonEncoder(json.JSONEncoder):
     def default(self, obj):
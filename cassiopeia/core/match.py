@@ -1,9 +1,30 @@
+import bisect
 import functools
 import arrow
 import datetime
 import itertools
+import threading
+from array import array
 from collections import Counter
-from typing import List, Dict, Union, Generator, Optional
+from typing import (
+    Any,
+    List,
+    Dict,
+    Iterable,
+    Mapping,
+    Sequence,
+    Tuple,
+    Union,
+    Generator,
+    Optional,
+)
+
+try:
+    import numpy
+
+    NUMPY_INSTALLED = True
+except ImportError:
+    NUMPY_INSTALLED = False
 
 from datapipelines import NotFoundError  # type: ignore
 from merakicommons.cache import lazy, lazy_property  # type: ignore
@@ -14,7 +35,7 @@ from merakicommons.container import (  # type: ignore
 )
 
 from .. import configuration
-from .staticdata import Versions
+from .staticdata import Versions, Champions, Items, Runes, SummonerSpells
 from ..data import (
     Region,
     Platform,
@@ -37,6 +58,7 @@ from .common import (
     CassiopeiaGhost,
     CassiopeiaLazyList,
     ghost_load_on,
+    get_latest_version,
 )
 from ..dto import match as dto
 from .patch import Patch
@@ -122,6 +144,121 @@ def _choose_staticdata_version(match: "Match") -> Optional[str]:
     return version
 
 
+_static_data_indexes = {}
+_static_data_indexes_lock = threading.Lock()
+
+
+def _clear_static_data_indexes():
+    # Called when the cached data (or the settings it came from) is dropped, so the indexes don't keep it alive
+    with _static_data_indexes_lock:
+        _static_data_indexes.clear()
+
+
+class StaticDataIndex(object):
+    """The champions, items, runes, and summoner spells of one region and version of the static data.
+
+    Each id is only looked up in the pipeline once; after that the same object is returned for it, so the participants
+    of every match played on a version share their static data objects. Use `StaticDataIndex.for_match` or
+    `resolve_static_data` rather than creating these directly.
+    """
+
+    def __init__(self, region: Region, version: str):
+        self.region = region
+        self.version = version
+        self._objects = {Champion: {}, Item: {}, Rune: {}, SummonerSpell: {}}
+        self._lists = {
+            Champion: Champions,
+            Item: Items,
+            Rune: Runes,
+            SummonerSpell: SummonerSpells,
+        }
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_version(cls, region: Union[Region, str], version: str) -> "StaticDataIndex":
+        region = Region(region)
+        with _static_data_indexes_lock:
+            try:
+                return _static_data_indexes[(region, version)]
+            except KeyError:
+                index = cls(region, version)
+                _static_data_indexes[(region, version)] = index
+                return index
+
+    @classmethod
+    def for_match(cls, match: "Match") -> "StaticDataIndex":
+        version = _choose_staticdata_version(match)
+        if version is None:
+            # This is what each object would have used, but it's only looked up once here
+            version = get_latest_version(region=match.region, endpoint=None)
+        return cls.for_version(match.region, version)
+
+    def get(self, type: type, id: int):
+        objects = self._objects[type]
+        try:
+            return objects[id]
+        except KeyError:
+            pass
+        obj = type(id=id, version=self.version, region=self.region)
+        with self._lock:
+            return objects.setdefault(id, obj)
+
+    def get_many(self, type: type, ids: List[int]) -> List:
+        return [self.get(type, id) if id else None for id in ids]
+
+    def load(self) -> "StaticDataIndex":
+        """Loads the champion, item, rune, and summoner spell lists (one pipeline call each) and indexes every object
+        in them, so that none of the objects returned afterwards need to be loaded individually.
+        """
+        if self._loaded:
+            return self
+        for type, list_type in self._lists.items():
+            loaded = list_type(region=self.region, version=self.version)
+            with self._lock:
+                for obj in loaded:
+                    self._objects[type].setdefault(obj.id, obj)
+        self._loaded = True
+        return self
+
+
+def resolve_static_data(
+    matches: Union["Match", List["Match"]], load: bool = False
+) -> List[StaticDataIndex]:
+    """Resolves the champions, items, runes, and summoner spells of every participant (and the bans) of `matches` in
+    one pass, and returns the `StaticDataIndex` of each static data version they were played on.
+
+    Afterwards, `Participant.champion`, `.runes`, `.stat_runes`, `.summoner_spell_d`, `.summoner_spell_f`,
+    `ParticipantStats.items` and `Team.bans` are all dictionary lookups that return shared objects. If `load` is True,
+    the static data lists are also loaded (once per version), so the objects themselves are loaded too.
+    """
+    if isinstance(matches, Match):
+        matches = [matches]
+    indexes = {}
+    for match in matches:
+        match.load()
+        index = match._static_data
+        if load and id(index) not in indexes:
+            index.load()
+        indexes[id(index)] = index
+        # Use the ids in the data rather than the participants' properties, which would load the runes
+        for participant in match._data[MatchData].participants:
+            index.get(Champion, participant.championId)
+            index.get(SummonerSpell, participant.summonerSpellDId)
+            index.get(SummonerSpell, participant.summonerSpellFId)
+            index.get_many(Rune, participant.perks)
+            index.get_many(Rune, participant.stat_perks.values())
+            index.get_many(
+                Item,
+                [getattr(participant.stats, "item{}".format(i), 0) for i in range(7)],
+            )
+        for team in match._data[MatchData].teams:
+            index.get_many(
+                Champion, [ban.championId for ban in team.bans if ban.championId != -1]
+            )
+    return list(indexes.values())
+
+
 ##############
 # Data Types #
 ##############
@@ -132,11 +269,114 @@ class MatchListData(CoreDataList):
     _renamed = {}
 
 
-class PositionData(CoreData):
+_shapes = {(): {}}
+_shape_transitions = {}
+_shapes_lock = threading.Lock()
+
+
+def _shape(names: Tuple[str, ...]) -> Dict[str, int]:
+    # Every sequence of attribute names has one name -> index mapping, which is shared by every object with those names
+    try:
+        return _shapes[names]
+    except KeyError:
+        pass
+    with _shapes_lock:
+        return _shapes.setdefault(
+            names, {name: index for index, name in enumerate(names)}
+        )
+
+
+def _add_key(keys: Dict[str, int], name: str) -> Dict[str, int]:
+    # `keys` must be one of the mappings in `_shapes`, which live forever, so their ids are never reused
+    try:
+        return _shape_transitions[(id(keys), name)]
+    except KeyError:
+        pass
+    new_keys = _shape(tuple(keys) + (name,))
+    with _shapes_lock:
+        _shape_transitions[(id(keys), name)] = new_keys
+    return new_keys
+
+
+class _CompactCoreData(CoreData):
+    # Stores the attributes in a tuple (`_values`) instead of a __dict__, and looks their names up in a name -> index
+    # mapping (`_keys`) that is shared by every object with the same attributes. The frames of a timeline have tens
+    # of thousands of events, participant frames, and positions, and this is smaller than a dict for each,
+    # especially when the objects don't all have their attributes in the same order.
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self, **kwargs):
+        object.__setattr__(self, "_keys", _shapes[()])
+        object.__setattr__(self, "_values", ())
+        super().__init__(**kwargs)
+
+    def __call__(self, **kwargs):
+        keys = self._keys
+        values = list(self._values)
+        for key, value in kwargs.items():
+            name = self._renamed.get(key, key)
+            index = keys.get(name, None)
+            if index is None:
+                keys = _add_key(keys, name)
+                values.append(value)
+            else:
+                values[index] = value
+        object.__setattr__(self, "_keys", keys)
+        object.__setattr__(self, "_values", tuple(values))
+        return self
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in ("_keys", "_values"):
+            object.__setattr__(self, name, value)
+            return
+        keys = self._keys
+        index = keys.get(name, None)
+        if index is None:
+            object.__setattr__(self, "_keys", _add_key(keys, name))
+            object.__setattr__(self, "_values", self._values + (value,))
+        else:
+            values = list(self._values)
+            values[index] = value
+            object.__setattr__(self, "_values", tuple(values))
+
+    def __getattr__(self, name: str):
+        if name.startswith("__") or name in ("_keys", "_values"):
+            raise AttributeError(name)
+        try:
+            return self._values[self._keys[name]]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __dir__(self):
+        return list(super().__dir__()) + list(self._keys)
+
+    # Pickling and copying would otherwise give the copy its own `_keys`, which isn't shared or in `_shapes`
+    def __getstate__(self):
+        return tuple(self._keys), self._values
+
+    def __setstate__(self, state) -> None:
+        names, values = state
+        object.__setattr__(self, "_keys", _shape(names))
+        object.__setattr__(self, "_values", values)
+
+
+def _new_data(data_type: type, **kwargs) -> CoreData:
+    # Uses the columnar version of `data_type` if the `columnar_timeline_data` setting is on, or its compact version
+    # if the `compact_match_data` setting is on
+    if data_type is TimelineData and configuration.settings.columnar_timeline_data:
+        data_type = ColumnarTimelineData
+    elif configuration.settings.compact_match_data:
+        data_type = _compact_data_types.get(data_type, data_type)
+    return data_type(**kwargs)
+
+
+class _PositionData(CoreData):
+    __slots__ = ()
     _renamed = {}
 
 
-class EventData(CoreData):
+class _EventData(CoreData):
+    __slots__ = ()
     _renamed = {
         "eventType": "type",
         "teamId": "side",
@@ -147,12 +387,13 @@ class EventData(CoreData):
 
     def __call__(self, **kwargs):
         if "position" in kwargs:
-            self.position = PositionData(**kwargs.pop("position"))
+            self.position = _new_data(PositionData, **kwargs.pop("position"))
         super().__call__(**kwargs)
         return self
 
 
-class ParticipantFrameData(CoreData):
+class _ParticipantFrameData(CoreData):
+    __slots__ = ()
     _renamed = {
         "totalGold": "goldEarned",
         "minionsKilled": "creepScore",
@@ -162,37 +403,272 @@ class ParticipantFrameData(CoreData):
 
     def __call__(self, **kwargs):
         if "position" in kwargs:
-            self.position = PositionData(**kwargs.pop("position"))
+            self.position = _new_data(PositionData, **kwargs.pop("position"))
         super().__call__(**kwargs)
         return self
 
 
-class FrameData(CoreData):
+class _FrameData(CoreData):
+    __slots__ = ()
     _renamed = {}
 
     def __call__(self, **kwargs):
         if "events" in kwargs:
-            self.events = [EventData(**event) for event in kwargs.pop("events")]
+            self.events = [
+                _new_data(EventData, **event) for event in kwargs.pop("events")
+            ]
         if "participantFrames" in kwargs:
             self.participantFrames = {
-                int(key): ParticipantFrameData(**pframe)
+                int(key): _new_data(ParticipantFrameData, **pframe)
                 for key, pframe in kwargs.pop("participantFrames").items()
             }
         super().__call__(**kwargs)
         return self
 
 
+class PositionData(_PositionData):
+    pass
+
+
+class EventData(_EventData):
+    pass
+
+
+class ParticipantFrameData(_ParticipantFrameData):
+    pass
+
+
+class FrameData(_FrameData):
+    pass
+
+
+class _CompactPositionData(_PositionData, _CompactCoreData):
+    __slots__ = ()
+    _data_type = PositionData
+
+
+class _CompactEventData(_EventData, _CompactCoreData):
+    __slots__ = ()
+    _data_type = EventData
+
+
+class _CompactParticipantFrameData(_ParticipantFrameData, _CompactCoreData):
+    __slots__ = ()
+    _data_type = ParticipantFrameData
+
+
+class _CompactFrameData(_FrameData, _CompactCoreData):
+    __slots__ = ()
+    _data_type = FrameData
+
+
+_compact_data_types = {
+    PositionData: _CompactPositionData,
+    EventData: _CompactEventData,
+    ParticipantFrameData: _CompactParticipantFrameData,
+    FrameData: _CompactFrameData,
+}
+
+
 class TimelineData(CoreData):
     _dto_type = dto.TimelineDto
     _renamed = {"matchId": "id", "frameInterval": "frame_interval"}
 
     def __call__(self, **kwargs):
         if "frames" in kwargs:
-            self.frames = [FrameData(**frame) for frame in kwargs.pop("frames")]
+            self.frames = [
+                _new_data(FrameData, **frame) for frame in kwargs.pop("frames")
+            ]
         super().__call__(**kwargs)
         return self
 
 
+class _Missing(object):
+    # Stays the same object when pickled
+    def __reduce__(self):
+        return "_missing"
+
+
+_missing = _Missing()
+_nan = float("nan")
+
+
+def _is_number(value: Any) -> bool:
+    # Numbers that a double holds exactly; bools are left as they are
+    return type(value) is float or (type(value) is int and -(2**53) <= value <= 2**53)
+
+
+def _flatten(row: Mapping[str, Any], prefix: str = "") -> Iterable[Tuple[str, Any]]:
+    # {"position": {"x": 1, "y": 2}} -> ("position.x", 1), ("position.y", 2)
+    for key, value in row.items():
+        if isinstance(value, dict) and value:
+            yield from _flatten(value, prefix + key + ".")
+        else:
+            yield prefix + key, value
+
+
+class _Columns(object):
+    # Rows of (flattened) dicts, stored column by column. Numbers are kept in arrays of doubles, with NaN where a row
+    # doesn't have the field, and anything else (strings, lists, ...) in lists, with _missing for the same.
+
+    def __init__(self):
+        self.length = 0
+        self.numbers = {}  # name -> array("d")
+        self.integers = set()  # The names of the number columns that only have ints
+        self.others = {}  # name -> list
+
+    def append(self, row: Mapping[str, Any]) -> None:
+        for name, value in _flatten(row):
+            column = self.numbers.get(name, None)
+            if column is None and name not in self.others:
+                if _is_number(value):
+                    column = self.numbers[name] = array("d", [_nan]) * self.length
+                    self.integers.add(name)
+                else:
+                    self.others[name] = [_missing] * self.length
+            if column is not None:
+                if _is_number(value):
+                    column.append(value)
+                    if type(value) is not int:
+                        self.integers.discard(name)
+                    continue
+                # Something other than a number turned up, so the column can't be kept as numbers any more
+                self.others[name] = self.column(name)
+                del self.numbers[name]
+                self.integers.discard(name)
+            self.others[name].append(value)
+        self.length += 1
+        for column in itertools.chain(self.numbers.values(), self.others.values()):
+            if len(column) < self.length:
+                column.append(_nan if isinstance(column, array) else _missing)
+
+    def column(self, name: str, missing: Any = _missing) -> List[Any]:
+        if name in self.others:
+            column = self.others[name]
+            if missing is _missing:
+                return list(column)
+            return [missing if value is _missing else value for value in column]
+        column = self.numbers.get(name, None)
+        if column is None:
+            return [missing] * self.length
+        convert = int if name in self.integers else float
+        return [convert(value) if value == value else missing for value in column]
+
+    def row(self, i: int) -> Dict[str, Any]:
+        row = {}
+        for name, column in self.numbers.items():
+            value = column[i]
+            if value == value:  # Not NaN
+                _set_path(row, name, int(value) if name in self.integers else value)
+        for name, column in self.others.items():
+            value = column[i]
+            if value is not _missing:
+                _set_path(row, name, value)
+        return row
+
+
+def _set_path(row: Dict[str, Any], name: str, value: Any) -> None:
+    *path, name = name.split(".")
+    for key in path:
+        row = row.setdefault(key, {})
+    row[name] = value
+
+
+class _TimelineColumns(object):
+    # The frames of a timeline, as three tables: the frames themselves (e.g. their timestamps), the participant frames
+    # (one row per participant per frame, frame by frame, in order of participant id), and the events (frame by frame).
+
+    def __init__(self, frames: Iterable[Mapping[str, Any]]):
+        self.participant_ids = None
+        self.frames = _Columns()
+        self.participants = _Columns()
+        self.events = _Columns()
+        self.event_offsets = array("q", [0])
+        self.absent = (
+            set()
+        )  # (frame, participant id) for the participant frames a frame doesn't have
+        for frame in frames:
+            frame = dict(frame)
+            pframes = {
+                int(id): pframe
+                for id, pframe in frame.pop("participantFrames", {}).items()
+            }
+            if self.participant_ids is None:
+                self.participant_ids = tuple(sorted(pframes))
+            elif not pframes.keys() <= set(self.participant_ids):
+                raise ValueError(
+                    "Every frame of a columnar timeline must have the participants of its first frame."
+                )
+            for id in self.participant_ids:
+                if id not in pframes:
+                    self.absent.add((self.frames.length, id))
+                self.participants.append(pframes.get(id, {}))
+            for event in frame.pop("events", []):
+                self.events.append(event)
+            self.event_offsets.append(self.events.length)
+            self.frames.append(frame)
+        if self.participant_ids is None:
+            self.participant_ids = ()
+
+    def frame(self, i: int) -> Dict[str, Any]:
+        frame = self.frames.row(i)
+        count = len(self.participant_ids)
+        frame["participantFrames"] = {
+            str(id): self.participants.row(i * count + j)
+            for j, id in enumerate(self.participant_ids)
+            if (i, id) not in self.absent
+        }
+        frame["events"] = [
+            self.events.row(k)
+            for k in range(self.event_offsets[i], self.event_offsets[i + 1])
+        ]
+        return frame
+
+
+class ColumnarTimelineData(TimelineData):
+    """`TimelineData` whose participant frames and events are stored column by column: every number a participant frame
+    has (e.g. "totalGold" or "position.x") is kept in one frames x participants array of doubles, and likewise for the
+    events, instead of in tens of thousands of objects.
+
+    This is used instead of `TimelineData` if the `columnar_timeline_data` setting is on. `frames` is built from the
+    columns the first time it's accessed and kept until new frames are given; `Timeline.curves` and
+    `Timeline.event_columns` read the columns directly.
+    """
+
+    _data_type = TimelineData
+
+    def __call__(self, **kwargs):
+        if "frames" in kwargs:
+            self._columns = _TimelineColumns(kwargs.pop("frames"))
+            self.__dict__.pop("frames", None)
+        CoreData.__call__(self, **kwargs)
+        return self
+
+    def __getattr__(self, name: str):
+        # Only called for attributes that haven't been set, i.e. before `frames` is first built
+        if name != "frames" or "_columns" not in self.__dict__:
+            raise AttributeError(name)
+        columns = self._columns
+        self.frames = [
+            _new_data(FrameData, **columns.frame(i))
+            for i in range(columns.frames.length)
+        ]
+        return self.frames
+
+    def __getstate__(self):
+        # The frames can be built again from the columns, so they aren't pickled
+        state = dict(self.__dict__)
+        if "_columns" in state:
+            state.pop("frames", None)
+        return state
+
+    def to_dict(self):
+        d = super().to_dict()
+        if d.pop("_columns", None) is not None:
+            d["frames"] = [frame.to_dict() for frame in self.frames]
+        return d
+
+
 class ParticipantTimelineData(CoreData):
     _renamed = {"participantId": "id"}
 
@@ -207,11 +683,47 @@ class ParticipantTimelineData(CoreData):
         return self
 
 
-class ParticipantStatsData(CoreData):
+_lazy_data_lock = threading.RLock()
+
+
+class _LazyCoreData(CoreData):
+    # If the `lazy_match_data` setting is on, the keyword arguments this is called with are only processed (by
+    # `_construct`) when one of its attributes is first read.
+
+    def __call__(self, **kwargs):
+        if configuration.settings.lazy_match_data:
+            self.__dict__.setdefault("_pending", []).append(kwargs)
+            return self
+        return self._construct(**kwargs)
+
+    def _construct(self, **kwargs):
+        return super().__call__(**kwargs)
+
+    def _materialize(self):
+        with _lazy_data_lock:
+            for kwargs in self.__dict__.pop("_pending", ()):
+                self._construct(**kwargs)
+
+    def __getattr__(self, name):
+        # Only called for attributes that haven't been set (yet)
+        if name.startswith("__"):
+            raise AttributeError(name)
+        self._materialize()
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def to_dict(self):
+        self._materialize()
+        return super().to_dict()
+
+
+class ParticipantStatsData(_LazyCoreData):
     _renamed = {}
 
 
-class ParticipantData(CoreData):
+class ParticipantData(_LazyCoreData):
     _renamed = {
         "summoner1Id": "summonerSpellDId",
         "summoner2Id": "summonerSpellFId",
@@ -221,15 +733,13 @@ class ParticipantData(CoreData):
         "gameEndedInSurrender": "endedInSurrender",
     }
 
-    def __call__(self, **kwargs):
+    def _construct(self, **kwargs):
         perks = kwargs.pop("perks", {})
-        stat_perks = perks.pop("statPerks", {})
+        stat_perks = perks.get("statPerks", {})
         # We're going to drop some info about the perks here because that info is already available from the static data
-        styles = perks.pop("styles", [])
+        styles = perks.get("styles", [])
         selections = list(itertools.chain(*[s.get("selections", []) for s in styles]))
-        self.perks = {
-            s["perk"]: [s.pop("var1"), s.pop("var2"), s.pop("var3")] for s in selections
-        }
+        self.perks = {s["perk"]: [s["var1"], s["var2"], s["var3"]] for s in selections}
         self.stat_perks = stat_perks
         non_stats = {  # noqa: F841
             "championId": kwargs.get("championId", None),
@@ -354,7 +864,7 @@ class ParticipantData(CoreData):
         if "teamId" in kwargs:
             self.side = Side(kwargs.pop("teamId"))
 
-        super().__call__(**kwargs)
+        super()._construct(**kwargs)
         return self
 
 
@@ -366,7 +876,7 @@ class ObjectiveData(CoreData):
     _renamed = {}
 
 
-class TeamData(CoreData):
+class TeamData(_LazyCoreData):
     _renamed = {
         "dominionVictoryScore": "dominionScore",
         "firstBaron": "firstBaronKiller",
@@ -377,7 +887,7 @@ class TeamData(CoreData):
         "firstTower": "firstTowerKiller",
     }
 
-    def __call__(self, **kwargs):
+    def _construct(self, **kwargs):
         self.bans = [BanData(**ban) for ban in kwargs.pop("bans", [])]
         self.objectives = {
             key: ObjectiveData(**obj)
@@ -387,7 +897,7 @@ class TeamData(CoreData):
             self.isWinner = kwargs.pop("win")
         if "teamId" in kwargs:
             self.side = Side(kwargs.pop("teamId"))
-        super().__call__(**kwargs)
+        super()._construct(**kwargs)
         return self
 
 
@@ -415,7 +925,7 @@ class MatchData(CoreData):
         if "gameStartTimestamp" in kwargs:
             self.start = arrow.get(kwargs["gameStartTimestamp"] / 1000)
 
-        participants = kwargs.pop("participants", [])
+        participants = raw_participants = kwargs.pop("participants", [])
         puuids = set([p.get("puuid", None) for p in participants])
         self.privateGame = False
         if len(puuids) == 1:
@@ -445,8 +955,14 @@ class MatchData(CoreData):
         for team in teams:
             team_side = Side(team["teamId"])
             participants = []
-            for participant in self.participants:
-                if participant.side is team_side:
+            # Use the raw teamIds so that (lazy) participant data doesn't need to be constructed here
+            for participant, participant_kwargs in zip(
+                self.participants, raw_participants
+            ):
+                if (
+                    "teamId" in participant_kwargs
+                    and Side(participant_kwargs["teamId"]) is team_side
+                ):
                     participants.append(participant)
             self.teams.append(TeamData(**team, participants=participants))
 
@@ -460,7 +976,12 @@ class MatchData(CoreData):
 
 
 class MatchHistory(CassiopeiaLazyList):
-    """The match history for a summoner. By default, this will return the entire match history."""
+    """The match history for a summoner. By default, this will return the entire match history.
+
+    With `prefetch` set, the next `prefetch` matches (and their timelines, if `prefetch_timelines` is set) are loaded
+    on up to `prefetch_concurrency` threads while the current one is being used, and the next page of the history is
+    requested before the current one runs out.
+    """
 
     _data_types = {MatchListData}
 
@@ -506,6 +1027,9 @@ class MatchHistory(CassiopeiaLazyList):
         type: MatchType = None,
         start: int = None,
         count: int = None,
+        prefetch: int = None,
+        prefetch_concurrency: int = None,
+        prefetch_timelines: bool = None,
     ):
         query = {"continent": continent, "puuid": puuid}
 
@@ -531,6 +1055,13 @@ class MatchHistory(CassiopeiaLazyList):
         if type is not None:
             query["type"] = type
 
+        if prefetch:
+            query["prefetch"] = prefetch
+            if prefetch_concurrency is not None:
+                query["prefetchConcurrency"] = prefetch_concurrency
+            if prefetch_timelines is not None:
+                query["prefetchTimelines"] = prefetch_timelines
+
         return query
 
     # For type hints
@@ -782,6 +1313,172 @@ class Frame(CassiopeiaObject):
         )
 
 
+class TimelineIndex(object):
+    """The events and participant frames of a timeline, grouped in a single pass over its frames.
+
+    Events are grouped by participant id and by event type (either can be None to mean "any"). An event belongs to a
+    participant if they are its participant, creator, killer, victim, or one of its assisting participants. Every
+    group is sorted by timestamp and has its timestamps (in milliseconds) alongside for bisecting.
+    """
+
+    def __init__(self, data: TimelineData):
+        self._events = {}  # (participant id, event type) -> [Event]
+        self._frames = {}  # participant id -> [ParticipantFrame]
+        # Frame timestamps are rounded to whole seconds because they're off by a few ms
+        self._frame_seconds = {}  # participant id -> [int]
+        for frame_data in data.frames:
+            timestamp = datetime.timedelta(seconds=frame_data.timestamp / 1000)
+            pframes = getattr(frame_data, "participantFrames", {})
+            for id, pframe_data in pframes.items():
+                # Assign the match's Frame timestamp to the ParticipantFrame
+                pframe = ParticipantFrame.from_data(pframe_data)
+                pframe.timestamp = timestamp
+                id = getattr(pframe_data, "participantId", id)
+                self._frames.setdefault(id, []).append(pframe)
+                self._frame_seconds.setdefault(id, []).append(timestamp.seconds)
+            for event_data in getattr(frame_data, "events", []):
+                event = Event.from_data(event_data)
+                type = getattr(event_data, "type", None)
+                ids = [
+                    getattr(event_data, name, None)
+                    for name in ("participantId", "creatorId", "killerId", "victimId")
+                ]
+                assisting = getattr(event_data, "assistingParticipants", None) or ()
+                ids.extend(dict.fromkeys(assisting))
+                keys = [(None, None), (None, type)]
+                for id in ids:
+                    if id is not None:
+                        keys.append((id, None))
+                        keys.append((id, type))
+                for key in keys:
+                    self._events.setdefault(key, []).append(event)
+
+        self._timestamps = {}
+        for key, events in self._events.items():
+            events.sort(key=lambda event: event._data[EventData].timestamp)
+            self._timestamps[key] = [
+                event._data[EventData].timestamp for event in events
+            ]
+
+    def events(
+        self,
+        participant_id: int = None,
+        type: str = None,
+        until: datetime.timedelta = None,
+    ) -> List[Event]:
+        """The events of `participant_id` (or of all participants) of `type` (or of any type), sorted by timestamp.
+
+        If `until` is given, only the events up to and including that time are returned.
+        """
+        key = (participant_id, type)
+        events = self._events.get(key, [])
+        if until is None:
+            return list(events)
+        milliseconds = until / datetime.timedelta(milliseconds=1)
+        return events[: bisect.bisect_right(self._timestamps[key], milliseconds)]
+
+    def participant_frames(self, participant_id: int) -> List[ParticipantFrame]:
+        return list(self._frames.get(participant_id, []))
+
+    def latest_participant_frame(
+        self, participant_id: int, time: datetime.timedelta
+    ) -> Optional[ParticipantFrame]:
+        """The participant's frame from the last frame at or before `time`, or None if there isn't one."""
+        seconds = self._frame_seconds.get(participant_id, [])
+        i = bisect.bisect_right(seconds, time.total_seconds())
+        if i == 0:
+            return None
+        return self._frames[participant_id][i - 1]
+
+
+def _api_name(field: str, data_type: type) -> str:
+    # "goldEarned" -> "totalGold"; the Riot API's names are accepted as they are
+    head, dot, rest = field.partition(".")
+    for api_name, name in data_type._renamed.items():
+        if name == head:
+            head = api_name
+            break
+    return head + dot + rest
+
+
+def _data_name(field: str, data_type: type) -> str:
+    # "totalGold" -> "goldEarned"; Cass's names are accepted as they are
+    head, dot, rest = field.partition(".")
+    return data_type._renamed.get(head, head) + dot + rest
+
+
+def _get_data_path(data: CoreData, name: str) -> Any:
+    for key in name.split("."):
+        data = getattr(data, key, None)
+        if data is None:
+            break
+    return data
+
+
+def _curves_format(format: Optional[str]) -> str:
+    if format is None:
+        format = "numpy" if NUMPY_INSTALLED else "python"
+    if format == "numpy" and not NUMPY_INSTALLED:
+        raise ImportError("numpy must be installed to return NumPy arrays.")
+    if format not in ("numpy", "python"):
+        raise ValueError(
+            'Unknown format "{}". Valid formats are "numpy" and "python".'.format(
+                format
+            )
+        )
+    return format
+
+
+def _curves(data: TimelineData, names: List[str], format: str) -> Any:
+    names = [_data_name(name, ParticipantFrameData) for name in names]
+    values = []
+    for frame in data.frames:
+        pframes = getattr(frame, "participantFrames", {})
+        values.append(
+            [
+                [_get_data_path(pframes[id], name) for name in names]
+                for id in sorted(pframes)
+            ]
+        )
+    if format == "numpy":
+        if not values:
+            return numpy.empty((0, 0, len(names)))
+        return numpy.array(
+            [
+                [[_nan if value is None else value for value in row] for row in frame]
+                for frame in values
+            ],
+            dtype=float,
+        ).reshape(len(values), -1, len(names))
+    return values
+
+
+def _columnar_curves(data: ColumnarTimelineData, names: List[str], format: str) -> Any:
+    columns = data._columns
+    table = columns.participants
+    shape = (columns.frames.length, len(columns.participant_ids), len(names))
+    names = [_api_name(name, ParticipantFrameData) for name in names]
+    if format == "numpy":
+        values = numpy.empty(shape, dtype=float)
+        for k, name in enumerate(names):
+            column = table.numbers.get(name, None)
+            if column is None:
+                column = [
+                    _nan if value is None else value
+                    for value in table.column(name, None)
+                ]
+                values[:, :, k] = numpy.array(column, dtype=float).reshape(shape[:2])
+            else:
+                values[:, :, k] = numpy.frombuffer(column, dtype=float).reshape(
+                    shape[:2]
+                )
+        return values
+    rows = list(zip(*[table.column(name, None) for name in names]))
+    return [
+        [list(rows[i * shape[1] + j]) for j in range(shape[1])] for i in range(shape[0])
+    ]
+
+
 class Timeline(CassiopeiaGhost):
     _data_types = {TimelineData}
 
@@ -798,6 +1495,7 @@ class Timeline(CassiopeiaGhost):
             platform = Platform(platform)
         kwargs = {"platform": platform, "id": id}
         super().__init__(**kwargs)
+        self._index = None
 
     def __get_query__(self):
         return {"platform": self.platform, "id": self.id}
@@ -806,6 +1504,14 @@ class Timeline(CassiopeiaGhost):
     def id(self):
         return self._data[TimelineData].id
 
+    @property
+    def index(self) -> TimelineIndex:
+        """The timeline's events and participant frames grouped by participant and event type. Built on first use."""
+        if self._index is None:
+            self.load()
+            self._index = TimelineIndex(self._data[TimelineData])
+        return self._index
+
     @property
     def continent(self) -> Continent:
         return self.platform.continent
@@ -832,13 +1538,96 @@ class Timeline(CassiopeiaGhost):
 
     @property
     def first_tower_fallen(self) -> Event:
-        for frame in self.frames:
-            for event in frame.events:
-                if (
-                    event.type == "BUILDING_KILL"
-                    and event.building_type == "TOWER_BUILDING"
-                ):
-                    return event
+        for event in self.index.events(type="BUILDING_KILL"):
+            if event.building_type == "TOWER_BUILDING":
+                return event
+
+    def curves(self, fields: Union[str, Sequence[str]], format: str = None) -> Any:
+        """The values of participant frame fields over the course of the game, with one row per frame and one column
+        per participant (in order of participant id).
+
+        `fields` is a field of the participant frames, e.g. "totalGold" (or "goldEarned"), "xp", or "position.x", or a
+        list of them, in which case there is one value per field for each participant in each frame. Missing values
+        are NaN (or None).
+
+        `format` can be "numpy" (an array of floats) or "python" (nested lists). By default, it's "numpy" if NumPy is
+        installed and "python" otherwise. This is fastest with the `columnar_timeline_data` setting on.
+        """
+        format = _curves_format(format)
+        names = [fields] if isinstance(fields, str) else list(fields)
+        self.load()
+        data = self._data[TimelineData]
+        if isinstance(data, ColumnarTimelineData):
+            values = _columnar_curves(data, names, format)
+        else:
+            values = _curves(data, names, format)
+        if isinstance(fields, str):
+            if format == "numpy":
+                return values[:, :, 0]
+            return [[row[0] for row in frame] for frame in values]
+        return values
+
+    @property
+    def gold_curves(self) -> Any:
+        """The gold each participant has earned by each frame. See `curves`."""
+        return self.curves("goldEarned")
+
+    @property
+    def experience_curves(self) -> Any:
+        """The experience each participant has by each frame. See `curves`."""
+        return self.curves("experience")
+
+    @property
+    def creep_score_curves(self) -> Any:
+        """The minions each participant has killed by each frame. See `curves`."""
+        return self.curves("creepScore")
+
+    @property
+    def position_curves(self) -> Any:
+        """The (x, y) position of each participant in each frame. See `curves`."""
+        return self.curves(["position.x", "position.y"])
+
+    def event_columns(
+        self, fields: Iterable[str], type: str = None, format: str = None
+    ) -> Dict[str, Any]:
+        """The values of event fields, e.g. "timestamp", "killerId", or "position.x", with one value per event (frame
+        by frame). If `type` is given, only the events of that type are included. Missing values are None (or NaN).
+
+        `format` can be "numpy" (a dict of NumPy arrays) or "python" (a dict of lists). See `curves`.
+        """
+        format = _curves_format(format)
+        fields = list(fields)
+        self.load()
+        data = self._data[TimelineData]
+        if isinstance(data, ColumnarTimelineData):
+            table = data._columns.events
+            names = [_api_name(field, EventData) for field in fields]
+            columns = {
+                field: table.column(name, None) for field, name in zip(fields, names)
+            }
+            keep = None
+            if type is not None:
+                keep = [event_type == type for event_type in table.column("type")]
+        else:
+            names = [_data_name(field, EventData) for field in fields]
+            columns = {field: [] for field in fields}
+            keep = [] if type is not None else None
+            for frame in data.frames:
+                for event in getattr(frame, "events", []):
+                    if keep is not None:
+                        keep.append(getattr(event, "type", None) == type)
+                    for field, name in zip(fields, names):
+                        columns[field].append(_get_data_path(event, name))
+        if keep is not None:
+            columns = {
+                field: list(itertools.compress(values, keep))
+                for field, values in columns.items()
+            }
+        if format == "numpy":
+            from .matchstats import _to_numpy
+
+            columns = {field: _to_numpy(values) for field, values in columns.items()}
+        return columns
 
 
 class ParticipantTimeline(object):
@@ -850,87 +1639,124 @@ class ParticipantTimeline(object):
         self.__match = match
         return self
 
+    @property
+    def _index(self) -> TimelineIndex:
+        return self.__match.timeline.index
+
+    @property
+    def _static_data(self) -> "StaticDataIndex":
+        return self.__match._static_data
+
     @property
     def frames(self) -> List[ParticipantFrame]:
-        timeline: Timeline = self.__match.timeline
-        these = []
-        for frame in timeline.frames:
-            for pid, pframe in frame.participant_frames.items():
-                pframe.timestamp = (
-                    frame.timestamp
-                )  # Assign the match's Frame timestamp to the ParticipantFrame
-                if pframe.participant_id == self.id:
-                    these.append(pframe)
-        return these
+        return self._index.participant_frames(self.id)
 
     @property
     def events(self):
-        my_events = []
-        timeline = self.__match.timeline
-        for frame in timeline.frames:
-            for event in frame.events:
-                try:
-                    if event.participant_id == self.id:
-                        my_events.append(event)
-                except AttributeError:
-                    pass
-                try:
-                    if event.creator_id == self.id:
-                        my_events.append(event)
-                except AttributeError:
-                    pass
-                try:
-                    if event.killer_id == self.id:
-                        my_events.append(event)
-                except AttributeError:
-                    pass
-                try:
-                    if event.victim_id == self.id:
-                        my_events.append(event)
-                except AttributeError:
-                    pass
-                try:
-                    if self.id in event.assisting_participants:
-                        my_events.append(event)
-                except AttributeError:
-                    pass
-        return SearchableList(my_events)
+        return SearchableList(self._index.events(participant_id=self.id))
 
     @property
     def champion_kills(self):
-        return self.events.filter(
-            lambda event: event.type == "CHAMPION_KILL" and event.killer_id == self.id
+        return SearchableList(
+            [
+                event
+                for event in self._index.events(self.id, "CHAMPION_KILL")
+                if event.killer_id == self.id
+            ]
         )
 
     @property
     def champion_deaths(self):
-        return self.events.filter(
-            lambda event: event.type == "CHAMPION_KILL" and event.victim_id == self.id
+        return SearchableList(
+            [
+                event
+                for event in self._index.events(self.id, "CHAMPION_KILL")
+                if event.victim_id == self.id
+            ]
         )
 
     @property
     def champion_assists(self):
-        return self.events.filter(
-            lambda event: event.type == "CHAMPION_KILL"
-            and self.id in event.assisting_participants
+        return SearchableList(
+            [
+                event
+                for event in self._index.events(self.id, "CHAMPION_KILL")
+                if self.id in event.assisting_participants
+            ]
         )
 
 
 class CumulativeTimeline:
-    def __init__(self, id: int, participant_timeline: ParticipantTimeline):
+    """A participant's state at any point in the timeline.
+
+    The state is saved every `checkpoint_interval` (one minute by default) the first time it's needed, so each lookup
+    only replays the events since the closest earlier checkpoint.
+    """
+
+    def __init__(
+        self,
+        id: int,
+        participant_timeline: ParticipantTimeline,
+        checkpoint_interval: datetime.timedelta = datetime.timedelta(minutes=1),
+    ):
         self._id = id
         self._timeline = participant_timeline
+        self._checkpoint_interval = checkpoint_interval
+        self._events = None
+        self._event_timestamps = None  # In ms
+        self._checkpoints = None  # [(number of events processed, ParticipantState)]
+        self._checkpoint_times = None
+
+    def _create_checkpoints(self) -> None:
+        events = self._timeline._index.events(participant_id=self._id)
+        timestamps = [event._data[EventData].timestamp for event in events]
+        checkpoints = []
+        checkpoint_times = []
+        state = None
+        time = datetime.timedelta(0)
+        processed = 0
+        while True:
+            checkpoint = ParticipantState(
+                id=self._id, time=time, participant_timeline=self._timeline
+            )
+            if state is not None:
+                checkpoint._copy_events_from(state)
+            state = checkpoint
+            end = bisect.bisect_right(
+                timestamps, time / datetime.timedelta(milliseconds=1)
+            )
+            for event in events[processed:end]:
+                state._process_event(event)
+            processed = end
+            checkpoints.append((processed, state))
+            checkpoint_times.append(time)
+            if processed == len(events):
+                break
+            time += self._checkpoint_interval
+        self._events = events
+        self._event_timestamps = timestamps
+        self._checkpoints = checkpoints
+        self._checkpoint_times = checkpoint_times
 
     def __getitem__(self, time: Union[datetime.timedelta, str]) -> "ParticipantState":
         if isinstance(time, str):
             time = time.split(":")
             time = datetime.timedelta(minutes=int(time[0]), seconds=int(time[1]))
+        if self._checkpoints is None:
+            self._create_checkpoints()
         state = ParticipantState(
             id=self._id, time=time, participant_timeline=self._timeline
         )
-        for event in self._timeline.events:
-            if event.timestamp > time:
-                break
+        i = bisect.bisect_right(self._checkpoint_times, time) - 1
+        if i < 0:
+            processed = 0
+        else:
+            processed, checkpoint = self._checkpoints[i]
+            state._copy_events_from(checkpoint)
+        end = bisect.bisect_right(
+            self._event_timestamps, time / datetime.timedelta(milliseconds=1)
+        )
+        for event in self._events[processed:end]:
             state._process_event(event)
         return state
 
@@ -946,18 +1772,11 @@ class ParticipantState:
     ):
         self._id = id
         self._time = time
-        # self._timeline = participant_timeline
+        self._participant_timeline = participant_timeline
         # Try to get info from the most recent participant timeline object
-        latest_frame = None
-        for frame in participant_timeline.frames:
-            # Round to the nearest second for the frame timestamp because it's off by a few ms
-            rounded_frame_timestamp = datetime.timedelta(
-                seconds=frame.timestamp.seconds
-            )
-            if rounded_frame_timestamp > self._time:
-                break
-            latest_frame = frame
-        self._latest_frame: Optional[ParticipantFrame] = latest_frame
+        self._latest_frame: Optional[ParticipantFrame] = (
+            participant_timeline._index.latest_participant_frame(id, time)
+        )
         self._item_state = _ItemState()
         self._skills = Counter()
         self._kills = 0
@@ -965,7 +1784,31 @@ class ParticipantState:
         self._assists = 0
         self._objectives = 0
         self._level = 1
-        self._processed_events = []
+        # The processed events, newest first, as (event, older events) pairs ending in None. Nothing is ever changed
+        # in place, so a state copied from another shares its events instead of copying them.
+        self._processed = None
+
+    def _copy_events_from(self, other: "ParticipantState") -> None:
+        # Start from the state `other` reached by processing its events
+        self._item_state._items = list(other._item_state._items)
+        self._item_state._events = other._item_state._events
+        self._skills = Counter(other._skills)
+        self._kills = other._kills
+        self._deaths = other._deaths
+        self._assists = other._assists
+        self._objectives = other._objectives
+        self._level = other._level
+        self._processed = other._processed
+
+    @property
+    def _processed_events(self) -> List[Event]:
+        events = []
+        processed = self._processed
+        while processed is not None:
+            event, processed = processed
+            events.append(event)
+        events.reverse()
+        return events
 
     def _process_event(self, event: Event):
         if "ITEM" in event.type:
@@ -989,13 +1832,23 @@ class ParticipantState:
         else:
             # print(f"Did not process event {event.to_dict()}")
             pass
-        self._processed_events.append(event)
-        self._processed_events.sort(key=lambda event: event.timestamp)
+        # Events are almost always processed in order, so only insert them in order when they're not
+        older = self._processed
+        later = []
+        while older is not None and event.timestamp < older[0].timestamp:
+            later.append(older[0])
+            older = older[1]
+        processed = (event, older)
+        for later_event in reversed(later):
+            processed = (later_event, processed)
+        self._processed = processed
 
     @property
     def items(self) -> SearchableList:
         return SearchableList(
-            [Item(id=id_, region="NA") for id_ in self._item_state._items]
+            self._participant_timeline._static_data.get_many(
+                Item, self._item_state._items
+            )
         )
 
     @property
@@ -1054,19 +1907,16 @@ class ParticipantState:
         # The latest position is either from the latest event or from the participant timeline frame.
         # Get the most recent frame. This is our baseline.
         latest_frame_ts = self._latest_frame.timestamp
-        # Now loop through all events and use the latest event's position if the event was generated later than the frame.
-        events = [
-            (getattr(event, "timestamp", None), getattr(event, "position", None))
-            for event in self._processed_events
-        ]
-        events_with_ts_and_position = [
-            (ts, p) for ts, p in events if ts is not None and p is not None
-        ]
-        # If an event exists with both a timestamp and position, and the event was generated later that the frame, return its position.
-        if len(events_with_ts_and_position) > 0:
-            latest_event_ts, latest_event_position = events_with_ts_and_position[-1]
-            if latest_event_ts > latest_frame_ts:
-                return latest_event_position
+        # Now find the latest event with a timestamp and position, and use its position if it was generated later than the frame.
+        processed = self._processed
+        while processed is not None:
+            event, processed = processed
+            latest_event_ts = getattr(event, "timestamp", None)
+            latest_event_position = getattr(event, "position", None)
+            if latest_event_ts is not None and latest_event_position is not None:
+                if latest_event_ts > latest_frame_ts:
+                    return latest_event_position
+                break
         # If we got this far, then the latest event (if it exists) is not relevant. Return the position from the latest frame.
         return self._latest_frame.position
 
@@ -1082,7 +1932,9 @@ class ParticipantState:
 class _ItemState:
     def __init__(self, *args):
         self._items = []
-        self._events = []
+        # The item events that can be undone, newest first, as (event, older events) pairs ending in None, so
+        # copies of the state can share them
+        self._events = None
 
     def __str__(self):
         return str(self._items)
@@ -1107,16 +1959,16 @@ class _ItemState:
             return
         if event.type == "ITEM_PURCHASED":
             self.add(event.item_id)
-            self._events.append(event)
+            self._events = (event, self._events)
         elif event.type == "ITEM_DESTROYED":
             self.destroy(event.item_id)
             if event.item_id in upgradable_items:
                 # add the upgraded item
                 self.add(upgradable_items[event.item_id])
-            self._events.append(event)
+            self._events = (event, self._events)
         elif event.type == "ITEM_SOLD":
             self.destroy(event.item_id)
-            self._events.append(event)
+            self._events = (event, self._events)
         elif event.type == "ITEM_UNDO":
             self.undo(event)
         else:
@@ -1172,7 +2024,9 @@ class _ItemState:
         item_id = event.before_id or event.after_id
         prev = None
         while prev is None or prev.item_id != item_id:
-            prev = self._events.pop()
+            if self._events is None:
+                raise IndexError("There are no item events to undo")
+            prev, self._events = self._events
             if prev.type == "ITEM_PURCHASED":
                 self.destroy(prev.item_id)
             elif prev.type == "ITEM_DESTROYED":
@@ -1343,13 +2197,7 @@ class ParticipantStats(CassiopeiaObject):
             self._data[ParticipantStatsData].item5,
             self._data[ParticipantStatsData].item6,
         ]
-        version = _choose_staticdata_version(self.__match)
-        return SearchableList(
-            [
-                Item(id=id, version=version, region=self.__match.region) if id else None
-                for id in ids
-            ]
-        )
+        return SearchableList(self.__match._static_data.get_many(Item, ids))
 
     @property
     @load_match_on_attributeerror
@@ -1705,10 +2553,10 @@ class Participant(CassiopeiaObject):
     @lazy_property
     @load_match_on_attributeerror
     def runes(self) -> Dict[Rune, int]:
-        version = _choose_staticdata_version(self.__match)
+        static_data = self.__match._static_data
         runes = SearchableDictionary(
             {
-                Rune(id=rune_id, version=version, region=self.__match.region): perk_vars
+                static_data.get(Rune, rune_id): perk_vars
                 for rune_id, perk_vars in self._data[ParticipantData].perks.items()
             }
         )
@@ -1727,10 +2575,10 @@ class Participant(CassiopeiaObject):
     @lazy_property
     @load_match_on_attributeerror
     def stat_runes(self) -> List[Rune]:
-        version = _choose_staticdata_version(self.__match)
+        static_data = self.__match._static_data
         runes = SearchableList(
             [
-                Rune(id=rune_id, version=version, region=self.__match.region)
+                static_data.get(Rune, rune_id)
                 for rune_id in self._data[ParticipantData].stat_perks.values()
             ]
         )
@@ -1743,7 +2591,7 @@ class Participant(CassiopeiaObject):
         timeline.id = self.id
         return timeline
 
-    @property
+    @lazy_property
     def cumulative_timeline(self) -> CumulativeTimeline:
         return CumulativeTimeline(id=self.id, participant_timeline=self.timeline)
 
@@ -1755,32 +2603,23 @@ class Participant(CassiopeiaObject):
     @lazy_property
     @load_match_on_attributeerror
     def summoner_spell_d(self) -> SummonerSpell:
-        version = _choose_staticdata_version(self.__match)
-        return SummonerSpell(
-            id=self._data[ParticipantData].summonerSpellDId,
-            version=version,
-            region=self.__match.region,
+        return self.__match._static_data.get(
+            SummonerSpell, self._data[ParticipantData].summonerSpellDId
         )
 
     @lazy_property
     @load_match_on_attributeerror
     def summoner_spell_f(self) -> SummonerSpell:
-        version = _choose_staticdata_version(self.__match)
-        return SummonerSpell(
-            id=self._data[ParticipantData].summonerSpellFId,
-            version=version,
-            region=self.__match.region,
+        return self.__match._static_data.get(
+            SummonerSpell, self._data[ParticipantData].summonerSpellFId
         )
 
     @lazy_property
     @load_match_on_attributeerror
     def champion(self) -> "Champion":
         # See ParticipantStats for info
-        version = _choose_staticdata_version(self.__match)
-        return Champion(
-            id=self._data[ParticipantData].championId,
-            version=version,
-            region=self.__match.region,
+        return self.__match._static_data.get(
+            Champion, self._data[ParticipantData].championId
         )
 
     # All the summoner data from the match endpoint is passed through to the Summoner class.
@@ -1875,13 +2714,9 @@ class Team(CassiopeiaObject):
 
     @property
     def bans(self) -> List["Champion"]:
-        version = _choose_staticdata_version(self.__match)
+        static_data = self.__match._static_data
         return [
-            (
-                Champion(id=ban.championId, version=version, region=self.__match.region)
-                if ban.championId != -1
-                else None
-            )
+            static_data.get(Champion, ban.championId) if ban.championId != -1 else None
             for ban in self._data[TeamData].bans
         ]
 
@@ -2006,6 +2841,10 @@ class Match(CassiopeiaGhost):
     def id(self) -> str:
         return self._data[MatchData].id
 
+    @lazy_property
+    def _static_data(self) -> StaticDataIndex:
+        return StaticDataIndex.for_match(self)
+
     @lazy_property
     def timeline(self) -> Timeline:
         if self._timeline is None:
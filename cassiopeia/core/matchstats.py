@@ -0,0 +1,204 @@
+from typing import Iterable, List, Mapping, Union, Any, Callable, Dict
+
+try:
+    import numpy
+
+    NUMPY_INSTALLED = True
+except ImportError:
+    NUMPY_INSTALLED = False
+
+try:
+    import pyarrow
+
+    PYARROW_INSTALLED = True
+except ImportError:
+    PYARROW_INSTALLED = False
+
+from .match import Match, MatchData, ParticipantData, TeamData
+from ..dto.match import MatchDto
+
+_missing = object()
+
+
+def _match_value(match: Union[MatchData, Mapping], key: str) -> Any:
+    if isinstance(match, MatchData):
+        return getattr(match, MatchData._renamed.get(key, key), None)
+    return match.get(key, None)
+
+
+# Attributes `ParticipantData` has that aren't in the Riot API's participants, so they aren't fields either
+_participant_attributes = set(ParticipantData._renamed.values()) | {
+    "side",
+    "stats",
+    "stat_perks",
+}
+
+
+def _check_participant_fields(paths: List[List[str]]) -> None:
+    # `ParticipantData` only keeps the ids and vars of the selected perks, and drops the summoner level, so these can't
+    # be extracted from a `Match` the same way as from a `MatchDto`
+    for path in paths:
+        if path[0] == "summonerLevel" or (
+            path[0] == "perks" and path[1:2] != ["statPerks"]
+        ):
+            raise ValueError(
+                "\"{}\" can't be extracted, because Match objects don't keep it.".format(
+                    ".".join(path)
+                )
+            )
+
+
+def _participant_value(participant: Union[ParticipantData, Mapping], key: str) -> Any:
+    if not isinstance(participant, ParticipantData):
+        return participant.get(key, _missing)
+    if key == "teamId":
+        side = getattr(participant, "side", None)
+        return side.value if side is not None else _missing
+    if key == "perks":
+        return {"statPerks": getattr(participant, "stat_perks", None)}
+    if key in _participant_attributes and key not in ParticipantData._renamed:
+        return _missing
+    value = getattr(participant, ParticipantData._renamed.get(key, key), _missing)
+    if value is _missing:
+        value = getattr(participant.stats, key, _missing)
+    return value
+
+
+def _team_value(team: Union[TeamData, Mapping], key: str) -> Any:
+    if not isinstance(team, TeamData):
+        return team.get(key, _missing)
+    if key == "teamId":
+        side = getattr(team, "side", None)
+        return side.value if side is not None else _missing
+    if key == "win":
+        key = "isWinner"
+    return getattr(team, TeamData._renamed.get(key, key), _missing)
+
+
+def _get_path(
+    record: Any,
+    match: Union[MatchData, Mapping],
+    path: List[str],
+    get_value: Callable[[Any, str], Any],
+) -> Any:
+    # Fields that aren't on the participant (or team) are looked up on the match, e.g. "queueId" or "gameDuration"
+    value = get_value(record, path[0])
+    if value is _missing:
+        value = _match_value(match, path[0])
+    for key in path[1:]:
+        if value is None:
+            break
+        if isinstance(value, Mapping):
+            value = value.get(key, None)
+        else:
+            value = getattr(value, key, None)
+    return value
+
+
+def _match_data(match: Union[Match, MatchDto, Mapping]) -> Union[MatchData, Mapping]:
+    if isinstance(match, Match):
+        match.load()
+        return match._data[MatchData]
+    # The response from the Riot API, as it was before Cass flattened it
+    if "info" in match:
+        return match["info"]
+    return match
+
+
+def _to_numpy(values: List[Any]) -> "numpy.ndarray":
+    if all(isinstance(value, bool) for value in values):
+        return numpy.array(values, dtype=bool)
+    if all(
+        value is None
+        or (isinstance(value, (int, float)) and not isinstance(value, bool))
+        for value in values
+    ):
+        if any(value is None for value in values):
+            return numpy.array(
+                [numpy.nan if value is None else value for value in values],
+                dtype=float,
+            )
+        return numpy.array(values)
+    if all(isinstance(value, str) for value in values):
+        return numpy.array(values, dtype=str)
+    array = numpy.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _to_format(columns: Dict[str, List[Any]], format: str) -> Any:
+    if format is None:
+        if PYARROW_INSTALLED:
+            format = "arrow"
+        elif NUMPY_INSTALLED:
+            format = "numpy"
+        else:
+            format = "python"
+    if format == "arrow":
+        if not PYARROW_INSTALLED:
+            raise ImportError("pyarrow must be installed to return an Arrow table.")
+        return pyarrow.table(
+            {field: pyarrow.array(values) for field, values in columns.items()}
+        )
+    if format == "numpy":
+        if not NUMPY_INSTALLED:
+            raise ImportError("numpy must be installed to return NumPy arrays.")
+        return {field: _to_numpy(values) for field, values in columns.items()}
+    if format == "python":
+        return columns
+    raise ValueError(
+        'Unknown format "{}". Valid formats are "arrow", "numpy", and "python".'.format(
+            format
+        )
+    )
+
+
+def _columns(
+    matches: Iterable[Union[Match, MatchDto, Mapping]],
+    fields: Iterable[str],
+    records: str,
+    get_value: Callable[[Any, str], Any],
+    format: str,
+) -> Any:
+    fields = list(fields)
+    paths = [field.split(".") for field in fields]
+    columns = {field: [] for field in fields}
+    for match in matches:
+        match = _match_data(match)
+        for record in _match_value(match, records) or ():
+            for field, path in zip(fields, paths):
+                columns[field].append(_get_path(record, match, path, get_value))
+    return _to_format(columns, format)
+
+
+def participant_columns(
+    matches: Iterable[Union[Match, MatchDto, Mapping]],
+    fields: Iterable[str],
+    format: str = None,
+) -> Any:
+    """Extracts `fields` for every participant of every match, with one row per participant.
+
+    `matches` can be loaded or unloaded `Match` objects, `MatchDto`s, or match-v5 responses. Fields use the Riot API's
+    names, e.g. "kills", "win", or "totalDamageDealtToChampions", and nested values can be selected with dots, e.g.
+    "challenges.kda". Fields that aren't participant fields are taken from the match, e.g. "gameId" or "queueId".
+    Missing values are None. "perks" can only be extracted as "perks.statPerks" (or below), and "summonerLevel" not
+    at all, because `Match` objects don't keep the rest; a ValueError is raised for them.
+
+    `format` can be "arrow" (a pyarrow Table), "numpy" (a dict of NumPy arrays), or "python" (a dict of lists).
+    By default, it's "arrow" if pyarrow is installed, otherwise "numpy" if NumPy is installed, otherwise "python".
+    """
+    fields = list(fields)
+    _check_participant_fields([field.split(".") for field in fields])
+    return _columns(matches, fields, "participants", _participant_value, format)
+
+
+def team_columns(
+    matches: Iterable[Union[Match, MatchDto, Mapping]],
+    fields: Iterable[str],
+    format: str = None,
+) -> Any:
+    """Extracts `fields` for every team of every match, with one row per team.
+
+    Fields use the Riot API's names, e.g. "teamId", "win", or "objectives.baron.kills". See `participant_columns`.
+    """
+    return _columns(matches, fields, "teams", _team_value, format)
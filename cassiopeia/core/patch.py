@@ -1,8 +1,8 @@
 from typing import Union, Optional, Self, Any
 from functools import total_ordering
-from collections import defaultdict
+from array import array
 import arrow
-from itertools import tee
+import bisect
 
 from .. import configuration
 from ..dto.patch import PatchListDto
@@ -10,16 +10,24 @@ from ..dto.patch import PatchListDto
 from ..data import Region
 
 
-def pairwise(iterable):
-    "s -> (s0,s1), (s1,s2), (s2, s3), ..."
-    a, b = tee(iterable)
-    next(b, None)
-    return zip(a, b)
+class _PatchIndex(object):
+    # One region's patches, sorted by start date, with their start times in epoch seconds for bisecting
+    __slots__ = ("patches", "starts", "by_name")
+
+    def __init__(self) -> None:
+        self.patches: list["Patch"] = []
+        self.starts = array("q")
+        self.by_name: dict[str, "Patch"] = {}
+
+    def append(self, patch: "Patch", start: int) -> None:
+        self.patches.append(patch)
+        self.starts.append(start)
+        self.by_name.setdefault(patch.name, patch)
 
 
 @total_ordering
 class Patch:
-    __patches: dict[Region, list[Self]] | None = None
+    __patches: dict[Region, _PatchIndex] | None = None
     __core_data: dict[str, Any]
 
     def __init__(
@@ -39,19 +47,45 @@ class Patch:
         self._name = name
         self._start = start
         self._end = end
+        self._start_timestamp = None
+        self._end_timestamp = None
+        self.__core_data = {}
+
+    @classmethod
+    def _from_timestamps(
+        cls, region: Region, name: str, start: int, end: Optional[int]
+    ) -> Self:
+        # The Arrow objects are only created if `start` or `end` is used
+        self = cls.__new__(cls)
+        self._region = region
+        self._name = name
+        self._start = None
+        self._end = None
+        self._start_timestamp = start
+        self._end_timestamp = end
         self.__core_data = {}
+        return self
 
     def __str__(self) -> str:
         return self._name
 
     @classmethod
-    def from_str(cls, string: str, region: Union[Region, str]) -> Self:
+    def _index(cls, region: Union[Region, str]) -> _PatchIndex:
         if not cls.__patches:
             cls.__load__()
             assert cls.__patches is not None
         if not isinstance(region, Region):
             region = Region(region)
-        for patch in cls.__patches[region]:
+        return cls.__patches[region]
+
+    @classmethod
+    def from_str(cls, string: str, region: Union[Region, str]) -> Self:
+        index = cls._index(region)
+        try:
+            return index.by_name[string]
+        except KeyError:
+            pass
+        for patch in index.patches:
             if string in patch.name:
                 return patch
         else:
@@ -60,72 +94,45 @@ class Patch:
 
     @classmethod
     def from_date(cls, date: arrow.Arrow, region: Union[Region, str]) -> Self:
-        if not cls.__patches:
-            cls.__load__()
-            assert cls.__patches is not None
-        if not isinstance(region, Region):
-            region = Region(region)
-        for patch in cls.__patches[region]:
-            patch_end = patch.end or arrow.now().shift(seconds=1)
-            if patch.start <= date < patch_end:
+        index = cls._index(region)
+        timestamp = date.timestamp()
+        i = bisect.bisect_right(index.starts, timestamp) - 1
+        if i >= 0:
+            patch = index.patches[i]
+            if patch._end_timestamp is not None:
+                # Patches are contiguous, so only the latest one has no end
                 return patch
-        else:
-            raise ValueError("Unknown patch date {}".format(date))
+            if timestamp < arrow.now().shift(seconds=1).timestamp():
+                return patch
+        raise ValueError("Unknown patch date {}".format(date))
 
     @classmethod
     def latest(cls, region: Union[Region, str]) -> Self:
-        if isinstance(region, str):
-            region = Region(region)
-        if cls.__patches is None:
-            cls.__load__()
-            assert cls.__patches is not None
-        return cls.__patches[region][-1]
+        return cls._index(region).patches[-1]
 
     @classmethod
     def __load__(cls):
         data = configuration.settings.pipeline.get(PatchListDto, query={})
-        patches = data["patches"]
+        patches = sorted(data["patches"], key=lambda patch: patch["start"])
         shifts = data["shifts"]
-        cls.__patches = defaultdict(list)
-        end: Optional[arrow.Arrow] = None
-        for patch, next_patch in pairwise(patches):
-            for region in Region:
-                if region.platform.value in shifts:
-                    region_key = region.platform.value
-                elif region.value in shifts:
-                    region_key = region.value
-                else:
-                    raise ValueError(f"Known region in patch data: {region}")
-                start = arrow.get(patch["start"] + shifts[region_key]).to(
-                    region.timezone
-                )
-                name = patch["name"]
-                end = arrow.get(next_patch["start"] + shifts[region_key]).to(
-                    region.timezone
-                )
-                cls.__patches[region].append(
-                    Patch(region=region, name=name, start=start, end=end)
-                )
-
-        # Since pairwise skips the last patch in the list, add it manually here
-        patch = patches[-1]
+        cls.__patches = indexes = {}
         for region in Region:
             if region.platform.value in shifts:
-                region_key = region.platform.value
+                shift = shifts[region.platform.value]
             elif region.value in shifts:
-                region_key = region.value
+                shift = shifts[region.value]
             else:
                 raise ValueError(f"Known region in patch data: {region}")
-            start = arrow.get(patch["start"] + shifts[region_key]).to(region.timezone)
-            name = patch["name"]
-            end = None
-            cls.__patches[region][-1] = Patch(
-                region=region, name=name, start=start, end=end
-            )
-
-        # Sort each region's patches by start date
-        for region in Region:
-            cls.__patches[region].sort(key=lambda patch: patch.start)
+            index = indexes[region] = _PatchIndex()
+            for i, patch in enumerate(patches):
+                start = int(patch["start"] + shift)
+                if i + 1 < len(patches):
+                    end = int(patches[i + 1]["start"] + shift)
+                else:
+                    end = None
+                index.append(
+                    Patch._from_timestamps(region, patch["name"], start, end), start
+                )
 
     @property
     def region(self) -> Region:
@@ -138,13 +145,17 @@ class Patch:
     @property
     def start(self) -> arrow.Arrow:
         if self._start is None:
-            raise ValueError(
-                f"Patch start date is unknown for patch {self.name}. Patch data may not exist."
-            )
+            if self._start_timestamp is None:
+                raise ValueError(
+                    f"Patch start date is unknown for patch {self.name}. Patch data may not exist."
+                )
+            self._start = arrow.get(self._start_timestamp).to(self._region.timezone)
         return self._start
 
     @property
     def end(self) -> arrow.Arrow | None:
+        if self._end is None and self._end_timestamp is not None:
+            self._end = arrow.get(self._end_timestamp).to(self._region.timezone)
         return self._end
 
     @property
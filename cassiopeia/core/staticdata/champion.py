@@ -191,6 +191,7 @@ class ChampionData(CoreData):
 
 class Champions(CassiopeiaLazyList):
     _data_types = {ChampionListData}
+    _index_keys = {int: ["id"]}
 
     def __init__(
         self,
@@ -121,6 +121,7 @@ class ItemData(CoreData):
 
 class Items(CassiopeiaLazyList):
     _data_types = {ItemListData}
+    _index_keys = {int: ["id"]}
 
     def __init__(
         self,
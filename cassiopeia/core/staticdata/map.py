@@ -50,6 +50,7 @@ class MapData(CoreData):
 
 class Maps(CassiopeiaLazyList):
     _data_types = {MapListData}
+    _index_keys = {int: ["id"]}
 
     def __init__(
         self,
@@ -49,6 +49,7 @@ class ProfileIconData(CoreData):
 
 class ProfileIcons(CassiopeiaLazyList):
     _data_types = {ProfileIconListData}
+    _index_keys = {int: ["id"]}
 
     def __init__(
         self,
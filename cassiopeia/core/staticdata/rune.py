@@ -106,6 +106,7 @@ class RunePath(CassiopeiaObject):
 
 class Runes(CassiopeiaLazyList):
     _data_types = {RuneListData}
+    _index_keys = {int: ["id"]}
 
     def __init__(
         self,
@@ -1,7 +1,9 @@
 from .cache import Cache
+from .sqlite import SQLiteStore
 from .riotapi import RiotAPI
 from .kernel import Kernel
 from .ddragon import DDragon
+from .dragontail import Dragontail
 from .ghost import UnloadedGhostStore
 from .merakianalyticscdn import MerakiAnalyticsCDN
 from .lolwikia import LolWikia
@@ -9,9 +11,11 @@ from .lolwikia import LolWikia
 
 __all__ = [
     "Cache",
+    "SQLiteStore",
     "RiotAPI",
     "Kernel",
     "DDragon",
+    "Dragontail",
     "UnloadedGhostStore",
     "MerakiAnalyticsCDN",
     "LolWikia",
@@ -1,5 +1,22 @@
-from typing import Type, Mapping, Any, Iterable, TypeVar, Tuple, Callable, Generator
+from typing import (
+    Type,
+    Mapping,
+    Any,
+    Iterable,
+    TypeVar,
+    Tuple,
+    Callable,
+    Generator,
+    Dict,
+    List,
+)
+from collections import OrderedDict, defaultdict
+from enum import Enum
+from threading import RLock
 import datetime
+import inspect
+import sys
+import time
 
 from datapipelines import (
     DataSource,
@@ -8,9 +25,9 @@ from datapipelines import (
     validate_query,
     NotFoundError,
 )
-from merakicommons.cache import Cache as CommonsCache
 
 from . import uniquekeys
+from . import instrumentation as _instrumentation
 from ..core.staticdata.champion import (
     ChampionData,
     ChampionListData,
@@ -53,7 +70,7 @@ from ..core.league import (
     MasterLeague,
     LeagueEntries,
 )
-from ..core.match import MatchData, TimelineData, Match, Timeline
+from ..core.match import MatchData, TimelineData, Match, Timeline, _CompactCoreData
 from ..core.summoner import SummonerData, Summoner
 from ..core.account import AccountData, Account
 from ..core.status import ShardStatusData, ShardStatus
@@ -64,6 +81,7 @@ from ..core.spectator import (
     FeaturedMatches,
 )
 from ..core.champion import ChampionRotationData, ChampionRotation
+from ..core.common import CassiopeiaObject, CassiopeiaGhost
 
 T = TypeVar("T")
 
@@ -102,10 +120,204 @@ default_expirations = {
     FeaturedMatches: datetime.timedelta(hours=0.5),
 }
 
+# How long a query that no source could find is remembered, by the type it would have been stored as
+default_not_found_expirations = {
+    Match: datetime.timedelta(days=1),
+    Timeline: datetime.timedelta(days=1),
+    Summoner: datetime.timedelta(hours=1),
+    Account: datetime.timedelta(hours=1),
+    CurrentMatch: datetime.timedelta(minutes=2),
+}
+
+_not_found_key_functions = {
+    Match: uniquekeys.for_match_query,
+    Timeline: uniquekeys.for_match_timeline_query,
+    Summoner: uniquekeys.for_summoner_query,
+    Account: uniquekeys.for_account_query,
+    CurrentMatch: uniquekeys.for_current_match_query,
+}
+
+
+def _approximate_size(item: Any) -> int:
+    # Sums sys.getsizeof over everything reachable from `item`, except other top-level objects (which are cached
+    # in their own right) and shared things like types and enums.
+    size = 0
+    seen = set()
+    stack = [item]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, (type, Enum)) or inspect.isroutine(obj):
+            continue
+        if obj is not item and isinstance(obj, CassiopeiaObject):
+            continue
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, _CompactCoreData):
+            # The names are shared, so only count the values
+            stack.extend(obj._values)
+        elif hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+    return size
+
+
+class _BoundedCache(object):
+    """A thread-safe (type, key) -> value store with per-entry timeouts and least-recently-used eviction.
+
+    A value is often stored under several keys of the same type (e.g. a summoner by id and by puuid). It's counted
+    once, used whenever any of its keys is, and evicted with all of its keys. `max_entries` caps the number of values
+    stored per type. `max_bytes` caps the approximate total size of all stored values; sizes are only measured when it
+    is set.
+    """
+
+    def __init__(
+        self, max_entries: Mapping[type, int] = None, max_bytes: int = None
+    ) -> None:
+        self._data = defaultdict(OrderedDict)  # type -> key -> (value, expires at)
+        self._recency = (
+            OrderedDict()
+        )  # (type, key) -> None, oldest first, across all types
+        self._keys = defaultdict(dict)  # type -> id(value) -> keys it's stored under
+        self._sizes = {}  # (type, id(value)) -> size
+        self._bytes = defaultdict(int)
+        self._total_bytes = 0
+        self._max_entries = dict(max_entries or {})
+        self._max_bytes = max_bytes
+        self._stats = defaultdict(lambda: defaultdict(int))
+        self._lock = RLock()
+
+    def put(self, type: Any, key: Any, value: Any, timeout: float = -1) -> None:
+        if timeout == 0:
+            return
+        expires = None if timeout == -1 else time.monotonic() + timeout
+        with self._lock:
+            if key in self._data[type]:
+                self._remove(type, key)
+            self._data[type][key] = (value, expires)
+            if self._max_bytes is not None:
+                self._recency[(type, key)] = None
+            keys = self._keys[type].get(id(value))
+            if keys is None:
+                self._keys[type][id(value)] = {key: None}
+                if self._max_bytes is not None:
+                    size = _approximate_size(value)
+                    self._sizes[(type, id(value))] = size
+                    self._bytes[type] += size
+                    self._total_bytes += size
+            else:
+                keys[key] = None
+                self._touch(type, keys)
+
+            max_entries = self._max_entries.get(type, None)
+            if max_entries is not None:
+                while len(self._keys[type]) > max_entries:
+                    self._evict(type, next(iter(self._data[type])))
+            if self._max_bytes is not None:
+                # Always keep the newest value, even if it alone is over budget
+                while self._total_bytes > self._max_bytes and len(self._sizes) > 1:
+                    self._evict(*next(iter(self._recency)))
+
+    def get(self, type: Any, key: Any) -> Any:
+        with self._lock:
+            try:
+                value, expires = self._data[type][key]
+            except KeyError:
+                self._stats[type]["misses"] += 1
+                raise
+            if expires is not None and time.monotonic() > expires:
+                self._remove(type, key)
+                self._stats[type]["expirations"] += 1
+                self._stats[type]["misses"] += 1
+                raise KeyError(key)
+            self._touch(type, self._keys[type][id(value)])
+            self._stats[type]["hits"] += 1
+            return value
+
+    def _touch(self, type: Any, keys: Iterable[Any]) -> None:
+        # Marks a value, under all of its keys, as the most recently used
+        for key in keys:
+            self._data[type].move_to_end(key)
+            if self._max_bytes is not None:
+                self._recency.move_to_end((type, key))
+
+    def _evict(self, type: Any, key: Any) -> None:
+        value, _ = self._data[type][key]
+        for key in list(self._keys[type][id(value)]):
+            self._remove(type, key)
+        self._stats[type]["evictions"] += 1
+
+    def _remove(self, type: Any, key: Any) -> None:
+        value, _ = self._data[type].pop(key)
+        if self._max_bytes is not None:
+            del self._recency[(type, key)]
+        keys = self._keys[type][id(value)]
+        del keys[key]
+        if not keys:
+            del self._keys[type][id(value)]
+            if self._max_bytes is not None:
+                size = self._sizes.pop((type, id(value)))
+                self._bytes[type] -= size
+                self._total_bytes -= size
+
+    def discard(self, type: Any, keys: Iterable[Any]) -> None:
+        with self._lock:
+            for key in keys:
+                if key in self._data[type]:
+                    self._remove(type, key)
+
+    def clear(self, type: Any = None) -> None:
+        with self._lock:
+            types = list(self._data) if type is None else [type]
+            for type in types:
+                for key in list(self._data[type]):
+                    self._remove(type, key)
+
+    def expire(self, type: Any = None) -> None:
+        now = time.monotonic()
+        with self._lock:
+            types = list(self._data) if type is None else [type]
+            for type in types:
+                expired = [
+                    key
+                    for key, (_, expires) in self._data[type].items()
+                    if expires is not None and now > expires
+                ]
+                for key in expired:
+                    self._remove(type, key)
+                self._stats[type]["expirations"] += len(expired)
+
+    def usage(self) -> Dict[type, Dict[str, int]]:
+        with self._lock:
+            usage = {}
+            for type in set(self._data) | set(self._stats):
+                stats = {
+                    "entries": len(self._keys.get(type, ())),
+                    "hits": 0,
+                    "misses": 0,
+                    "evictions": 0,
+                    "expirations": 0,
+                }
+                stats.update(self._stats.get(type, {}))
+                if self._max_bytes is not None:
+                    stats["bytes"] = self._bytes.get(type, 0)
+                usage[type] = stats
+            return usage
+
 
 class Cache(DataSource, DataSink):
-    def __init__(self, expirations: Mapping[type, float] = None) -> None:
-        self._cache = CommonsCache()
+    def __init__(
+        self,
+        expirations: Mapping[type, float] = None,
+        max_entries: Mapping[type, int] = None,
+        max_bytes: int = None,
+        not_found_expirations: Mapping[type, float] = None,
+    ) -> None:
         self._expirations = (
             dict(expirations) if expirations is not None else default_expirations
         )
@@ -116,6 +328,35 @@ class Cache(DataSource, DataSink):
                 key = new_key
             if value != -1 and isinstance(value, datetime.timedelta):
                 self._expirations[key] = value.seconds + 24 * 60 * 60 * value.days
+        max_entries = dict(max_entries) if max_entries is not None else {}
+        for key in list(max_entries):
+            if isinstance(key, str):
+                max_entries[globals()[key]] = max_entries.pop(key)
+        self._cache = _BoundedCache(max_entries=max_entries, max_bytes=max_bytes)
+
+        self._not_found_expirations = (
+            dict(not_found_expirations)
+            if not_found_expirations is not None
+            else dict(default_not_found_expirations)
+        )
+        for key, value in list(self._not_found_expirations.items()):
+            if isinstance(key, str):
+                new_key = globals()[key]
+                self._not_found_expirations[new_key] = self._not_found_expirations.pop(
+                    key
+                )
+                key = new_key
+            if value != -1 and isinstance(value, datetime.timedelta):
+                self._not_found_expirations[key] = (
+                    value.seconds + 24 * 60 * 60 * value.days
+                )
+        # The pipeline asks for the data and DTO types, which are recorded under the type they're cached as
+        self._not_found_types = {}
+        for core_type in self._not_found_expirations:
+            for data_type in core_type._data_types:
+                self._not_found_types[data_type] = core_type
+                self._not_found_types[data_type._dto_type] = core_type
+        self._not_found = _BoundedCache()
 
     @DataSource.dispatch
     def get(
@@ -147,12 +388,19 @@ class Cache(DataSource, DataSink):
         context: PipelineContext = None,
     ) -> T:
         keys = key_function(query)
+        instrument = _instrumentation.current
         for key in keys:
             try:
-                return self._cache.get(type, key)
+                item = self._cache.get(type, key)
             except KeyError:
                 pass
+            else:
+                if instrument is not None:
+                    instrument.cache_lookup(type.__name__, True)
+                return item
         else:
+            if instrument is not None:
+                instrument.cache_lookup(type.__name__, False)
             raise NotFoundError
 
     def _get_many(
@@ -191,10 +439,12 @@ class Cache(DataSource, DataSink):
         except KeyError:
             expire_seconds = -1
 
-        if expire_seconds != 0:
-            keys = key_function(item)
-            for key in keys:
-                self._cache.put(type, key, item, expire_seconds)
+        if expire_seconds != 0 or type in self._not_found_expirations:
+            keys = list(key_function(item))
+            if expire_seconds != 0:
+                for key in keys:
+                    self._cache.put(type, key, item, expire_seconds)
+            self._put_found(type, item, keys)
 
     def _put_many(
         self,
@@ -206,16 +456,76 @@ class Cache(DataSource, DataSink):
         expire_seconds = self._expirations.get(type, default_expirations[type])
         for key, item in Cache._put_many_generator(items, key_function):
             self._cache.put(type, key, item, expire_seconds)
+            self._put_found(type, item, [key])
+
+    def _put_found(self, type: Type[T], item: T, keys: List[Any]) -> None:
+        # Once a loaded object is put, the queries for it are no longer "not found". Unloaded objects, which are put
+        # whenever one is created from a query, don't count.
+        if type not in self._not_found_expirations:
+            return
+        if isinstance(item, CassiopeiaGhost) and not any(
+            item._Ghost__is_loaded(data_type) for data_type in type._data_types
+        ):
+            return
+        self._not_found.discard(type, keys)
+
+    def _not_found_keys(self, type: Type[T], query: Mapping[str, Any]):
+        # Returns the type the query's object would be cached as and its keys, or (None, []) if that isn't known
+        try:
+            type = self._not_found_types[type]
+        except KeyError:
+            return None, []
+        query = dict(query)
+        try:
+            uniquekeys.convert_region_to_platform(query)
+            return type, _not_found_key_functions[type](query)
+        except (KeyError, ValueError):
+            return None, []
+
+    def is_not_found(self, type: Type[T], query: Mapping[str, Any]) -> bool:
+        """Whether no source could find the object for this query the last time it was requested, and that hasn't
+        expired."""
+        type, keys = self._not_found_keys(type, query)
+        if not keys:
+            return False
+        for key in keys:
+            try:
+                self._not_found.get(type, key)
+            except KeyError:
+                return False
+        return True
+
+    def put_not_found(self, type: Type[T], query: Mapping[str, Any]) -> None:
+        """Records that no source could find the object for this query, until a loaded object is put for it.
+
+        Unloaded objects are cached too, so putting one doesn't clear this.
+        """
+        type, keys = self._not_found_keys(type, query)
+        expire_seconds = self._not_found_expirations.get(type, 0)
+        # The keys of one query share a value, so they're counted and evicted together, like a cached object's keys
+        marker = object()
+        for key in keys:
+            self._not_found.put(type, key, marker, expire_seconds)
 
     def clear(self, type: Type[T] = None):
+        self._cache.clear(type)
         if type is None:
-            for key in self._cache._data:
-                self._cache._data[key].clear()
-        else:
-            self._cache._data[type].clear()
+            self._not_found.clear()
+        elif type in self._not_found_types or type in self._not_found_expirations:
+            self._not_found.clear(self._not_found_types.get(type, type))
 
     def expire(self, type: Type[T] = None):
         self._cache.expire(type)
+        if type is None:
+            self._not_found.expire()
+        elif type in self._not_found_types or type in self._not_found_expirations:
+            self._not_found.expire(self._not_found_types.get(type, type))
+
+    def usage(self) -> Dict[Type, Dict[str, int]]:
+        """Returns, for each type, the number of cached entries and the hits, misses, evictions, and expirations
+        seen so far. If `max_bytes` is set, the approximate size of the cached values is included as "bytes".
+        """
+        return self._cache.usage()
 
     #####################
     # Champion Rotation #
@@ -1,32 +1,78 @@
 import re
+import time
 import zlib
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, ExitStack
 from io import BytesIO
-from typing import Mapping, MutableMapping, Any, Union, Dict, List
-from urllib.parse import urlencode
+from typing import (
+    Mapping,
+    MutableMapping,
+    Any,
+    Union,
+    Dict,
+    List,
+    Tuple,
+    Optional,
+    Generator,
+)
+from urllib.parse import urlencode, urlsplit
 
 try:
+    import pycurl
     from pycurl import Curl
 
     USE_PYCURL = True
 except ImportError:
     import requests
+    import requests.adapters
 
     USE_PYCURL = False
     Curl = None  # This might break a few type hints but they are all internal and not user-facing.
 
 from merakicommons.ratelimits import RateLimiter
 
+from . import instrumentation as _instrumentation
+
 try:
     import certifi
 except ImportError:
     certifi = None
 
+try:
+    import aiohttp
+
+    USE_AIOHTTP = True
+except ImportError:
+    aiohttp = None
+
+    USE_AIOHTTP = False
+
 try:
     import ujson as json
 except ImportError:
     import json
 
+import json as _json  # The standard library's decoder is needed to decode JSON one value at a time
+
+# The fastest installed parser is used to decode response bodies straight from their bytes
+try:
+    import orjson
+
+    _loads = orjson.loads
+    JSON_PARSER = "orjson"
+except ImportError:
+    try:
+        import msgspec.json
+
+        _loads = msgspec.json.Decoder().decode
+        JSON_PARSER = "msgspec"
+    except ImportError:
+        _loads = json.loads
+        JSON_PARSER = json.__name__
+
 
 _print_calls = True
 _print_api_key = False
@@ -39,9 +85,165 @@ class HTTPError(RuntimeError):
         self.response_headers = response_headers or {}
 
 
+def loads(body: Union[str, bytes, dict, list]) -> Union[dict, list]:
+    """Decodes a JSON response body, which can be given as bytes, as text, or already decoded."""
+    if isinstance(body, (bytes, bytearray, memoryview, str)):
+        return _loads(body)
+    return body
+
+
+_whitespace = re.compile(r"[ \t\n\r]*")
+
+
+def _skip_whitespace(text: str, index: int) -> int:
+    return _whitespace.match(text, index).end()
+
+
+def iter_json_object(
+    body: Union[str, bytes], path: List[str] = (), streamed: List[str] = ()
+) -> Generator[Tuple[str, Any], None, None]:
+    """Decodes the JSON object at `path` in `body` one value at a time and yields its (key, value) pairs.
+
+    The values of the keys in `streamed` that are arrays are yielded as generators that decode one item at a time,
+    so that a large array (like the frames of a timeline) can be converted item by item rather than being decoded
+    all at once first.
+    """
+    if not isinstance(body, str):
+        body = bytes(body).decode("utf-8")
+    decoder = _json.JSONDecoder()
+    index = _skip_whitespace(body, 0)
+    for key in path:
+        index = _enter(body, index, "{")
+        while True:
+            name, index = _next_key(body, index, decoder)
+            if name is None:
+                raise KeyError(key)
+            if name == key:
+                break
+            _, index = decoder.raw_decode(body, index)
+    index = _enter(body, index, "{")
+    while True:
+        name, index = _next_key(body, index, decoder)
+        if name is None:
+            return
+        if name in streamed and body.startswith("[", index):
+            position = [index]
+            items = _iter_array(body, position, decoder)
+            yield name, items
+            for _ in items:  # Skip whatever wasn't used
+                pass
+            index = position[0]
+        else:
+            value, index = decoder.raw_decode(body, index)
+            yield name, value
+
+
+def _enter(body: str, index: int, token: str) -> int:
+    if not body.startswith(token, index):
+        raise ValueError(
+            "Expected '{}' at position {} of the JSON document.".format(token, index)
+        )
+    return index + 1
+
+
+def _next_key(
+    body: str, index: int, decoder: "_json.JSONDecoder"
+) -> Tuple[Optional[str], int]:
+    # Returns the next key of an object and the index of its value, or None and the index after the object
+    index = _skip_whitespace(body, index)
+    if body.startswith(",", index):
+        index = _skip_whitespace(body, index + 1)
+    if body.startswith("}", index):
+        return None, index + 1
+    name, index = decoder.raw_decode(body, index)
+    index = _skip_whitespace(body, index)
+    index = _skip_whitespace(body, _enter(body, index, ":"))
+    return name, index
+
+
+def _iter_array(
+    body: str, position: List[int], decoder: "_json.JSONDecoder"
+) -> Generator[Any, None, None]:
+    # `position` holds the index of the array, and is set to the index after it once every item has been decoded
+    index = _skip_whitespace(body, _enter(body, position[0], "["))
+    if body.startswith("]", index):
+        position[0] = index + 1
+        return
+    while True:
+        item, index = decoder.raw_decode(body, index)
+        yield item
+        index = _skip_whitespace(body, index)
+        if body.startswith("]", index):
+            position[0] = index + 1
+            return
+        index = _skip_whitespace(body, _enter(body, index, ","))
+
+
+def _decode_json(content: bytes, charset: Optional[re.Match]) -> Union[dict, list]:
+    # JSON is almost always UTF-8, which the parsers read directly
+    if charset is not None and charset.group(1) not in ("UTF-8", "UTF8"):
+        return _loads(content.decode(charset.group(1)))
+    return _loads(content)
+
+
+def _host(url: Union[str, bytes]) -> str:
+    if isinstance(url, bytes):
+        url = url.decode("utf-8")
+    return urlsplit(url).netloc
+
+
+def _pool_key(url: Union[str, bytes]) -> str:
+    # Connections are pooled per scheme and host
+    if isinstance(url, bytes):
+        url = url.decode("utf-8")
+    parts = urlsplit(url)
+    return "{}://{}".format(parts.scheme, parts.netloc)
+
+
 if USE_PYCURL:
 
     class HTTPClient(object):
+        """Makes blocking HTTP GET requests using pycurl.
+
+        If `pool_size` is positive, curl handles are kept open after each request and reused for later requests to
+        the same host (up to `pool_size` idle handles per host), so connections are kept alive between calls. If
+        `http2` is set and libcurl supports it, HTTP/2 is negotiated for https connections.
+        """
+
+        def __init__(self, pool_size: int = 0, http2: bool = True):
+            self._pool_size = pool_size
+            self._http2 = http2
+            self._idle: Dict[str, List[Curl]] = {}
+            self._lock = threading.Lock()
+
+        def _checkout(self, key: str) -> Curl:
+            with self._lock:
+                idle = self._idle.get(key, None)
+                if idle:
+                    return idle.pop()
+            curl = Curl()
+            if self._http2:
+                try:
+                    curl.setopt(curl.HTTP_VERSION, pycurl.CURL_HTTP_VERSION_2TLS)
+                except (AttributeError, pycurl.error):
+                    pass  # This libcurl doesn't support HTTP/2
+            return curl
+
+        def _checkin(self, key: str, curl: Curl) -> None:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self._pool_size:
+                    idle.append(curl)
+                    return
+            curl.close()
+
+        def close(self) -> None:
+            with self._lock:
+                idle, self._idle = self._idle, {}
+            for handles in idle.values():
+                for curl in handles:
+                    curl.close()
+
         @staticmethod
         def _execute(curl: Curl, close_connection: bool) -> int:
             curl.perform()
@@ -107,12 +309,19 @@ if USE_PYCURL:
                         for rate_limiter in rate_limiters
                     ]
                     exit_limiters = stack.pop_all().__exit__
+                    start = time.perf_counter()
                     status_code = HTTPClient._execute(curl, connection is None)
                 exit_limiters(None, None, None)
             else:
+                start = time.perf_counter()
                 status_code = HTTPClient._execute(curl, connection is None)
 
             body = buffer.getvalue()
+            instrument = _instrumentation.current
+            if instrument is not None:
+                instrument.http_request(
+                    _host(url), status_code, time.perf_counter() - start, len(body)
+                )
 
             # Decompress if we got gzipped data
             try:
@@ -132,6 +341,7 @@ if USE_PYCURL:
             rate_limiters: List[RateLimiter] = None,
             connection: Curl = None,
             encode_parameters: bool = True,
+            decode_json: bool = True,
         ) -> (Union[dict, list, str, bytes], dict):
             if parameters:
                 if encode_parameters:
@@ -142,23 +352,32 @@ if USE_PYCURL:
                     parameters = urlencode(parameters, doseq=True)
                 url = "{url}?{params}".format(url=url, params=parameters)
 
-            status_code, body, response_headers = HTTPClient._get(
-                url, headers, rate_limiters, connection
-            )
+            if connection is None and self._pool_size > 0:
+                key = _pool_key(url)
+                curl = self._checkout(key)
+                try:
+                    status_code, body, response_headers = HTTPClient._get(
+                        url, headers, rate_limiters, curl
+                    )
+                except BaseException:
+                    curl.close()  # Don't put a handle in an unknown state back in the pool
+                    raise
+                self._checkin(key, curl)
+            else:
+                status_code, body, response_headers = HTTPClient._get(
+                    url, headers, rate_limiters, connection
+                )
 
             content_type = response_headers.get(
                 "Content-Type", "application/octet-stream"
             ).upper()
 
-            # Decode to text if a charset is included
-            match = re.search("CHARSET=(\S+)", content_type)
-            if match:
-                encoding = match.group(1)
-                body = body.decode(encoding)
-
-                # Load JSON if necessary
-                if "APPLICATION/JSON" in content_type:
-                    body = json.loads(body)
+            # Decode JSON straight from the bytes, or decode to text if a charset is included
+            match = re.search(r"CHARSET=(\S+)", content_type)
+            if decode_json and "APPLICATION/JSON" in content_type:
+                body = _decode_json(body, match)
+            elif match:
+                body = body.decode(match.group(1))
 
             # Handle errors
             if status_code >= 400:
@@ -183,12 +402,45 @@ if USE_PYCURL:
 else:  # Use requests
 
     class HTTPClient(object):
-        @staticmethod
+        """Makes blocking HTTP GET requests using requests.
+
+        If `pool_size` is positive, each host gets its own `requests.Session` that keeps up to `pool_size`
+        connections alive between calls. requests only speaks HTTP/1.1, so `http2` is accepted for parity with the
+        pycurl client and ignored.
+        """
+
+        def __init__(self, pool_size: int = 0, http2: bool = True):
+            self._pool_size = pool_size
+            self._http2 = http2
+            self._sessions: Dict[str, requests.Session] = {}
+            self._lock = threading.Lock()
+
+        def _get_session(self, url: str) -> requests.Session:
+            key = _pool_key(url)
+            with self._lock:
+                session = self._sessions.get(key, None)
+                if session is None:
+                    session = requests.Session()
+                    adapter = requests.adapters.HTTPAdapter(
+                        pool_connections=1, pool_maxsize=self._pool_size
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._sessions[key] = session
+            return session
+
+        def close(self) -> None:
+            with self._lock:
+                sessions, self._sessions = self._sessions, {}
+            for session in sessions.values():
+                session.close()
+
         def _get(
+            self,
             url: str,
             headers: Mapping[str, str] = None,
             rate_limiters: List[RateLimiter] = None,
-        ) -> (int, bytes, dict):
+        ) -> requests.Response:
             if not headers:
                 request_headers = {"Accept-Encoding": "gzip"}
             else:
@@ -206,6 +458,10 @@ else:  # Use requests
                     else:
                         _url += "&api_key={}".format(headers["X-Riot-Token"])
                 print("Making call: {}".format(_url))
+            if self._pool_size > 0:
+                get = self._get_session(url).get
+            else:
+                get = requests.get
             if rate_limiters:
                 with ExitStack() as stack:
                     # Enter each context manager / rate limiter
@@ -214,11 +470,23 @@ else:  # Use requests
                         for rate_limiter in rate_limiters
                     ]
                     exit_limiters = stack.pop_all().__exit__
-                    r = requests.get(url, headers=request_headers)
+                    start = time.perf_counter()
+                    r = get(url, headers=request_headers)
                 exit_limiters(None, None, None)
             else:
-                r = requests.get(url, headers=request_headers)
-
+                start = time.perf_counter()
+                r = get(url, headers=request_headers)
+
+            instrument = _instrumentation.current
+            if instrument is not None:
+                # Content-Length is the size on the wire, before any decompression
+                size = r.headers.get("Content-Length", None)
+                instrument.http_request(
+                    _host(url),
+                    r.status_code,
+                    time.perf_counter() - start,
+                    int(size) if size is not None else len(r.content),
+                )
             return r
 
         def get(
@@ -229,6 +497,7 @@ else:  # Use requests
             rate_limiters: List[RateLimiter] = None,
             connection: Curl = None,
             encode_parameters: bool = True,
+            decode_json: bool = True,
         ) -> (Union[dict, list, str, bytes], dict):
             if parameters:
                 if encode_parameters:
@@ -240,7 +509,7 @@ else:  # Use requests
                 url = "{url}?{params}".format(url=url, params=parameters)
 
             # status_code, body, response_headers = HTTPClient._get(url, headers, rate_limiters)
-            r = HTTPClient._get(url, headers, rate_limiters)
+            r = self._get(url, headers, rate_limiters)
             response_headers = r.headers
 
             # Handle errors
@@ -251,14 +520,12 @@ else:  # Use requests
                 "Content-Type", "application/octet-stream"
             ).upper()
 
-            # Decode to text if a charset is included
-            match = re.search("CHARSET=(\S+)", content_type)
-            if match:
-                # Load JSON if necessary
-                if "APPLICATION/JSON" in content_type:
-                    body = r.json()
-                else:
-                    body = r.content.decode("utf-8")
+            # Decode JSON straight from the bytes, or decode to text if a charset is included
+            match = re.search(r"CHARSET=(\S+)", content_type)
+            if decode_json and "APPLICATION/JSON" in content_type:
+                body = _decode_json(r.content, match)
+            elif match:
+                body = r.content.decode("utf-8")
             elif "IMAGE/" in content_type:
                 body = r.content
             else:
@@ -271,3 +538,194 @@ else:  # Use requests
             session = requests.Session()
             yield session
             session.close()
+
+
+async def _close_at_shutdown(session: "aiohttp.ClientSession"):
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+class AsyncHTTPClient(object):
+    """An asyncio counterpart to `HTTPClient`.
+
+    If aiohttp is installed, requests are made on the event loop and only the (blocking) rate limiter acquisition is
+    pushed onto a worker thread. Otherwise each request is run through a blocking `HTTPClient` on a worker thread.
+    In both cases at most `max_concurrency` requests are in flight at once.
+    """
+
+    def __init__(self, http_client: HTTPClient = None, max_concurrency: int = 100):
+        if http_client is None:
+            self._client = HTTPClient()
+        else:
+            self._client = http_client
+        self._max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="cassiopeia-http"
+        )
+        # Each loop's semaphore and aiohttp session, and the suspended async generator that closes the session
+        self._semaphores = {}
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        return self._executor
+
+    def _prune(self) -> None:
+        # asyncio.run closes its loop when it's done, so every call to it leaves entries behind that can't be used again
+        with self._lock:
+            for loop in [loop for loop in self._semaphores if loop.is_closed()]:
+                del self._semaphores[loop]
+            for loop in [loop for loop in self._sessions if loop.is_closed()]:
+                del self._sessions[loop]
+
+    def _get_semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        # asyncio primitives are bound to the loop they are first used on
+        try:
+            return self._semaphores[loop]
+        except KeyError:
+            self._prune()
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+            with self._lock:
+                return self._semaphores.setdefault(loop, semaphore)
+
+    async def _get_session(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> "aiohttp.ClientSession":
+        session, closer = self._sessions.get(loop, (None, None))
+        if session is None or session.closed:
+            self._prune()
+            session = aiohttp.ClientSession()
+            # Started and left suspended, so that the loop closes the session when it shuts down (as asyncio.run does
+            # before closing the loop) if `close` isn't called first
+            closer = _close_at_shutdown(session)
+            await closer.__anext__()
+            with self._lock:
+                self._sessions[loop] = (session, closer)
+        return session
+
+    async def close(self) -> None:
+        """Closes the aiohttp session of the running event loop. Call this before the loop is closed if it isn't
+        closed by `asyncio.run`, which closes the sessions itself."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._semaphores.pop(loop, None)
+            session, closer = self._sessions.pop(loop, (None, None))
+        if closer is not None:
+            await closer.aclose()
+
+    async def get(
+        self,
+        url: str,
+        parameters: MutableMapping[str, Any] = None,
+        headers: Mapping[str, str] = None,
+        rate_limiters: List[RateLimiter] = None,
+        connection: Any = None,
+        encode_parameters: bool = True,
+        decode_json: bool = True,
+    ) -> (Union[dict, list, str, bytes], dict):
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore(loop):
+            if not USE_AIOHTTP:
+                return await loop.run_in_executor(
+                    self._executor,
+                    functools.partial(
+                        self._client.get,
+                        url=url,
+                        parameters=parameters,
+                        headers=headers,
+                        rate_limiters=rate_limiters,
+                        encode_parameters=encode_parameters,
+                        decode_json=decode_json,
+                    ),
+                )
+            return await self._get(
+                loop,
+                url,
+                parameters,
+                headers,
+                rate_limiters,
+                encode_parameters,
+                decode_json,
+            )
+
+    async def _get(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        url: str,
+        parameters: MutableMapping[str, Any],
+        headers: Mapping[str, str],
+        rate_limiters: List[RateLimiter],
+        encode_parameters: bool,
+        decode_json: bool,
+    ) -> (Union[dict, list, str, bytes], dict):
+        if parameters:
+            if encode_parameters:
+                parameters = {
+                    k: str(v).lower() if isinstance(v, bool) else v
+                    for k, v in parameters.items()
+                }
+                parameters = urlencode(parameters, doseq=True)
+            url = "{url}?{params}".format(url=url, params=parameters)
+
+        request_headers = {k: v for k, v in (headers or {}).items()}
+        if "Accept-Encoding" not in request_headers:
+            request_headers["Accept-Encoding"] = "gzip"
+
+        if _print_calls:
+            _url = url
+            if _print_api_key and ".api.riotgames.com/lol" in _url:
+                if "?" not in _url:
+                    _url += "?api_key={}".format(headers["X-Riot-Token"])
+                else:
+                    _url += "&api_key={}".format(headers["X-Riot-Token"])
+            print("Making call: {}".format(_url))
+
+        # The rate limiters block the calling thread, so wait on them from a worker thread instead of the event loop
+        entered = []
+        try:
+            for rate_limiter in rate_limiters or []:
+                await loop.run_in_executor(self._executor, rate_limiter.__enter__)
+                entered.append(rate_limiter)
+            start = time.perf_counter()
+            session = await self._get_session(loop)
+            async with session.get(url, headers=request_headers) as response:
+                status_code = response.status
+                reason = response.reason
+                response_headers = dict(response.headers)
+                content = await response.read()
+        finally:
+            for rate_limiter in reversed(entered):
+                rate_limiter.__exit__(None, None, None)
+
+        instrument = _instrumentation.current
+        if instrument is not None:
+            size = response_headers.get("Content-Length", None)
+            instrument.http_request(
+                _host(url),
+                status_code,
+                time.perf_counter() - start,
+                int(size) if size is not None else len(content),
+            )
+
+        if status_code >= 400:
+            raise HTTPError(reason, status_code, response_headers)
+
+        content_type = response_headers.get(
+            "Content-Type", "application/octet-stream"
+        ).upper()
+
+        # Decode JSON straight from the bytes, or decode to text if a charset is included
+        match = re.search(r"CHARSET=(\S+)", content_type)
+        if decode_json and "APPLICATION/JSON" in content_type:
+            body = _decode_json(content, match)
+        elif match:
+            body = content.decode(match.group(1))
+        elif "IMAGE/" in content_type:
+            body = content
+        else:
+            body = content.decode("utf-8")
+
+        return body, response_headers
@@ -1,5 +1,6 @@
 import copy
-from typing import Type, TypeVar, MutableMapping, Any, Iterable
+import threading
+from typing import Type, TypeVar, MutableMapping, Any, Iterable, List, Dict
 from collections import defaultdict
 
 from datapipelines import (
@@ -20,15 +21,10 @@ from ..dto.staticdata.profileicon import ProfileIconDataDto
 from ..dto.staticdata.language import LanguagesDto, LanguageStringsDto
 from ..dto.staticdata.realm import RealmDto
 from ..dto.staticdata.map import MapDto, MapListDto
-from .common import HTTPClient, HTTPError
+from .common import HTTPClient, HTTPError, loads
 from .riotapi.common import _get_latest_version
 from .uniquekeys import _hash_included_data, convert_region_to_platform
 
-try:
-    import ujson as json
-except ImportError:
-    import json
-
 T = TypeVar("T")
 
 
@@ -46,6 +42,9 @@ class DDragon(DataSource):
             SummonerSpellListDto: {},
             MapListDto: {},
         }
+        # CommunityDragon's perks aren't versioned, so they're only downloaded once for every rune list
+        self._cdragon_perks = None
+        self._cdragon_perks_lock = threading.Lock()
 
     @DataSource.dispatch
     def get(
@@ -65,6 +64,13 @@ class DDragon(DataSource):
     ) -> Iterable[T]:
         pass
 
+    def _get_json(self, url: str) -> Any:
+        # Every file is downloaded here, so other sources of the same files only need to override this
+        try:
+            return loads(self._client.get(url)[0])
+        except HTTPError as e:
+            raise NotFoundError(str(e)) from e
+
     def calculate_hash(self, query):
         hash = list(value for _, value in sorted(query.items()))
         for i, value in enumerate(hash):
@@ -154,10 +160,7 @@ class DDragon(DataSource):
         url = "https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/championFull.json".format(
             version=query["version"], locale=locale
         )
-        try:
-            body = json.loads(self._client.get(url)[0])
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
+        body = self._get_json(url)
 
         for champ_name, champ in body["data"].items():
             champ = ChampionDto(champ)
@@ -245,10 +248,7 @@ class DDragon(DataSource):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> VersionListDto:
         url = "https://ddragon.leagueoflegends.com/api/versions.json"
-        try:
-            body = json.loads(self._client.get(url)[0])
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
+        body = self._get_json(url)
 
         return VersionListDto(
             {"region": query["platform"].region.value, "versions": body}
@@ -269,11 +269,7 @@ class DDragon(DataSource):
         url = "https://ddragon.leagueoflegends.com/realms/{region}.json".format(
             region=region.value.lower()
         )
-        try:
-            body = json.loads(self._client.get(url)[0])
-
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
+        body = self._get_json(url)
 
         body["region"] = query["platform"].region.value
         return RealmDto(body)
@@ -290,10 +286,7 @@ class DDragon(DataSource):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> LanguagesDto:
         url = "https://ddragon.leagueoflegends.com/cdn/languages.json"
-        try:
-            body = json.loads(self._client.get(url)[0])
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
+        body = self._get_json(url)
 
         data = {"region": query["platform"].region.value, "languages": body}
         return LanguagesDto(data)
@@ -375,10 +368,7 @@ class DDragon(DataSource):
         url = "https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/map.json".format(
             version=query["version"], locale=locale
         )
-        try:
-            body = json.loads(self._client.get(url)[0])
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
+        body = self._get_json(url)
 
         body["region"] = query["platform"].region.value
         body["locale"] = locale
@@ -416,10 +406,7 @@ class DDragon(DataSource):
         url = "https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/language.json".format(
             version=query["version"], locale=locale
         )
-        try:
-            body = json.loads(self._client.get(url)[0])
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
+        body = self._get_json(url)
 
         body["region"] = query["platform"].region.value
         body["locale"] = locale
@@ -513,16 +500,9 @@ class DDragon(DataSource):
         url = "https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/runesReforged.json".format(
             version=query["version"], locale=locale
         )
-        try:
-            body = json.loads(self._client.get(url)[0])
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
+        body = self._get_json(url)
 
-        cdragon_url = "https://raw.communitydragon.org/pbe/plugins/rcp-be-lol-game-data/global/default/v1/perks.json"
-        try:
-            cdragon_body = json.loads(self._client.get(cdragon_url)[0])
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
+        cdragon_body = self._get_cdragon_perks()
 
         cdragon_runes = []
         for rune in cdragon_body:
@@ -572,6 +552,13 @@ class DDragon(DataSource):
         self._cache[RuneListDto][ahash] = result
         return result
 
+    def _get_cdragon_perks(self) -> List[Dict[str, Any]]:
+        with self._cdragon_perks_lock:
+            if self._cdragon_perks is None:
+                cdragon_url = "https://raw.communitydragon.org/pbe/plugins/rcp-be-lol-game-data/global/default/v1/perks.json"
+                self._cdragon_perks = self._get_json(cdragon_url)
+            return self._cdragon_perks
+
     _validate_get_rune_paths_query = (
         Query.has("platform")
         .as_(Platform)
@@ -684,10 +671,7 @@ class DDragon(DataSource):
         url = "https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/item.json".format(
             version=query["version"], locale=locale
         )
-        try:
-            body = json.loads(self._client.get(url)[0])
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
+        body = self._get_json(url)
 
         body.pop("basic")
 
@@ -804,10 +788,7 @@ class DDragon(DataSource):
         url = "https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/summoner.json".format(
             version=query["version"], locale=locale
         )
-        try:
-            body = json.loads(self._client.get(url)[0])
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
+        body = self._get_json(url)
 
         for ss_name, ss in body["data"].items():
             ss = SummonerSpellDto(ss)
@@ -854,10 +835,7 @@ class DDragon(DataSource):
         url = "https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/profileicon.json".format(
             version=query["version"], locale=locale
         )
-        try:
-            body = json.loads(self._client.get(url)[0])
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
+        body = self._get_json(url)
 
         body["region"] = query["platform"].region.value
         body["locale"] = locale
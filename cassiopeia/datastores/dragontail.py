@@ -0,0 +1,294 @@
+import mmap
+import os
+import re
+import tarfile
+import threading
+from io import BytesIO
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    MutableMapping,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from datapipelines import (
+    CompositeDataSource,
+    DataSource,
+    NotFoundError,
+    PipelineContext,
+    Query,
+)
+from PIL import Image as ImageLoader
+from PIL.Image import Image
+
+from ..data import Region
+from .common import JSON_PARSER, loads
+from .ddragon import DDragon
+
+T = TypeVar("T")
+
+_CDN = re.compile(r"https://ddragon\.leagueoflegends\.com/cdn/(.+)")
+_REALMS = re.compile(r"https://ddragon\.leagueoflegends\.com/realms/([a-z]+)\.json")
+_VERSIONS_URL = "https://ddragon.leagueoflegends.com/api/versions.json"
+_PERKS_URL = "https://raw.communitydragon.org/pbe/plugins/rcp-be-lol-game-data/global/default/v1/perks.json"
+_VERSION = re.compile(r"\d+\.\d+\.\d+")
+
+# JSON files at least this big are memory-mapped instead of read, if the JSON parser can decode from a buffer
+_MMAP_SIZE = 1 << 20
+_PARSES_BUFFERS = JSON_PARSER in ("orjson", "msgspec")
+
+
+def _version_key(version: str) -> tuple:
+    return tuple(int(part) for part in version.split("."))
+
+
+class _Directory(object):
+    # An extracted dragontail
+    def __init__(self, path: str) -> None:
+        self._root = os.path.abspath(path)
+
+    def _path(self, name: str) -> str:
+        path = os.path.normpath(os.path.join(self._root, *name.split("/")))
+        if not path.startswith(self._root + os.sep) or not os.path.isfile(path):
+            raise KeyError(name)
+        return path
+
+    def versions(self) -> List[str]:
+        return [
+            name
+            for name in os.listdir(self._root)
+            if _VERSION.fullmatch(name)
+            and os.path.isdir(os.path.join(self._root, name, "data"))
+        ]
+
+    def read(self, name: str) -> bytes:
+        with open(self._path(name), "rb") as file:
+            return file.read()
+
+    def load_json(self, name: str) -> Any:
+        path = self._path(name)
+        with open(path, "rb") as file:
+            if not _PARSES_BUFFERS or os.fstat(file.fileno()).st_size < _MMAP_SIZE:
+                return loads(file.read())
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return loads(view)
+
+
+class _Archive(object):
+    # A dragontail that's still a (usually gzipped) tar archive. Nothing is read until the first file is needed, and
+    # then only the archive's index; each file is decompressed when it's asked for.
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._tar = None
+        self._members = None
+        self._lock = threading.Lock()
+
+    def _index(self) -> Dict[str, tarfile.TarInfo]:
+        # Must be called with the lock held, since a tar file can only be read from one thread at a time
+        if self._members is None:
+            self._tar = tarfile.open(self._path, "r:*")
+            members = {}
+            for member in self._tar:
+                if member.isfile():
+                    name = (
+                        member.name[2:] if member.name.startswith("./") else member.name
+                    )
+                    members[name] = member
+            self._members = members
+        return self._members
+
+    def versions(self) -> List[str]:
+        with self._lock:
+            members = self._index()
+        return list(
+            {
+                name.split("/", 1)[0]
+                for name in members
+                if _VERSION.fullmatch(name.split("/", 1)[0])
+            }
+        )
+
+    def read(self, name: str) -> bytes:
+        with self._lock:
+            member = self._index()[name]
+            return self._tar.extractfile(member).read()
+
+    def load_json(self, name: str) -> Any:
+        return loads(self.read(name))
+
+
+def _open_bundle(path: str) -> Union[_Directory, _Archive]:
+    path = os.path.expanduser(path)
+    if os.path.isdir(path):
+        return _Directory(path)
+    if os.path.isfile(path):
+        return _Archive(path)
+    raise ValueError("No dragontail at {}".format(path))
+
+
+class _Bundles(object):
+    # The dragontails of one data source, in the order they're looked in
+    def __init__(self, paths: List[str]) -> None:
+        self._bundles = [_open_bundle(path) for path in paths]
+        self._versions = None
+
+    @property
+    def versions(self) -> List[str]:
+        # Newest first, like Data Dragon's list
+        if self._versions is None:
+            versions = {
+                version for bundle in self._bundles for version in bundle.versions()
+            }
+            self._versions = sorted(versions, key=_version_key, reverse=True)
+        return self._versions
+
+    def read(self, name: str) -> bytes:
+        for bundle in self._bundles:
+            try:
+                return bundle.read(name)
+            except KeyError:
+                pass
+        raise NotFoundError("{} isn't in the dragontail".format(name))
+
+    def load_json(self, name: str) -> Any:
+        for bundle in self._bundles:
+            try:
+                return bundle.load_json(name)
+            except KeyError:
+                pass
+        raise NotFoundError("{} isn't in the dragontail".format(name))
+
+
+class _DragontailDDragon(DDragon):
+    # Serves the same data as DDragon, from the files in the dragontails instead of the ones on Data Dragon
+    def __init__(self, bundles: _Bundles, perks_path: str = None) -> None:
+        super().__init__()
+        self._bundles = bundles
+        self._perks_path = perks_path
+
+    def _get_json(self, url: str) -> Any:
+        match = _CDN.fullmatch(url)
+        if match is not None:
+            return self._bundles.load_json(match.group(1))
+        if url == _VERSIONS_URL:
+            if not self._bundles.versions:
+                raise NotFoundError("There are no versions in the dragontail")
+            return list(self._bundles.versions)
+        match = _REALMS.fullmatch(url)
+        if match is not None:
+            return self._get_realms(Region(match.group(1).upper()))
+        if url == _PERKS_URL:
+            # CommunityDragon's perks (for the stat runes) aren't in Data Dragon's archives
+            if self._perks_path is not None:
+                with open(os.path.expanduser(self._perks_path), "rb") as file:
+                    return loads(file.read())
+            return self._bundles.load_json("perks.json")
+        raise NotFoundError("{} isn't in the dragontail".format(url))
+
+    def _get_realms(self, region: Region) -> Dict[str, Any]:
+        # The archives don't have the realms, so the latest version in them is the latest version of everything
+        if not self._bundles.versions:
+            raise NotFoundError("There are no versions in the dragontail")
+        latest = self._bundles.versions[0]
+        return {
+            "n": {
+                name: latest
+                for name in (
+                    "item",
+                    "rune",
+                    "mastery",
+                    "summoner",
+                    "champion",
+                    "profileicon",
+                    "map",
+                    "language",
+                    "sticker",
+                )
+            },
+            "v": latest,
+            "l": region.default_locale,
+            "cdn": "https://ddragon.leagueoflegends.com/cdn",
+            "dd": latest,
+            "lg": latest,
+            "css": latest,
+            "profileiconmax": 28,
+            "store": None,
+        }
+
+
+class _DragontailImages(DataSource):
+    # Serves the images at Data Dragon URLs from the files in the dragontails
+    def __init__(self, bundles: _Bundles) -> None:
+        self._bundles = bundles
+
+    @DataSource.dispatch
+    def get(
+        self,
+        type: Type[T],
+        query: MutableMapping[str, Any],
+        context: PipelineContext = None,
+    ) -> T:
+        pass
+
+    @DataSource.dispatch
+    def get_many(
+        self,
+        type: Type[T],
+        query: MutableMapping[str, Any],
+        context: PipelineContext = None,
+    ) -> Iterable[T]:
+        pass
+
+    def _open(self, url: str) -> Image:
+        match = _CDN.fullmatch(url) if isinstance(url, str) else None
+        if match is None:
+            raise NotFoundError("{} isn't in the dragontail".format(url))
+        return ImageLoader.open(BytesIO(self._bundles.read(match.group(1))))
+
+    _validate_get_image = Query.has("url").as_(str)
+
+    @get.register(Image)
+    def get_image(
+        self, query: MutableMapping[str, Any], context: PipelineContext = None
+    ) -> Image:
+        _DragontailImages._validate_get_image(query, context)
+        return self._open(query["url"])
+
+    _validate_get_many_image = Query.has("urls").as_(Iterable)
+
+    @get_many.register(Image)
+    def get_many_image(
+        self, query: MutableMapping[str, Any], context: PipelineContext = None
+    ) -> Generator[Image, None, None]:
+        _DragontailImages._validate_get_many_image(query, context)
+
+        def generator():
+            for url in query["urls"]:
+                yield self._open(url)
+
+        return generator()
+
+
+def Dragontail(
+    path: Union[str, List[str]], perks_path: str = None
+) -> CompositeDataSource:
+    """Serves the static data, versions, languages and images in Data Dragon's full archives (dragontail-{version}.tgz)
+    without making any requests.
+
+    `path` is an archive or the directory it was extracted to, or a list of them (e.g. one for each version). Archives
+    are read without extracting them, but each file has to be decompressed whenever it's needed, so extracting them is
+    faster. The latest version in them is used as the latest version of the static data.
+
+    The stat runes come from CommunityDragon's perks.json, which isn't in the archives. It's read from `perks_path`,
+    or from the top of an archive if it's put there; without it, the runes aren't found here.
+    """
+    bundles = _Bundles([path] if isinstance(path, str) else list(path))
+    return CompositeDataSource(
+        {_DragontailDDragon(bundles, perks_path), _DragontailImages(bundles)}
+    )
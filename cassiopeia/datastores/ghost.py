@@ -1,4 +1,7 @@
 from typing import Type, TypeVar, MutableMapping, Any, Iterable
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor
+import collections
 import copy
 
 from datapipelines import DataSource, PipelineContext, Query, validate_query
@@ -334,6 +337,12 @@ class UnloadedGhostStore(DataSource):
         .as_(MatchType)
         .also.can_have("queue")
         .as_(Queue)
+        .also.can_have("prefetch")
+        .as_(int)
+        .also.can_have("prefetchConcurrency")
+        .as_(int)
+        .also.can_have("prefetchTimelines")
+        .as_(bool)
     )
 
     _validate_get_timeline_query = (
@@ -607,11 +616,34 @@ class UnloadedGhostStore(DataSource):
         type = query.get("type", None)
         start_time = query.get("startTime", None)
         end_time = query.get("endTime", None)
+        prefetch = query.get("prefetch", 0)
+        prefetch_concurrency = query.get("prefetchConcurrency", 4)
+        prefetch_timelines = query.get("prefetchTimelines", False)
+        pipeline = context[context.Keys.PIPELINE]
+
+        def get_matchlist(start: int, count: int) -> MatchListData:
+            new_query = {
+                "continent": continent,
+                "puuid": puuid,
+                "start": start,
+                "count": count,
+            }
+            if start_time is not None:
+                new_query["startTime"] = start_time
+            if end_time is not None:
+                new_query["endTime"] = end_time
+            if queue is not None:
+                new_query["queue"] = queue
+            if type is not None:
+                new_query["type"] = type
+            return pipeline.get(MatchListData, query=new_query)
 
         # Create the generator that will populate the match history object.
+        # If an executor is given, the next page is requested on it while the current one is being consumed.
         def generate_matchlists(
             start: int,
             count: int = None,
+            executor: ThreadPoolExecutor = None,
         ):
             _start = start
 
@@ -619,25 +651,24 @@ class UnloadedGhostStore(DataSource):
                 count = float(count)
 
             pulled_matches = 0
+            next_page = None
             while pulled_matches < count:
-                new_query = {
-                    "continent": continent,
-                    "puuid": puuid,
-                    "start": _start,
-                    "count": count,
-                }
-                if start_time is not None:
-                    new_query["startTime"] = start_time
-                if end_time is not None:
-                    new_query["endTime"] = end_time
-                if queue is not None:
-                    new_query["queue"] = queue
-                if type is not None:
-                    new_query["type"] = type
-
-                data = context[context.Keys.PIPELINE].get(
-                    MatchListData, query=new_query
-                )
+                if next_page is not None:
+                    data = next_page.result()
+                else:
+                    data = get_matchlist(_start, count)
+
+                # Stop after this page if the API returned less data than we asked for, and so there isn't any more
+                # left
+                last_page = len(data) < data.pulled_match_count
+                if (
+                    executor is not None
+                    and not last_page
+                    and pulled_matches + len(data) < count
+                ):
+                    next_page = executor.submit(
+                        get_matchlist, _start + data.pulled_match_count, count
+                    )
 
                 matchrefdata = None
                 for matchrefdata in data:
@@ -648,13 +679,50 @@ class UnloadedGhostStore(DataSource):
                     if pulled_matches >= count:
                         break
 
-                if len(data) < data.pulled_match_count:
-                    # Stop because the API returned less data than we asked for, and so there isn't any more left
+                if last_page:
                     break
 
                 _start += data.pulled_match_count
 
-        generator = generate_matchlists(start, count)
+        def load_match(match: Match) -> None:
+            match.load()
+            if prefetch_timelines:
+                match.timeline.load()
+
+        # Loads the next `prefetch` matches (and their timelines) in the background while the consumer works on
+        # the current one.
+        def prefetch_matches(start: int, count: int = None):
+            executor = ThreadPoolExecutor(
+                max_workers=prefetch_concurrency,
+                thread_name_prefix="cassiopeia-match-history",
+            )
+            pending = collections.deque()
+            first = True
+            try:
+                for match in generate_matchlists(start, count, executor):
+                    future = executor.submit(load_match, match)
+                    pending.append((match, future))
+                    if first:
+                        # The rate limiters don't know the real limits for an endpoint until Riot has sent them back,
+                        # so the first match is loaded on its own before the rest are fanned out.
+                        futures.wait([future])
+                        first = False
+                    if len(pending) > prefetch:
+                        match, future = pending.popleft()
+                        # A match that failed to load raises the error again when it's used
+                        futures.wait([future])
+                        yield match
+                while pending:
+                    match, future = pending.popleft()
+                    futures.wait([future])
+                    yield match
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        if prefetch > 0:
+            generator = prefetch_matches(start, count)
+        else:
+            generator = generate_matchlists(start, count)
 
         generator = MatchHistory.from_generator(
             generator=generator,
@@ -0,0 +1,397 @@
+import bisect
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Mapping, Optional, Tuple, Union
+
+try:
+    from opentelemetry import metrics as otel_metrics
+    from opentelemetry import trace as otel_trace
+
+    OPENTELEMETRY_INSTALLED = True
+except ImportError:
+    otel_metrics = None
+    otel_trace = None
+
+    OPENTELEMETRY_INSTALLED = False
+
+
+class Instrumentation(object):
+    """Receives measurements from the HTTP clients, Riot API requests, rate limiters, and the cache.
+
+    Every method does nothing; subclasses override the ones they need. Methods are called on whichever thread made
+    the measurement, so implementations must be thread-safe.
+    """
+
+    def http_request(self, host: str, status: int, seconds: float, bytes: int) -> None:
+        """An HTTP request to `host` got a response with `status` after `seconds` (not counting rate limiter
+        waits), and `bytes` were received."""
+        pass
+
+    def api_request(
+        self, endpoint: str, platform: str, status: int, seconds: float
+    ) -> None:
+        """A Riot API request to `endpoint` (e.g. "matches/id") finished with `status` after `seconds`, including
+        rate limiter waits and retries."""
+        pass
+
+    def rate_limiter_wait(self, limiter: str, seconds: float) -> None:
+        """A request waited `seconds` for a permit from `limiter` (e.g. "NA1:application")."""
+        pass
+
+    def rate_limited(self, limit_type: str, endpoint: str) -> None:
+        """The Riot API responded with a 429 for the "application", "method", or "service" limit."""
+        pass
+
+    def retry(self, status: int, strategy: str, seconds: float) -> None:
+        """A request that failed with `status` is being retried by `strategy` (e.g. "exponential_backoff"), after
+        waiting `seconds`."""
+        pass
+
+    def cache_lookup(self, type: str, hit: bool) -> None:
+        """An object of `type` was looked up in the cache."""
+        pass
+
+    def close(self) -> None:
+        """Releases anything the instrumentation holds, such as a server for its metrics. `apply_settings` calls this
+        when it replaces the instrumentation."""
+        pass
+
+
+# The instrumentation everything emits into. Callers check for None first, so measurements cost nothing when off.
+current: Optional[Instrumentation] = None
+
+
+def set_instrumentation(instrumentation: Optional[Instrumentation]) -> None:
+    global current
+    current = instrumentation
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[Any, ...]) -> str:
+    if not names:
+        return ""
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in zip(names, values)
+    )
+
+
+class _Counter(object):
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...]) -> None:
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.values = {}
+
+    def add(self, labels: Tuple[Any, ...], amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self) -> str:
+        lines = [
+            "# HELP {} {}".format(self.name, self.help),
+            "# TYPE {} counter".format(self.name),
+        ]
+        for labels, value in sorted(self.values.items()):
+            lines.append(
+                "{}{{{}}} {}".format(self.name, _labels(self.labels, labels), value)
+            )
+        return "\n".join(lines)
+
+
+class _Histogram(object):
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Tuple[str, ...],
+        buckets: Tuple[float, ...],
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        self.values = {}  # labels -> [count per bucket (not cumulative), sum, count]
+
+    def observe(self, labels: Tuple[Any, ...], value: float) -> None:
+        try:
+            counts = self.values[labels]
+        except KeyError:
+            counts = self.values[labels] = [[0] * len(self.buckets), 0.0, 0]
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            counts[0][index] += 1
+        counts[1] += value
+        counts[2] += 1
+
+    def render(self) -> str:
+        lines = [
+            "# HELP {} {}".format(self.name, self.help),
+            "# TYPE {} histogram".format(self.name),
+        ]
+        for labels, (buckets, total, count) in sorted(self.values.items()):
+            names = self.labels + ("le",)
+            cumulative = 0
+            for bound, bucket in zip(self.buckets, buckets):
+                cumulative += bucket
+                lines.append(
+                    "{}_bucket{{{}}} {}".format(
+                        self.name, _labels(names, labels + (repr(bound),)), cumulative
+                    )
+                )
+            lines.append(
+                "{}_bucket{{{}}} {}".format(
+                    self.name, _labels(names, labels + ("+Inf",)), count
+                )
+            )
+            lines.append(
+                "{}_sum{{{}}} {}".format(self.name, _labels(self.labels, labels), total)
+            )
+            lines.append(
+                "{}_count{{{}}} {}".format(
+                    self.name, _labels(self.labels, labels), count
+                )
+            )
+        return "\n".join(lines)
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_WAIT_BUCKETS = (0.001, 0.01, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """Keeps counters and histograms of the measurements and renders them in the Prometheus text format.
+
+    `render` returns the current values, to be served however the application serves its own metrics, and `serve`
+    starts a small HTTP server that answers every GET with them.
+    """
+
+    def __init__(
+        self,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+        wait_buckets: Tuple[float, ...] = DEFAULT_WAIT_BUCKETS,
+        port: int = None,
+        address: str = "",
+    ) -> None:
+        self._lock = threading.Lock()
+        self._http_requests = _Histogram(
+            "cassiopeia_http_request_duration_seconds",
+            "Time taken by HTTP requests, not counting rate limiter waits.",
+            ("host", "status"),
+            buckets,
+        )
+        self._http_bytes = _Counter(
+            "cassiopeia_http_response_bytes_total",
+            "Bytes received in HTTP responses.",
+            ("host",),
+        )
+        self._api_requests = _Histogram(
+            "cassiopeia_api_request_duration_seconds",
+            "Time taken by Riot API requests, including rate limiter waits and retries.",
+            ("endpoint", "platform", "status"),
+            buckets,
+        )
+        self._rate_limiter_waits = _Histogram(
+            "cassiopeia_rate_limiter_wait_seconds",
+            "Time spent waiting for rate limiter permits.",
+            ("limiter",),
+            wait_buckets,
+        )
+        self._rate_limited = _Counter(
+            "cassiopeia_rate_limited_total",
+            "429 responses from the Riot API, by the type of limit that was hit.",
+            ("limit_type", "endpoint"),
+        )
+        self._retries = _Counter(
+            "cassiopeia_retries_total",
+            "Requests retried after an error.",
+            ("status", "strategy"),
+        )
+        self._cache_lookups = _Counter(
+            "cassiopeia_cache_lookups_total",
+            "Cache lookups, by type and result.",
+            ("type", "result"),
+        )
+        self._metrics = [
+            self._http_requests,
+            self._http_bytes,
+            self._api_requests,
+            self._rate_limiter_waits,
+            self._rate_limited,
+            self._retries,
+            self._cache_lookups,
+        ]
+        self._server = None
+        if port is not None:
+            self.serve(port, address)
+
+    def http_request(self, host: str, status: int, seconds: float, bytes: int) -> None:
+        with self._lock:
+            self._http_requests.observe((host, status), seconds)
+            self._http_bytes.add((host,), bytes)
+
+    def api_request(
+        self, endpoint: str, platform: str, status: int, seconds: float
+    ) -> None:
+        with self._lock:
+            self._api_requests.observe((endpoint, platform, status), seconds)
+
+    def rate_limiter_wait(self, limiter: str, seconds: float) -> None:
+        with self._lock:
+            self._rate_limiter_waits.observe((limiter,), seconds)
+
+    def rate_limited(self, limit_type: str, endpoint: str) -> None:
+        with self._lock:
+            self._rate_limited.add((limit_type, endpoint))
+
+    def retry(self, status: int, strategy: str, seconds: float) -> None:
+        with self._lock:
+            self._retries.add((status, strategy))
+
+    def cache_lookup(self, type: str, hit: bool) -> None:
+        with self._lock:
+            self._cache_lookups.add((type, "hit" if hit else "miss"))
+
+    def render(self) -> str:
+        with self._lock:
+            return "\n".join(metric.render() for metric in self._metrics) + "\n"
+
+    def serve(self, port: int, address: str = "") -> None:
+        """Serves the metrics over HTTP on `port` from a background thread."""
+        instrumentation = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = instrumentation.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.close()
+        self._server = ThreadingHTTPServer((address, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def port(self) -> Optional[int]:
+        return self._server.server_address[1] if self._server is not None else None
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Records the measurements with the OpenTelemetry metrics API, and each Riot API request as a client span.
+
+    The globally configured meter and tracer providers are used unless others are given, so the measurements go to
+    whatever exporters the application has set up.
+    """
+
+    def __init__(self, meter_provider: Any = None, tracer_provider: Any = None):
+        if not OPENTELEMETRY_INSTALLED:
+            raise ImportError(
+                "The opentelemetry-api package must be installed to use OpenTelemetryInstrumentation."
+            )
+        meter = otel_metrics.get_meter("cassiopeia", meter_provider=meter_provider)
+        self._tracer = otel_trace.get_tracer(
+            "cassiopeia", tracer_provider=tracer_provider
+        )
+        self._http_requests = meter.create_histogram(
+            "cassiopeia.http.request.duration",
+            unit="s",
+            description="Time taken by HTTP requests, not counting rate limiter waits.",
+        )
+        self._http_bytes = meter.create_counter(
+            "cassiopeia.http.response.size",
+            unit="By",
+            description="Bytes received in HTTP responses.",
+        )
+        self._api_requests = meter.create_histogram(
+            "cassiopeia.api.request.duration",
+            unit="s",
+            description="Time taken by Riot API requests, including rate limiter waits and retries.",
+        )
+        self._rate_limiter_waits = meter.create_histogram(
+            "cassiopeia.rate_limiter.wait",
+            unit="s",
+            description="Time spent waiting for rate limiter permits.",
+        )
+        self._rate_limited = meter.create_counter(
+            "cassiopeia.rate_limited",
+            description="429 responses from the Riot API, by the type of limit that was hit.",
+        )
+        self._retries = meter.create_counter(
+            "cassiopeia.retries", description="Requests retried after an error."
+        )
+        self._cache_lookups = meter.create_counter(
+            "cassiopeia.cache.lookups", description="Cache lookups, by type and result."
+        )
+
+    def http_request(self, host: str, status: int, seconds: float, bytes: int) -> None:
+        attributes = {"server.address": host, "http.response.status_code": status}
+        self._http_requests.record(seconds, attributes)
+        self._http_bytes.add(bytes, {"server.address": host})
+
+    def api_request(
+        self, endpoint: str, platform: str, status: int, seconds: float
+    ) -> None:
+        attributes = {
+            "cassiopeia.endpoint": endpoint,
+            "cassiopeia.platform": platform,
+            "http.response.status_code": status,
+        }
+        self._api_requests.record(seconds, attributes)
+        end = time.time_ns()
+        span = self._tracer.start_span(
+            "GET {}".format(endpoint),
+            kind=otel_trace.SpanKind.CLIENT,
+            attributes=attributes,
+            start_time=end - int(seconds * 1e9),
+        )
+        if status >= 400:
+            span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR))
+        span.end(end_time=end)
+
+    def rate_limiter_wait(self, limiter: str, seconds: float) -> None:
+        self._rate_limiter_waits.record(seconds, {"cassiopeia.limiter": limiter})
+
+    def rate_limited(self, limit_type: str, endpoint: str) -> None:
+        self._rate_limited.add(
+            1, {"cassiopeia.limit_type": limit_type, "cassiopeia.endpoint": endpoint}
+        )
+
+    def retry(self, status: int, strategy: str, seconds: float) -> None:
+        self._retries.add(
+            1, {"http.response.status_code": status, "cassiopeia.strategy": strategy}
+        )
+
+    def cache_lookup(self, type: str, hit: bool) -> None:
+        self._cache_lookups.add(
+            1, {"cassiopeia.type": type, "cassiopeia.result": "hit" if hit else "miss"}
+        )
+
+
+_INSTRUMENTATIONS = {
+    "prometheus": PrometheusInstrumentation,
+    "opentelemetry": OpenTelemetryInstrumentation,
+}
+
+
+def create_instrumentation(
+    config: Union[Instrumentation, Mapping[str, Any]],
+) -> Optional[Instrumentation]:
+    # Instrumentations can be given directly or configured like {"type": "prometheus", "port": 9090}
+    if config is None or isinstance(config, Instrumentation):
+        return config
+    config = dict(config)
+    return _INSTRUMENTATIONS[config.pop("type").lower()](**config)
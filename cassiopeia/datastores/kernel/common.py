@@ -1,14 +1,9 @@
 from abc import abstractmethod
 from typing import MutableMapping, Any, Union, TypeVar, Iterable, Type
 
-try:
-    import ujson as json
-except ImportError:
-    import json
-
 from datapipelines import DataSource, PipelineContext
 
-from ..common import HTTPClient, HTTPError, Curl
+from ..common import HTTPClient, HTTPError, Curl, loads
 from ..riotapi.common import (
     APIForbiddenError,
     APINotFoundError,
@@ -57,11 +52,7 @@ class KernelSource(DataSource):
                 url=url, parameters=parameters, connection=connection
             )
 
-            # Ensure compatibility with both Curl and Requests based clients
-            if isinstance(result, bytes):
-                result = json.loads(result.decode())
-            elif isinstance(result, str):
-                result = json.loads(result)
+            result = loads(result)
 
             if not isinstance(result, (dict, list)):
                 raise ValueError(
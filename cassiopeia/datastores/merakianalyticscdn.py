@@ -4,14 +4,7 @@ from datapipelines import DataSource, PipelineContext, NotFoundError
 
 from ..dto.patch import PatchListDto
 from ..dto.staticdata.champion import ChampionAllRatesDto, ChampionRatesDto
-from .common import HTTPClient, HTTPError
-
-try:
-    import ujson as json
-except ImportError:
-    import json
-
-    json.decode = json.loads
+from .common import HTTPClient, HTTPError, loads
 
 T = TypeVar("T")
 
@@ -57,7 +50,7 @@ class MerakiAnalyticsCDN(DataSource):
         url = "https://cdn.merakianalytics.com/riot/lol/resources/patches.json"
         try:
             body = self._client.get(url)[0]
-            body = json.decode(body)
+            body = loads(body)
         except HTTPError as e:
             raise NotFoundError(str(e)) from e
 
@@ -78,7 +71,7 @@ class MerakiAnalyticsCDN(DataSource):
         url = "http://cdn.merakianalytics.com/riot/lol/resources/latest/en-US/championrates.json"
         try:
             body = self._client.get(url)[0]
-            body = json.decode(body)
+            body = loads(body)
             body["data"] = {int(k): v for k, v in body["data"].items()}
         except HTTPError as e:
             raise NotFoundError(str(e)) from e
@@ -1,15 +1,43 @@
-from typing import Iterable, Set, Dict
+from typing import (
+    Iterable,
+    Set,
+    Dict,
+    Type,
+    TypeVar,
+    MutableMapping,
+    Any,
+    List,
+    Union,
+    Mapping,
+)
+from copy import deepcopy
+import asyncio
 import itertools
 import os
 
-from datapipelines import CompositeDataSource
+from datapipelines import (
+    CompositeDataSource,
+    DataSource,
+    PipelineContext,
+    NotFoundError,
+)
+from ..common import HTTPClient
 from .common import RiotAPIService, RiotAPIRateLimiter
+from .ratelimits import RateLimiterBackend, create_rate_limiter_backend
+
+T = TypeVar("T")
 
 
 def _default_services(
-    api_key: str, limiting_share: float = 1.0, request_error_handling: Dict = None
+    api_key: str,
+    limiting_share: float = 1.0,
+    request_error_handling: Dict = None,
+    max_concurrent_requests: int = 100,
+    http_client: HTTPClient = None,
+    synchronize_rate_limits: bool = False,
+    rate_limiter_backend: RateLimiterBackend = None,
 ) -> Set[RiotAPIService]:
-    from ..common import HTTPClient
+    from ..common import AsyncHTTPClient
     from ..image import ImageDataSource
     from .champion import ChampionAPI
     from .summoner import SummonerAPI
@@ -22,11 +50,20 @@ def _default_services(
     from ...data import Platform, Continent
 
     app_rate_limiter = {
-        platform: RiotAPIRateLimiter(limiting_share=limiting_share)
+        platform: RiotAPIRateLimiter(
+            limiting_share=limiting_share,
+            synchronize=synchronize_rate_limits,
+            backend=rate_limiter_backend,
+            key="{}:application".format(platform.value),
+        )
         for platform in itertools.chain(Platform, Continent)
     }
 
-    client = HTTPClient()
+    if http_client is None:
+        client = HTTPClient(pool_size=10)
+    else:
+        client = http_client
+    async_client = AsyncHTTPClient(client, max_concurrency=max_concurrent_requests)
     services = {
         ImageDataSource(client),
         ChampionAPI(
@@ -34,48 +71,56 @@ def _default_services(
             app_rate_limiter=app_rate_limiter,
             request_error_handling=request_error_handling,
             http_client=client,
+            async_http_client=async_client,
         ),
         SummonerAPI(
             api_key,
             app_rate_limiter=app_rate_limiter,
             request_error_handling=request_error_handling,
             http_client=client,
+            async_http_client=async_client,
         ),
         AccountAPI(
             api_key,
             app_rate_limiter=app_rate_limiter,
             request_error_handling=request_error_handling,
             http_client=client,
+            async_http_client=async_client,
         ),
         ChampionMasteryAPI(
             api_key,
             app_rate_limiter=app_rate_limiter,
             request_error_handling=request_error_handling,
             http_client=client,
+            async_http_client=async_client,
         ),
         MatchAPI(
             api_key,
             app_rate_limiter=app_rate_limiter,
             request_error_handling=request_error_handling,
             http_client=client,
+            async_http_client=async_client,
         ),
         SpectatorAPI(
             api_key,
             app_rate_limiter=app_rate_limiter,
             request_error_handling=request_error_handling,
             http_client=client,
+            async_http_client=async_client,
         ),
         StatusAPI(
             api_key,
             app_rate_limiter=app_rate_limiter,
             request_error_handling=request_error_handling,
             http_client=client,
+            async_http_client=async_client,
         ),
         LeaguesAPI(
             api_key,
             app_rate_limiter=app_rate_limiter,
             request_error_handling=request_error_handling,
             http_client=client,
+            async_http_client=async_client,
         ),
     }
 
@@ -89,6 +134,10 @@ class RiotAPI(CompositeDataSource):
         services: Iterable[RiotAPIService] = None,
         limiting_share: float = 1.0,
         request_error_handling: Dict = None,
+        max_concurrent_requests: int = 100,
+        http_client: HTTPClient = None,
+        synchronize_rate_limits: bool = False,
+        rate_limiter_backend: Union[RateLimiterBackend, Mapping[str, Any]] = None,
     ) -> None:
         if api_key is None:
             api_key = "RIOT_API_KEY"  # Use this env variable.
@@ -100,10 +149,70 @@ class RiotAPI(CompositeDataSource):
                 api_key=api_key,
                 limiting_share=limiting_share,
                 request_error_handling=request_error_handling,
+                max_concurrent_requests=max_concurrent_requests,
+                http_client=http_client,
+                synchronize_rate_limits=synchronize_rate_limits,
+                rate_limiter_backend=create_rate_limiter_backend(rate_limiter_backend),
             )
 
         super().__init__(services)
 
+    async def get_async(
+        self,
+        type: Type[T],
+        query: MutableMapping[str, Any],
+        context: PipelineContext = None,
+    ) -> T:
+        try:
+            sources = self._sources[type]
+        except KeyError as error:
+            raise DataSource.unsupported(type) from error
+
+        for source in sources:
+            try:
+                if isinstance(source, RiotAPIService):
+                    return await source.get_async(type, deepcopy(query), context)
+                return await asyncio.to_thread(
+                    source.get, type, deepcopy(query), context
+                )
+            except NotFoundError:
+                continue
+        raise NotFoundError()
+
+    async def get_many_async(
+        self,
+        type: Type[T],
+        query: MutableMapping[str, Any],
+        context: PipelineContext = None,
+    ) -> List[T]:
+        try:
+            sources = self._sources[type]
+        except KeyError as error:
+            raise DataSource.unsupported(type) from error
+
+        for source in sources:
+            try:
+                if isinstance(source, RiotAPIService):
+                    return await source.get_many_async(type, deepcopy(query), context)
+                return await asyncio.to_thread(
+                    lambda: list(source.get_many(type, deepcopy(query), context))
+                )
+            except NotFoundError:
+                continue
+        raise NotFoundError()
+
+    async def close(self) -> None:
+        """Closes the connections that `get_async` and `get_many_async` opened on the running event loop. Loops run
+        with `asyncio.run` close them when they finish, so this is only needed for other loops."""
+        clients = {
+            id(source._async_client): source._async_client
+            for sources in self._sources.values()
+            for source in sources
+            if isinstance(source, RiotAPIService)
+        }
+        for client in clients.values():
+            await client.close()
+
     def set_api_key(self, key: str):
         for sources in self._sources.values():
             for source in sources:
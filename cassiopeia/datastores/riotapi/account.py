@@ -1,5 +1,4 @@
 from typing import Type, TypeVar, MutableMapping, Any, Iterable
-import json
 
 from datapipelines import (
     DataSource,
@@ -9,6 +8,7 @@ from datapipelines import (
     validate_query,
 )
 from .common import RiotAPIService, APINotFoundError
+from ..common import loads
 from ...data import Platform, Continent
 from ...dto.account import AccountDto
 from ..uniquekeys import convert_region_to_platform
@@ -80,7 +80,7 @@ class AccountAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 query["platform"], endpoint
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url, {}, app_limiter=app_limiter, method_limiter=method_limiter
                 )
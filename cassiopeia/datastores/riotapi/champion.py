@@ -1,6 +1,5 @@
 from typing import Type, TypeVar, MutableMapping, Any, Iterable, Generator
 import copy
-import json
 
 from datapipelines import (
     DataSource,
@@ -10,6 +9,7 @@ from datapipelines import (
     validate_query,
 )
 from .common import RiotAPIService, APINotFoundError
+from ..common import loads
 from ...data import Platform
 from ...dto.champion import ChampionRotationDto
 from ..uniquekeys import convert_region_to_platform
@@ -50,7 +50,7 @@ class ChampionAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 query["platform"], "champion/rotations"
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url, {}, app_limiter=app_limiter, method_limiter=method_limiter
                 )
@@ -1,5 +1,4 @@
 from typing import Type, TypeVar, MutableMapping, Any, Iterable, Generator
-import json
 
 from datapipelines import (
     DataSource,
@@ -9,6 +8,7 @@ from datapipelines import (
     validate_query,
 )
 from .common import RiotAPIService, APINotFoundError
+from ..common import loads
 from ...data import Platform
 from ...dto.championmastery import (
     ChampionMasteryDto,
@@ -65,7 +65,7 @@ class ChampionMasteryAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 query["platform"], endpoint
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url, {}, app_limiter=app_limiter, method_limiter=method_limiter
                 )
@@ -103,7 +103,7 @@ class ChampionMasteryAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 query["platform"], endpoint
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url, {}, app_limiter=app_limiter, method_limiter=method_limiter
                 )
@@ -149,7 +149,7 @@ class ChampionMasteryAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 query["platform"], endpoint
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url, {}, app_limiter=app_limiter, method_limiter=method_limiter
                 )
@@ -188,7 +188,7 @@ class ChampionMasteryAPI(RiotAPIService):
                     app_limiter, method_limiter = self._get_rate_limiter(
                         query["platform"], endpoint
                     )
-                    data = json.loads(
+                    data = loads(
                         self._get(
                             url,
                             {},
@@ -233,7 +233,7 @@ class ChampionMasteryAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 query["platform"], endpoint
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url, {}, app_limiter=app_limiter, method_limiter=method_limiter
                 )
@@ -270,7 +270,7 @@ class ChampionMasteryAPI(RiotAPIService):
                     app_limiter, method_limiter = self._get_rate_limiter(
                         query["platform"], endpoint
                     )
-                    data = json.loads(
+                    data = loads(
                         self._get(
                             url,
                             {},
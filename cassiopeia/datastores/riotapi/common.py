@@ -1,5 +1,7 @@
 import time
 import copy
+import threading
+import asyncio
 import functools
 import collections.abc
 from abc import abstractmethod, ABC
@@ -17,9 +19,15 @@ from typing import (
 )
 
 from datapipelines import DataSource, PipelineContext
-from merakicommons.ratelimits import FixedWindowRateLimiter, MultiRateLimiter
+from merakicommons.ratelimits import (
+    RateLimiter,
+    FixedWindowRateLimiter,
+    MultiRateLimiter,
+)
 
-from ..common import HTTPClient, HTTPError, Curl
+from .. import instrumentation as _instrumentation
+from ..common import HTTPClient, AsyncHTTPClient, HTTPError, Curl
+from .ratelimits import RateLimiterBackend
 from ...data import Platform
 from ...dto.staticdata.realm import RealmDto
 
@@ -70,28 +78,167 @@ _ERROR_CODES = {
 T = TypeVar("T")
 
 
+class SynchronizedWindowRateLimiter(RateLimiter):
+    """A fixed window rate limiter whose window can be re-synchronized with the counts the Riot API reports.
+
+    A window opens when the first permit is taken. Once `window_permits` permits have been taken, callers wait until
+    the window closes and are then let through together at the start of the next one. `synchronize` adopts the
+    server's count for the window when it is higher than ours (e.g. after a restart, or when other processes share
+    the API key), and moves the end of the window back to match the server's when a response shows that the request
+    opened the server's window.
+    """
+
+    def __init__(self, window_seconds: int, window_permits: int) -> None:
+        self._window_seconds = window_seconds
+        self._window_permits = window_permits
+        self._count = 0
+        self._window_end = None
+        self._condition = threading.Condition()
+        self._total_permits_issued = 0
+
+    def _roll_window(self, now: float) -> None:
+        if self._window_end is not None and now >= self._window_end:
+            self._count = 0
+            self._window_end = None
+            self._condition.notify_all()
+
+    def __enter__(self) -> "SynchronizedWindowRateLimiter":
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._roll_window(now)
+                if self._count < self._window_permits:
+                    break
+                self._condition.wait(self._window_end - now)
+            self._count += 1
+            if self._window_end is None:
+                self._window_end = now + self._window_seconds
+            self._total_permits_issued += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+    def synchronize(self, count: int) -> None:
+        with self._condition:
+            now = time.monotonic()
+            self._roll_window(now)
+            if self._window_end is None or count == 1:
+                # The server's window opened no later than now, so ending ours a full window from now is safe
+                self._window_end = now + self._window_seconds
+            self._count = min(max(self._count, count), self._window_permits)
+
+    def set_permits(self, permits: int) -> None:
+        with self._condition:
+            self._window_permits = permits
+            self._condition.notify_all()
+
+    def restrict_for(self, seconds: int) -> None:
+        with self._condition:
+            self._count = self._window_permits
+            self._window_end = time.monotonic() + seconds
+
+    @property
+    def permits_issued(self) -> int:
+        with self._condition:
+            return self._total_permits_issued
+
+    def reset_permits_issued(self) -> None:
+        with self._condition:
+            self._total_permits_issued = 0
+
+
+class SharedWindow(object):
+    # The limits of one window of a RiotAPIRateLimiter whose state is kept by a RateLimiterBackend
+
+    def __init__(self, window_seconds: int, window_permits: int) -> None:
+        self._window_seconds = window_seconds
+        self._window_permits = window_permits
+
+    def set_permits(self, permits: int) -> None:
+        self._window_permits = permits
+
+
 class RiotAPIRateLimiter(MultiRateLimiter):
     # The application limiter and method limiters will each be an instance of this.
+    # If a backend is given, the windows are shared with every other limiter using the same backend and key.
 
-    def __init__(self, limiting_share):
+    def __init__(
+        self,
+        limiting_share,
+        synchronize: bool = False,
+        backend: RateLimiterBackend = None,
+        key: str = None,
+    ):
         self.limiting_share = limiting_share
+        self.synchronize = synchronize
+        self.backend = backend
+        self.key = key
         super().__init__()  # Initialize with no underlying limiters
         self._limiters = []  # Make it a list rather than a tuple so we can append
 
+    @property
+    def limits_known(self) -> bool:
+        # The limits are only known once they've been read from the headers of a response
+        return len(self._limiters) > 0
+
+    def __enter__(self) -> "RiotAPIRateLimiter":
+        instrument = _instrumentation.current
+        if instrument is None:
+            return self._enter()
+        start = time.perf_counter()
+        try:
+            return self._enter()
+        finally:
+            instrument.rate_limiter_wait(self.key, time.perf_counter() - start)
+
+    def _enter(self) -> "RiotAPIRateLimiter":
+        if self.backend is None:
+            return super().__enter__()
+        limits = [
+            (limiter._window_permits, limiter._window_seconds)
+            for limiter in self._limiters
+        ]
+        if limits:
+            while True:
+                wait = self.backend.acquire(self.key, limits)
+                if wait <= 0:
+                    break
+                time.sleep(wait)
+        with self._total_permits_issued_lock:
+            self._total_permits_issued += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self.backend is None:
+            super().__exit__(exc_type, exc_val, exc_tb)
+
     def restrict_for(self, seconds: int) -> None:
+        if self.backend is not None:
+            windows = [limiter._window_seconds for limiter in self._limiters]
+            self.backend.restrict_for(self.key, windows, seconds)
+            return
         for limiter in self._limiters:
             limiter.restrict_for(seconds)
 
     def _construct_limiters(self, limits: List[List[int]]):
         # Creates the necessary FixedWindowRateLimiters from the rates in the headers
         assert len(self._limiters) == 0
+        if self.backend is not None:
+            limiter_type = SharedWindow
+        elif self.synchronize:
+            limiter_type = SynchronizedWindowRateLimiter
+        else:
+            limiter_type = FixedWindowRateLimiter
         # Create the rate limiters
         for permits, window in limits:
             self._limiters.append(
-                FixedWindowRateLimiter(window_seconds=window, window_permits=permits)
+                limiter_type(window_seconds=window, window_permits=permits)
             )
 
-    def adjust_rate_limits_if_necessary(self, limits: List[List[int]]) -> None:
+    def adjust_rate_limits_if_necessary(
+        self, limits: List[List[int]], counts: List[List[int]] = None
+    ) -> None:
         if len(self._limiters) == 0:
             self._construct_limiters(limits)
         for permits, window in limits:
@@ -103,8 +250,13 @@ class RiotAPIRateLimiter(MultiRateLimiter):
                 for_window = self._get_specific_limiter_for_window(window)
             if permits != for_window._window_permits:
                 for_window.set_permits(permits)
+        if self.synchronize and self.backend is None and counts is not None:
+            for count, window in counts:
+                for_window = self._get_specific_limiter_for_window(window)
+                if for_window is not None:
+                    for_window.synchronize(count)
 
-    def _get_specific_limiter_for_window(self, window: int) -> FixedWindowRateLimiter:
+    def _get_specific_limiter_for_window(self, window: int) -> RateLimiter:
         for limiter in self._limiters:
             if limiter._window_seconds == window:
                 return limiter
@@ -127,14 +279,24 @@ class RiotAPIService(DataSource):
         app_rate_limiter: Dict[Platform, RiotAPIRateLimiter],
         request_error_handling: Dict = None,
         http_client: HTTPClient = None,
+        async_http_client: AsyncHTTPClient = None,
     ):
         self._limiting_share = app_rate_limiter[Platform.north_america].limiting_share
+        self._synchronize_rate_limits = app_rate_limiter[
+            Platform.north_america
+        ].synchronize
+        self._rate_limiter_backend = app_rate_limiter[Platform.north_america].backend
 
         if http_client is None:
             self._client = HTTPClient()
         else:
             self._client = http_client
 
+        if async_http_client is None:
+            self._async_client = AsyncHTTPClient(self._client)
+        else:
+            self._async_client = async_http_client
+
         self._headers = {"X-Riot-Token": api_key}
 
         # Both the application and method rate limiters will be in the same rate limiter
@@ -213,7 +375,12 @@ class RiotAPIService(DataSource):
         try:
             method_limiter = self._rate_limiters[(platform, endpoint)]
         except KeyError:
-            method_limiter = RiotAPIRateLimiter(self._limiting_share)
+            method_limiter = RiotAPIRateLimiter(
+                self._limiting_share,
+                synchronize=self._synchronize_rate_limits,
+                backend=self._rate_limiter_backend,
+                key="{}:{}".format(platform.value, endpoint),
+            )
             self._rate_limiters[(platform, endpoint)] = method_limiter
         app_limiter = self._rate_limiters["application"][platform]
         return app_limiter, method_limiter
@@ -222,13 +389,18 @@ class RiotAPIService(DataSource):
         self, app_limiter, method_limiter, response_headers
     ):
         # If Riot changes the # of permits allowed in their response headers, change our rate limiters.
-        # We are currently ignoring the X-*-Rate-Limit-Count headers and assuming our rate limiter logic agrees.
-        if "X-App-Rate-Limit" in response_headers:
-            limits = _split_rate_limit_header(response_headers["X-App-Rate-Limit"])
-            app_limiter.adjust_rate_limits_if_necessary(limits)
-        if "X-Method-Rate-Limit" in response_headers:
-            limits = _split_rate_limit_header(response_headers["X-Method-Rate-Limit"])
-            method_limiter.adjust_rate_limits_if_necessary(limits)
+        # The X-*-Rate-Limit-Count headers are only used by synchronized limiters; otherwise we assume our rate
+        # limiter logic agrees with them.
+        for limiter, header in (
+            (app_limiter, "X-App-Rate-Limit"),
+            (method_limiter, "X-Method-Rate-Limit"),
+        ):
+            if header in response_headers:
+                limits = _split_rate_limit_header(response_headers[header])
+                counts = response_headers.get(header + "-Count", None)
+                if counts is not None:
+                    counts = _split_rate_limit_header(counts)
+                limiter.adjust_rate_limits_if_necessary(limits, counts)
 
     def _get(
         self,
@@ -249,49 +421,102 @@ class RiotAPIService(DataSource):
             method_limiter=method_limiter,
             connection=connection,
         )
+        instrument = _instrumentation.current
+        if instrument is not None:
+            start, status = time.perf_counter(), 0  # 0 if no response was received
         try:
-            return request()
+            body = request()
+            status = 200
+            return body
         except HTTPError as error:
-            # The error handlers didn't work, so raise an appropriate error.
-            new_error_type = _ERROR_CODES[error.code]
-            if new_error_type is RuntimeError:
-                new_error = RuntimeError(
-                    'Encountered an HTTP error code {code} with message "{message}" which should have already been handled. Report this to the Cassiopeia team.'.format(
-                        code=error.code, message=str(error)
-                    )
-                )
-            elif new_error_type is APIError:
-                new_error = APIError(
-                    'The Riot API experienced an internal error on the request. You may want to retry the request after a short wait or continue without the result. The received error was {code}: "{message}"'.format(
-                        code=error.code, message=str(error)
-                    ),
-                    error.code,
+            status = error.code
+            raise self._convert_http_error(error) from error
+        finally:
+            if instrument is not None:
+                instrument.api_request(
+                    request.endpoint,
+                    request.platform,
+                    status,
+                    time.perf_counter() - start,
                 )
-            elif new_error_type is APINotFoundError:
-                new_error = APINotFoundError(
-                    'The Riot API returned a NOT FOUND error for the request. The received error was {code}: "{message}"'.format(
-                        code=error.code, message=str(error)
-                    ),
-                    error.code,
-                )
-            elif new_error_type is APIRequestError:
-                new_error = APIRequestError(
-                    'The Riot API returned an error on the request. The received error was {code}: "{message}"'.format(
-                        code=error.code, message=str(error)
-                    ),
-                    error.code,
+
+    async def _get_async(
+        self,
+        url: str,
+        parameters: MutableMapping[str, Any] = None,
+        app_limiter: RiotAPIRateLimiter = None,
+        method_limiter: RiotAPIRateLimiter = None,
+    ) -> Union[dict, list, Any]:
+        # The same as `_get`, but the request is made by the async client and awaited.
+        request = RiotAPIRequest(
+            service=self,
+            url=url,
+            parameters=parameters,
+            app_limiter=app_limiter,
+            method_limiter=method_limiter,
+            connection=None,
+        )
+        instrument = _instrumentation.current
+        if instrument is not None:
+            start, status = time.perf_counter(), 0  # 0 if no response was received
+        try:
+            body = await request.call_async()
+            status = 200
+            return body
+        except HTTPError as error:
+            status = error.code
+            raise self._convert_http_error(error) from error
+        finally:
+            if instrument is not None:
+                instrument.api_request(
+                    request.endpoint,
+                    request.platform,
+                    status,
+                    time.perf_counter() - start,
                 )
-            elif new_error_type is APIForbiddenError:
-                new_error = APIForbiddenError(
-                    'The Riot API returned a FORBIDDEN error for the request. The received error was {code}: "{message}"'.format(
-                        code=error.code, message=str(error)
-                    ),
-                    error.code,
+
+    @staticmethod
+    def _convert_http_error(error: HTTPError) -> Exception:
+        # The error handlers didn't work, so raise an appropriate error.
+        new_error_type = _ERROR_CODES[error.code]
+        if new_error_type is RuntimeError:
+            new_error = RuntimeError(
+                'Encountered an HTTP error code {code} with message "{message}" which should have already been handled. Report this to the Cassiopeia team.'.format(
+                    code=error.code, message=str(error)
                 )
-            else:
-                new_error = new_error_type(str(error))
+            )
+        elif new_error_type is APIError:
+            new_error = APIError(
+                'The Riot API experienced an internal error on the request. You may want to retry the request after a short wait or continue without the result. The received error was {code}: "{message}"'.format(
+                    code=error.code, message=str(error)
+                ),
+                error.code,
+            )
+        elif new_error_type is APINotFoundError:
+            new_error = APINotFoundError(
+                'The Riot API returned a NOT FOUND error for the request. The received error was {code}: "{message}"'.format(
+                    code=error.code, message=str(error)
+                ),
+                error.code,
+            )
+        elif new_error_type is APIRequestError:
+            new_error = APIRequestError(
+                'The Riot API returned an error on the request. The received error was {code}: "{message}"'.format(
+                    code=error.code, message=str(error)
+                ),
+                error.code,
+            )
+        elif new_error_type is APIForbiddenError:
+            new_error = APIForbiddenError(
+                'The Riot API returned a FORBIDDEN error for the request. The received error was {code}: "{message}"'.format(
+                    code=error.code, message=str(error)
+                ),
+                error.code,
+            )
+        else:
+            new_error = new_error_type(str(error))
 
-            raise new_error from error
+        return new_error
 
     @abstractmethod
     def get(
@@ -311,6 +536,47 @@ class RiotAPIService(DataSource):
     ) -> Iterable[T]:
         pass
 
+    # Services register natively asynchronous implementations of their endpoints here, keyed by the type returned.
+    # Types without one fall back to running the blocking endpoint on the async client's worker threads.
+    _get_async_methods: Dict[Type, Callable] = {}
+    _get_many_async_methods: Dict[Type, Callable] = {}
+
+    async def get_async(
+        self,
+        type: Type[T],
+        query: MutableMapping[str, Any],
+        context: PipelineContext = None,
+    ) -> T:
+        try:
+            method = self._get_async_methods[type]
+        except KeyError:
+            if type not in self.provides:
+                raise DataSource.unsupported(type)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._async_client.executor,
+                functools.partial(self.get, type, query, context),
+            )
+        return await method(self, query, context)
+
+    async def get_many_async(
+        self,
+        type: Type[T],
+        query: MutableMapping[str, Any],
+        context: PipelineContext = None,
+    ) -> List[T]:
+        try:
+            method = self._get_many_async_methods[type]
+        except KeyError:
+            if type not in self.provides:
+                raise DataSource.unsupported(type)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._async_client.executor,
+                lambda: list(self.get_many(type, query, context)),
+            )
+        return await method(self, query, context)
+
 
 class RiotAPIRequest(object):
     def __init__(
@@ -329,6 +595,17 @@ class RiotAPIRequest(object):
         self.method_limiter = method_limiter
         self.connection = connection
 
+    @property
+    def platform(self) -> str:
+        # Method limiters are keyed like "NA1:matches/id"
+        key = getattr(self.method_limiter, "key", None) or ":"
+        return key.split(":", 1)[0]
+
+    @property
+    def endpoint(self) -> str:
+        key = getattr(self.method_limiter, "key", None) or ":"
+        return key.split(":", 1)[1]
+
     def __call__(self):
         try:
             body, response_headers = self.service._client.get(
@@ -347,9 +624,24 @@ class RiotAPIRequest(object):
         except HTTPError as error:
             return self._retry_request_by_handling_error(error)
 
-    def _retry_request_by_handling_error(self, error: HTTPError, handlers=None):
-        if handlers is None:
-            handlers = []
+    async def call_async(self):
+        try:
+            body, response_headers = await self.service._async_client.get(
+                url=self.url,
+                parameters=self.parameters,
+                headers=self.service._headers,
+                rate_limiters=[self.app_limiter, self.method_limiter],
+            )
+            self.service._adjust_rate_limiters_from_headers(
+                app_limiter=self.app_limiter,
+                method_limiter=self.method_limiter,
+                response_headers=response_headers,
+            )
+            return body
+        except HTTPError as error:
+            return await self._retry_request_by_handling_error_async(error)
+
+    def _new_error_handler(self, error: HTTPError, handlers: List):
         # Try to properly handling the 429 and retry the call after the appropriate time limit.
         if error.code == 429:
             # Identify which rate limit was hit (application, method, or service)
@@ -367,6 +659,9 @@ class RiotAPIRequest(object):
                         error.response_headers
                     )
                 )
+            instrument = _instrumentation.current
+            if instrument is not None:
+                instrument.rate_limited(rate_limiting_type, self.endpoint)
 
             # Create a new handler
             new_handler = self.service._handlers[429][
@@ -380,6 +675,45 @@ class RiotAPIRequest(object):
             if isinstance(new_handler, handler.__class__):
                 new_handler = handler
                 break
+        return new_handler
+
+    async def _retry_request_by_handling_error_async(
+        self, error: HTTPError, handlers=None
+    ):
+        if handlers is None:
+            handlers = []
+        new_handler = self._new_error_handler(error, handlers)
+
+        if new_handler.stop:
+            raise error
+        else:
+            try:
+                body, response_headers = await new_handler.call_async(
+                    error=error,
+                    requester=self.service._async_client.get,
+                    url=self.url,
+                    parameters=self.parameters,
+                    headers=self.service._headers,
+                    rate_limiters=[self.app_limiter, self.method_limiter],
+                    connection=None,
+                )
+                self.service._adjust_rate_limiters_from_headers(
+                    app_limiter=self.app_limiter,
+                    method_limiter=self.method_limiter,
+                    response_headers=response_headers,
+                )
+                return body
+            except HTTPError as error:
+                if new_handler not in handlers:
+                    handlers.append(new_handler)
+                return await self._retry_request_by_handling_error_async(
+                    error, handlers=handlers
+                )
+
+    def _retry_request_by_handling_error(self, error: HTTPError, handlers=None):
+        if handlers is None:
+            handlers = []
+        new_handler = self._new_error_handler(error, handlers)
 
         if new_handler.stop:
             raise error
@@ -413,6 +747,12 @@ class FailedRequestHandler(ABC):
     ) -> Tuple[Union[dict, list, str, bytes], dict]:
         pass
 
+    @abstractmethod
+    async def call_async(
+        self, error, requester, url, parameters, headers, rate_limiters, connection
+    ) -> Tuple[Union[dict, list, str, bytes], dict]:
+        pass
+
 
 class ExponentialBackoff(FailedRequestHandler):
     def __init__(self, initial_backoff: int, backoff_factor: int, max_attempts: int):
@@ -433,11 +773,33 @@ class ExponentialBackoff(FailedRequestHandler):
                 headers.get("X-Rate-Limit-Type", "service"), error.code, self.backoff
             )
         )
+        instrument = _instrumentation.current
+        if instrument is not None:
+            instrument.retry(error.code, "exponential_backoff", self.backoff)
         time.sleep(self.backoff)
         self.backoff = self.backoff * self.factor
         self.attempts += 1
         return requester(url, parameters, headers, rate_limiters, connection)
 
+    async def call_async(
+        self, error, requester, url, parameters, headers, rate_limiters, connection
+    ) -> Tuple[Union[dict, list, str, bytes], dict]:
+        if self.attempts >= self.max_attempts:
+            self.stop = True
+            raise error
+        print(
+            "INFO: Unexpected {} error ({}), backing off for {} seconds.".format(
+                headers.get("X-Rate-Limit-Type", "service"), error.code, self.backoff
+            )
+        )
+        instrument = _instrumentation.current
+        if instrument is not None:
+            instrument.retry(error.code, "exponential_backoff", self.backoff)
+        await asyncio.sleep(self.backoff)
+        self.backoff = self.backoff * self.factor
+        self.attempts += 1
+        return await requester(url, parameters, headers, rate_limiters, connection)
+
 
 class RetryFromHeaders(object):
     def __init__(self, max_attempts: int):
@@ -457,11 +819,35 @@ class RetryFromHeaders(object):
                 headers.get("X-Rate-Limit-Type", "service"), backoff
             )
         )
+        instrument = _instrumentation.current
+        if instrument is not None:
+            instrument.retry(error.code, "retry_from_headers", backoff)
         for rate_limiter in rate_limiters:
             rate_limiter.restrict_for(backoff)
         self.attempts += 1
         return requester(url, parameters, headers, rate_limiters, connection)
 
+    async def call_async(
+        self, error, requester, url, parameters, headers, rate_limiters, connection
+    ) -> Tuple[Union[dict, list, str, bytes], dict]:
+        if self.attempts >= self.max_attempts:
+            self.stop = True
+            raise error
+        backoff = int(error.response_headers["Retry-After"])
+        print(
+            "INFO: Unexpected {} rate limit, backing off for {} seconds (from headers).".format(
+                headers.get("X-Rate-Limit-Type", "service"), backoff
+            )
+        )
+        instrument = _instrumentation.current
+        if instrument is not None:
+            instrument.retry(error.code, "retry_from_headers", backoff)
+        # The limiters are drained rather than slept on, so the wait happens on the async client's worker threads
+        for rate_limiter in rate_limiters:
+            rate_limiter.restrict_for(backoff)
+        self.attempts += 1
+        return await requester(url, parameters, headers, rate_limiters, connection)
+
 
 class ThrowException(FailedRequestHandler):
     def __init__(self):
@@ -471,3 +857,8 @@ class ThrowException(FailedRequestHandler):
         self, error, requester, url, parameters, headers, rate_limiters, connection
     ) -> Tuple[Union[dict, list, str, bytes], dict]:
         raise error
+
+    async def call_async(
+        self, error, requester, url, parameters, headers, rate_limiters, connection
+    ) -> Tuple[Union[dict, list, str, bytes], dict]:
+        raise error
@@ -1,5 +1,4 @@
 from typing import Type, TypeVar, MutableMapping, Any, Iterable, Generator
-import json
 
 from datapipelines import (
     DataSource,
@@ -9,6 +8,7 @@ from datapipelines import (
     validate_query,
 )
 from .common import RiotAPIService, APINotFoundError
+from ..common import loads
 from ...data import Platform, Queue, Tier, Division
 from ...dto.league import (
     LeagueEntriesDto,
@@ -72,7 +72,7 @@ class LeaguesAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 query["platform"], "leagues/paginated-entries"
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url,
                     parameters={"page": query["page"]},
@@ -112,7 +112,7 @@ class LeaguesAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 query["platform"], "leagues/summoner-entries"
             )
-            data = json.loads(
+            data = loads(
                 self._get(url, app_limiter=app_limiter, method_limiter=method_limiter)
             )
         except APINotFoundError:
@@ -143,7 +143,7 @@ class LeaguesAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 query["platform"], endpoint
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url, {}, app_limiter=app_limiter, method_limiter=method_limiter
                 )
@@ -176,7 +176,7 @@ class LeaguesAPI(RiotAPIService):
                     app_limiter, method_limiter = self._get_rate_limiter(
                         query["platform"], endpoint
                     )
-                    data = json.loads(
+                    data = loads(
                         self._get(
                             url,
                             {},
@@ -214,7 +214,7 @@ class LeaguesAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 query["platform"], endpoint
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url, {}, app_limiter=app_limiter, method_limiter=method_limiter
                 )
@@ -251,7 +251,7 @@ class LeaguesAPI(RiotAPIService):
                     app_limiter, method_limiter = self._get_rate_limiter(
                         query["platform"], endpoint
                     )
-                    data = json.loads(
+                    data = loads(
                         self._get(
                             url,
                             {},
@@ -288,7 +288,7 @@ class LeaguesAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 query["platform"], endpoint
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url, {}, app_limiter=app_limiter, method_limiter=method_limiter
                 )
@@ -325,7 +325,7 @@ class LeaguesAPI(RiotAPIService):
                     app_limiter, method_limiter = self._get_rate_limiter(
                         query["platform"], endpoint
                     )
-                    data = json.loads(
+                    data = loads(
                         self._get(
                             url,
                             {},
@@ -362,7 +362,7 @@ class LeaguesAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 query["platform"], endpoint
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url, {}, app_limiter=app_limiter, method_limiter=method_limiter
                 )
@@ -397,7 +397,7 @@ class LeaguesAPI(RiotAPIService):
                     app_limiter, method_limiter = self._get_rate_limiter(
                         query["platform"], endpoint
                     )
-                    data = json.loads(
+                    data = loads(
                         self._get(
                             url,
                             {},
@@ -1,6 +1,10 @@
-from typing import Type, TypeVar, MutableMapping, Any, Iterable, Generator
+from typing import Type, TypeVar, MutableMapping, Any, Iterable, Generator, List
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import collections
+import itertools
 import arrow
-import json
 
 from datapipelines import (
     DataSource,
@@ -11,6 +15,7 @@ from datapipelines import (
 )
 
 from .common import RiotAPIService, APINotFoundError
+from ..common import loads
 from ...data import Continent, Region, Platform, MatchType, Queue, QUEUE_IDS
 from ...dto.match import MatchDto, MatchListDto, TimelineDto
 from ..uniquekeys import convert_region_to_platform, convert_to_continent
@@ -59,18 +64,44 @@ class MatchAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 continent, "matches/id"
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url, {}, app_limiter=app_limiter, method_limiter=method_limiter
                 )
             )
-            # metadata = data["metadata"]
-            data = data["info"]  # Drop the metadata
         except APINotFoundError as error:
             raise NotFoundError(str(error)) from error
 
+        return self._to_match_dto(data, continent, id)
+
+    @validate_query(_validate_get_match_query, convert_region_to_platform)
+    async def get_match_async(
+        self, query: MutableMapping[str, Any], context: PipelineContext = None
+    ) -> MatchDto:
+        platform: Platform = query["platform"]
+        continent = platform.continent
+        id = query["id"]
+        url = f"https://{continent.value.lower()}.api.riotgames.com/lol/match/v5/matches/{platform.value}_{id}"
+        try:
+            app_limiter, method_limiter = self._get_rate_limiter(
+                continent, "matches/id"
+            )
+            data = loads(
+                await self._get_async(
+                    url, {}, app_limiter=app_limiter, method_limiter=method_limiter
+                )
+            )
+        except APINotFoundError as error:
+            raise NotFoundError(str(error)) from error
+
+        return self._to_match_dto(data, continent, id)
+
+    @staticmethod
+    def _to_match_dto(data: dict, continent: Continent, id: int) -> MatchDto:
+        # metadata = data["metadata"]
+        data = data["info"]  # Drop the metadata
         data["continent"] = continent.value
-        data["matchId"] = query["id"]
+        data["matchId"] = id
         for p in data["participants"]:
             puuid = p.get("puuid", None)
             if puuid is None:  # TODO: Figure out what bots are marked as in match-v5
@@ -86,6 +117,10 @@ class MatchAPI(RiotAPIService):
         .as_(Platform)
         .also.has("ids")
         .as_(Iterable)
+        .also.can_have("concurrency")
+        .as_(int)
+        .also.can_have("ordered")
+        .as_(bool)
     )
 
     @get_many.register(MatchDto)
@@ -95,42 +130,97 @@ class MatchAPI(RiotAPIService):
     ) -> Generator[MatchDto, None, None]:
         platform: Platform = query["platform"]
         continent = platform.continent
+        # Every request in the batch goes through the same app and method limiters, so fetching in parallel
+        # can never exceed the quotas that sequential fetching would respect.
+        app_limiter, method_limiter = self._get_rate_limiter(continent, "matches/id")
+        concurrency = max(1, query.get("concurrency", 1))
+        ordered = query.get("ordered", True)
+
+        def get_match(id):
+            url = f"https://{continent.value.lower()}.api.riotgames.com/lol/match/v5/matches/{platform.value}_{id}"
+            try:
+                data = loads(
+                    self._get(
+                        url,
+                        {},
+                        app_limiter=app_limiter,
+                        method_limiter=method_limiter,
+                    )
+                )
+            except APINotFoundError as error:
+                raise NotFoundError(str(error)) from error
+            return self._to_match_dto(data, continent, id)
 
         def generator():
             for id in query["ids"]:
-                url = f"https://{continent.value.lower()}.api.riotgames.com/lol/match/v5/matches/{platform.value}_{id}"
-                try:
-                    app_limiter, method_limiter = self._get_rate_limiter(
-                        continent, "matches/id"
-                    )
-                    data = json.loads(
-                        self._get(
-                            url,
-                            {},
-                            app_limiter=app_limiter,
-                            method_limiter=method_limiter,
-                        )
-                    )
-                    # metadata = data["metadata"]
-                    data = data["info"]  # Drop the metadata
-                except APINotFoundError as error:
-                    raise NotFoundError(str(error)) from error
-
-                for p in data["participants"]:
-                    puuid = p.get("puuid", None)
-                    if (
-                        puuid is None
-                    ):  # TODO: Figure out what bots are marked as in match-v5
-                        p["bot"] = True
+                yield get_match(id)
+
+        def concurrent_generator():
+            ids = iter(query["ids"])
+            # The limiters don't know the real limits until Riot has sent them back in the response headers of
+            # a first request, so that request is made on its own before the rest are fanned out.
+            if not app_limiter.limits_known or not method_limiter.limits_known:
+                for id in ids:
+                    yield get_match(id)
+                    break
+            executor = ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix="cassiopeia-match"
+            )
+            pending = collections.deque()
+            try:
+                # Keep at most `concurrency` requests in flight or waiting to be yielded
+                for id in itertools.islice(ids, concurrency):
+                    pending.append(executor.submit(get_match, id))
+                while pending:
+                    if ordered:
+                        future = pending.popleft()
+                        futures.wait([future])
                     else:
-                        p["bot"] = False
-
-                data["matchId"] = id
-                data["continent"] = continent.value
-                yield MatchDto(data)
-
+                        done, _ = futures.wait(
+                            pending, return_when=futures.FIRST_COMPLETED
+                        )
+                        future = next(f for f in pending if f in done)
+                        pending.remove(future)
+                    for id in itertools.islice(ids, 1):
+                        pending.append(executor.submit(get_match, id))
+                    yield future.result()
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        if concurrency > 1:
+            return concurrent_generator()
         return generator()
 
+    @validate_query(_validate_get_many_match_query, convert_region_to_platform)
+    async def get_many_match_async(
+        self, query: MutableMapping[str, Any], context: PipelineContext = None
+    ) -> List[MatchDto]:
+        platform: Platform = query["platform"]
+        ids = list(query["ids"])
+        matches = []
+        # As in `get_many_match`, the first request is made on its own so the limiters learn the real limits.
+        app_limiter, method_limiter = self._get_rate_limiter(
+            platform.continent, "matches/id"
+        )
+        if ids and (not app_limiter.limits_known or not method_limiter.limits_known):
+            matches.append(
+                await self.get_match_async(
+                    {"platform": platform, "id": ids[0]}, context
+                )
+            )
+            ids = ids[1:]
+        # The rest are put in flight at once; the rate limiters and the async client decide how many of them
+        # actually run concurrently.
+        matches.extend(
+            await asyncio.gather(
+                *[
+                    self.get_match_async({"platform": platform, "id": id}, context)
+                    for id in ids
+                ]
+            )
+        )
+        return matches
+
     _validate_get_match_list_query = (
         Query.has("continent")
         .as_(Continent)
@@ -159,15 +249,54 @@ class MatchAPI(RiotAPIService):
     def get_match_list(
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> MatchListDto:
+        params = self._match_list_parameters(query)
+        continent: Continent = query["continent"]
+        puuid: str = query["puuid"]
+        url = f"https://{continent.value.lower()}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
+        try:
+            app_limiter, method_limiter = self._get_rate_limiter(
+                continent, "matchlists/by-puuid/puuid"
+            )
+            data = loads(
+                self._get(
+                    url, params, app_limiter=app_limiter, method_limiter=method_limiter
+                )
+            )
+        except APINotFoundError:
+            data = []
+
+        return self._to_match_list_dto(data, query, params)
+
+    @validate_query(_validate_get_match_list_query, convert_to_continent)
+    async def get_match_list_async(
+        self, query: MutableMapping[str, Any], context: PipelineContext = None
+    ) -> MatchListDto:
+        params = self._match_list_parameters(query)
+        continent: Continent = query["continent"]
+        puuid: str = query["puuid"]
+        url = f"https://{continent.value.lower()}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
+        try:
+            app_limiter, method_limiter = self._get_rate_limiter(
+                continent, "matchlists/by-puuid/puuid"
+            )
+            data = loads(
+                await self._get_async(
+                    url, params, app_limiter=app_limiter, method_limiter=method_limiter
+                )
+            )
+        except APINotFoundError:
+            data = []
+
+        return self._to_match_list_dto(data, query, params)
+
+    @staticmethod
+    def _match_list_parameters(query: MutableMapping[str, Any]) -> dict:
         params = {}
 
         riot_index_interval = 100
 
-        start = query["start"]
-        params["start"] = start
-
-        count = query["count"]
-        params["count"] = int(min(riot_index_interval, count))
+        params["start"] = query["start"]
+        params["count"] = int(min(riot_index_interval, query["count"]))
 
         start_time = query.get("startTime", None)
         if start_time is not None:
@@ -189,36 +318,27 @@ class MatchAPI(RiotAPIService):
         if type is not None:
             params["type"] = MatchType(type).value
 
-        continent: Continent = query["continent"]
-        puuid: str = query["puuid"]
-        url = f"https://{continent.value.lower()}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
-        try:
-            app_limiter, method_limiter = self._get_rate_limiter(
-                continent, "matchlists/by-puuid/puuid"
-            )
-            data = json.loads(
-                self._get(
-                    url, params, app_limiter=app_limiter, method_limiter=method_limiter
-                )
-            )
-        except APINotFoundError:
-            data = []
+        return params
 
+    @staticmethod
+    def _to_match_list_dto(
+        data: list, query: MutableMapping[str, Any], params: dict
+    ) -> MatchListDto:
         data = {
             "match_ids": data,
-            "continent": continent.value,
-            "puuid": puuid,
-            "type": type,
-            "queue": queue,
-            "start": start,
+            "continent": query["continent"].value,
+            "puuid": query["puuid"],
+            "type": query.get("type", None),
+            "queue": query.get("queue", None),
+            "start": query["start"],
             "pulled_match_count": params["count"],
         }
 
-        if start_time is not None:
-            data["startTime"] = start_time
+        if "startTime" in params:
+            data["startTime"] = params["startTime"]
 
-        if end_time is not None:
-            data["endTime"] = end_time
+        if "endTime" in params:
+            data["endTime"] = params["endTime"]
 
         return MatchListDto(data)
 
@@ -245,16 +365,51 @@ class MatchAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 continent, "matches/id/timeline"
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url, {}, app_limiter=app_limiter, method_limiter=method_limiter
                 )
             )
-            # metadata = data["metadata"]
-            data = data["info"]  # Drop the metadata
         except APINotFoundError as error:
             raise NotFoundError(str(error)) from error
 
-        data["matchId"] = query["id"]
+        return self._to_timeline_dto(data, platform, id)
+
+    @validate_query(_validate_get_timeline_query, convert_region_to_platform)
+    async def get_match_timeline_async(
+        self, query: MutableMapping[str, Any], context: PipelineContext = None
+    ) -> TimelineDto:
+        platform: Platform = query["platform"]
+        continent: Continent = platform.continent
+        id = query["id"]
+
+        url = f"https://{continent.value.lower()}.api.riotgames.com/lol/match/v5/matches/{platform.value}_{id}/timeline"
+        try:
+            app_limiter, method_limiter = self._get_rate_limiter(
+                continent, "matches/id/timeline"
+            )
+            data = loads(
+                await self._get_async(
+                    url, {}, app_limiter=app_limiter, method_limiter=method_limiter
+                )
+            )
+        except APINotFoundError as error:
+            raise NotFoundError(str(error)) from error
+
+        return self._to_timeline_dto(data, platform, id)
+
+    @staticmethod
+    def _to_timeline_dto(data: dict, platform: Platform, id: int) -> TimelineDto:
+        # metadata = data["metadata"]
+        data = data["info"]  # Drop the metadata
+        data["matchId"] = id
         data["platform"] = platform.value
         return TimelineDto(data)
+
+    _get_async_methods = {
+        MatchDto: get_match_async,
+        MatchListDto: get_match_list_async,
+        TimelineDto: get_match_timeline_async,
+    }
+
+    _get_many_async_methods = {MatchDto: get_many_match_async}
@@ -0,0 +1,319 @@
+import hashlib
+import os
+import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import List, Tuple, Mapping, Any, Union
+
+
+class RateLimiterBackend(ABC):
+    """Keeps the state of rate limit windows somewhere several processes (or machines) can share it.
+
+    Each limiter is identified by a key (e.g. "NA1:application") and has one or more fixed windows, given as
+    (permits, window seconds) pairs. A window opens when the first permit is taken from it.
+    """
+
+    @abstractmethod
+    def acquire(self, key: str, limits: List[Tuple[float, int]]) -> float:
+        """Takes one permit from every window of `key` and returns 0 if they all have one left. Otherwise takes
+        nothing and returns the number of seconds to wait before trying again."""
+        pass
+
+    @abstractmethod
+    def restrict_for(self, key: str, windows: List[int], seconds: float) -> None:
+        """Lets no permits be taken from the given windows of `key` for `seconds`."""
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteRateLimiterBackend(RateLimiterBackend):
+    """Shares rate limits between the processes on one machine through a SQLite file."""
+
+    def __init__(self, path: str = None) -> None:
+        if path is None:
+            path = os.path.join(
+                os.path.expanduser("~"), ".cassiopeia", "ratelimits.sqlite"
+            )
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._path = path
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS windows ("
+            "key TEXT NOT NULL, "
+            "window INTEGER NOT NULL, "
+            "count INTEGER NOT NULL, "
+            "ends REAL NOT NULL, "
+            "PRIMARY KEY (key, window)"
+            ") WITHOUT ROWID"
+        )
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, limits: List[Tuple[float, int]]) -> float:
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                windows = []
+                wait = 0.0
+                for permits, window in limits:
+                    row = cursor.execute(
+                        "SELECT count, ends FROM windows WHERE key = ? AND window = ?",
+                        (key, window),
+                    ).fetchone()
+                    if row is None or row[1] <= now:
+                        count, ends = 0, now + window
+                    else:
+                        count, ends = row
+                    if count >= permits:
+                        wait = max(wait, ends - now)
+                    windows.append((key, window, count + 1, ends))
+                if wait > 0:
+                    cursor.execute("ROLLBACK")
+                    return wait
+                cursor.executemany(
+                    "INSERT OR REPLACE INTO windows (key, window, count, ends) VALUES (?, ?, ?, ?)",
+                    windows,
+                )
+                cursor.execute("COMMIT")
+                return 0.0
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+
+    def restrict_for(self, key: str, windows: List[int], seconds: float) -> None:
+        with self._lock:
+            ends = time.time() + seconds
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO windows (key, window, count, ends) VALUES (?, ?, ?, ?)",
+                [(key, window, 2**62, ends) for window in windows],
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class RedisError(Exception):
+    pass
+
+
+class _RedisConnection(object):
+    # A minimal client for the Redis serialization protocol (RESP), enough to pipeline a few commands.
+
+    def __init__(
+        self, host: str, port: int, db: int, password: str, timeout: float
+    ) -> None:
+        self._socket = socket.create_connection((host, port), timeout=timeout)
+        self._file = self._socket.makefile("rb")
+        if password is not None:
+            self.execute(["AUTH", password])
+        if db:
+            self.execute(["SELECT", db])
+
+    def execute(self, *commands: List[Any]) -> List[Any]:
+        payload = []
+        for command in commands:
+            payload.append(b"*%d\r\n" % len(command))
+            for argument in command:
+                if not isinstance(argument, bytes):
+                    argument = str(argument).encode("utf-8")
+                payload.append(b"$%d\r\n%s\r\n" % (len(argument), argument))
+        self._socket.sendall(b"".join(payload))
+        replies = [self._read_reply() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+        return replies
+
+    def _read_reply(self) -> Any:
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("The Redis server closed the connection.")
+        prefix, line = line[:1], line[1:-2]
+        if prefix == b"+":
+            return line.decode("utf-8")
+        if prefix == b"-":
+            return RedisError(line.decode("utf-8"))
+        if prefix == b":":
+            return int(line)
+        if prefix == b"$":
+            length = int(line)
+            if length == -1:
+                return None
+            data = self._file.read(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            length = int(line)
+            if length == -1:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise RedisError("Unexpected reply from the Redis server: {}".format(line))
+
+    def close(self) -> None:
+        self._file.close()
+        self._socket.close()
+
+
+# Takes a permit from every window in KEYS, or from none of them, in one step. ARGV holds each window's permits and
+# length in milliseconds. Returns 0 if the permits were taken, or else the milliseconds to wait.
+_ACQUIRE_SCRIPT = """
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local count = tonumber(redis.call("GET", key) or "0")
+    if count + 1 > tonumber(ARGV[2 * i - 1]) then
+        local ttl = redis.call("PTTL", key)
+        if ttl < 0 then
+            ttl = tonumber(ARGV[2 * i])
+            redis.call("PEXPIRE", key, ttl)
+        end
+        wait = math.max(wait, ttl, 1)
+    end
+end
+if wait > 0 then
+    return wait
+end
+for i, key in ipairs(KEYS) do
+    if redis.call("INCR", key) == 1 or redis.call("PTTL", key) < 0 then
+        redis.call("PEXPIRE", key, ARGV[2 * i])
+    end
+end
+return 0
+"""
+_ACQUIRE_SCRIPT_SHA = hashlib.sha1(_ACQUIRE_SCRIPT.encode("utf-8")).hexdigest()
+
+
+class RedisRateLimiterBackend(RateLimiterBackend):
+    """Shares rate limits between processes on any number of machines through a Redis server.
+
+    Each window is a counter that is incremented for every permit and expires when the window ends. The permits are
+    checked and taken by a Lua script, so no two processes can take the last permit of a window.
+
+    Servers that speak the Redis protocol but can't run scripts are supported with INCR, DECR, PTTL, PEXPIRE, and SET
+    alone. Then a permit is taken before it's checked and given back if the window was full, so for that moment
+    other processes see one permit too few and may wait when they didn't have to. A window is also left without an
+    expiry until the process that opened it sets one, though the next process to use it sets it if that one died.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str = None,
+        prefix: str = "cassiopeia:",
+        timeout: float = 10.0,
+    ) -> None:
+        self._address = (host, port, db, password, timeout)
+        self._prefix = prefix
+        self._connection = None
+        self._lock = threading.Lock()
+        self._scripting = True
+
+    def _execute(self, *commands: List[Any]) -> List[Any]:
+        with self._lock:
+            if self._connection is None:
+                self._connection = _RedisConnection(*self._address)
+            try:
+                return self._connection.execute(*commands)
+            except (OSError, ConnectionError):
+                # Reconnect on the next call
+                self._connection.close()
+                self._connection = None
+                raise
+
+    def _key(self, key: str, window: int) -> str:
+        return "{}{}:{}".format(self._prefix, key, window)
+
+    def acquire(self, key: str, limits: List[Tuple[float, int]]) -> float:
+        if not self._scripting:
+            return self._acquire_without_script(key, limits)
+        keys = [self._key(key, window) for _, window in limits]
+        arguments = [
+            argument
+            for permits, window in limits
+            for argument in (permits, window * 1000)
+        ]
+        try:
+            try:
+                (wait,) = self._execute(
+                    ["EVALSHA", _ACQUIRE_SCRIPT_SHA, len(keys), *keys, *arguments]
+                )
+            except RedisError as error:
+                if not str(error).startswith("NOSCRIPT"):
+                    raise
+                # The server hasn't seen the script yet (or was restarted)
+                (wait,) = self._execute(
+                    ["EVAL", _ACQUIRE_SCRIPT, len(keys), *keys, *arguments]
+                )
+        except RedisError as error:
+            if "unknown command" not in str(error).lower():
+                raise
+            self._scripting = False
+            return self._acquire_without_script(key, limits)
+        return wait / 1000
+
+    def _acquire_without_script(
+        self, key: str, limits: List[Tuple[float, int]]
+    ) -> float:
+        keys = [self._key(key, window) for _, window in limits]
+        commands = []
+        for name in keys:
+            commands.append(["INCR", name])
+            commands.append(["PTTL", name])
+        replies = self._execute(*commands)
+
+        wait = 0.0
+        expire = []
+        for (permits, window), name, count, ttl in zip(
+            limits, keys, replies[::2], replies[1::2]
+        ):
+            if ttl < 0:
+                # The window was just opened (or its opener died before setting the expiry)
+                ttl = window * 1000
+                expire.append(["PEXPIRE", name, ttl])
+            if count > permits:
+                wait = max(wait, ttl / 1000)
+        if expire:
+            self._execute(*expire)
+        if wait > 0:
+            self._execute(*[["DECR", name] for name in keys])
+        return wait
+
+    def restrict_for(self, key: str, windows: List[int], seconds: float) -> None:
+        milliseconds = max(int(seconds * 1000), 1)
+        self._execute(
+            *[
+                ["SET", self._key(key, window), 2**62, "PX", milliseconds]
+                for window in windows
+            ]
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+_BACKENDS = {"sqlite": SQLiteRateLimiterBackend, "redis": RedisRateLimiterBackend}
+
+
+def create_rate_limiter_backend(
+    config: Union[RateLimiterBackend, Mapping[str, Any]],
+) -> RateLimiterBackend:
+    # Backends can be given directly or configured like {"type": "redis", "host": ..., "port": ...}
+    if config is None or isinstance(config, RateLimiterBackend):
+        return config
+    config = dict(config)
+    return _BACKENDS[config.pop("type").lower()](**config)
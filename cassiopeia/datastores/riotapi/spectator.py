@@ -1,5 +1,4 @@
 from typing import Type, TypeVar, MutableMapping, Any, Iterable
-import json
 
 from datapipelines import (
     DataSource,
@@ -9,6 +8,7 @@ from datapipelines import (
     validate_query,
 )
 from .common import RiotAPIService, APINotFoundError
+from ..common import loads
 from ...data import Platform, Region
 from ...dto.staticdata.version import VersionListDto
 from ...dto.spectator import CurrentGameInfoDto, FeaturedGamesDto
@@ -70,7 +70,7 @@ class SpectatorAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 query["platform"], "spectator/active-games/by-summoner"
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url, {}, app_limiter=app_limiter, method_limiter=method_limiter
                 )
@@ -99,7 +99,7 @@ class SpectatorAPI(RiotAPIService):
             app_limiter, method_limiter = self._get_rate_limiter(
                 query["platform"], "featured-games"
             )
-            data = json.loads(
+            data = loads(
                 self._get(
                     url, {}, app_limiter=app_limiter, method_limiter=method_limiter
                 )
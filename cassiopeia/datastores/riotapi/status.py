@@ -1,5 +1,4 @@
 from typing import Type, TypeVar, MutableMapping, Any, Iterable, Generator
-import json
 
 from datapipelines import (
     DataSource,
@@ -9,6 +8,7 @@ from datapipelines import (
     validate_query,
 )
 from .common import RiotAPIService, APINotFoundError
+from ..common import loads
 from ...data import Platform
 from ...dto.staticdata.version import VersionListDto
 from ...dto.status import ShardStatusDto
@@ -94,7 +94,7 @@ class StatusAPI(RiotAPIService):
                     app_limiter, method_limiter = self._get_rate_limiter(
                         query["platform"], "status"
                     )
-                    data = json.loads(
+                    data = loads(
                         self._get(
                             url,
                             {},
@@ -0,0 +1,804 @@
+from typing import Type, Mapping, Any, Iterable, TypeVar, Callable, Generator, List
+import datetime
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from datapipelines import (
+    DataSource,
+    DataSink,
+    PipelineContext,
+    validate_query,
+    NotFoundError,
+)
+
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+from . import uniquekeys
+from ..dto.champion import ChampionRotationDto
+from ..dto.staticdata import (
+    ChampionListDto,
+    ItemListDto,
+    LanguageStringsDto,
+    LanguagesDto,
+    MapListDto,
+    ProfileIconDataDto,
+    RealmDto,
+    RuneListDto,
+    SummonerSpellListDto,
+    VersionListDto,
+)
+from ..dto.status import ShardStatusDto
+from ..dto.match import MatchDto, TimelineDto
+from ..dto.summoner import SummonerDto
+from ..dto.account import AccountDto
+
+T = TypeVar("T")
+
+
+default_expirations = {
+    RealmDto: datetime.timedelta(hours=6),
+    VersionListDto: datetime.timedelta(hours=6),
+    LanguagesDto: datetime.timedelta(days=20),
+    ChampionListDto: -1,
+    ItemListDto: -1,
+    LanguageStringsDto: -1,
+    MapListDto: -1,
+    ProfileIconDataDto: -1,
+    RuneListDto: -1,
+    SummonerSpellListDto: -1,
+    ChampionRotationDto: datetime.timedelta(hours=6),
+    ShardStatusDto: datetime.timedelta(hours=1),
+    MatchDto: -1,
+    TimelineDto: -1,
+    SummonerDto: datetime.timedelta(days=1),
+    AccountDto: datetime.timedelta(days=1),
+}
+
+# How long a query that no source could find is remembered
+default_not_found_expirations = {
+    MatchDto: datetime.timedelta(days=1),
+    TimelineDto: datetime.timedelta(days=1),
+    SummonerDto: datetime.timedelta(hours=1),
+    AccountDto: datetime.timedelta(hours=1),
+}
+
+_not_found_key_functions = {
+    MatchDto: uniquekeys.for_match_dto_query,
+    TimelineDto: uniquekeys.for_match_timeline_dto_query,
+    SummonerDto: uniquekeys.for_summoner_dto_query,
+    AccountDto: uniquekeys.for_account_dto_query,
+}
+
+
+class SQLiteStore(DataSource, DataSink):
+    """A persistent data store backed by a single SQLite file.
+
+    DTOs are stored as (optionally compressed) JSON, keyed by the DTO key functions in `uniquekeys`. The file can be
+    shared by several processes; writes are serialized by SQLite. Queries that no source could find are also stored,
+    for the times in `not_found_expirations`, until the object is put.
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        expirations: Mapping[type, float] = None,
+        compress: bool = True,
+        not_found_expirations: Mapping[type, float] = None,
+    ) -> None:
+        if path is None:
+            path = os.path.join(os.path.expanduser("~"), ".cassiopeia", "store.sqlite")
+        path = os.path.expanduser(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._path = path
+        self._compress = compress
+
+        self._expirations = dict(default_expirations)
+        if expirations is not None:
+            self._expirations.update(expirations)
+        for key, value in list(self._expirations.items()):
+            if isinstance(key, str):
+                new_key = globals()[key]
+                self._expirations[new_key] = self._expirations.pop(key)
+                key = new_key
+            if value != -1 and isinstance(value, datetime.timedelta):
+                self._expirations[key] = value.seconds + 24 * 60 * 60 * value.days
+
+        self._not_found_expirations = dict(default_not_found_expirations)
+        if not_found_expirations is not None:
+            self._not_found_expirations.update(not_found_expirations)
+        for key, value in list(self._not_found_expirations.items()):
+            if isinstance(key, str):
+                new_key = globals()[key]
+                self._not_found_expirations[new_key] = self._not_found_expirations.pop(
+                    key
+                )
+                key = new_key
+            if value != -1 and isinstance(value, datetime.timedelta):
+                self._not_found_expirations[key] = (
+                    value.seconds + 24 * 60 * 60 * value.days
+                )
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS data ("
+                "type TEXT NOT NULL, "
+                "key TEXT NOT NULL, "
+                "value BLOB NOT NULL, "
+                "expires REAL, "
+                "PRIMARY KEY (type, key)) WITHOUT ROWID"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS not_found ("
+                "type TEXT NOT NULL, "
+                "key TEXT NOT NULL, "
+                "expires REAL, "
+                "PRIMARY KEY (type, key)) WITHOUT ROWID"
+            )
+
+    @DataSource.dispatch
+    def get(
+        self, type: Type[T], query: Mapping[str, Any], context: PipelineContext = None
+    ) -> T:
+        pass
+
+    @DataSource.dispatch
+    def get_many(
+        self, type: Type[T], query: Mapping[str, Any], context: PipelineContext = None
+    ) -> Iterable[T]:
+        pass
+
+    @DataSink.dispatch
+    def put(self, type: Type[T], item: T, context: PipelineContext = None) -> None:
+        pass
+
+    @DataSink.dispatch
+    def put_many(
+        self, type: Type[T], items: Iterable[T], context: PipelineContext = None
+    ) -> None:
+        pass
+
+    @staticmethod
+    def _encode_key(key: Any) -> str:
+        if isinstance(key, tuple):
+            key = list(key)
+        return json.dumps(key)
+
+    def _encode_value(self, item: Mapping[str, Any]) -> bytes:
+        included_data = item.get("includedData", None)
+        if isinstance(included_data, set):
+            item = dict(item)
+            item["includedData"] = sorted(included_data)
+        value = json.dumps(item).encode("utf-8")
+        if self._compress:
+            value = b"z" + zlib.compress(value)
+        else:
+            value = b"j" + value
+        return value
+
+    @staticmethod
+    def _decode_value(type: Type[T], value: bytes) -> T:
+        # The first byte says how the value was written, so files stay readable if `compress` is changed
+        if value[:1] == b"z":
+            value = zlib.decompress(value[1:])
+        else:
+            value = value[1:]
+        item = type(json.loads(value))
+        if "includedData" in item:
+            item["includedData"] = set(item["includedData"])
+        return item
+
+    def _get(self, type: Type[T], key: Any) -> T:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM data WHERE type = ? AND key = ? AND (expires IS NULL OR expires > ?)",
+                (type.__name__, self._encode_key(key), time.time()),
+            ).fetchone()
+        if row is None:
+            raise NotFoundError
+        return self._decode_value(type, row[0])
+
+    def _get_many(self, type: Type[T], keys: Iterable[Any]) -> Generator[T, None, None]:
+        keys = [self._encode_key(key) for key in keys]
+        values = {}
+        now = time.time()
+        with self._lock:
+            # Stay well under SQLite's limit on the number of bound parameters
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                rows = self._connection.execute(
+                    "SELECT key, value FROM data WHERE type = ? AND key IN ({}) AND (expires IS NULL OR expires > ?)".format(
+                        ", ".join("?" * len(chunk))
+                    ),
+                    (type.__name__, *chunk, now),
+                ).fetchall()
+                values.update(rows)
+        if len(values) < len(set(keys)):
+            raise NotFoundError
+
+        def generator():
+            for key in keys:
+                yield self._decode_value(type, values[key])
+
+        return generator()
+
+    def _expires(self, type: Type[T]) -> float:
+        # Returns the expiration timestamp, None for "never", or 0 for "don't store"
+        expire_seconds = self._expirations.get(type, -1)
+        if expire_seconds == -1:
+            return None
+        if expire_seconds == 0:
+            return 0
+        return time.time() + expire_seconds
+
+    def _put(self, type: Type[T], item: T, keys: Iterable[Any]) -> None:
+        self._put_many(type, [item], lambda item: keys)
+
+    def _put_many(
+        self,
+        type: Type[T],
+        items: Iterable[T],
+        key_function: Callable[[T], Iterable[Any]],
+    ) -> None:
+        expires = self._expires(type)
+        if expires == 0:
+            return
+        rows = []
+        for item in items:
+            value = self._encode_value(item)
+            for key in key_function(item):
+                rows.append((type.__name__, self._encode_key(key), value, expires))
+        with self._lock:
+            with self._connection:
+                self._connection.execute("BEGIN")
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO data (type, key, value, expires) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                if type in self._not_found_expirations:
+                    self._connection.executemany(
+                        "DELETE FROM not_found WHERE type = ? AND key = ?",
+                        [(row[0], row[1]) for row in rows],
+                    )
+
+    def _not_found_key(self, type: Type[T], query: Mapping[str, Any]):
+        # Returns the DTO type of the query's object and its encoded key, or (None, None) if that isn't known
+        type = getattr(type, "_dto_type", type)
+        if type not in self._not_found_expirations:
+            return None, None
+        query = dict(query)
+        try:
+            uniquekeys.convert_region_to_platform(query)
+            return type, self._encode_key(_not_found_key_functions[type](query))
+        except (KeyError, ValueError):
+            return None, None
+
+    def is_not_found(self, type: Type[T], query: Mapping[str, Any]) -> bool:
+        """Whether no source could find the object for this query the last time it was requested, and that hasn't
+        expired."""
+        type, key = self._not_found_key(type, query)
+        if key is None:
+            return False
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM not_found WHERE type = ? AND key = ? AND (expires IS NULL OR expires > ?)",
+                (type.__name__, key, time.time()),
+            ).fetchone()
+        return row is not None
+
+    def put_not_found(self, type: Type[T], query: Mapping[str, Any]) -> None:
+        """Records that no source could find the object for this query. Putting the object clears this."""
+        type, key = self._not_found_key(type, query)
+        if key is None:
+            return
+        expire_seconds = self._not_found_expirations[type]
+        if expire_seconds == 0:
+            return
+        expires = None if expire_seconds == -1 else time.time() + expire_seconds
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO not_found (type, key, expires) VALUES (?, ?, ?)",
+                (type.__name__, key, expires),
+            )
+
+    def clear(self, type: Type[T] = None):
+        with self._lock:
+            for table in ("data", "not_found"):
+                if type is None:
+                    self._connection.execute("DELETE FROM {}".format(table))
+                else:
+                    self._connection.execute(
+                        "DELETE FROM {} WHERE type = ?".format(table), (type.__name__,)
+                    )
+
+    def expire(self, type: Type[T] = None):
+        with self._lock:
+            for table in ("data", "not_found"):
+                if type is None:
+                    self._connection.execute(
+                        "DELETE FROM {} WHERE expires <= ?".format(table),
+                        (time.time(),),
+                    )
+                else:
+                    self._connection.execute(
+                        "DELETE FROM {} WHERE type = ? AND expires <= ?".format(table),
+                        (type.__name__, time.time()),
+                    )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    ###############
+    # Static Data #
+    ###############
+
+    # Versions
+
+    @get.register(VersionListDto)
+    @validate_query(
+        uniquekeys.validate_version_list_dto_query,
+        uniquekeys.convert_region_to_platform,
+    )
+    def get_versions(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> VersionListDto:
+        return self._get(VersionListDto, uniquekeys.for_version_list_dto_query(query))
+
+    @put.register(VersionListDto)
+    def put_versions(
+        self, item: VersionListDto, context: PipelineContext = None
+    ) -> None:
+        self._put(VersionListDto, item, [uniquekeys.for_version_list_dto(item)])
+
+    @put_many.register(VersionListDto)
+    def put_many_versions(
+        self, items: Iterable[VersionListDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(
+            VersionListDto,
+            items,
+            lambda item: [uniquekeys.for_version_list_dto(item)],
+        )
+
+    # Realms
+
+    @get.register(RealmDto)
+    @validate_query(
+        uniquekeys.validate_realm_dto_query, uniquekeys.convert_region_to_platform
+    )
+    def get_realms(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> RealmDto:
+        return self._get(RealmDto, uniquekeys.for_realm_dto_query(query))
+
+    @put.register(RealmDto)
+    def put_realms(self, item: RealmDto, context: PipelineContext = None) -> None:
+        self._put(RealmDto, item, [uniquekeys.for_realm_dto(item)])
+
+    @put_many.register(RealmDto)
+    def put_many_realms(
+        self, items: Iterable[RealmDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(RealmDto, items, lambda item: [uniquekeys.for_realm_dto(item)])
+
+    # Languages
+
+    @get.register(LanguagesDto)
+    @validate_query(
+        uniquekeys.validate_languages_dto_query,
+        uniquekeys.convert_region_to_platform,
+    )
+    def get_languages(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> LanguagesDto:
+        return self._get(LanguagesDto, uniquekeys.for_languages_dto_query(query))
+
+    @put.register(LanguagesDto)
+    def put_languages(
+        self, item: LanguagesDto, context: PipelineContext = None
+    ) -> None:
+        self._put(LanguagesDto, item, [uniquekeys.for_languages_dto(item)])
+
+    @put_many.register(LanguagesDto)
+    def put_many_languages(
+        self, items: Iterable[LanguagesDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(
+            LanguagesDto, items, lambda item: [uniquekeys.for_languages_dto(item)]
+        )
+
+    # Language Strings
+
+    @get.register(LanguageStringsDto)
+    @validate_query(
+        uniquekeys.validate_language_strings_dto_query,
+        uniquekeys.convert_region_to_platform,
+    )
+    def get_language_strings(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> LanguageStringsDto:
+        return self._get(
+            LanguageStringsDto, uniquekeys.for_language_strings_dto_query(query)
+        )
+
+    @put.register(LanguageStringsDto)
+    def put_language_strings(
+        self, item: LanguageStringsDto, context: PipelineContext = None
+    ) -> None:
+        self._put(LanguageStringsDto, item, [uniquekeys.for_language_strings_dto(item)])
+
+    @put_many.register(LanguageStringsDto)
+    def put_many_language_strings(
+        self, items: Iterable[LanguageStringsDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(
+            LanguageStringsDto,
+            items,
+            lambda item: [uniquekeys.for_language_strings_dto(item)],
+        )
+
+    # Champions
+
+    @get.register(ChampionListDto)
+    @validate_query(
+        uniquekeys.validate_champion_list_dto_query,
+        uniquekeys.convert_region_to_platform,
+    )
+    def get_champion_list(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> ChampionListDto:
+        return self._get(ChampionListDto, uniquekeys.for_champion_list_dto_query(query))
+
+    @put.register(ChampionListDto)
+    def put_champion_list(
+        self, item: ChampionListDto, context: PipelineContext = None
+    ) -> None:
+        self._put(ChampionListDto, item, [uniquekeys.for_champion_list_dto(item)])
+
+    @put_many.register(ChampionListDto)
+    def put_many_champion_list(
+        self, items: Iterable[ChampionListDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(
+            ChampionListDto,
+            items,
+            lambda item: [uniquekeys.for_champion_list_dto(item)],
+        )
+
+    # Items
+
+    @get.register(ItemListDto)
+    @validate_query(
+        uniquekeys.validate_item_list_dto_query,
+        uniquekeys.convert_region_to_platform,
+    )
+    def get_item_list(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> ItemListDto:
+        return self._get(ItemListDto, uniquekeys.for_item_list_dto_query(query))
+
+    @put.register(ItemListDto)
+    def put_item_list(self, item: ItemListDto, context: PipelineContext = None) -> None:
+        self._put(ItemListDto, item, [uniquekeys.for_item_list_dto(item)])
+
+    @put_many.register(ItemListDto)
+    def put_many_item_list(
+        self, items: Iterable[ItemListDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(
+            ItemListDto, items, lambda item: [uniquekeys.for_item_list_dto(item)]
+        )
+
+    # Maps
+
+    @get.register(MapListDto)
+    @validate_query(
+        uniquekeys.validate_map_list_dto_query,
+        uniquekeys.convert_region_to_platform,
+    )
+    def get_map_list(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> MapListDto:
+        return self._get(MapListDto, uniquekeys.for_map_list_dto_query(query))
+
+    @put.register(MapListDto)
+    def put_map_list(self, item: MapListDto, context: PipelineContext = None) -> None:
+        self._put(MapListDto, item, [uniquekeys.for_map_list_dto(item)])
+
+    @put_many.register(MapListDto)
+    def put_many_map_list(
+        self, items: Iterable[MapListDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(
+            MapListDto, items, lambda item: [uniquekeys.for_map_list_dto(item)]
+        )
+
+    # Profile Icons
+
+    @get.register(ProfileIconDataDto)
+    @validate_query(
+        uniquekeys.validate_profile_icon_data_dto_query,
+        uniquekeys.convert_region_to_platform,
+    )
+    def get_profile_icons(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> ProfileIconDataDto:
+        return self._get(
+            ProfileIconDataDto, uniquekeys.for_profile_icon_data_dto_query(query)
+        )
+
+    @put.register(ProfileIconDataDto)
+    def put_profile_icons(
+        self, item: ProfileIconDataDto, context: PipelineContext = None
+    ) -> None:
+        self._put(
+            ProfileIconDataDto, item, [uniquekeys.for_profile_icon_data_dto(item)]
+        )
+
+    @put_many.register(ProfileIconDataDto)
+    def put_many_profile_icons(
+        self, items: Iterable[ProfileIconDataDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(
+            ProfileIconDataDto,
+            items,
+            lambda item: [uniquekeys.for_profile_icon_data_dto(item)],
+        )
+
+    # Runes
+
+    @get.register(RuneListDto)
+    @validate_query(
+        uniquekeys.validate_rune_list_dto_query,
+        uniquekeys.convert_region_to_platform,
+    )
+    def get_rune_list(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> RuneListDto:
+        return self._get(RuneListDto, uniquekeys.for_rune_list_dto_query(query))
+
+    @put.register(RuneListDto)
+    def put_rune_list(self, item: RuneListDto, context: PipelineContext = None) -> None:
+        self._put(RuneListDto, item, [uniquekeys.for_rune_list_dto(item)])
+
+    @put_many.register(RuneListDto)
+    def put_many_rune_list(
+        self, items: Iterable[RuneListDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(
+            RuneListDto, items, lambda item: [uniquekeys.for_rune_list_dto(item)]
+        )
+
+    # Summoner Spells
+
+    @get.register(SummonerSpellListDto)
+    @validate_query(
+        uniquekeys.validate_summoner_spell_list_dto_query,
+        uniquekeys.convert_region_to_platform,
+    )
+    def get_summoner_spell_list(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> SummonerSpellListDto:
+        return self._get(
+            SummonerSpellListDto, uniquekeys.for_summoner_spell_list_dto_query(query)
+        )
+
+    @put.register(SummonerSpellListDto)
+    def put_summoner_spell_list(
+        self, item: SummonerSpellListDto, context: PipelineContext = None
+    ) -> None:
+        self._put(
+            SummonerSpellListDto,
+            item,
+            [uniquekeys.for_summoner_spell_list_dto(item)],
+        )
+
+    @put_many.register(SummonerSpellListDto)
+    def put_many_summoner_spell_list(
+        self, items: Iterable[SummonerSpellListDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(
+            SummonerSpellListDto,
+            items,
+            lambda item: [uniquekeys.for_summoner_spell_list_dto(item)],
+        )
+
+    #####################
+    # Champion Rotation #
+    #####################
+
+    @get.register(ChampionRotationDto)
+    @validate_query(
+        uniquekeys.validate_champion_rotation_dto_query,
+        uniquekeys.convert_region_to_platform,
+    )
+    def get_champion_rotation(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> ChampionRotationDto:
+        return self._get(
+            ChampionRotationDto, uniquekeys.for_champion_rotation_dto_query(query)
+        )
+
+    @put.register(ChampionRotationDto)
+    def put_champion_rotation(
+        self, item: ChampionRotationDto, context: PipelineContext = None
+    ) -> None:
+        self._put(
+            ChampionRotationDto, item, [uniquekeys.for_champion_rotation_dto(item)]
+        )
+
+    @put_many.register(ChampionRotationDto)
+    def put_many_champion_rotation(
+        self, items: Iterable[ChampionRotationDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(
+            ChampionRotationDto,
+            items,
+            lambda item: [uniquekeys.for_champion_rotation_dto(item)],
+        )
+
+    ##########
+    # Status #
+    ##########
+
+    @get.register(ShardStatusDto)
+    @validate_query(
+        uniquekeys.validate_shard_status_dto_query,
+        uniquekeys.convert_region_to_platform,
+    )
+    def get_shard_status(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> ShardStatusDto:
+        return self._get(ShardStatusDto, uniquekeys.for_shard_status_dto_query(query))
+
+    @put.register(ShardStatusDto)
+    def put_shard_status(
+        self, item: ShardStatusDto, context: PipelineContext = None
+    ) -> None:
+        self._put(ShardStatusDto, item, [uniquekeys.for_shard_status_dto(item)])
+
+    @put_many.register(ShardStatusDto)
+    def put_many_shard_status(
+        self, items: Iterable[ShardStatusDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(
+            ShardStatusDto,
+            items,
+            lambda item: [uniquekeys.for_shard_status_dto(item)],
+        )
+
+    #########
+    # Match #
+    #########
+
+    @get.register(MatchDto)
+    @validate_query(
+        uniquekeys.validate_match_dto_query, uniquekeys.convert_region_to_platform
+    )
+    def get_match(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> MatchDto:
+        return self._get(MatchDto, uniquekeys.for_match_dto_query(query))
+
+    @get_many.register(MatchDto)
+    @validate_query(
+        uniquekeys.validate_many_match_dto_query,
+        uniquekeys.convert_region_to_platform,
+    )
+    def get_many_match(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> Generator[MatchDto, None, None]:
+        return self._get_many(MatchDto, uniquekeys.for_many_match_dto_query(query))
+
+    @put.register(MatchDto)
+    def put_match(self, item: MatchDto, context: PipelineContext = None) -> None:
+        self._put(MatchDto, item, [uniquekeys.for_match_dto(item)])
+
+    @put_many.register(MatchDto)
+    def put_many_match(
+        self, items: Iterable[MatchDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(MatchDto, items, lambda item: [uniquekeys.for_match_dto(item)])
+
+    # Timeline
+
+    @get.register(TimelineDto)
+    @validate_query(
+        uniquekeys.validate_match_timeline_dto_query,
+        uniquekeys.convert_region_to_platform,
+    )
+    def get_match_timeline(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> TimelineDto:
+        return self._get(TimelineDto, uniquekeys.for_match_timeline_dto_query(query))
+
+    @put.register(TimelineDto)
+    def put_match_timeline(
+        self, item: TimelineDto, context: PipelineContext = None
+    ) -> None:
+        self._put(TimelineDto, item, [uniquekeys.for_match_timeline_dto(item)])
+
+    @put_many.register(TimelineDto)
+    def put_many_match_timeline(
+        self, items: Iterable[TimelineDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(
+            TimelineDto,
+            items,
+            lambda item: [uniquekeys.for_match_timeline_dto(item)],
+        )
+
+    ############
+    # Summoner #
+    ############
+
+    @get.register(SummonerDto)
+    @validate_query(
+        uniquekeys.validate_summoner_dto_query, uniquekeys.convert_region_to_platform
+    )
+    def get_summoner(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> SummonerDto:
+        return self._get(SummonerDto, uniquekeys.for_summoner_dto_query(query))
+
+    @staticmethod
+    def _summoner_keys(item: SummonerDto) -> List[Any]:
+        return [
+            uniquekeys.for_summoner_dto(item, identifier)
+            for identifier in ("id", "accountId", "puuid")
+            if identifier in item
+        ]
+
+    @put.register(SummonerDto)
+    def put_summoner(self, item: SummonerDto, context: PipelineContext = None) -> None:
+        self._put(SummonerDto, item, self._summoner_keys(item))
+
+    @put_many.register(SummonerDto)
+    def put_many_summoner(
+        self, items: Iterable[SummonerDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(SummonerDto, items, self._summoner_keys)
+
+    ###########
+    # Account #
+    ###########
+
+    @get.register(AccountDto)
+    @validate_query(
+        uniquekeys.validate_account_dto_query, uniquekeys.convert_region_to_platform
+    )
+    def get_account(
+        self, query: Mapping[str, Any], context: PipelineContext = None
+    ) -> AccountDto:
+        return self._get(AccountDto, uniquekeys.for_account_dto_query(query))
+
+    @staticmethod
+    def _account_keys(item: AccountDto) -> List[Any]:
+        keys = [uniquekeys.for_account_dto(item, "puuid")]
+        if "gameName" in item and "tagLine" in item:
+            keys.append(uniquekeys.for_account_dto(item, "name"))
+        return keys
+
+    @put.register(AccountDto)
+    def put_account(self, item: AccountDto, context: PipelineContext = None) -> None:
+        self._put(AccountDto, item, self._account_keys(item))
+
+    @put_many.register(AccountDto)
+    def put_many_account(
+        self, items: Iterable[AccountDto], context: PipelineContext = None
+    ) -> None:
+        self._put_many(AccountDto, items, self._account_keys)
@@ -1,3 +1,5 @@
+import itertools
+import zlib
 from typing import (
     Tuple,
     Set,
@@ -100,7 +102,17 @@ def _rgetattr(obj, key):
 
 
 def _hash_included_data(included_data: Set[str]) -> int:
-    return hash(tuple(included_data))
+    # Sets have no stable order and str hashes are salted per process, so hash a canonical encoding instead. This
+    # keeps keys stable across runs, which the persistent stores rely on.
+    return zlib.crc32(",".join(sorted(included_data)).encode("utf-8"))
+
+
+def _dto_platform(dto: Mapping[str, Any]) -> str:
+    # Most DTOs only carry the region they were pulled from
+    try:
+        return dto["platform"]
+    except KeyError:
+        return Region(dto["region"]).platform.value
 
 
 def _get_default_version(query: Mapping[str, Any], context: PipelineContext) -> str:
@@ -177,7 +189,7 @@ validate_many_champion_rotation_dto_query = Query.has("platform").as_(Platform)
 
 
 def for_champion_rotation_dto(champion_rotation: ChampionRotationDto) -> str:
-    return champion_rotation["platform"]
+    return _dto_platform(champion_rotation)
 
 
 def for_champion_rotation_dto_query(query: Query) -> str:
@@ -222,7 +234,7 @@ def for_champion_mastery_dto(
     champion_mastery: ChampionMasteryDto,
 ) -> Tuple[str, str, int]:
     return (
-        champion_mastery["platform"],
+        _dto_platform(champion_mastery),
         champion_mastery["playerId"],
         champion_mastery["championId"],
     )
@@ -256,7 +268,7 @@ validate_many_champion_mastery_list_dto_query = (
 def for_champion_mastery_list_dto(
     champion_mastery_list: ChampionMasteryListDto,
 ) -> Tuple[str, str]:
-    return champion_mastery_list["platform"], champion_mastery_list["playerId"]
+    return _dto_platform(champion_mastery_list), champion_mastery_list["playerId"]
 
 
 def for_champion_mastery_list_dto_query(query: Query) -> Tuple[str, str]:
@@ -286,7 +298,7 @@ validate_many_champion_mastery_score_dto_query = (
 def for_champion_mastery_score_dto(
     champion_mastery_score: ChampionMasteryScoreDto,
 ) -> Tuple[str, str]:
-    return champion_mastery_score["platform"], champion_mastery_score["playerId"]
+    return _dto_platform(champion_mastery_score), champion_mastery_score["playerId"]
 
 
 def for_champion_mastery_score_dto_query(query: Query) -> Tuple[str, str]:
@@ -325,7 +337,7 @@ def for_league_entries_dto(
     league_entries: LeagueEntriesDto,
 ) -> Tuple[str, str, str, int, int]:
     return (
-        league_entries["platform"],
+        _dto_platform(league_entries),
         league_entries["queue"],
         league_entries["tier"],
         league_entries["id"],
@@ -351,7 +363,7 @@ validate_league_summoner_entries_dto_query = (
 def for_league_summoner_entries_dto(
     league_entries: LeagueEntriesDto,
 ) -> Tuple[str, int]:
-    return league_entries["platform"], league_entries["id"]
+    return _dto_platform(league_entries), league_entries["id"]
 
 
 def for_league_summoner_entries_dto_query(query: Query) -> Tuple[str, int]:
@@ -401,7 +413,7 @@ def for_champion_dto(
     champion: ChampionDto, identifier: str = "id"
 ) -> Tuple[str, str, str, int, Union[int, str]]:
     return (
-        champion["platform"],
+        _dto_platform(champion),
         champion["version"],
         champion["locale"],
         _hash_included_data(champion["includedData"]),
@@ -463,7 +475,7 @@ validate_many_champion_list_dto_query = (
 
 def for_champion_list_dto(champion_list: ChampionListDto) -> Tuple[str, str, str, int]:
     return (
-        champion_list["platform"],
+        _dto_platform(champion_list),
         champion_list["version"],
         champion_list["locale"],
         _hash_included_data(champion_list["includedData"]),
@@ -530,7 +542,7 @@ def for_item_dto(
     item: ItemDto, identifier: str = "id"
 ) -> Tuple[str, str, str, int, Union[int, str]]:
     return (
-        item["platform"],
+        _dto_platform(item),
         item["version"],
         item["locale"],
         _hash_included_data(item["includedData"]),
@@ -592,7 +604,7 @@ validate_many_item_list_dto_query = (
 
 def for_item_list_dto(item_list: ItemListDto) -> Tuple[str, str, str, int]:
     return (
-        item_list["platform"],
+        _dto_platform(item_list),
         item_list["version"],
         item_list["locale"],
         _hash_included_data(item_list["includedData"]),
@@ -647,7 +659,7 @@ def for_language_strings_dto(
     language_strings: LanguageStringsDto,
 ) -> Tuple[str, str, str]:
     return (
-        language_strings["platform"],
+        _dto_platform(language_strings),
         language_strings["version"],
         language_strings["locale"],
     )
@@ -675,7 +687,7 @@ validate_many_languages_dto_query = Query.has("platforms").as_(Iterable)
 
 
 def for_languages_dto(languages: LanguagesDto) -> str:
-    return languages["platform"]
+    return _dto_platform(languages)
 
 
 def for_languages_dto_query(query: Query) -> str:
@@ -724,7 +736,7 @@ validate_many_map_dto_query = (
 def for_map_dto(
     map: MapDto, identifier: str = "mapId"
 ) -> Tuple[str, str, str, Union[int, str]]:
-    return map["platform"], map["version"], map["locale"], map[identifier]
+    return _dto_platform(map), map["version"], map["locale"], map[identifier]
 
 
 def for_map_dto_query(query: Query) -> Tuple[str, str, str, Union[int, str]]:
@@ -767,7 +779,7 @@ validate_many_map_list_dto_query = (
 
 
 def for_map_list_dto(map_list: MapListDto) -> Tuple[str, str, str]:
-    return map_list["platform"], map_list["version"], map_list["locale"]
+    return _dto_platform(map_list), map_list["version"], map_list["locale"]
 
 
 def for_map_list_dto_query(query: Query) -> Tuple[str, str, str]:
@@ -812,7 +824,7 @@ def for_profile_icon_data_dto(
     profile_icon_data: ProfileIconDataDto,
 ) -> Tuple[str, str, str]:
     return (
-        profile_icon_data["platform"],
+        _dto_platform(profile_icon_data),
         profile_icon_data["version"],
         profile_icon_data["locale"],
     )
@@ -861,7 +873,7 @@ def for_profile_icon_dto(
     profile_icon: ProfileIconDetailsDto,
 ) -> Tuple[str, str, str, int]:
     return (
-        profile_icon["platform"],
+        _dto_platform(profile_icon),
         profile_icon["version"],
         profile_icon["locale"],
         profile_icon["id"],
@@ -893,7 +905,7 @@ validate_many_realm_dto_query = Query.has("platforms").as_(Iterable)
 
 
 def for_realm_dto(realm: RealmDto) -> str:
-    return realm["platform"]
+    return _dto_platform(realm)
 
 
 def for_realm_dto_query(query: Query) -> str:
@@ -943,7 +955,7 @@ def for_rune_dto(
     rune: RuneDto, identifier: str = "id"
 ) -> Tuple[str, str, str, int, Union[int, str]]:
     return (
-        rune["platform"],
+        _dto_platform(rune),
         rune["version"],
         rune["locale"],
         _hash_included_data(rune["includedData"]),
@@ -1005,7 +1017,7 @@ validate_many_rune_list_dto_query = (
 
 def for_rune_list_dto(rune_list: RuneListDto) -> Tuple[str, str, str, int]:
     return (
-        rune_list["platform"],
+        _dto_platform(rune_list),
         rune_list["version"],
         rune_list["locale"],
         _hash_included_data(rune_list["includedData"]),
@@ -1072,7 +1084,7 @@ def for_summoner_spell_dto(
     summoner_spell: SummonerSpellDto, identifier: str = "id"
 ) -> Tuple[str, str, str, int, Union[int, str]]:
     return (
-        summoner_spell["platform"],
+        _dto_platform(summoner_spell),
         summoner_spell["version"],
         summoner_spell["locale"],
         _hash_included_data(summoner_spell["includedData"]),
@@ -1138,7 +1150,7 @@ def for_summoner_spell_list_dto(
     summoner_spell_list: SummonerSpellListDto,
 ) -> Tuple[str, str, str, int]:
     return (
-        summoner_spell_list["platform"],
+        _dto_platform(summoner_spell_list),
         summoner_spell_list["version"],
         summoner_spell_list["locale"],
         _hash_included_data(summoner_spell_list["includedData"]),
@@ -1176,7 +1188,7 @@ validate_many_version_list_dto_query = Query.has("platforms").as_(Iterable)
 
 
 def for_version_list_dto(version_list: VersionListDto) -> str:
-    return version_list["platform"]
+    return _dto_platform(version_list)
 
 
 def for_version_list_dto_query(query: Query) -> str:
@@ -1204,7 +1216,7 @@ validate_many_shard_status_dto_query = Query.has("platforms").as_(Iterable)
 
 
 def for_shard_status_dto(shard_status: ShardStatusDto) -> str:
-    return shard_status["platform"]
+    return _dto_platform(shard_status)
 
 
 def for_shard_status_dto_query(query: Query) -> str:
@@ -1226,21 +1238,17 @@ def for_many_shard_status_dto_query(query: Query) -> Generator[str, None, None]:
 
 
 validate_match_dto_query = (
-    Query.has("continent")
-    .as_(Continent)
-    .or_("region")
+    Query.has("region")
     .as_(Region)
     .or_("platform")
     .as_(Platform)
     .also.has("id")
-    .as_(str)
+    .as_(int)
 )
 
 
 validate_many_match_dto_query = (
-    Query.has("continent")
-    .as_(Continent)
-    .or_("region")
+    Query.has("region")
     .as_(Region)
     .or_("platform")
     .as_(Platform)
@@ -1249,20 +1257,19 @@ validate_many_match_dto_query = (
 )
 
 
-def for_match_dto(match: MatchDto) -> Tuple[str, str]:
-    return match["continent"], match["id"]
+def for_match_dto(match: MatchDto) -> Tuple[str, int]:
+    return match["platformId"], match["matchId"]
 
 
-def for_match_dto_query(query: Query) -> Tuple[str, str]:
-    convert_to_continent(query)
-    return query["continent"].value, query["id"]
+def for_match_dto_query(query: Query) -> Tuple[str, int]:
+    return query["platform"].value, query["id"]
 
 
-def for_many_match_dto_query(query: Query) -> Generator[Tuple[str, str], None, None]:
-    convert_to_continent(query)
+def for_many_match_dto_query(query: Query) -> Generator[Tuple[str, int], None, None]:
     for match_id in query["ids"]:
         try:
-            yield query["continent"].value, match_id
+            match_id = int(match_id)
+            yield query["platform"].value, match_id
         except ValueError as e:
             raise QueryValidationError from e
 
@@ -1312,21 +1319,17 @@ def for_many_match_reference_dto_query(
 
 
 validate_match_timeline_dto_query = (
-    Query.has("continent")
-    .as_(Continent)
-    .or_("region")
+    Query.has("region")
     .as_(Region)
     .or_("platform")
     .as_(Platform)
     .also.has("id")
-    .as_(str)
+    .as_(int)
 )
 
 
 validate_many_match_timeline_dto_query = (
-    Query.has("continent")
-    .as_(Continent)
-    .or_("region")
+    Query.has("region")
     .as_(Region)
     .or_("platform")
     .as_(Platform)
@@ -1335,22 +1338,21 @@ validate_many_match_timeline_dto_query = (
 )
 
 
-def for_match_timeline_dto(match_timeline: TimelineDto) -> Tuple[str, str]:
-    return match_timeline["continent"], match_timeline["id"]
+def for_match_timeline_dto(match_timeline: TimelineDto) -> Tuple[str, int]:
+    return match_timeline["platform"], match_timeline["matchId"]
 
 
-def for_match_timeline_dto_query(query: Query) -> Tuple[str, str]:
-    convert_to_continent(query)
-    return query["continent"].value, query["id"]
+def for_match_timeline_dto_query(query: Query) -> Tuple[str, int]:
+    return query["platform"].value, query["id"]
 
 
 def for_many_match_timeline_dto_query(
     query: Query,
-) -> Generator[Tuple[str, str], None, None]:
-    convert_to_continent(query)
+) -> Generator[Tuple[str, int], None, None]:
     for match_id in query["ids"]:
         try:
-            yield query["continent"].value, match_id
+            match_id = int(match_id)
+            yield query["platform"].value, match_id
         except ValueError as e:
             raise QueryValidationError from e
 
@@ -1371,7 +1373,7 @@ validate_many_current_game_info_dto_query = (
 
 
 def for_current_game_info_dto(current_game_info: CurrentGameInfoDto) -> Tuple[str, int]:
-    return current_game_info["platform"], current_game_info["gameId"]
+    return _dto_platform(current_game_info), current_game_info["gameId"]
 
 
 def for_current_game_info_dto_query(query: Query) -> Tuple[str, int]:
@@ -1396,7 +1398,7 @@ validate_many_featured_game_dto_query = Query.has("platforms").as_(Iterable)
 
 
 def for_featured_games_dto(featured_games: FeaturedGamesDto) -> str:
-    return featured_games["platform"]
+    return _dto_platform(featured_games)
 
 
 def for_featured_games_dto_query(query: Query) -> str:
@@ -1423,49 +1425,45 @@ validate_account_dto_query = (
     .as_(str)
     .or_("name")
     .as_(str)
-    .or_("tagline")
+    .also.can_have("tagline")
     .as_(str)
 )
 
 validate_many_account_dto_query = (
     Query.has("platform")
     .as_(Platform)
-    .also.has("puuid")
+    .also.has("puuids")
     .as_(Iterable)
-    .or_("name")
+    .or_("names")
     .as_(Iterable)
-    .or_("tagline")
+    .also.can_have("taglines")
     .as_(Iterable)
 )
 
 
-def for_account_dto(
-    account: AccountDto, identifier: str = "puuid"
-) -> Tuple[str, Union[int, str]]:
-    return account["platform"], account[identifier]
+def for_account_dto(account: AccountDto, identifier: str = "puuid") -> Tuple[str, str]:
+    # Accounts are global, so they aren't keyed by platform
+    if identifier == "puuid":
+        return identifier, account["puuid"]
+    return identifier, "{}#{}".format(account["gameName"], account["tagLine"]).lower()
 
 
-def for_account_dto_query(query: Query) -> Tuple[str, Union[int, str]]:
+def for_account_dto_query(query: Query) -> Tuple[str, str]:
     if "puuid" in query:
-        identifier = "puuid"
-    else:
-        identifier = "name"
-    return query["platform"].value, query[identifier]
+        return "puuid", query["puuid"]
+    return "name", "{}#{}".format(query["name"], query.get("tagline", "")).lower()
 
 
-def for_many_account_dto_query(
-    query: Query,
-) -> Generator[Tuple[str, Union[int, str]], None, None]:
+def for_many_account_dto_query(query: Query) -> Generator[Tuple[str, str], None, None]:
     if "puuids" in query:
-        identifiers, identifier_type = query["puuids"], str
-    else:
-        identifiers, identifier_type = query["names"], str
-    for identifier in identifiers:
-        try:
-            identifier = identifier_type(identifier)
-            yield query["platform"].value, identifier
-        except ValueError as e:
-            raise QueryValidationError from e
+        for puuid in query["puuids"]:
+            yield "puuid", puuid
+        return
+    taglines = query.get("taglines", None)
+    if taglines is None:
+        taglines = itertools.repeat("")
+    for name, tagline in zip(query["names"], taglines):
+        yield "name", "{}#{}".format(name, tagline).lower()
 
 
 ################
@@ -1477,10 +1475,10 @@ validate_summoner_dto_query = (
     Query.has("platform")
     .as_(Platform)
     .also.has("id")
-    .as_(int)
+    .as_(str)
     .or_("accountId")
-    .as_(int)
-    .or_("name")
+    .as_(str)
+    .or_("puuid")
     .as_(str)
 )
 
@@ -1492,42 +1490,38 @@ validate_many_summoner_dto_query = (
     .as_(Iterable)
     .or_("accountIds")
     .as_(Iterable)
-    .or_("names")
+    .or_("puuids")
     .as_(Iterable)
 )
 
 
 def for_summoner_dto(
     summoner: SummonerDto, identifier: str = "id"
-) -> Tuple[str, Union[int, str]]:
-    return summoner["platform"], summoner[identifier]
+) -> Tuple[str, str, str]:
+    return _dto_platform(summoner), identifier, summoner[identifier]
 
 
-def for_summoner_dto_query(query: Query) -> Tuple[str, Union[int, str]]:
+def for_summoner_dto_query(query: Query) -> Tuple[str, str, str]:
     if "id" in query:
         identifier = "id"
     elif "accountId" in query:
         identifier = "accountId"
     else:
-        identifier = "name"
-    return query["platform"].value, query[identifier]
+        identifier = "puuid"
+    return query["platform"].value, identifier, query[identifier]
 
 
 def for_many_summoner_dto_query(
     query: Query,
-) -> Generator[Tuple[str, Union[int, str]], None, None]:
+) -> Generator[Tuple[str, str, str], None, None]:
     if "ids" in query:
-        identifiers, identifier_type = query["ids"], int
+        identifier, values = "id", query["ids"]
     elif "accountIds" in query:
-        identifiers, identifier_type = query["accountIds"], int
+        identifier, values = "accountId", query["accountIds"]
     else:
-        identifiers, identifier_type = query["names"], str
-    for identifier in identifiers:
-        try:
-            identifier = identifier_type(identifier)
-            yield query["platform"].value, identifier
-        except ValueError as e:
-            raise QueryValidationError from e
+        identifier, values = "puuid", query["puuids"]
+    for value in values:
+        yield query["platform"].value, identifier, value
 
 
 ########
@@ -2571,16 +2565,16 @@ validate_many_realms_query = Query.has("platforms").as_(Iterable)
 
 
 def for_realms(realm: Realms) -> List[str]:
-    return [(realm.platform.value)]
+    return [realm.platform.value]
 
 
 def for_realms_query(query: Query) -> List[str]:
-    return [(query["platform"].value)]
+    return [query["platform"].value]
 
 
 def for_many_realms_query(query: Query) -> Generator[List[str], None, None]:
     for platform in query["platforms"]:
-        yield [(platform.value)]
+        yield [platform.value]
 
 
 # Rune
@@ -1,4 +1,4 @@
-from typing import Type, TypeVar
+from typing import Type, TypeVar, Union
 from copy import deepcopy
 
 from datapipelines import DataTransformer, PipelineContext
@@ -8,11 +8,13 @@ from ..core.match import (
     MatchListData,
     MatchReferenceData,
     TimelineData,
+    _new_data,
     Match,
     MatchHistory,
     Timeline,
 )
 from ..dto.match import MatchDto, MatchListDto, MatchReferenceDto, TimelineDto
+from ..datastores.common import iter_json_object
 
 T = TypeVar("T")
 F = TypeVar("F")
@@ -73,7 +75,27 @@ class MatchTransformer(DataTransformer):
     def timeline_dto_to_data(
         self, value: TimelineDto, context: PipelineContext = None
     ) -> TimelineData:
-        return TimelineData(**value)
+        return _new_data(TimelineData, **value)
+
+    def timeline_json_to_data(
+        self, value: Union[str, bytes], context: PipelineContext = None
+    ) -> TimelineData:
+        """Converts a match-v5 timeline response body to `TimelineData` one frame at a time, so the frames of a large
+        timeline are never all decoded into dicts at once."""
+        platform = None
+        for key, match_id in iter_json_object(value, ["metadata"]):
+            if key == "matchId":
+                platform = match_id.split("_")[0]
+                break
+        data = _new_data(TimelineData)
+        kwargs = {"platform": platform}
+        for key, item in iter_json_object(value, ["info"], streamed=["frames"]):
+            if key == "frames":
+                data(frames=item)
+            else:
+                kwargs[key] = item
+        kwargs["matchId"] = kwargs.get("gameId", None)
+        return data(**kwargs)
 
     # Data to Core
 
@@ -0,0 +1,221 @@
+"""Loads the static data of a set of regions, locales and patches into the configured sinks ahead of time.
+
+From the command line, with the settings of the workers that will use the data::
+
+    python -m cassiopeia.warmup --settings settings.json --region NA --region EUW --patches 14.1 14.5
+"""
+
+import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple, Type, Union
+
+from . import configuration
+from .core import Champions, Items, Maps, ProfileIcons, Runes, SummonerSpells, Versions
+from .core.match import StaticDataIndex
+from .data import Region
+
+STATIC_DATA_LISTS = (Champions, Items, Runes, SummonerSpells, Maps, ProfileIcons)
+# The lists in a StaticDataIndex
+_INDEXED_LISTS = (Champions, Items, Runes, SummonerSpells)
+
+
+def _patch(version: str) -> Optional[Tuple[int, int]]:
+    # "14.1.1" -> (14, 1); the oldest versions (e.g. "lolpatch_3.7") aren't patches
+    try:
+        major, minor = version.split(".")[:2]
+        return int(major), int(minor)
+    except ValueError:
+        return None
+
+
+def select_versions(
+    versions: Iterable[str], first_patch: str = None, last_patch: str = None
+) -> List[str]:
+    """The latest version of each patch from `first_patch` to `last_patch` (both included, e.g. "14.1" and "14.5"),
+    newest first. `versions` is newest first, as Data Dragon lists them.
+
+    Without `last_patch`, the range ends at the latest patch; without `first_patch`, it's only `last_patch`.
+    """
+    patches = {}
+    for version in versions:
+        patch = _patch(version)
+        if patch is not None and patch not in patches:
+            patches[patch] = version
+    if not patches:
+        return []
+    last = _patch(last_patch) if last_patch is not None else max(patches)
+    first = _patch(first_patch) if first_patch is not None else last
+    if first is None or last is None:
+        raise ValueError(
+            "Patches must look like '14.1', not {!r}".format(first_patch or last_patch)
+        )
+    return [
+        version
+        for patch, version in sorted(patches.items(), reverse=True)
+        if first <= patch <= last
+    ]
+
+
+def warm_up_static_data(
+    regions: Iterable[Union[Region, str]] = None,
+    locales: Iterable[str] = None,
+    first_patch: str = None,
+    last_patch: str = None,
+    lists: Iterable[Type] = STATIC_DATA_LISTS,
+    concurrency: int = 8,
+) -> List[Tuple[Type, Region, str, str, Optional[Exception]]]:
+    """Loads every static data list (champions, items, runes, summoner spells, maps and profile icons) of each region,
+    locale and patch, `concurrency` at a time, so they're in the configured sinks before anything needs them.
+
+    Each patch is its latest version (see `select_versions`); by default only the latest patch is loaded. `regions`
+    defaults to the default region, and `locales` to each region's default locale. If the default locale's champions,
+    items, runes and summoner spells are loaded, the `StaticDataIndex` that matches share for the version is too.
+
+    Returns (list type, region, version, locale, error) for each list; the error is None if it loaded. A list that
+    fails doesn't stop the others.
+    """
+    if regions is None:
+        if configuration.settings.default_region is None:
+            raise ValueError("No regions were given and there is no default region")
+        regions = [configuration.settings.default_region]
+    regions = [Region(region) for region in regions]
+    locales = list(locales) if locales is not None else None
+    lists = list(lists)
+
+    # Each region's versions are needed before anything else can start
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        region_versions = dict(
+            zip(
+                regions,
+                executor.map(
+                    lambda region: select_versions(
+                        Versions(region=region), first_patch, last_patch
+                    ),
+                    regions,
+                ),
+            )
+        )
+
+    def load(task: Tuple[Type, Region, str, str]):
+        list_type, region, version, locale = task
+        try:
+            len(list_type(region=region, version=version, locale=locale))
+        except Exception as error:
+            logging.warning(
+                "Couldn't load %s for %s %s %s: %s",
+                list_type.__name__,
+                region.value,
+                version,
+                locale,
+                error,
+            )
+            return (*task, error)
+        return (*task, None)
+
+    tasks = [
+        (list_type, region, version, locale)
+        for region, versions in region_versions.items()
+        for version in versions
+        for locale in (locales if locales is not None else [region.default_locale])
+        for list_type in lists
+    ]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(load, tasks))
+
+    # Matches use the default locale, and once its champions, items, runes and summoner spells have loaded, the index
+    # they share for the version only has to look them up
+    loaded = {
+        (list_type, region, version)
+        for list_type, region, version, locale, error in results
+        if error is None and locale == region.default_locale
+    }
+    for region, versions in region_versions.items():
+        for version in versions:
+            if all(
+                (list_type, region, version) in loaded for list_type in _INDEXED_LISTS
+            ):
+                StaticDataIndex.for_version(region, version).load()
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m cassiopeia.warmup",
+        description="Loads the static data of some regions, locales and patches into the sinks in the settings, "
+        "so the workers that share those sinks don't wait for Data Dragon.",
+    )
+    parser.add_argument(
+        "--settings",
+        help="A JSON settings file, as for cassiopeia.apply_settings. It should have the same sinks (e.g. an "
+        "SQLiteStore) as the workers.",
+    )
+    parser.add_argument(
+        "--region",
+        action="append",
+        dest="regions",
+        help="A region to load (can be repeated). Defaults to the default region in the settings.",
+    )
+    parser.add_argument(
+        "--locale",
+        action="append",
+        dest="locales",
+        help="A locale to load (can be repeated). Defaults to each region's default locale.",
+    )
+    parser.add_argument(
+        "--patches",
+        nargs="+",
+        metavar="PATCH",
+        default=[],
+        help="The first and last patch to load, e.g. '14.1 14.5', or a single patch. Defaults to the latest patch.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="How many lists to load at once (default: 8).",
+    )
+    args = parser.parse_args(argv)
+    if len(args.patches) > 2:
+        parser.error("--patches takes a single patch or the first and last patch")
+
+    if args.settings is not None:
+        from .cassiopeia import apply_settings
+
+        apply_settings(args.settings)
+
+    if len(args.patches) == 2:
+        first_patch, last_patch = args.patches
+    elif args.patches:
+        first_patch = last_patch = args.patches[0]
+    else:
+        first_patch = last_patch = None
+
+    start = time.perf_counter()
+    results = warm_up_static_data(
+        regions=args.regions,
+        locales=args.locales,
+        first_patch=first_patch,
+        last_patch=last_patch,
+        concurrency=args.concurrency,
+    )
+    failed = [result for result in results if result[-1] is not None]
+    print(
+        "Loaded {} of {} static data lists in {:.1f}s".format(
+            len(results) - len(failed), len(results), time.perf_counter() - start
+        )
+    )
+    for list_type, region, version, locale, error in failed:
+        print(
+            "Failed: {} {} {} {}: {}".format(
+                list_type.__name__, region.value, version, locale, error
+            ),
+            file=sys.stderr,
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
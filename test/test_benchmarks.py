@@ -0,0 +1,63 @@
+import json
+
+from benchmarks import compare, fixtures, run
+from benchmarks.stubserver import StubHTTPClient, StubServer
+from cassiopeia import configuration
+
+
+def test_stub_server():
+    with StubServer() as server:
+        client = StubHTTPClient(server.url)
+        body, headers = client.get(
+            "https://americas.api.riotgames.com/lol/match/v5/matches/NA1_{}".format(
+                fixtures.MATCH_ID
+            )
+        )
+        assert body["info"]["gameId"] == fixtures.MATCH_ID
+        assert "X-App-Rate-Limit" in headers
+        assert server.requests == [
+            (
+                "americas.api.riotgames.com",
+                "/lol/match/v5/matches/NA1_{}".format(fixtures.MATCH_ID),
+            )
+        ]
+
+
+def test_run():
+    settings = configuration.settings
+    results = run(
+        quick=True, only=["transform.match.dto_to_data", "cache.get.miss", "pipeline."]
+    )
+    assert configuration.settings is settings
+    json.dumps(results)
+
+    assert results["format"] == 1
+    assert set(results["environment"]) >= {"cassiopeia", "python", "fixtures"}
+    names = set(results["results"])
+    assert "transform.match.dto_to_data" in names and "cache.get.miss" in names
+    assert "pipeline.get.match.cold" in names and "pipeline.get.realms.warm" in names
+    assert not any(name.startswith("memory.") for name in names)
+    assert all(result["per_op"] > 0 for result in results["results"].values())
+
+
+def test_compare():
+    baseline = {
+        "results": {
+            "a": {"unit": "seconds", "per_op": 1.0},
+            "b": {"unit": "seconds", "per_op": 1.0},
+            "c": {"unit": "bytes", "per_item": 100},
+        }
+    }
+    results = {
+        "results": {
+            "a": {"unit": "seconds", "per_op": 1.1},
+            "b": {"unit": "seconds", "per_op": 1.5},
+            "c": {"unit": "bytes", "per_item": 200},
+            "d": {"unit": "seconds", "per_op": 1.0},
+        }
+    }
+    rows = {row["name"]: row for row in compare(baseline, results, tolerance=0.2)}
+    assert not rows["a"]["regressed"]
+    assert rows["b"]["regressed"] and rows["b"]["ratio"] == 1.5
+    assert rows["c"]["regressed"]
+    assert "d" not in rows
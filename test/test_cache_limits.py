@@ -0,0 +1,149 @@
+import time
+
+from cassiopeia.core import Match, Summoner
+from cassiopeia.core.match import MatchData
+from cassiopeia.datastores import Cache
+from cassiopeia.datastores.cache import _BoundedCache, _approximate_size
+
+import pytest
+
+
+def test_max_entries_evicts_least_recently_used():
+    cache = _BoundedCache(max_entries={Match: 2})
+    cache.put(Match, 1, "one")
+    cache.put(Match, 2, "two")
+    cache.get(Match, 1)
+    cache.put(Match, 3, "three")
+    cache.put(Summoner, 1, "summoner")
+
+    assert cache.get(Match, 1) == "one"
+    assert cache.get(Match, 3) == "three"
+    with pytest.raises(KeyError):
+        cache.get(Match, 2)
+    assert cache.get(Summoner, 1) == "summoner"
+
+    usage = cache.usage()
+    assert usage[Match]["entries"] == 2
+    assert usage[Match]["evictions"] == 1
+    assert usage[Match]["hits"] == 3
+    assert usage[Match]["misses"] == 1
+    assert "bytes" not in usage[Match]
+
+
+def test_max_bytes_evicts_across_types():
+    value = "x" * 1000
+    cache = _BoundedCache(max_bytes=2500)
+    cache.put(Match, 1, value + "1")
+    cache.put(Summoner, 1, value + "2")
+    cache.get(Match, 1)
+    cache.put(Summoner, 2, value + "3")
+
+    assert cache.get(Match, 1)
+    with pytest.raises(KeyError):
+        cache.get(Summoner, 1)
+    usage = cache.usage()
+    assert 2000 < usage[Match]["bytes"] + usage[Summoner]["bytes"] <= 2500
+
+
+def test_value_under_several_keys_is_counted_once():
+    value = ["x" * 1000]
+    cache = _BoundedCache(max_bytes=10000)
+    cache.put(Summoner, "id", value)
+    cache.put(Summoner, "puuid", value)
+    bytes = cache.usage()[Summoner]["bytes"]
+    assert 1000 < bytes < 2000
+
+    cache.clear(Summoner)
+    assert cache.usage()[Summoner] == {
+        "entries": 0,
+        "bytes": 0,
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "expirations": 0,
+    }
+
+
+def test_max_entries_counts_values_not_keys():
+    cache = _BoundedCache(max_entries={Summoner: 2})
+    one, two, three = ["one"], ["two"], ["three"]
+    for value in (one, two):
+        cache.put(Summoner, ("id", value[0]), value)
+        cache.put(Summoner, ("puuid", value[0]), value)
+    assert cache.usage()[Summoner]["entries"] == 2
+
+    # Using a value by one key keeps it under all of them
+    cache.get(Summoner, ("id", "one"))
+    cache.put(Summoner, ("id", "three"), three)
+
+    assert cache.get(Summoner, ("puuid", "one")) is one
+    for key in (("id", "two"), ("puuid", "two")):
+        with pytest.raises(KeyError):
+            cache.get(Summoner, key)
+    usage = cache.usage()[Summoner]
+    assert usage["entries"] == 2
+    assert usage["evictions"] == 1
+
+
+def test_max_bytes_evicts_every_key_of_a_value():
+    cache = _BoundedCache(max_bytes=2500)
+    old, new = ["x" * 1000], ["y" * 2000]
+    cache.put(Summoner, "id", old)
+    cache.put(Summoner, "puuid", old)
+    cache.put(Summoner, "other", new)
+
+    for key in ("id", "puuid"):
+        with pytest.raises(KeyError):
+            cache.get(Summoner, key)
+    assert cache.get(Summoner, "other") is new
+
+
+def test_timeouts_still_apply():
+    cache = _BoundedCache(max_entries={Match: 10})
+    cache.put(Match, 1, "one", timeout=0.01)
+    cache.put(Match, 2, "two", timeout=0)
+    cache.put(Match, 3, "three")
+    time.sleep(0.02)
+
+    with pytest.raises(KeyError):
+        cache.get(Match, 1)
+    with pytest.raises(KeyError):
+        cache.get(Match, 2)
+    cache.put(Match, 4, "four", timeout=0.01)
+    time.sleep(0.02)
+    cache.expire()
+    assert cache.usage()[Match]["entries"] == 1
+    assert cache.usage()[Match]["expirations"] == 2
+
+
+def test_cache_accepts_type_names():
+    cache = Cache(max_entries={"Match": 10}, max_bytes=1000)
+    assert cache._cache._max_entries == {Match: 10}
+    assert cache._cache._max_bytes == 1000
+    assert cache.usage() == {}
+
+
+def _match(id):
+    match = Match._construct_normally(id=id, platform="NA1")
+    match._data[MatchData] = MatchData(
+        gameId=id, platformId="NA1", gameMode="CLASSIC", participants=[], teams=[]
+    )
+    match._data[MatchData].name = "x" * 5000
+    return match
+
+
+def test_core_objects_are_measured():
+    # Core objects and their data define __call__, which mustn't stop them from being measured
+    match = _match(1)
+    assert _approximate_size(match._data[MatchData]) > 5000
+    assert _approximate_size(match) > 5000
+
+    cache = Cache(max_bytes=8000)
+    cache.put(Match, match)
+    assert cache.usage()[Match]["bytes"] > 5000
+    cache.put(Match, _match(2))
+    usage = cache.usage()[Match]
+    assert usage["evictions"] >= 1 and usage["bytes"] <= 8000
+    with pytest.raises(KeyError):
+        cache._cache.get(Match, ("NA1", 1))
+    assert cache._cache.get(Match, ("NA1", 2)).id == 2
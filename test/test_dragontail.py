@@ -0,0 +1,116 @@
+import json
+import os
+import tarfile
+
+import pytest
+from datapipelines import NotFoundError
+from PIL import Image as ImageLoader
+from PIL.Image import Image
+
+from cassiopeia import Champions, Items, Runes, configuration, get_locales
+from cassiopeia._configuration.settings import create_pipeline
+from cassiopeia.datastores import common, dragontail
+from cassiopeia.dto.staticdata import ChampionListDto
+
+from benchmarks import fixtures
+
+_FILES = {
+    "championFull.json": fixtures.champions,
+    "item.json": fixtures.items,
+    "runesReforged.json": fixtures.runes,
+    "summoner.json": fixtures.summoner_spells,
+    "map.json": fixtures.maps,
+    "profileicon.json": fixtures.profile_icons,
+}
+
+
+def _write(root, name, body):
+    path = os.path.join(root, *name.split("/"))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(body if isinstance(body, bytes) else json.dumps(body).encode())
+
+
+@pytest.fixture
+def directory(tmp_path):
+    root = str(tmp_path / "dragontail")
+    for version in ("13.24.1", "14.1.1"):
+        for name, body in _FILES.items():
+            _write(root, "{}/data/en_US/{}".format(version, name), body())
+    _write(root, "languages.json", ["en_US", "ko_KR"])
+    _write(root, "perks.json", fixtures.perks())
+    os.makedirs(os.path.join(root, "14.1.1", "img", "champion"))
+    ImageLoader.new("RGB", (4, 4)).save(
+        os.path.join(root, "14.1.1", "img", "champion", "Annie.png")
+    )
+    return root
+
+
+@pytest.fixture
+def archive(directory, tmp_path):
+    path = str(tmp_path / "dragontail-14.1.1.tgz")
+    with tarfile.open(path, "w:gz") as tar:
+        for name in os.listdir(directory):
+            tar.add(os.path.join(directory, name), arcname="./" + name)
+    return path
+
+
+@pytest.fixture
+def use_pipeline(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("No requests should be made")
+
+    monkeypatch.setattr(common.HTTPClient, "get", fail)
+
+    def use(path):
+        pipeline = create_pipeline({"Cache": {}, "Dragontail": {"path": path}})
+        monkeypatch.setattr(configuration.settings, "_Settings__pipeline", pipeline)
+        return pipeline
+
+    return use
+
+
+@pytest.mark.parametrize("bundle", ["directory", "archive"])
+def test_static_data(bundle, request, use_pipeline):
+    use_pipeline(request.getfixturevalue(bundle))
+    # The latest version in the dragontail is the latest version
+    champions = Champions(region="NA")
+    assert champions.version == "14.1.1"
+    annie = champions[0]
+    assert annie.name == "Annie" and annie.id == 1
+    assert isinstance(annie.image.image, Image)
+    assert Items(region="NA", version="13.24.1")[0].name == "Boots"
+    assert [rune.name for rune in Runes(region="KR", locale="en_US")] == [
+        "Electrocute",
+        "Adaptive Force",
+    ]
+    assert list(get_locales(region="NA")) == ["en_US", "ko_KR"]
+
+
+def test_missing_files(directory, use_pipeline):
+    pipeline = use_pipeline(directory)
+    with pytest.raises(NotFoundError):
+        pipeline.get(
+            ChampionListDto,
+            {"region": "NA", "version": "14.1.1", "locale": "ko_KR"},
+        )
+    source = dragontail._DragontailDDragon(dragontail._Bundles([directory]))
+    with pytest.raises(NotFoundError):
+        source._get_json("https://ddragon.leagueoflegends.com/cdn/../../secret.json")
+    with pytest.raises(NotFoundError):
+        source._get_json("https://example.com/perks.json")
+
+
+def test_large_files_are_memory_mapped(directory, monkeypatch):
+    monkeypatch.setattr(dragontail, "_MMAP_SIZE", 0)
+    bundle = dragontail._Directory(directory)
+    assert bundle.load_json("14.1.1/data/en_US/item.json") == fixtures.items()
+    assert sorted(bundle.versions()) == ["13.24.1", "14.1.1"]
+
+
+def test_several_bundles(directory, archive, tmp_path):
+    newer = str(tmp_path / "newer")
+    _write(newer, "14.2.1/data/en_US/item.json", fixtures.items())
+    bundles = dragontail._Bundles([newer, archive])
+    assert bundles.versions == ["14.2.1", "14.1.1", "13.24.1"]
+    assert bundles.load_json("languages.json") == ["en_US", "ko_KR"]
@@ -0,0 +1,70 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cassiopeia.datastores import common
+from cassiopeia.datastores.common import HTTPClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep connections alive
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json;charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.connections = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    print_calls = common._print_calls
+    common._print_calls = False
+    yield
+    common._print_calls = print_calls
+
+
+def _get(client, server, n):
+    url = "http://127.0.0.1:{}/lol/{}".format(server.server_address[1], n)
+    body, _ = client.get(url)
+    if isinstance(body, str):
+        body = json.loads(body)
+    return body["path"]
+
+
+def test_pooled_client_reuses_connections(server):
+    client = HTTPClient(pool_size=2)
+    assert [_get(client, server, n) for n in range(5)] == [
+        "/lol/{}".format(n) for n in range(5)
+    ]
+    client.close()
+    assert server.connections == 1
+
+
+def test_unpooled_client_opens_a_connection_per_request(server):
+    client = HTTPClient()
+    for n in range(3):
+        _get(client, server, n)
+    assert server.connections == 3
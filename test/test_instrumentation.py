@@ -0,0 +1,219 @@
+import itertools
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import cassiopeia
+from cassiopeia import configuration
+from cassiopeia.data import Platform, Continent
+from cassiopeia.datastores import Cache, common
+from cassiopeia.datastores import instrumentation
+from cassiopeia.datastores.common import HTTPClient
+from cassiopeia.datastores.instrumentation import (
+    Instrumentation,
+    PrometheusInstrumentation,
+    create_instrumentation,
+)
+from cassiopeia.datastores.riotapi.common import RiotAPIRateLimiter
+from cassiopeia.datastores.riotapi.match import MatchAPI
+from cassiopeia.dto.match import MatchDto
+from cassiopeia.core.summoner import Summoner
+
+from datapipelines import NotFoundError
+
+
+class Recorder(Instrumentation):
+    def __init__(self):
+        self.calls = []
+
+    def __getattribute__(self, name):
+        if name in Instrumentation.__dict__ and not name.startswith("_"):
+            return lambda *args: self.calls.append((name,) + args)
+        return super().__getattribute__(name)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.count += 1
+        if self.server.count == 1:
+            body = b'{"status": {"message": "Rate limit exceeded", "status_code": 429}}'
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("X-Rate-Limit-Type", "method")
+        else:
+            match_id = int(self.path.rsplit("_", 1)[1])
+            body = json.dumps(
+                {"metadata": {}, "info": {"gameId": match_id, "participants": []}}
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("X-App-Rate-Limit", "100:1")
+            self.send_header("X-Method-Rate-Limit", "100:1")
+        self.send_header("Content-Type", "application/json;charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _LocalHTTPClient(HTTPClient):
+    def __init__(self, server_url):
+        super().__init__()
+        self._server_url = server_url
+
+    def get(self, url, *args, **kwargs):
+        return super().get(
+            re.sub(r"^https://[^/]+", self._server_url, url), *args, **kwargs
+        )
+
+
+@pytest.fixture
+def recorder():
+    instrument = Recorder()
+    instrumentation.set_instrumentation(instrument)
+    common._print_calls, print_calls = False, common._print_calls
+    yield instrument
+    common._print_calls = print_calls
+    instrumentation.set_instrumentation(None)
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.count = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_riot_api_requests_are_instrumented(recorder, server):
+    app_rate_limiter = {
+        platform: RiotAPIRateLimiter(
+            limiting_share=1.0, key="{}:application".format(platform.value)
+        )
+        for platform in itertools.chain(Platform, Continent)
+    }
+    client = _LocalHTTPClient("http://127.0.0.1:{}".format(server.server_address[1]))
+    api = MatchAPI("RGAPI-test", app_rate_limiter=app_rate_limiter, http_client=client)
+    match = api.get(MatchDto, {"platform": "NA1", "id": 1234})
+    assert match["gameId"] == 1234
+
+    names = [call[0] for call in recorder.calls]
+    assert names.count("http_request") == 2
+    assert names.count("rate_limiter_wait") == 4
+    assert ("rate_limited", "method", "matches/id") in recorder.calls
+    assert ("retry", 429, "retry_from_headers", 0) in recorder.calls
+
+    http_requests = [call for call in recorder.calls if call[0] == "http_request"]
+    assert [call[2] for call in http_requests] == [429, 200]
+    assert all(
+        call[1].startswith("127.0.0.1:") and call[4] > 0 for call in http_requests
+    )
+    (api_request,) = [call for call in recorder.calls if call[0] == "api_request"]
+    assert api_request[1:4] == ("matches/id", "AMERICAS", 200)
+    assert {call[1] for call in recorder.calls if call[0] == "rate_limiter_wait"} == {
+        "AMERICAS:application",
+        "AMERICAS:matches/id",
+    }
+
+
+def test_cache_lookups_are_instrumented(recorder):
+    cache = Cache()
+    with pytest.raises(NotFoundError):
+        cache.get(Summoner, {"platform": "NA1", "puuid": "a"})
+    assert recorder.calls == [("cache_lookup", "Summoner", False)]
+
+
+def test_nothing_is_measured_when_off(server):
+    client = _LocalHTTPClient("http://127.0.0.1:{}".format(server.server_address[1]))
+    assert instrumentation.current is None
+    with pytest.raises(common.HTTPError):
+        client.get("https://na1.api.riotgames.com/lol/match/v5/matches/NA1_1")
+
+
+def test_prometheus_text():
+    prometheus = create_instrumentation({"type": "prometheus", "buckets": (0.1, 1.0)})
+    prometheus.http_request("na1.api.riotgames.com", 200, 0.05, 100)
+    prometheus.http_request("na1.api.riotgames.com", 200, 0.5, 50)
+    prometheus.http_request("na1.api.riotgames.com", 200, 5.0, 50)
+    prometheus.rate_limited("application", "matches/id")
+    prometheus.cache_lookup("MatchData", True)
+    prometheus.cache_lookup("MatchData", True)
+    text = prometheus.render()
+
+    lines = text.splitlines()
+    labels = 'host="na1.api.riotgames.com",status="200"'
+    assert "# TYPE cassiopeia_http_request_duration_seconds histogram" in lines
+    assert (
+        "cassiopeia_http_request_duration_seconds_bucket{" + labels + ',le="0.1"} 1'
+        in lines
+    )
+    assert (
+        "cassiopeia_http_request_duration_seconds_bucket{" + labels + ',le="1.0"} 2'
+        in lines
+    )
+    assert (
+        "cassiopeia_http_request_duration_seconds_bucket{" + labels + ',le="+Inf"} 3'
+        in lines
+    )
+    assert "cassiopeia_http_request_duration_seconds_count{" + labels + "} 3" in lines
+    assert (
+        'cassiopeia_http_response_bytes_total{host="na1.api.riotgames.com"} 200'
+        in lines
+    )
+    assert (
+        'cassiopeia_rate_limited_total{limit_type="application",endpoint="matches/id"} 1'
+        in lines
+    )
+    assert 'cassiopeia_cache_lookups_total{type="MatchData",result="hit"} 2' in lines
+
+
+def test_prometheus_server():
+    prometheus = PrometheusInstrumentation(port=0, address="127.0.0.1")
+    try:
+        prometheus.cache_lookup("MatchData", False)
+        common._print_calls, print_calls = False, common._print_calls
+        try:
+            body, _ = HTTPClient().get(
+                "http://127.0.0.1:{}/metrics".format(prometheus.port)
+            )
+        finally:
+            common._print_calls = print_calls
+        assert body == prometheus.render()
+    finally:
+        prometheus.close()
+
+
+def test_apply_settings_replaces_the_instrumentation():
+    old_settings = configuration.settings
+    config = {
+        "pipeline": {"Cache": {}},
+        "logging": {
+            "print_calls": False,
+            "instrumentation": {"type": "prometheus", "port": 0},
+        },
+    }
+    try:
+        cassiopeia.apply_settings(config)
+        first = instrumentation.current
+        assert isinstance(first, PrometheusInstrumentation) and first.port
+        cassiopeia.apply_settings(config)
+        second = instrumentation.current
+        assert second is not first and second.port
+        # The first server was shut down
+        assert first.port is None
+
+        del config["logging"]["instrumentation"]
+        cassiopeia.apply_settings(config)
+        assert instrumentation.current is None
+        assert second.port is None
+    finally:
+        instrumentation.set_instrumentation(None)
+        configuration._settings = old_settings
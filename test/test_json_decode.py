@@ -0,0 +1,98 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cassiopeia.data import Platform
+from cassiopeia.datastores import common
+from cassiopeia.datastores.common import HTTPClient, iter_json_object, loads
+from cassiopeia.datastores.riotapi.match import MatchAPI
+from cassiopeia.core.match import TimelineData
+from cassiopeia.transformers.match import MatchTransformer
+
+TIMELINE = {
+    "metadata": {"matchId": "NA1_1234", "participants": ["a", "b"]},
+    "info": {
+        "frameInterval": 60000,
+        "frames": [
+            {
+                "timestamp": minute * 60000,
+                "participantFrames": {
+                    "1": {"participantId": 1, "totalGold": 500 * minute},
+                    "2": {"participantId": 2, "totalGold": 400 * minute},
+                },
+                "events": [{"type": "SKILL_LEVEL_UP", "timestamp": minute * 60000 + 1}],
+            }
+            for minute in range(3)
+        ],
+        "gameId": 1234,
+        "participants": [{"participantId": 1, "puuid": "a"}],
+    },
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({"path": self.path, "name": "Lé"}).encode("utf-8")
+        self.send_response(200)
+        if self.path.startswith("/charset"):
+            self.send_header("Content-Type", "application/json;charset=utf-8")
+        else:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    common._print_calls, print_calls = False, common._print_calls
+    yield "http://127.0.0.1:{}".format(server.server_address[1])
+    common._print_calls = print_calls
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("path", ["/charset", "/plain"])
+def test_json_bodies_are_decoded_once(url, path):
+    body, _ = HTTPClient().get(url + path)
+    assert body == {"path": path, "name": "Lé"}
+    assert loads(body) is body
+
+    body, _ = HTTPClient().get(url + path, decode_json=False)
+    assert not isinstance(body, dict)
+    assert loads(body) == {"path": path, "name": "Lé"}
+
+
+def test_iter_json_object():
+    body = json.dumps(TIMELINE, indent=2).encode("utf-8")
+    info = {}
+    for key, value in iter_json_object(body, ["info"], streamed=["frames"]):
+        info[key] = [frame for frame in value] if key == "frames" else value
+    assert info == TIMELINE["info"]
+
+    # Arrays that aren't used up are skipped
+    keys = [key for key, _ in iter_json_object(body, ["info"], streamed=["frames"])]
+    assert keys == ["frameInterval", "frames", "gameId", "participants"]
+    assert dict(iter_json_object(body, ["metadata"])) == TIMELINE["metadata"]
+    with pytest.raises(KeyError):
+        list(iter_json_object(body, ["missing"]))
+
+
+def test_timeline_json_to_data():
+    body = json.dumps(TIMELINE).encode("utf-8")
+    streamed = MatchTransformer().timeline_json_to_data(body)
+
+    dto = MatchAPI._to_timeline_dto(json.loads(body), Platform.north_america, 1234)
+    expected = TimelineData(**dto)
+    assert streamed.to_dict() == expected.to_dict()
+    assert [sorted(frame.participantFrames) for frame in streamed.frames] == [
+        [1, 2]
+    ] * 3
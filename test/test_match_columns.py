@@ -0,0 +1,177 @@
+import pytest
+
+from cassiopeia import participant_columns, team_columns
+from cassiopeia.core.match import Match, MatchData
+from cassiopeia.dto.match import MatchDto
+from cassiopeia.transformers.match import MatchTransformer
+
+
+def _participant(id, team_id, kills, damage):
+    return {
+        "participantId": id,
+        "teamId": team_id,
+        "championId": 100 + id,
+        "summoner1Id": 4,
+        "kills": kills,
+        "deaths": 2,
+        "totalDamageDealtToChampions": damage,
+        "win": team_id == 100,
+        "challenges": {"kda": kills / 2},
+        "summonerLevel": 30,
+        "bot": False,
+        "perks": {
+            "statPerks": {"defense": 5002, "flex": 5008, "offense": 5005},
+            "styles": [
+                {
+                    "description": "primaryStyle",
+                    "selections": [{"perk": 8010, "var1": 1, "var2": 0, "var3": 0}],
+                    "style": 8000,
+                }
+            ],
+        },
+    }
+
+
+def _match(id, duration):
+    return MatchDto(
+        {
+            "platformId": "NA1",
+            "gameId": id,
+            "gameDuration": duration,
+            "queueId": 420,
+            "participants": [
+                _participant(1, 100, 3, 10000),
+                _participant(2, 200, 4, 12000),
+            ],
+            "teams": [
+                {
+                    "teamId": 100,
+                    "win": True,
+                    "bans": [],
+                    "objectives": {"baron": {"first": True, "kills": 1}},
+                },
+                {
+                    "teamId": 200,
+                    "win": False,
+                    "bans": [],
+                    "objectives": {"baron": {"first": False, "kills": 0}},
+                },
+            ],
+        }
+    )
+
+
+def _core_match(dto):
+    match = Match._construct_normally(id=dto["gameId"], platform="NA1")
+    match.__load_hook__(MatchData, MatchTransformer().match_dto_to_data(dto))
+    match._Ghost__set_loaded(MatchData)
+    return match
+
+
+FIELDS = [
+    "gameId",
+    "queueId",
+    "gameDuration",
+    "championId",
+    "summoner1Id",
+    "teamId",
+    "kills",
+    "win",
+    "totalDamageDealtToChampions",
+    "challenges.kda",
+    "missing",
+]
+
+EXPECTED = {
+    "gameId": [1, 1, 2, 2],
+    "queueId": [420] * 4,
+    "gameDuration": [1500, 1500, 2000, 2000],
+    "championId": [101, 102] * 2,
+    "summoner1Id": [4] * 4,
+    "teamId": [100, 200] * 2,
+    "kills": [3, 4] * 2,
+    "win": [True, False] * 2,
+    "totalDamageDealtToChampions": [10000, 12000] * 2,
+    "challenges.kda": [1.5, 2.0] * 2,
+    "missing": [None] * 4,
+}
+
+
+def test_participant_columns_from_dtos():
+    matches = [_match(1, 1500), _match(2, 2000)]
+    assert participant_columns(matches, FIELDS, format="python") == EXPECTED
+
+
+def test_participant_columns_from_riot_api_responses():
+    matches = [{"metadata": {}, "info": dict(_match(1, 1500))}]
+    columns = participant_columns(matches, ["gameId", "kills"], format="python")
+    assert columns == {"gameId": [1, 1], "kills": [3, 4]}
+
+
+def test_participant_columns_from_matches():
+    matches = [_core_match(_match(1, 1500)), _core_match(_match(2, 2000))]
+    assert participant_columns(matches, FIELDS, format="python") == EXPECTED
+
+
+def test_participant_columns_are_the_same_for_every_input():
+    fields = [
+        "teamId",
+        "bot",
+        "win",
+        "perks.statPerks",
+        "perks.statPerks.offense",
+        "side",
+        "stats",
+        "isBot",
+        "stat_perks",
+    ]
+    dto = _match(1, 1500)
+    columns = participant_columns([dto], fields, format="python")
+    assert columns["perks.statPerks.offense"] == [5005, 5005]
+    assert columns["isBot"] == [None, None]
+    for match in [{"metadata": {}, "info": dict(dto)}, _core_match(dto)]:
+        assert participant_columns([match], fields, format="python") == columns
+
+    for field in ["perks", "perks.styles", "summonerLevel"]:
+        for match in [dto, _core_match(dto)]:
+            with pytest.raises(ValueError):
+                participant_columns([match], [field], format="python")
+
+
+def test_team_columns():
+    fields = ["gameId", "teamId", "win", "objectives.baron.kills"]
+    expected = {
+        "gameId": [1, 1],
+        "teamId": [100, 200],
+        "win": [True, False],
+        "objectives.baron.kills": [1, 0],
+    }
+    dto = _match(1, 1500)
+    assert team_columns([dto], fields, format="python") == expected
+    assert team_columns([_core_match(dto)], fields, format="python") == expected
+
+
+def test_numpy_columns():
+    numpy = pytest.importorskip("numpy")
+    columns = participant_columns(
+        [_match(1, 1500), _match(2, 2000)],
+        ["kills", "win", "missing", "challenges.kda"],
+        format="numpy",
+    )
+    assert columns["kills"].dtype.kind == "i"
+    assert columns["win"].dtype == bool
+    assert columns["win"].mean() == 0.5
+    assert numpy.isnan(columns["missing"]).all()
+    assert columns["challenges.kda"].sum() == 7.0
+
+
+def test_arrow_table():
+    pytest.importorskip("pyarrow")
+    table = participant_columns([_match(1, 1500)], ["kills", "win"], format="arrow")
+    assert table.column_names == ["kills", "win"]
+    assert table.column("kills").to_pylist() == [3, 4]
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        participant_columns([_match(1, 1500)], ["kills"], format="csv")
@@ -0,0 +1,134 @@
+import copy
+import pickle
+import tracemalloc
+
+import pytest
+
+from cassiopeia import configuration
+from cassiopeia.core.match import (
+    Timeline,
+    TimelineData,
+    MatchData,
+    _CompactEventData,
+    _shapes,
+)
+from cassiopeia.datastores.cache import _approximate_size
+
+from .test_match_lazy import _match
+from .test_timeline_index import TIMELINE
+
+
+@pytest.fixture
+def compact(monkeypatch):
+    monkeypatch.setattr(configuration.settings, "_Settings__compact_match_data", True)
+
+
+def _event(minute, i):
+    # Different event types have different fields, like the real timelines
+    event = {"type": "ITEM_PURCHASED", "timestamp": minute * 60000 + i}
+    if i % 3 == 0:
+        event.update(participantId=i % 10 + 1, itemId=1000 + minute * 40 + i)
+    elif i % 3 == 1:
+        event.update(
+            type="CHAMPION_KILL",
+            killerId=i % 10 + 1,
+            victimId=(i + 1) % 10 + 1,
+            assistingParticipantIds=[],
+            position={"x": 1000 + minute * 40 + i, "y": 2000 + i},
+            bounty=300,
+        )
+    else:
+        event.update(type="WARD_PLACED", creatorId=i % 10 + 1, wardType="SIGHT_WARD")
+    return event
+
+
+def _timeline():
+    frames = [
+        {
+            "timestamp": minute * 60000,
+            "participantFrames": {
+                str(id): {
+                    "participantId": id,
+                    "totalGold": 500 * minute + id,
+                    "level": minute // 2 + 1,
+                    "xp": 1000 * minute + id,
+                    "position": {"x": 1000 + id, "y": 2000 + minute},
+                }
+                for id in range(1, 11)
+            },
+            "events": [_event(minute, i) for i in range(30)],
+        }
+        for minute in range(30)
+    ]
+    return {"frames": frames, "frameInterval": 60000}
+
+
+def test_compact_data_has_no_dict(compact):
+    data = TimelineData(**copy.deepcopy(TIMELINE))
+    event = data.frames[1].events[0]
+    assert event.killerId == 1
+    assert event.position.x == 1
+    assert hasattr(event, "victimId") and not hasattr(event, "creatorId")
+    assert not hasattr(event, "__dict__")
+    # Events with the same attributes share their names
+    assert data.frames[2].events[1]._keys is event._keys
+
+    event.killerId = 3
+    event.bounty = 300
+    assert (event.killerId, event.bounty) == (3, 300)
+
+
+def test_compact_data_behaves_the_same(monkeypatch):
+    expected = TimelineData(**copy.deepcopy(TIMELINE))
+    monkeypatch.setattr(configuration.settings, "_Settings__compact_match_data", True)
+    data = TimelineData(**copy.deepcopy(TIMELINE))
+
+    assert data.to_dict() == expected.to_dict()
+    assert pickle.loads(pickle.dumps(data)).to_dict() == expected.to_dict()
+    index = Timeline.from_data(data).index
+    assert [event.timestamp for event in index.events(participant_id=1)] == [
+        event.timestamp
+        for event in Timeline.from_data(expected).index.events(participant_id=1)
+    ]
+
+
+def test_compact_match(compact):
+    match = _match()
+    assert match.duration.seconds == 1800
+    assert [p.stats.kills for p in match.participants] == [3, 5]
+    assert match._data[MatchData].to_dict()["id"] == 1234
+
+
+def test_compact_data_is_smaller(monkeypatch):
+    sizes = []
+    for compact in (False, True):
+        monkeypatch.setattr(
+            configuration.settings, "_Settings__compact_match_data", compact
+        )
+        raw = [_timeline() for _ in range(5)]
+        tracemalloc.start()
+        timelines = [TimelineData(**timeline) for timeline in raw]
+        del raw
+        sizes.append(tracemalloc.get_traced_memory()[0])
+        tracemalloc.stop()
+        assert _approximate_size(timelines[0]) > 0
+        del timelines
+    assert sizes[1] < 0.95 * sizes[0]
+
+
+def test_copies_share_shapes(compact):
+    def event(**fields):
+        return _CompactEventData(**fields)
+
+    first = pickle.loads(pickle.dumps(event(type="A", timestamp=1, x=2)))
+    assert first._keys is _shapes[("type", "timestamp", "x")]
+    first.killerId = 3
+    del first
+    # A copy that's freed can't leave a shape behind for an unrelated object that reuses its id
+    for _ in range(100):
+        second = pickle.loads(pickle.dumps(event(type="B", timestamp=4)))
+        second.killerId = 9
+        assert (second.type, second.timestamp, second.killerId) == ("B", 4, 9)
+    third = copy.deepcopy(event(type="C", timestamp=5, x=6))
+    third.killerId = 7
+    assert third.to_dict() == {"type": "C", "timestamp": 5, "x": 6, "killerId": 7}
@@ -0,0 +1,96 @@
+import itertools
+import json
+import threading
+import time
+
+from cassiopeia.data import Platform, Continent
+from cassiopeia.dto.match import MatchDto
+from cassiopeia.datastores.riotapi.common import RiotAPIRateLimiter
+from cassiopeia.datastores.riotapi.match import MatchAPI
+
+
+class StubHTTPClient(object):
+    """Serves canned match-v5 responses, taking longer for lower match ids."""
+
+    def __init__(self):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        # Requests for these match ids wait for the event to be set before they're answered
+        self.held = {}
+
+    def get(
+        self,
+        url,
+        parameters=None,
+        headers=None,
+        rate_limiters=None,
+        connection=None,
+        encode_parameters=True,
+    ):
+        match_id = int(url.rsplit("_", 1)[1])
+        with self._lock:
+            self.calls.append(match_id)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        if match_id in self.held:
+            self.held[match_id].wait(5)
+        time.sleep(0.05 / match_id)
+        with self._lock:
+            self.in_flight -= 1
+        body = {"metadata": {}, "info": {"gameId": match_id, "participants": []}}
+        response_headers = {
+            "X-App-Rate-Limit": "1000:1",
+            "X-Method-Rate-Limit": "1000:1",
+        }
+        return json.dumps(body), response_headers
+
+
+def _match_api(client):
+    app_rate_limiter = {
+        platform: RiotAPIRateLimiter(limiting_share=1.0)
+        for platform in itertools.chain(Platform, Continent)
+    }
+    return MatchAPI("RGAPI-test", app_rate_limiter=app_rate_limiter, http_client=client)
+
+
+def test_get_many_match_sequential_by_default():
+    client = StubHTTPClient()
+    api = _match_api(client)
+    matches = list(api.get_many(MatchDto, {"platform": "NA1", "ids": [1, 2, 3]}))
+
+    assert [match["matchId"] for match in matches] == [1, 2, 3]
+    assert client.max_in_flight == 1
+
+
+def test_get_many_match_concurrent_keeps_order():
+    client = StubHTTPClient()
+    api = _match_api(client)
+    ids = list(range(1, 13))
+    matches = list(
+        api.get_many(MatchDto, {"platform": "NA1", "ids": ids, "concurrency": 4})
+    )
+
+    assert [match["matchId"] for match in matches] == ids
+    assert 1 < client.max_in_flight <= 4
+
+
+def test_get_many_match_concurrent_as_completed():
+    client = StubHTTPClient()
+    release = threading.Event()
+    client.held[2] = release
+    api = _match_api(client)
+    ids = list(range(1, 9))
+    matches = api.get_many(
+        MatchDto,
+        {"platform": "NA1", "ids": ids, "concurrency": 4, "ordered": False},
+    )
+
+    # The first match is fetched on its own, then 2 is held back while the rest finish
+    first = [next(matches)["matchId"] for _ in range(4)]
+    assert first[0] == 1 and 2 not in first
+    release.set()
+    rest = [match["matchId"] for match in matches]
+    assert set(first + rest) == set(ids) and len(first + rest) == len(ids)
+    assert client.max_in_flight <= 4
@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+import cassiopeia
+from cassiopeia import configuration
+from cassiopeia.core.match import MatchData, TimelineData
+from cassiopeia.data import Continent
+from cassiopeia.datastores import common
+
+from benchmarks import fixtures
+from benchmarks.stubserver import StubHTTPClient, StubServer
+
+
+@pytest.fixture
+def server():
+    common._print_calls, print_calls = False, common._print_calls
+    old_settings = configuration.settings
+    with StubServer() as server:
+        client = StubHTTPClient(server.url)
+        cassiopeia.apply_settings(
+            {
+                "global": {"default_region": "NA"},
+                "pipeline": {
+                    "Cache": {},
+                    "RiotAPI": {"api_key": "RGAPI-test", "http_client": client},
+                },
+                "logging": {"print_calls": False},
+            }
+        )
+        try:
+            yield server
+        finally:
+            configuration._settings = old_settings
+    common._print_calls = print_calls
+
+
+def _requests(server, suffix):
+    return len([path for _, path in server.requests if path.endswith(suffix)])
+
+
+def test_prefetch_loads_matches_ahead(server):
+    history = cassiopeia.get_match_history(
+        continent=Continent.americas,
+        puuid=fixtures.PUUID,
+        count=5,
+        prefetch=3,
+        prefetch_concurrency=2,
+        prefetch_timelines=True,
+    )
+    matches = list(history)
+    assert len(matches) == 5
+    for match in matches:
+        assert match._Ghost__is_loaded(MatchData)
+        assert match.timeline._Ghost__is_loaded(TimelineData)
+    assert _requests(server, "/ids") == 1
+
+
+def test_prefetch_requests_the_next_page(server):
+    # The stub server returns the same 100 ids for every page, so the second page's matches are already cached
+    history = cassiopeia.get_match_history(
+        continent=Continent.americas, puuid=fixtures.PUUID, count=150, prefetch=2
+    )
+    iterator = iter(history)
+    next(iterator)
+    deadline = time.monotonic() + 5
+    while _requests(server, "/ids") < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _requests(server, "/ids") == 2
+    assert len(list(iterator)) == 149
+    assert _requests(server, "/ids") == 2
+    assert _requests(server, "/timeline") == 0
+
+
+def test_no_prefetch_by_default(server):
+    history = cassiopeia.get_match_history(
+        continent=Continent.americas, puuid=fixtures.PUUID, count=3
+    )
+    matches = list(history)
+    assert len(matches) == 3
+    assert not any(match._Ghost__is_loaded(MatchData) for match in matches)
@@ -0,0 +1,99 @@
+import copy
+
+import pytest
+
+from cassiopeia import configuration
+from cassiopeia.core.match import Match, MatchData, ParticipantData
+from cassiopeia.data import Side
+from cassiopeia.transformers.match import MatchTransformer
+from cassiopeia.dto.match import MatchDto
+
+
+def _participant(id, team_id, kills):
+    return {
+        "participantId": id,
+        "teamId": team_id,
+        "puuid": "puuid-{}".format(id),
+        "championId": 1,
+        "individualPosition": "TOP",
+        "teamPosition": "TOP",
+        "kills": kills,
+        "deaths": 1,
+        "assists": 2,
+        "win": team_id == 100,
+        "perks": {
+            "statPerks": {"defense": 5002, "flex": 5008, "offense": 5005},
+            "styles": [
+                {"selections": [{"perk": 8005, "var1": 1, "var2": 2, "var3": 3}]}
+            ],
+        },
+    }
+
+
+MATCH = {
+    "platformId": "NA1",
+    "gameId": 1234,
+    "gameCreation": 1700000000000,
+    "gameDuration": 1800,
+    "queueId": 420,
+    "gameVersion": "13.22.1.1",
+    "participants": [_participant(1, 100, 3), _participant(2, 200, 5)],
+    "teams": [
+        {"teamId": 100, "win": True, "bans": [], "objectives": {}},
+        {"teamId": 200, "win": False, "bans": [], "objectives": {}},
+    ],
+}
+
+
+@pytest.fixture(params=[False, True])
+def lazy(request, monkeypatch):
+    monkeypatch.setattr(
+        configuration.settings, "_Settings__lazy_match_data", request.param
+    )
+    return request.param
+
+
+def _match():
+    dto = MatchDto(copy.deepcopy(MATCH))
+    match = Match._construct_normally(id=1234, platform="NA1")
+    match.__load_hook__(MatchData, MatchTransformer().match_dto_to_data(dto))
+    match._Ghost__set_loaded(MatchData)
+    return match
+
+
+def test_match_api_is_unchanged(lazy):
+    match = _match()
+    assert match.duration.seconds == 1800
+    assert [p.id for p in match.participants] == [1, 2]
+    assert [p.side for p in match.participants] == [Side.blue, Side.red]
+    assert [p.stats.kills for p in match.participants] == [3, 5]
+    assert match.participants[0].stats.kda == 5
+    assert match.participants[0]._data[ParticipantData].perks == {8005: [1, 2, 3]}
+    assert match.blue_team.win and not match.red_team.win
+    assert [p.id for p in match.red_team.participants] == [2]
+
+
+def test_participants_are_constructed_on_first_access(lazy):
+    data = _match()._data[MatchData]
+    participants = data.__dict__["participants"]
+    assert all(("_pending" in p.__dict__) is lazy for p in participants)
+
+    assert participants[0].participantId == 1
+    assert "_pending" not in participants[0].__dict__
+    assert ("_pending" in participants[1].__dict__) is lazy
+    assert ("_pending" in participants[0].__dict__["stats"].__dict__) is lazy
+
+
+def test_to_dict(lazy):
+    d = _match()._data[MatchData].to_dict()
+    assert d["participants"][1]["stats"]["kills"] == 5
+    assert "_pending" not in d["participants"][1]
+
+
+def test_dto_is_not_modified(lazy):
+    dto = MatchDto(copy.deepcopy(MATCH))
+    for _ in range(2):
+        data = MatchTransformer().match_dto_to_data(dto)
+        assert data.participants[0].stat_perks["flex"] == 5008
+        assert data.participants[0].perks == {8005: [1, 2, 3]}
+    assert dto == MATCH
@@ -0,0 +1,117 @@
+import pytest
+
+from cassiopeia import configuration
+from cassiopeia._configuration.settings import create_pipeline
+from cassiopeia.core import match as core_match
+from cassiopeia.core.match import (
+    Match,
+    MatchData,
+    StaticDataIndex,
+    resolve_static_data,
+)
+from cassiopeia.core.staticdata import Champion, Item, Rune, SummonerSpell
+from cassiopeia.data import Region
+from cassiopeia.dto.match import MatchDto
+from cassiopeia.transformers.match import MatchTransformer
+
+
+def _participant(id, team_id):
+    return {
+        "participantId": id,
+        "teamId": team_id,
+        "puuid": "puuid-{}".format(id),
+        "championId": 1,
+        "summoner1Id": 4,
+        "summoner2Id": 14,
+        "item0": 1055,
+        "item1": 0,
+        "item6": 3340,
+        "perks": {
+            "statPerks": {"defense": 5002, "flex": 5008, "offense": 5005},
+            "styles": [
+                {"selections": [{"perk": 8005, "var1": 1, "var2": 2, "var3": 3}]}
+            ],
+        },
+    }
+
+
+def _match(id):
+    dto = MatchDto(
+        {
+            "platformId": "NA1",
+            "gameId": id,
+            "gameCreation": 1700000000000,
+            "gameDuration": 1800,
+            "queueId": 420,
+            "participants": [_participant(1, 100), _participant(2, 200)],
+            "teams": [
+                {"teamId": 100, "win": True, "bans": [{"championId": 1}]},
+                {"teamId": 200, "win": False, "bans": [{"championId": -1}]},
+            ],
+        }
+    )
+    match = Match._construct_normally(id=id, platform="NA1")
+    match.__load_hook__(MatchData, MatchTransformer().match_dto_to_data(dto))
+    match._Ghost__set_loaded(MatchData)
+    return match
+
+
+@pytest.fixture(autouse=True)
+def latest_version(monkeypatch):
+    monkeypatch.setattr(
+        configuration.settings, "_Settings__version_from_match", "latest"
+    )
+    calls = []
+
+    def get_latest_version(region, endpoint):
+        calls.append(region)
+        return "14.1.1"
+
+    monkeypatch.setattr(core_match, "get_latest_version", get_latest_version)
+    monkeypatch.setattr(core_match, "_static_data_indexes", {})
+    return calls
+
+
+def test_participants_share_static_data(latest_version):
+    first, second = _match(1), _match(2)
+    a, b = first.participants[0], second.participants[1]
+
+    assert a.champion is b.champion
+    assert isinstance(a.champion, Champion)
+    assert (a.champion.id, a.champion.version) == (1, "14.1.1")
+    assert a.champion.region is Region.north_america
+    assert a.summoner_spell_d is b.summoner_spell_d
+    assert isinstance(a.summoner_spell_f, SummonerSpell)
+    assert a.stat_runes[1] is b.stat_runes[1]
+    assert isinstance(a.stat_runes[1], Rune)
+
+    items = a.stats.items
+    assert items[1] is None
+    assert items[0] is b.stats.items[0]
+    assert isinstance(items[0], Item) and items[0].id == 1055
+    assert first.blue_team.bans[0] is a.champion
+    assert first.red_team.bans == [None]
+    # The version is looked up once per match, not once per object
+    assert len(latest_version) == 2
+
+
+def test_resolve_static_data():
+    matches = [_match(1), _match(2)]
+    indexes = resolve_static_data(matches)
+
+    assert len(indexes) == 1
+    index = indexes[0]
+    assert index is StaticDataIndex.for_version("NA", "14.1.1")
+    assert sorted(index._objects[Item]) == [1055, 3340]
+    assert sorted(index._objects[Rune]) == [5002, 5005, 5008, 8005]
+    assert sorted(index._objects[SummonerSpell]) == [4, 14]
+    assert matches[1].participants[0].stats.items[6] is index.get(Item, 3340)
+
+
+def test_clearing_the_sinks_drops_the_indexes(monkeypatch):
+    monkeypatch.setattr(
+        configuration.settings, "_Settings__pipeline", create_pipeline({"Cache": {}})
+    )
+    index = StaticDataIndex.for_version("NA", "14.1.1")
+    configuration.settings.clear_sinks()
+    assert StaticDataIndex.for_version("NA", "14.1.1") is not index
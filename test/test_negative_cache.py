@@ -0,0 +1,127 @@
+import time
+
+import pytest
+from datapipelines import NotFoundError
+
+from cassiopeia._configuration.settings import create_pipeline
+from cassiopeia.core.match import Match, MatchData
+from cassiopeia.core.spectator import CurrentGameInfoData, CurrentMatch
+from cassiopeia.data import Platform
+from cassiopeia.datastores import Cache, SQLiteStore, common
+from cassiopeia.dto.match import MatchDto
+
+from benchmarks.stubserver import StubHTTPClient, StubServer
+
+# The stub server doesn't know the spectator endpoint, so it always answers 404
+_QUERY = {"platform": Platform.north_america, "summoner.puuid": "nobody"}
+
+
+@pytest.fixture
+def server():
+    common._print_calls, print_calls = False, common._print_calls
+    with StubServer() as server:
+        yield server
+    common._print_calls = print_calls
+
+
+def _pipeline(server, cache_config):
+    client = StubHTTPClient(server.url)
+    return create_pipeline(
+        {
+            "Cache": cache_config,
+            "RiotAPI": {"api_key": "RGAPI-test", "http_client": client},
+        }
+    )
+
+
+def _spectator_requests(server):
+    return len([path for _, path in server.requests if "/spectator/" in path])
+
+
+def test_not_found_is_cached(server):
+    pipeline = _pipeline(server, {})
+    cache = pipeline._cache
+    for _ in range(3):
+        with pytest.raises(NotFoundError):
+            pipeline.get(CurrentGameInfoData, dict(_QUERY))
+    assert _spectator_requests(server) == 1
+
+    # Clearing the type (as Settings.clear_sinks does) clears what wasn't found too
+    cache.clear(CurrentMatch)
+    with pytest.raises(NotFoundError):
+        pipeline.get(CurrentGameInfoData, dict(_QUERY))
+    assert _spectator_requests(server) == 2
+
+
+def test_not_found_expires(server):
+    pipeline = _pipeline(server, {"not_found_expirations": {"CurrentMatch": 0.05}})
+    cache = pipeline._cache
+    with pytest.raises(NotFoundError):
+        pipeline.get(CurrentGameInfoData, dict(_QUERY))
+    assert cache.is_not_found(CurrentGameInfoData, _QUERY)
+    time.sleep(0.1)
+    assert not cache.is_not_found(CurrentGameInfoData, _QUERY)
+    with pytest.raises(NotFoundError):
+        pipeline.get(CurrentGameInfoData, dict(_QUERY))
+    assert _spectator_requests(server) == 2
+
+
+def test_only_configured_types_are_cached():
+    cache = Cache(not_found_expirations={})
+    cache.put_not_found(CurrentGameInfoData, _QUERY)
+    assert not cache.is_not_found(CurrentGameInfoData, _QUERY)
+    # Core objects aren't recorded, because unloaded ones are always "found"
+    cache = Cache()
+    cache.put_not_found(CurrentMatch, _QUERY)
+    assert not cache.is_not_found(CurrentMatch, _QUERY)
+
+
+def test_putting_a_loaded_object_clears_not_found():
+    cache = Cache()
+    query = {"region": "NA", "id": 1}
+    cache.put_not_found(MatchData, query)
+    # Every query makes an unloaded object, which isn't evidence that the match exists
+    cache.put(Match, Match._construct_normally(id=1, platform="NA1"))
+    assert cache.is_not_found(MatchData, query)
+
+    match = Match._construct_normally(id=1, platform="NA1")
+    match._data[MatchData] = MatchData(
+        gameId=1, platformId="NA1", participants=[], teams=[]
+    )
+    match._Ghost__set_loaded(MatchData)
+    cache.put_many(Match, [match])
+    assert not cache.is_not_found(MatchData, query)
+
+    cache.put_not_found(MatchData, query)
+    cache.put(Match, match)
+    assert not cache.is_not_found(MatchData, query)
+
+
+def test_queries_without_keys_are_never_not_found():
+    cache = Cache()
+    cache.put_not_found(MatchData, {"region": "NA"})
+    assert not cache.is_not_found(MatchData, {"region": "NA"})
+
+
+def test_sqlite_store_not_found(tmp_path):
+    path = str(tmp_path / "store.sqlite")
+    query = {"region": "NA", "id": 1}
+    SQLiteStore(path).put_not_found(MatchData, query)
+
+    store = SQLiteStore(path)
+    assert store.is_not_found(MatchDto, query)
+    assert not store.is_not_found(MatchDto, {"region": "EUW", "id": 1})
+
+    store.put(
+        MatchDto,
+        MatchDto({"platformId": "NA1", "matchId": 1, "continent": "AMERICAS"}),
+    )
+    assert not store.is_not_found(MatchData, query)
+
+    store.put_not_found(MatchData, query)
+    store.clear(MatchDto)
+    assert not store.is_not_found(MatchData, query)
+
+    store = SQLiteStore(path, not_found_expirations={"MatchDto": 0})
+    store.put_not_found(MatchData, query)
+    assert not store.is_not_found(MatchData, query)
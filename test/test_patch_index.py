@@ -0,0 +1,75 @@
+import arrow
+import pytest
+
+from cassiopeia import configuration
+from cassiopeia.core.patch import Patch
+from cassiopeia.data import Region
+from cassiopeia.dto.patch import PatchListDto
+
+_DAY = 24 * 60 * 60
+_START = 1546300800  # 2019-01-01
+
+
+class _Pipeline(object):
+    def __init__(self, data):
+        self.data = data
+        self.gets = 0
+
+    def get(self, type, query):
+        assert type is PatchListDto
+        self.gets += 1
+        return PatchListDto(self.data)
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    names = ["9.1", "9.2", "9.10", "9.11"]
+    data = {
+        # Deliberately out of order
+        "patches": [
+            {"name": name, "start": _START + 14 * _DAY * i, "season": 13}
+            for i, name in reversed(list(enumerate(names)))
+        ],
+        "shifts": {region.platform.value: 0 for region in Region},
+    }
+    data["shifts"]["NA1"] = _DAY
+    pipeline = _Pipeline(data)
+    monkeypatch.setattr(Patch, "_Patch__patches", None)
+    monkeypatch.setattr(configuration.settings, "_Settings__pipeline", pipeline)
+    return pipeline
+
+
+def test_from_str(pipeline):
+    assert Patch.from_str("9.1", region="NA").name == "9.1"
+    assert Patch.from_str("9.10", region=Region.europe_west).name == "9.10"
+    # Names that aren't exact still match the first patch that contains them
+    assert Patch.from_str("9.1", region="NA") is Patch.from_str("9.", region="NA")
+    unknown = Patch.from_str("8.24", region="NA")
+    assert unknown.name == "8.24" and unknown not in Patch._index("NA").patches
+    assert pipeline.gets == 1
+
+
+def test_from_date(pipeline):
+    assert Patch.from_date(arrow.get(_START + _DAY), region="EUW").name == "9.1"
+    assert Patch.from_date(arrow.get(_START + 14 * _DAY), region="EUW").name == "9.2"
+    # NA's patches start a day later
+    assert Patch.from_date(arrow.get(_START + 14 * _DAY), region="NA").name == "9.1"
+    # The latest patch lasts until now
+    assert Patch.from_date(arrow.now(), region="NA").name == "9.11"
+    with pytest.raises(ValueError):
+        Patch.from_date(arrow.get(_START - 1), region="EUW")
+    with pytest.raises(ValueError):
+        Patch.from_date(arrow.now().shift(days=1), region="EUW")
+
+
+def test_every_patch_is_indexed(pipeline):
+    patches = Patch._index("NA").patches
+    assert [patch.name for patch in patches] == ["9.1", "9.2", "9.10", "9.11"]
+    assert Patch.latest("NA").name == "9.11" and Patch.latest("NA").end is None
+    assert patches[0] < patches[1] < patches[2]
+
+    # The dates are only made into Arrow objects when they're used
+    patch = Patch._index("TR").patches[1]
+    assert patch._start is None and patch._end is None
+    assert patch.start == arrow.get(_START + 14 * _DAY)
+    assert patch.end == Patch._index("TR").patches[2].start
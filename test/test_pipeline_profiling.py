@@ -0,0 +1,87 @@
+import pytest
+
+from cassiopeia._configuration.pipeline import CassiopeiaPipeline
+from cassiopeia._configuration.profiling import ProfilingDataPipeline
+from cassiopeia._configuration.settings import create_pipeline
+from cassiopeia.core.staticdata import Versions
+from cassiopeia.core.summoner import Summoner, SummonerData
+from cassiopeia.data import Platform
+from cassiopeia.datastores import common
+
+from benchmarks import fixtures
+from benchmarks.stubserver import StubHTTPClient, StubServer
+
+
+@pytest.fixture
+def server():
+    common._print_calls, print_calls = False, common._print_calls
+    with StubServer() as server:
+        yield server
+    common._print_calls = print_calls
+
+
+def _pipeline(server, profile):
+    client = StubHTTPClient(server.url)
+    return create_pipeline(
+        {
+            "Cache": {},
+            "DDragon": {"http_client": client},
+            "RiotAPI": {"api_key": "RGAPI-test", "http_client": client},
+        },
+        profile=profile,
+    )
+
+
+def test_profiling_is_off_by_default(server):
+    pipeline = _pipeline(server, profile=False)
+    assert type(pipeline) is CassiopeiaPipeline
+
+
+def test_profile(server):
+    pipeline = _pipeline(server, profile=True)
+    assert isinstance(pipeline, ProfilingDataPipeline)
+    query = {"platform": Platform.north_america, "puuid": fixtures.PUUID}
+    first = pipeline.get(SummonerData, query)
+    assert pipeline.get(SummonerData, query).puuid == first.puuid == fixtures.PUUID
+
+    profile = pipeline.profile()["SummonerData"]
+    assert profile["requests"] == 2
+    assert profile["not_found"] == 0
+    stores = profile["stores"]
+    # Summoners are cached as core objects, so the data always comes from the API
+    assert stores["RiotAPI"]["served"] == 2
+    assert stores["Cache"]["missed"] == 2 and stores["Cache"]["served"] == 0
+    assert profile["misses"] == 2
+    assert profile["transform_hops"] == 2  # SummonerDto -> SummonerData
+    assert (
+        profile["seconds"]
+        >= profile["source_seconds"] + profile["transform_seconds"]
+        > 0
+    )
+    assert "SummonerData" in pipeline.format_profile()
+
+    pipeline.get(Summoner, query)
+    assert pipeline.profile()["Summoner"]["stores"]["UnloadedGhostStore"]["served"] == 1
+
+    pipeline.reset_profile()
+    assert pipeline.profile() == {}
+
+
+def test_puts_are_not_profiled(server):
+    pipeline = _pipeline(server, profile=True)
+    # On a thread that hasn't made a request yet, and on one that has
+    pipeline.put(Versions, Versions(region="NA"))
+    pipeline.get(Summoner, {"platform": Platform.north_america, "puuid": "a"})
+    pipeline.put_many(Versions, [Versions(region="EUW")])
+    assert list(pipeline.profile()) == ["Summoner"]
+
+    # A source handler given a context without a request still works
+    (handler,) = [
+        handler
+        for handler in pipeline._create_source_handlers(SummonerData)
+        if type(handler._source).__name__ == "RiotAPI"
+    ]
+    assert handler.get(
+        {"platform": Platform.north_america, "puuid": fixtures.PUUID},
+        pipeline._new_context(),
+    )
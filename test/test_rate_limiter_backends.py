@@ -0,0 +1,210 @@
+import hashlib
+import socketserver
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cassiopeia.datastores.riotapi.common import RiotAPIRateLimiter
+from cassiopeia.datastores.riotapi.ratelimits import (
+    SQLiteRateLimiterBackend,
+    RedisRateLimiterBackend,
+    create_rate_limiter_backend,
+)
+
+
+class _RedisHandler(socketserver.StreamRequestHandler):
+    # Implements the handful of Redis commands the backend uses, and runs its acquire script as Python.
+
+    def handle(self):
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = []
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                command.append(self.rfile.read(length + 2)[:-2].decode("utf-8"))
+            self.wfile.write(self.server.execute(command))
+
+
+class _RedisStandIn(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+
+    def __init__(self, scripting=True):
+        super().__init__(("127.0.0.1", 0), _RedisHandler)
+        self.data = {}
+        self.lock = threading.Lock()
+        self.scripting = scripting
+        self.scripts = set()
+
+    def _get(self, key):
+        value, expires = self.data.get(key, (0, None))
+        if expires is not None and time.monotonic() >= expires:
+            del self.data[key]
+            return 0, None
+        return value, expires
+
+    def _acquire(self, keys, arguments):
+        # What _ACQUIRE_SCRIPT does
+        wait = 0
+        for key, permits, window in zip(keys, arguments[::2], arguments[1::2]):
+            value, expires = self._get(key)
+            if value + 1 > float(permits):
+                if expires is None:
+                    expires = time.monotonic() + int(window) / 1000
+                    self.data[key] = (value, expires)
+                ttl = int((expires - time.monotonic()) * 1000)
+                wait = max(wait, ttl, 1)
+        if wait > 0:
+            return wait
+        for key, window in zip(keys, arguments[1::2]):
+            value, expires = self._get(key)
+            if expires is None:
+                expires = time.monotonic() + int(window) / 1000
+            self.data[key] = (value + 1, expires)
+        return 0
+
+    def execute(self, command):
+        name, key, arguments = command[0].upper(), command[1], command[2:]
+        if name in ("EVAL", "EVALSHA") and self.scripting:
+            keys = command[3 : 3 + int(command[2])]
+            arguments = command[3 + int(command[2]) :]
+            with self.lock:
+                if name == "EVAL":
+                    self.scripts.add(hashlib.sha1(key.encode("utf-8")).hexdigest())
+                elif key not in self.scripts:
+                    return b"-NOSCRIPT No matching script.\r\n"
+                return b":%d\r\n" % self._acquire(keys, arguments)
+        with self.lock:
+            value, expires = self._get(key)
+            if name in ("INCR", "DECR"):
+                value += 1 if name == "INCR" else -1
+                self.data[key] = (value, expires)
+                return b":%d\r\n" % value
+            if name == "PTTL":
+                if key not in self.data:
+                    return b":-2\r\n"
+                if expires is None:
+                    return b":-1\r\n"
+                return b":%d\r\n" % int((expires - time.monotonic()) * 1000)
+            if name == "PEXPIRE":
+                self.data[key] = (value, time.monotonic() + int(arguments[0]) / 1000)
+                return b":1\r\n"
+            if name == "SET":
+                self.data[key] = (
+                    int(arguments[0]),
+                    time.monotonic() + int(arguments[2]) / 1000,
+                )
+                return b"+OK\r\n"
+        return b"-ERR unknown command\r\n"
+
+
+def _serve(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def _stop(server):
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=[True, False], ids=["scripts", "no-scripts"])
+def redis_server(request):
+    server = _serve(_RedisStandIn(scripting=request.param))
+    yield server
+    _stop(server)
+
+
+@pytest.fixture(params=["sqlite", "redis", "redis-without-scripts"])
+def backends(request, tmp_path):
+    server = None
+    if request.param == "sqlite":
+        path = str(tmp_path / "ratelimits.sqlite")
+        config = {"type": "sqlite", "path": path}
+    else:
+        server = _serve(_RedisStandIn(scripting=request.param == "redis"))
+        port = server.server_address[1]
+        config = {"type": "redis", "host": "127.0.0.1", "port": port}
+    backends = [create_rate_limiter_backend(config) for _ in range(2)]
+    yield backends
+    for backend in backends:
+        backend.close()
+    if server is not None:
+        _stop(server)
+
+
+def test_windows_are_shared(backends):
+    first, second = backends
+    limits = [(3, 1), (4, 60)]
+    assert first.acquire("NA1:application", limits) == 0
+    assert second.acquire("NA1:application", limits) == 0
+    assert first.acquire("NA1:application", limits) == 0
+    assert 0 < second.acquire("NA1:application", limits) <= 1
+    # Other keys have their own windows
+    assert second.acquire("EUW1:application", limits) == 0
+
+
+def test_failed_acquire_takes_nothing(backends):
+    first, second = backends
+    assert first.acquire("NA1:application", [(1, 60)]) == 0
+    assert first.acquire("NA1:application", [(5, 1), (1, 60)]) > 50
+    for _ in range(4):
+        assert second.acquire("NA1:application", [(5, 1)]) == 0
+
+
+def test_concurrent_acquires_take_each_permit_once(backends):
+    def acquire(backend):
+        return [backend.acquire("NA1:application", [(10, 60)]) for _ in range(10)]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        waits = [wait for waits in executor.map(acquire, backends) for wait in waits]
+    assert waits.count(0) == 10
+
+
+def test_redis_acquires_with_a_script(redis_server):
+    backend = RedisRateLimiterBackend(port=redis_server.server_address[1])
+    assert backend.acquire("NA1:application", [(1, 60)]) == 0
+    assert backend.acquire("NA1:application", [(1, 60)]) > 50
+    # The script is only sent once; after that it's called by its hash
+    assert len(redis_server.scripts) == (1 if redis_server.scripting else 0)
+    assert backend._scripting == redis_server.scripting
+    backend.close()
+
+
+def test_restrict_for(backends):
+    first, second = backends
+    first.restrict_for("NA1:application", [1, 60], 0.2)
+    assert 0 < second.acquire("NA1:application", [(3, 1), (4, 60)]) <= 0.2
+    time.sleep(0.25)
+    assert second.acquire("NA1:application", [(3, 1), (4, 60)]) == 0
+
+
+def test_riot_api_rate_limiters_share_a_backend(tmp_path):
+    backend = SQLiteRateLimiterBackend(str(tmp_path / "ratelimits.sqlite"))
+    limiters = [
+        RiotAPIRateLimiter(1.0, backend=backend, key="NA1:application")
+        for _ in range(2)
+    ]
+    for limiter in limiters:
+        limiter.adjust_rate_limits_if_necessary([(2, 1)])
+
+    start = time.monotonic()
+    for limiter in limiters + limiters[:1]:
+        with limiter:
+            pass
+    assert time.monotonic() - start >= 0.5
+    assert limiters[0].permits_issued == 2
+
+
+def test_create_rate_limiter_backend():
+    backend = RedisRateLimiterBackend()
+    assert create_rate_limiter_backend(backend) is backend
+    assert create_rate_limiter_backend(None) is None
+    assert isinstance(
+        create_rate_limiter_backend({"type": "redis", "port": 1}),
+        RedisRateLimiterBackend,
+    )
@@ -0,0 +1,87 @@
+import itertools
+import json
+import time
+
+from cassiopeia.data import Platform, Continent
+from cassiopeia.dto.match import MatchDto
+from cassiopeia.datastores.riotapi.common import (
+    RiotAPIRateLimiter,
+    SynchronizedWindowRateLimiter,
+)
+from cassiopeia.datastores.riotapi.match import MatchAPI
+
+
+def test_waits_for_the_next_window():
+    limiter = SynchronizedWindowRateLimiter(window_seconds=0.2, window_permits=2)
+    start = time.monotonic()
+    for _ in range(3):
+        with limiter:
+            pass
+    assert time.monotonic() - start >= 0.2
+    assert limiter.permits_issued == 3
+
+
+def test_synchronize_adopts_a_higher_count():
+    limiter = SynchronizedWindowRateLimiter(window_seconds=0.2, window_permits=5)
+    with limiter:
+        pass
+    limiter.synchronize(2)
+    assert limiter._count == 2
+    limiter.synchronize(9)
+    assert limiter._count == 5
+
+    start = time.monotonic()
+    with limiter:
+        pass
+    assert time.monotonic() - start >= 0.1
+
+
+class StubHTTPClient(object):
+    """Reports that another process has already used two of the three requests allowed per second."""
+
+    def __init__(self):
+        self.times = []
+
+    def get(
+        self,
+        url,
+        parameters=None,
+        headers=None,
+        rate_limiters=None,
+        connection=None,
+        encode_parameters=True,
+    ):
+        for rate_limiter in rate_limiters:
+            rate_limiter.__enter__()
+        self.times.append(time.monotonic())
+        match_id = int(url.rsplit("_", 1)[1])
+        body = {"metadata": {}, "info": {"gameId": match_id, "participants": []}}
+        response_headers = {
+            "X-App-Rate-Limit": "3:1",
+            "X-App-Rate-Limit-Count": "{}:1".format(min(len(self.times) + 2, 3)),
+            "X-Method-Rate-Limit": "100:1",
+            "X-Method-Rate-Limit-Count": "{}:1".format(len(self.times)),
+        }
+        return json.dumps(body), response_headers
+
+
+def _match_api(client, synchronize):
+    app_rate_limiter = {
+        platform: RiotAPIRateLimiter(limiting_share=1.0, synchronize=synchronize)
+        for platform in itertools.chain(Platform, Continent)
+    }
+    return MatchAPI("RGAPI-test", app_rate_limiter=app_rate_limiter, http_client=client)
+
+
+def test_synchronized_limiter_respects_other_processes():
+    client = StubHTTPClient()
+    api = _match_api(client, synchronize=True)
+    list(api.get_many(MatchDto, {"platform": "NA1", "ids": [1, 2]}))
+    assert client.times[1] - client.times[0] >= 0.9
+
+
+def test_fixed_window_limiter_ignores_counts():
+    client = StubHTTPClient()
+    api = _match_api(client, synchronize=False)
+    list(api.get_many(MatchDto, {"platform": "NA1", "ids": [1, 2]}))
+    assert client.times[1] - client.times[0] < 0.5
@@ -0,0 +1,81 @@
+import threading
+import time
+
+from datapipelines import DataSource, NotFoundError
+
+from cassiopeia._configuration.pipeline import CassiopeiaPipeline
+from cassiopeia.dto.staticdata import RealmDto
+
+
+class _SlowSource(DataSource):
+    def __init__(self) -> None:
+        self.calls = []
+        self._lock = threading.Lock()
+
+    @DataSource.dispatch
+    def get(self, type, query, context=None):
+        pass
+
+    @DataSource.dispatch
+    def get_many(self, type, query, context=None):
+        pass
+
+    @get.register(RealmDto)
+    def get_realms(self, query, context=None) -> RealmDto:
+        with self._lock:
+            self.calls.append(query["platform"])
+        time.sleep(0.2)
+        if query["platform"] == "missing":
+            raise NotFoundError
+        return RealmDto({"v": "14.1.1", "platform": query["platform"]})
+
+
+def _get_concurrently(pipeline, queries):
+    barrier = threading.Barrier(len(queries))
+    results = [None] * len(queries)
+
+    def get(i):
+        barrier.wait()
+        try:
+            results[i] = pipeline.get(RealmDto, queries[i])
+        except NotFoundError as error:
+            results[i] = error
+
+    threads = [threading.Thread(target=get, args=(i,)) for i in range(len(queries))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_identical_gets_share_one_fetch():
+    source = _SlowSource()
+    pipeline = CassiopeiaPipeline([source])
+    results = _get_concurrently(pipeline, [{"platform": "NA1"}] * 8)
+    assert source.calls == ["NA1"]
+    assert all(result is results[0] for result in results)
+    assert results[0]["v"] == "14.1.1"
+
+    # Once it's done, the next get fetches again
+    pipeline.get(RealmDto, {"platform": "NA1"})
+    assert source.calls == ["NA1", "NA1"]
+
+
+def test_different_gets_are_not_coalesced():
+    source = _SlowSource()
+    pipeline = CassiopeiaPipeline([source])
+    results = _get_concurrently(
+        pipeline, [{"platform": "NA1"}, {"platform": "EUW1"}] * 2
+    )
+    assert sorted(source.calls) == ["EUW1", "NA1"]
+    assert results[0] is results[2] and results[1] is results[3]
+    assert results[0]["platform"] == "NA1" and results[1]["platform"] == "EUW1"
+
+
+def test_errors_are_shared():
+    source = _SlowSource()
+    pipeline = CassiopeiaPipeline([source])
+    results = _get_concurrently(pipeline, [{"platform": "missing"}] * 4)
+    assert source.calls == ["missing"]
+    assert all(isinstance(result, NotFoundError) for result in results)
@@ -0,0 +1,122 @@
+import asyncio
+import itertools
+import json
+import types
+
+from cassiopeia.data import Platform, Continent
+from cassiopeia.dto.match import MatchDto
+from cassiopeia.datastores import common
+from cassiopeia.datastores.common import AsyncHTTPClient, HTTPError
+from cassiopeia.datastores.riotapi.common import RiotAPIRateLimiter
+from cassiopeia.datastores.riotapi.match import MatchAPI
+
+
+class StubAsyncClient(object):
+    """Serves canned match-v5 responses, failing the first call with a 429."""
+
+    def __init__(self):
+        self.calls = []
+        self.executor = None
+
+    async def get(
+        self,
+        url,
+        parameters=None,
+        headers=None,
+        rate_limiters=None,
+        connection=None,
+        encode_parameters=True,
+    ):
+        self.calls.append(url)
+        if len(self.calls) == 1:
+            raise HTTPError(
+                "Rate limit exceeded",
+                429,
+                {"X-Rate-Limit-Type": "method", "Retry-After": "0"},
+            )
+        await asyncio.sleep(0)
+        match_id = url.rsplit("_", 1)[1]
+        body = {
+            "metadata": {"matchId": match_id},
+            "info": {"gameId": int(match_id), "participants": [{"puuid": "abc"}, {}]},
+        }
+        return json.dumps(body), {}
+
+
+def _match_api(client):
+    app_rate_limiter = {
+        platform: RiotAPIRateLimiter(limiting_share=1.0)
+        for platform in itertools.chain(Platform, Continent)
+    }
+    return MatchAPI(
+        "RGAPI-test", app_rate_limiter=app_rate_limiter, async_http_client=client
+    )
+
+
+def test_get_match_async_retries_and_builds_dto():
+    client = StubAsyncClient()
+    api = _match_api(client)
+    match = asyncio.run(api.get_async(MatchDto, {"region": "NA", "id": 1}))
+
+    assert isinstance(match, MatchDto)
+    assert match["matchId"] == 1
+    assert match["continent"] == Continent.americas.value
+    assert [p["bot"] for p in match["participants"]] == [False, True]
+    assert len(client.calls) == 2
+
+
+def test_get_many_match_async_returns_in_order():
+    client = StubAsyncClient()
+    api = _match_api(client)
+    matches = asyncio.run(
+        api.get_many_async(MatchDto, {"platform": "NA1", "ids": [3, 1, 2]})
+    )
+
+    assert [match["matchId"] for match in matches] == [3, 1, 2]
+
+
+class StubHTTPClient(object):
+    def get(self, url, **kwargs):
+        return "{}", {}
+
+
+class StubSession(object):
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def test_closed_loops_are_forgotten():
+    client = AsyncHTTPClient(StubHTTPClient())
+    for _ in range(3):
+        assert asyncio.run(client.get("https://example.com")) == ("{}", {})
+    # Only the last loop's semaphore is left, until the next loop replaces it
+    assert len(client._semaphores) == 1
+
+
+def test_sessions_are_closed_with_their_loop(monkeypatch):
+    monkeypatch.setattr(
+        common,
+        "aiohttp",
+        types.SimpleNamespace(ClientSession=StubSession),
+        raising=False,
+    )
+    client = AsyncHTTPClient(StubHTTPClient())
+
+    async def get_session():
+        return await client._get_session(asyncio.get_running_loop())
+
+    # asyncio.run closes the session before closing the loop
+    session = asyncio.run(get_session())
+    assert session.closed
+
+    async def get_and_close():
+        session = await get_session()
+        assert not session.closed
+        await client.close()
+        return session
+
+    assert asyncio.run(get_and_close()).closed
+    assert client._sessions == {}
@@ -0,0 +1,126 @@
+import time
+
+import pytest
+from datapipelines import NotFoundError
+
+from cassiopeia.dto.match import MatchDto
+from cassiopeia.dto.staticdata import ChampionListDto
+from cassiopeia.dto.account import AccountDto
+from cassiopeia.dto.summoner import SummonerDto
+from cassiopeia.datastores import SQLiteStore
+from cassiopeia.datastores import uniquekeys
+
+
+def _match(id):
+    return MatchDto(
+        {"platformId": "NA1", "matchId": id, "continent": "AMERICAS", "gameId": id}
+    )
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "store.sqlite")
+
+
+def test_match_survives_a_new_store(path):
+    SQLiteStore(path).put(MatchDto, _match(1))
+
+    store = SQLiteStore(path)
+    match = store.get(MatchDto, {"region": "NA", "id": 1})
+    assert isinstance(match, MatchDto)
+    assert match == _match(1)
+    with pytest.raises(NotFoundError):
+        store.get(MatchDto, {"region": "EUW", "id": 1})
+
+
+def test_get_many_match(path):
+    store = SQLiteStore(path, compress=False)
+    store.put_many(MatchDto, [_match(1), _match(2), _match(3)])
+
+    matches = store.get_many(MatchDto, {"platform": "NA1", "ids": [3, 1]})
+    assert [match["matchId"] for match in matches] == [3, 1]
+    with pytest.raises(NotFoundError):
+        store.get_many(MatchDto, {"platform": "NA1", "ids": [1, 4]})
+
+
+def test_static_data_keeps_included_data(path):
+    store = SQLiteStore(path)
+    champions = ChampionListDto(
+        {
+            "region": "NA",
+            "version": "14.1.1",
+            "locale": "en_US",
+            "includedData": {"all"},
+            "data": {"Annie": {"id": 1}},
+        }
+    )
+    store.put(ChampionListDto, champions)
+
+    loaded = store.get(ChampionListDto, {"platform": "NA1", "version": "14.1.1"})
+    assert loaded["includedData"] == {"all"}
+    assert loaded["data"] == {"Annie": {"id": 1}}
+
+
+def test_summoner_is_found_by_any_identifier(path):
+    store = SQLiteStore(path)
+    store.put(
+        SummonerDto,
+        SummonerDto(region="NA", id="abc", accountId="def", puuid="ghi"),
+    )
+
+    for identifier, value in [("id", "abc"), ("accountId", "def"), ("puuid", "ghi")]:
+        summoner = store.get(SummonerDto, {"platform": "NA1", identifier: value})
+        assert summoner["id"] == "abc"
+
+
+def test_many_keys_match_single_keys():
+    account = AccountDto(puuid="ghi", gameName="Name", tagLine="NA1")
+    query = {"platform": "NA1", "names": ["Name"], "taglines": ["NA1"]}
+    uniquekeys.validate_many_account_dto_query(query, None)
+    assert list(uniquekeys.for_many_account_dto_query(query)) == [
+        uniquekeys.for_account_dto(account, "name")
+    ]
+    query = {"platform": "NA1", "puuids": ["ghi"]}
+    uniquekeys.validate_many_account_dto_query(query, None)
+    assert list(uniquekeys.for_many_account_dto_query(query)) == [
+        uniquekeys.for_account_dto(account)
+    ]
+
+    summoner = SummonerDto(region="NA", id="abc", accountId="def", puuid="ghi")
+    for identifier, value in [("id", "abc"), ("accountId", "def"), ("puuid", "ghi")]:
+        query = {"platform": "NA1", identifier + "s": [value]}
+        uniquekeys.validate_many_summoner_dto_query(query, None)
+        assert list(uniquekeys.for_many_summoner_dto_query(query)) == [
+            uniquekeys.for_summoner_dto(summoner, identifier)
+        ]
+
+
+def test_expirations(path):
+    store = SQLiteStore(
+        path,
+        expirations={
+            "MatchDto": 0,
+            SummonerDto: 0.01,
+        },
+    )
+    store.put(MatchDto, _match(1))
+    store.put(SummonerDto, SummonerDto(region="NA", id="abc", puuid="ghi"))
+    time.sleep(0.02)
+
+    with pytest.raises(NotFoundError):
+        store.get(MatchDto, {"platform": "NA1", "id": 1})
+    with pytest.raises(NotFoundError):
+        store.get(SummonerDto, {"platform": "NA1", "id": "abc"})
+
+    store.expire()
+    assert store._connection.execute("SELECT COUNT(*) FROM data").fetchone()[0] == 0
+
+
+def test_clear(path):
+    store = SQLiteStore(path)
+    store.put(MatchDto, _match(1))
+    store.clear(SummonerDto)
+    assert store.get(MatchDto, {"platform": "NA1", "id": 1})
+    store.clear(MatchDto)
+    with pytest.raises(NotFoundError):
+        store.get(MatchDto, {"platform": "NA1", "id": 1})
@@ -0,0 +1,74 @@
+import pytest
+from merakicommons.container import SearchableList, SearchError
+
+from cassiopeia.core.staticdata.champion import Champion, ChampionData, Champions
+from cassiopeia.data import Region
+
+_CHAMPIONS = [(266, "Aatrox"), (254, "Vi"), (112, "Viktor"), (103, "Ahri")]
+
+
+def _champions(generated):
+    def generator():
+        for id, name in _CHAMPIONS:
+            generated.append(id)
+            data = ChampionData(
+                id=id,
+                name=name,
+                key=name,
+                region="NA",
+                locale="en_US",
+                tags=[],
+            )
+            yield Champion.from_data(data, loaded_groups={ChampionData})
+
+    return Champions.from_generator(
+        generator=generator(),
+        region=Region.north_america,
+        version="14.1.1",
+        locale="en_US",
+        included_data={"all"},
+    )
+
+
+def test_find_uses_the_index():
+    generated = []
+    champions = _champions(generated)
+    assert champions.find(112).name == "Viktor"
+    assert generated == [266, 254, 112, 103]
+    assert champions._index is not None
+    assert champions.contains(266)
+    assert not champions.contains(1)
+    with pytest.raises(SearchError):
+        champions.find(1)
+
+
+@pytest.mark.parametrize("item", [254, 1, "Vi", "Vik", "Ahri", "i", "NA", "x"])
+def test_lookups_match_a_plain_search(item):
+    champions = _champions([])
+    champions.find(266)  # Builds the index
+    plain = SearchableList(list.__iter__(champions))
+
+    def result(search, *args, **kwargs):
+        try:
+            return search(item, *args, **kwargs)
+        except SearchError:
+            return SearchError
+
+    assert result(champions.find) is result(plain.find)
+    assert result(champions.find, reverse=True) is result(plain.find, reverse=True)
+    assert result(champions.search) == result(plain.search)
+    assert result(champions.search, reverse=True) == result(plain.search, reverse=True)
+    assert champions.contains(item) == plain.contains(item)
+
+
+def test_changing_the_list_rebuilds_the_index():
+    champions = _champions([])
+    assert champions["Ahri"].id == 103
+    del champions[3]
+    with pytest.raises(SearchError):
+        champions.find("Ahri")
+    data = ChampionData(
+        id=103, name="Ahri", key="Ahri", region="NA", locale="en_US", tags=[]
+    )
+    champions.append(Champion.from_data(data, loaded_groups={ChampionData}))
+    assert champions.find(103).name == "Ahri"
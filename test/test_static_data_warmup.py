@@ -0,0 +1,95 @@
+from collections import Counter
+
+import pytest
+
+from cassiopeia import Champions, Items, Runes, configuration
+from cassiopeia._configuration.settings import create_pipeline
+from cassiopeia.core import match as core_match
+from cassiopeia.core.match import StaticDataIndex
+from cassiopeia.core.staticdata import Champion
+from cassiopeia.data import Region
+from cassiopeia.datastores import common
+from cassiopeia.warmup import main, select_versions, warm_up_static_data
+
+from benchmarks.stubserver import StubHTTPClient, StubServer
+
+
+@pytest.fixture
+def server(monkeypatch):
+    common._print_calls, print_calls = False, common._print_calls
+    with StubServer() as server:
+        pipeline = create_pipeline(
+            {"Cache": {}, "DDragon": {"http_client": StubHTTPClient(server.url)}}
+        )
+        monkeypatch.setattr(configuration.settings, "_Settings__pipeline", pipeline)
+        monkeypatch.setattr(core_match, "_static_data_indexes", {})
+        yield server
+    common._print_calls = print_calls
+
+
+def _files(server):
+    return Counter(
+        path.rsplit("/", 1)[-1] for _, path in server.requests if "/cdn/" in path
+    )
+
+
+def test_select_versions():
+    versions = ["14.2.1", "14.1.2", "14.1.1", "13.24.1", "13.9.1", "lolpatch_3.7"]
+    assert select_versions(versions) == ["14.2.1"]
+    assert select_versions(versions, "13.24", "14.1") == ["14.1.2", "13.24.1"]
+    assert select_versions(versions, "13.9") == [
+        "14.2.1",
+        "14.1.2",
+        "13.24.1",
+        "13.9.1",
+    ]
+    assert select_versions(versions, last_patch="14.1") == ["14.1.2"]
+    assert select_versions(versions, "15.1") == []
+    with pytest.raises(ValueError):
+        select_versions(versions, "latest")
+
+
+def test_warm_up_loads_every_list(server):
+    results = warm_up_static_data(
+        regions=["NA", "EUW"], first_patch="13.24", last_patch="14.1"
+    )
+    assert all(error is None for *_, error in results)
+    # 2 regions, 2 patches, 6 lists, each downloaded once
+    assert len(results) == 24
+    files = _files(server)
+    assert set(files.values()) == {4} and len(files) == 6
+    # The perks aren't versioned, so they're only downloaded once
+    assert (
+        len([path for _, path in server.requests if path.endswith("perks.json")]) == 1
+    )
+
+    requests = len(server.requests)
+    assert Champions(region="NA", version="14.1.1")[0].name == "Annie"
+    assert Items(region=Region.europe_west, version="13.24.1")[0].name == "Boots"
+    assert len(Runes(region="NA", version="13.24.1")) == 2
+    index = StaticDataIndex.for_version(Region.north_america, "14.1.1")
+    assert index._loaded and index.get(Champion, 1).name == "Annie"
+    assert len(server.requests) == requests
+
+
+def test_warm_up_locales(server):
+    results = warm_up_static_data(
+        regions=["NA"], locales=["en_US", "ko_KR"], lists=[Champions]
+    )
+    assert [(region, version, locale) for _, region, version, locale, _ in results] == [
+        (Region.north_america, "14.1.1", "en_US"),
+        (Region.north_america, "14.1.1", "ko_KR"),
+    ]
+    paths = {path for _, path in server.requests if "/cdn/" in path}
+    assert paths == {
+        "/cdn/14.1.1/data/en_US/championFull.json",
+        "/cdn/14.1.1/data/ko_KR/championFull.json",
+    }
+
+
+def test_main(server, capsys):
+    assert main(["--region", "NA", "--patches", "13.23", "--concurrency", "2"]) == 0
+    assert "Loaded 6 of 6" in capsys.readouterr().out
+    assert {path.split("/")[2] for _, path in server.requests if "/cdn/" in path} == {
+        "13.23.1"
+    }
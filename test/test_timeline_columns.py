@@ -0,0 +1,121 @@
+import copy
+import pickle
+import tracemalloc
+
+import pytest
+
+from cassiopeia import configuration
+from cassiopeia.core.match import ColumnarTimelineData, Timeline, TimelineData
+from cassiopeia.transformers.match import MatchTransformer
+
+from .test_match_compact import _timeline
+from .test_timeline_index import TIMELINE
+
+
+@pytest.fixture
+def columnar(monkeypatch):
+    monkeypatch.setattr(
+        configuration.settings, "_Settings__columnar_timeline_data", True
+    )
+
+
+def _timelines():
+    expected = Timeline.from_data(TimelineData(**copy.deepcopy(TIMELINE)))
+    data = ColumnarTimelineData(**copy.deepcopy(TIMELINE))
+    return Timeline.from_data(data), expected
+
+
+def test_columnar_data_behaves_the_same():
+    timeline, expected = _timelines()
+    data = timeline._data[TimelineData]
+
+    assert data.to_dict() == expected._data[TimelineData].to_dict()
+    assert pickle.loads(pickle.dumps(data)).to_dict() == data.to_dict()
+    assert [frame.timestamp for frame in timeline.frames] == [
+        frame.timestamp for frame in expected.frames
+    ]
+    assert timeline.frames[1].participant_frames[2].gold_earned == 700
+    assert timeline.frames[1].events[0].assisting_participants == []
+    assert (
+        timeline.first_tower_fallen.timestamp == expected.first_tower_fallen.timestamp
+    )
+    assert [event.timestamp for event in timeline.index.events(participant_id=1)] == [
+        event.timestamp for event in expected.index.events(participant_id=1)
+    ]
+
+
+def test_frames_are_built_once():
+    data = ColumnarTimelineData(**copy.deepcopy(TIMELINE))
+    frames = data.frames
+    assert data.frames is frames
+    assert "frames" not in pickle.loads(pickle.dumps(data)).__dict__
+
+    data(frames=copy.deepcopy(TIMELINE["frames"][:1]))
+    assert data.frames is not frames
+    assert len(data.frames) == 1
+    assert data.to_dict()["frames"] == [frame.to_dict() for frame in data.frames]
+
+
+def test_columnar_timelines_are_built_when_the_setting_is_on(columnar):
+    data = MatchTransformer().timeline_dto_to_data(copy.deepcopy(TIMELINE))
+    assert isinstance(data, ColumnarTimelineData)
+    assert Timeline.from_data(data).id == "NA1_1"
+
+
+def test_curves():
+    for timeline in _timelines():
+        assert timeline.curves("totalGold", format="python") == [
+            [500, 500],
+            [600, 700],
+            [700, 900],
+            [800, 1100],
+        ]
+        assert timeline.curves(["goldEarned", "level"], format="python")[1] == [
+            [600, 2],
+            [700, 2],
+        ]
+        assert timeline.curves(["position.x", "position.y"], format="python")[2] == [
+            [2, 1],
+            [2, 2],
+        ]
+        assert timeline.curves("xp", format="python")[0] == [None, None]
+
+
+def test_event_columns():
+    timeline, expected = _timelines()
+    fields = ["timestamp", "killerId", "assistingParticipants", "position.x"]
+    columns = timeline.event_columns(fields, type="CHAMPION_KILL", format="python")
+    assert columns == expected.event_columns(
+        fields, type="CHAMPION_KILL", format="python"
+    )
+    assert columns["killerId"] == [1, 2, 2]
+    assert columns["assistingParticipants"] == [[], [], [1]]
+    assert timeline.event_columns(["creatorId"], format="python")["creatorId"][:4] == [
+        None,
+        None,
+        None,
+        2,
+    ]
+
+
+def test_curves_with_numpy():
+    numpy = pytest.importorskip("numpy")
+    for timeline in _timelines():
+        gold = timeline.gold_curves
+        assert gold.shape == (len(TIMELINE["frames"]), 2)
+        assert gold[1].tolist() == [600, 700]
+        assert timeline.position_curves.shape == (len(TIMELINE["frames"]), 2, 2)
+        assert numpy.isnan(timeline.experience_curves).all()
+
+
+def test_columnar_data_is_smaller():
+    sizes = []
+    for data_type in (TimelineData, ColumnarTimelineData):
+        raw = [_timeline() for _ in range(5)]
+        tracemalloc.start()
+        timelines = [data_type(**timeline) for timeline in raw]
+        del raw
+        sizes.append(tracemalloc.get_traced_memory()[0])
+        tracemalloc.stop()
+        del timelines
+    assert sizes[1] < 0.5 * sizes[0]
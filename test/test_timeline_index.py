@@ -0,0 +1,190 @@
+import datetime
+
+from cassiopeia.core.match import (
+    Match,
+    MatchData,
+    Timeline,
+    TimelineData,
+    Participant,
+    ParticipantData,
+)
+
+
+def _frame(minute, events):
+    return {
+        "timestamp": minute * 60000 + 15,
+        "participantFrames": {
+            str(id): {
+                "participantId": id,
+                "totalGold": 500 + 100 * minute * id,
+                "level": 1 + minute,
+                "position": {"x": minute, "y": id},
+            }
+            for id in (1, 2)
+        },
+        "events": events,
+    }
+
+
+def _kill(timestamp, killer, victim, assisting=()):
+    return {
+        "type": "CHAMPION_KILL",
+        "timestamp": timestamp,
+        "killerId": killer,
+        "victimId": victim,
+        "assistingParticipantIds": list(assisting),
+        "position": {"x": 1, "y": 1},
+    }
+
+
+def _skill(timestamp, participant):
+    return {
+        "type": "SKILL_LEVEL_UP",
+        "timestamp": timestamp,
+        "participantId": participant,
+        "skillSlot": 1,
+        "levelUpType": "NORMAL",
+    }
+
+
+TIMELINE = {
+    "matchId": "NA1_1",
+    "platform": "NA1",
+    "frames": [
+        _frame(0, [_skill(1000, 1), _skill(1200, 2)]),
+        _frame(
+            1,
+            [
+                _kill(70000, 1, 2),
+                {"type": "WARD_PLACED", "timestamp": 80000, "creatorId": 2},
+            ],
+        ),
+        _frame(
+            2,
+            [
+                {
+                    "type": "BUILDING_KILL",
+                    "timestamp": 130000,
+                    "killerId": 0,
+                    "buildingType": "INHIBITOR_BUILDING",
+                },
+                _kill(140000, 2, 1),
+                _kill(145000, 2, 3, assisting=[1]),
+                {
+                    "type": "BUILDING_KILL",
+                    "timestamp": 150000,
+                    "killerId": 1,
+                    "buildingType": "TOWER_BUILDING",
+                },
+            ],
+        ),
+        _frame(3, []),
+    ],
+}
+
+
+def _timeline():
+    return Timeline.from_data(TimelineData(**TIMELINE))
+
+
+def _participant(timeline, id):
+    match = Match._construct_normally(id=1, platform="NA1")
+    match.__load_hook__(MatchData, MatchData(platformId="NA1", gameId=1))
+    match._Ghost__set_loaded(MatchData)
+    match._timeline = timeline
+    return Participant.from_data(ParticipantData(participantId=id), match=match)
+
+
+def test_index_groups_events():
+    index = _timeline().index
+    assert len(index.events()) == 8
+    assert [event.type for event in index.events(participant_id=1)] == [
+        "SKILL_LEVEL_UP",
+        "CHAMPION_KILL",
+        "CHAMPION_KILL",
+        "CHAMPION_KILL",  # As an assistant
+        "BUILDING_KILL",
+    ]
+    kill_times = [event.timestamp.seconds for event in index.events(2, "CHAMPION_KILL")]
+    assert kill_times == [70, 140, 145]
+    assert [
+        event.timestamp.seconds
+        for event in index.events(1, until=datetime.timedelta(seconds=140))
+    ] == [1, 70, 140]
+    assert index.events(4) == []
+    assert index.latest_participant_frame(1, datetime.timedelta(seconds=59)).level == 1
+    assert index.latest_participant_frame(1, datetime.timedelta(minutes=2)).level == 3
+
+
+def test_first_tower_fallen():
+    event = _timeline().first_tower_fallen
+    assert event.killer_id == 1
+    assert event.timestamp == datetime.timedelta(seconds=150)
+
+
+def test_participant_timeline():
+    timeline = _timeline()
+    participant = _participant(timeline, 1)
+    assert len(participant.timeline.events) == 5
+    assert [frame.gold_earned for frame in participant.timeline.frames] == [
+        500,
+        600,
+        700,
+        800,
+    ]
+    assert participant.timeline.frames[2].timestamp.seconds == 120
+    assert len(participant.timeline.champion_kills) == 1
+    assert len(participant.timeline.champion_deaths) == 1
+    assert len(participant.timeline.champion_assists) == 1
+
+
+def test_cumulative_timeline():
+    participant = _participant(_timeline(), 2)
+    state = participant.cumulative_timeline["2:00"]
+    assert (state.kills, state.deaths, state.assists, state.level) == (0, 1, 0, 2)
+    assert state.gold_earned == 900
+    state = participant.cumulative_timeline["2:25"]
+    assert (state.kills, state.deaths, state.assists) == (2, 1, 0)
+
+
+def test_cumulative_timeline_checkpoints_match_a_full_replay():
+    from cassiopeia.core.match import ParticipantState
+
+    participant = _participant(_timeline(), 2)
+    cumulative = participant.cumulative_timeline
+    assert participant.cumulative_timeline is cumulative
+    for seconds in range(0, 240, 5):
+        time = datetime.timedelta(seconds=seconds)
+        state = cumulative[time]
+
+        expected = ParticipantState(2, time, participant.timeline)
+        for event in participant.timeline.events:
+            if event.timestamp <= time:
+                expected._process_event(event)
+        assert (state.kills, state.deaths, state.level, state.gold_earned) == (
+            expected.kills,
+            expected.deaths,
+            expected.level,
+            expected.gold_earned,
+        )
+        assert state._processed_events == expected._processed_events
+    assert [time.seconds for time in cumulative._checkpoint_times] == [0, 60, 120, 180]
+
+
+def test_cumulative_timeline_checkpoints_share_their_events():
+    participant = _participant(_timeline(), 2)
+    cumulative = participant.cumulative_timeline
+    state = cumulative["3:30"]
+    checkpoints = [checkpoint for _, checkpoint in cumulative._checkpoints]
+
+    def tails(processed):
+        while processed is not None:
+            yield processed
+            processed = processed[1]
+
+    # Each checkpoint (and each state made from one) only adds its own events to the previous one's
+    for earlier, later in zip(checkpoints, checkpoints[1:] + [state]):
+        assert earlier._processed is None or any(
+            tail is earlier._processed for tail in tails(later._processed)
+        )
+    assert checkpoints[-1]._processed is not None